@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+PACKAGE
+
+Benchmark
+
+PATH
+
+[app_root]/benchmark/
+
+INTRO
+
+Benchmark package times and memory-profiles operator matrix
+enlargement, quantum flows, partial trace and projective
+measurement across numbers of qubits. Validation cases time a
+flow at each validation level. Results are recorded as
+JSON together with environment metadata; two result files can
+be compared to flag regressions.
+
+From the application root,
+    python3 -m benchmark run --output current.json
+    python3 -m benchmark compare baseline.json current.json
+
+CONTENT
+
+`BenchmarkError` - Error class of the package
+
+`BenchmarkCase` - Benchmark case
+
+`benchmark_cases()` - Returns all benchmark cases
+
+`validation_flow_gates()` - Number of gates in validation cases
+
+`run_benchmarks()` - Runs benchmark cases
+
+`save_results()`, `load_results()` - Write and read results
+
+`compare_results()` - Compares two results
+
+`regressions()` - Returns regressed records of a comparison
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from .base import BenchmarkError
+from .cases import BenchmarkCase, benchmark_cases, validation_flow_gates
+from .runner import measure, environment_metadata, run_benchmarks, \
+    save_results, load_results
+from .compare import compare_results, regressions, format_comparison
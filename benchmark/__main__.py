@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+benchmark.__main__.py
+
+PATH
+
+[app_root]/benchmark/__main__.py
+
+INTRO
+
+Command line interface of benchmark package.
+
+`python3 -m benchmark run` runs benchmark cases and writes
+results into a JSON file. `python3 -m benchmark compare` compares
+two result files and exits with status 1 if any regression is
+flagged.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import argparse
+import sys
+
+from quantum_memory.base_memory import GATE_ENGINES, STATEVECTOR_ENGINE
+
+from .runner import DEFAULT_QUBIT_RANGE, run_benchmarks, save_results, \
+    load_results
+from .compare import TIME_METRICS, compare_results, regressions, \
+    format_comparison
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog='python3 -m benchmark')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run = subparsers.add_parser('run', help='run benchmark cases')
+    run.add_argument('--output', default='benchmark_results.json',
+                     help='JSON file of results')
+    run.add_argument('--min-qubits', type=int,
+                     default=DEFAULT_QUBIT_RANGE[0])
+    run.add_argument('--max-qubits', type=int,
+                     default=DEFAULT_QUBIT_RANGE[1])
+    run.add_argument('--repeat', type=int, default=3)
+    run.add_argument('--case', action='append', dest='names',
+                     help='name of a case to run; may be repeated')
+    run.add_argument('--engine', choices=GATE_ENGINES,
+                     default=STATEVECTOR_ENGINE,
+                     help='gate engine used by flow cases')
+    run.add_argument('--no-memory', action='store_true',
+                     help="don't measure peak memory")
+    compare = subparsers.add_parser('compare',
+                                    help='compare two result files')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.2)
+    compare.add_argument('--metric', choices=TIME_METRICS,
+                         default='median')
+    return parser
+
+
+def main(argv=None):
+    args = _parser().parse_args(argv)
+    if args.command == 'run':
+        results = run_benchmarks(
+            names=args.names,
+            qubit_range=(args.min_qubits, args.max_qubits),
+            repeat=args.repeat, memory=not args.no_memory,
+            engine=args.engine, verbose=True)
+        save_results(results, args.output)
+        return 0
+    comparison = compare_results(load_results(args.baseline),
+                                 load_results(args.current),
+                                 threshold=args.threshold,
+                                 metric=args.metric)
+    print(format_comparison(comparison))
+    flagged = regressions(comparison)
+    if flagged:
+        print("{} regression(s) flagged.".format(len(flagged)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+benchmark.base.py
+
+PATH
+
+[app_root]/benchmark/base.py
+
+INTRO
+
+Base classes to benchmark package.
+
+CONTENT
+
+`BenchmarkError` - Error class for the entire package
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from common.exception import Generic_Error
+
+
+class BenchmarkError(Generic_Error):
+    """ Base error class of benchmark package """
+    header = "Benchmark_Error"
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+benchmark.cases.py
+
+PATH
+
+[app_root]/benchmark/cases.py
+
+INTRO
+
+Benchmark cases.
+
+A benchmark case has a name and a setup function. Setup receives
+the number of qubits and returns a callable without arguments;
+only that callable is timed. Setup is invoked before every timed
+run, so that a run mutating its memory, e.g. a flow launched on
+memory, always starts from the same global state.
+
+Validation cases launch the same flow of single-qubit and
+controlled gates at each validation level, 'full', 'boundary' and
+'off'. Flow has `VALIDATION_FLOW_LAYERS` layers of `2n - 1` gates
+on `n` qubits, so that the difference of times between levels,
+divided by the number of gates, is the per-gate overhead of
+validation.
+
+Every case has a range of qubits it supports. Dense operator
+matrices of `n` qubits hold `4^n` complex numbers, i.e. 4 GiB at
+14 qubits; cases built on dense matrices are therefore capped
+well below the state-vector and sparse cases. Other caps keep a
+single run of a case within a minute or so.
+
+CONTENT
+
+`BenchmarkCase` - Name, setup function and qubit range of a case
+
+`benchmark_phase_oracle` - Gate used as oracle in phase estimation
+
+`validation_flow_gates(noq)` - Number of gates in validation cases
+
+`benchmark_cases(engine)` - Returns all benchmark cases
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import numpy as np
+
+from common.validator import VALIDATION_LEVELS, validation_level
+from linear_space.matrix import SquareMatrix, HADAMARD
+from linear_space.algebra import matrix_product
+from linear_space.scipy_lib import HAS_SCIPY
+from linear_space.vector import ColumnVector
+from qubit import ComputationalBasis, QubitState
+from qubit.utils import qubit_from_bitlist
+from density_matrix.density_matrix import QubitDensityMatrix
+from gate.prototype import GatePrototype
+from gate.decorator import as_gate
+from gate.parameter import GateParameter
+from gate.enlarge_matrix.noncontrolled import enlarge_single_qubit_matrix
+from gate.enlarge_matrix.controlled_kernel import kernel
+from quantum_register import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_memory.base_memory import STATEVECTOR_ENGINE
+from quantum_operation.gate import gate_operation_from_instruction_dict as GOfID
+from quantum_flow.quantum_flow import QuantumFlow
+from quantum_flow.makers.fourier import quantum_fourier_flow_on_register
+from quantum_circuit.grover import grover_search
+from quantum_circuit.phase_estimation import phase_estimation
+from measurement.partial_trace import partial_trace_out_index_range
+from measurement.projective import projective_all
+
+from .base import BenchmarkError
+
+_MODULE_LOCATION_ = 'benchmark.cases'
+
+# number of gate layers in validation cases
+VALIDATION_FLOW_LAYERS = 8
+
+
+class BenchmarkCase:
+    """ Benchmark case
+
+    CONSTRUCTOR
+
+    `name` (`str`) : unique name of the case
+
+    `setup` (callable) : receives number of qubits and returns
+    the callable to be timed
+
+    `min_qubits`, `max_qubits` (`int`) : range of number of qubits
+    supported by the case, both inclusive
+
+    `requires_scipy` (`bool`) : if `True`, case is only available
+    with scipy installed
+
+    ATTRIBUTES
+
+    `self.is_available` : property; `False` if a required optional
+    dependency is missing
+
+    `self.supports(, noq)` : checks if number of qubits is in range
+    """
+    error_location = _MODULE_LOCATION_ + '.BenchmarkCase'
+
+    def __init__(self, name=None, setup=None, min_qubits=1, max_qubits=14,
+                 requires_scipy=False):
+        """ Benchmark Case : Initialiser """
+        if not isinstance(name, str) or not callable(setup):
+            raise BenchmarkError("Benchmark case requires a name " +\
+                    "and a callable setup.",
+                    location=self.error_location+'.__init__')
+        self.name = name
+        self.setup = setup
+        self.min_qubits = min_qubits
+        self.max_qubits = max_qubits
+        self.requires_scipy = requires_scipy
+
+    @property
+    def is_available(self):
+        """ Benchmark Case : Check optional dependencies """
+        return HAS_SCIPY or not self.requires_scipy
+
+    def supports(self, noq):
+        """ Benchmark Case : Check number of qubits """
+        return self.min_qubits <= noq <= self.max_qubits
+
+
+@as_gate
+class benchmark_phase_oracle(GatePrototype):
+    """ Phase oracle for phase estimation
+
+    Eigenstate [1/sqrt(2), 1/sqrt(2)] has the phase pi/4. Gate
+    parameter `n` raises the matrix to the power of `n`.
+    """
+    minimal_number_of_qubits = 1
+    alias = 'benchmark_phase_oracle'
+    parameters = {
+        'n': GateParameter(paramtype=int, default=1)
+    }
+
+    def _default_matrix(self):
+        phase = np.exp(0.25j * np.pi)
+        return SquareMatrix(array=np.array([[0, phase], [phase, 0]]))
+
+    def gate_matrix(self, n):
+        final_matrix = self._default_matrix()
+        for _ in range(1, n):
+            final_matrix = matrix_product(final_matrix,
+                                          self._default_matrix())
+        return final_matrix
+
+
+def _random_state(noq, seed=7):
+    """ Normalised random qubit state of `noq` qubits """
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=2**noq) + 1.j * rng.normal(size=2**noq)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def _setup_enlarge(sparse):
+    """ Enlarge Hadamard on the middle qubit """
+    def setup(noq):
+        return lambda: enlarge_single_qubit_matrix(
+                number_of_qubits=noq, target_index=noq // 2,
+                original_matrix=HADAMARD, sparse=sparse)
+    return setup
+
+
+def _setup_kernel(sparse):
+    """ Hadamard on the last qubit, controlled by the first """
+    def setup(noq):
+        return lambda: kernel(
+                number_of_qubits=noq, control_list=[(0, '1')],
+                target_range=[noq - 1, noq - 1],
+                original_matrix=HADAMARD, sparse=sparse)
+    return setup
+
+
+def _launcher(flow, memory, engine):
+    """ Callable launching flow on memory with engine """
+    flow.set_engine(engine)
+    return lambda: flow.launch_on_memory(memory)
+
+
+def _setup_qft(engine):
+    """ QFT on a register of `noq` qubits """
+    def setup(noq):
+        register = QubitRegister(state=ComputationalBasis(bitstring='0'*noq),
+                                 label='COMPUTER')
+        memory = QubitMemory(register=[register])
+        flow = quantum_fourier_flow_on_register(register)
+        return _launcher(flow, memory, engine)
+    return setup
+
+
+def _setup_grover(engine):
+    """ Grover search for |1...1> with `noq - 1` computer qubits """
+    def setup(noq):
+        computer = QubitRegister(
+                state=ComputationalBasis(bitstring='0'*(noq - 1)),
+                label='COMPUTER')
+        ancilla = QubitRegister(state=qubit_from_bitlist([(1, '1')]),
+                                label='ANCILLA')
+        memory = QubitMemory(register=[computer, ancilla])
+        computer = memory.get_register_metadata_by_label('COMPUTER')
+        ancilla = memory.get_register_metadata_by_label('ANCILLA')
+        oracle = GOfID({
+            'gate': {
+                'alias': 'Flip'
+            },
+            'target': {
+                'register': ancilla.label,
+                'local_index': 0
+            },
+            'control': {
+                'list': [
+                    {
+                        'register': computer.label,
+                        'local_index': index,
+                        'state': '1'
+                    } for index in range(0, noq - 1)
+                ]
+            }
+        })
+        flow = grover_search(computer=computer, ancilla=ancilla,
+                             oracle_operation=oracle)
+        return _launcher(flow, memory, engine)
+    return setup
+
+
+def _setup_phase_estimation(engine):
+    """ Phase estimation with `noq - 1` computer qubits """
+    def setup(noq):
+        computer = QubitRegister(
+                state=ComputationalBasis(bitstring='0'*(noq - 1)),
+                label='COMPUTER')
+        ancilla = QubitRegister(
+                state=qubit_from_bitlist([(1.0, '0'), (1.0, '1')]),
+                label='ANCILLA')
+        memory = QubitMemory(register=[computer, ancilla])
+        flow = phase_estimation(computer=computer, ancilla=ancilla,
+                                oracle=benchmark_phase_oracle)
+        return _launcher(flow, memory, engine)
+    return setup
+
+
+def validation_flow_gates(noq):
+    """ Number of gates in the flow of validation cases """
+    return VALIDATION_FLOW_LAYERS * (2*noq - 1)
+
+
+def _setup_validation(engine, level):
+    """ Layers of Hadamard gates and a ladder of CNOT at a level
+
+    A layer has Hadamard on every qubit, then Flip on qubit
+    `k + 1` controlled by qubit `k`. Flow is built in setup; only
+    its launch is timed.
+    """
+    def setup(noq):
+        register = QubitRegister(state=ComputationalBasis(bitstring='0'*noq),
+                                 label='COMPUTER')
+        memory = QubitMemory(register=[register])
+        operations = []
+        for _ in range(0, VALIDATION_FLOW_LAYERS):
+            for index in range(0, noq):
+                operations.append(GOfID({
+                    'gate': {'alias': 'Hadamard'},
+                    'target': {'register': 'COMPUTER', 'local_index': index}
+                }))
+            for index in range(0, noq - 1):
+                operations.append(GOfID({
+                    'gate': {'alias': 'Flip'},
+                    'target': {'register': 'COMPUTER',
+                               'local_index': index + 1},
+                    'control': {'list': [{'register': 'COMPUTER',
+                                          'local_index': index,
+                                          'state': '1'}]}
+                }))
+        flow = QuantumFlow(operation=operations)
+        launch = _launcher(flow, memory, engine)
+        def run():
+            with validation_level(level):
+                launch()
+        return run
+    return setup
+
+
+def _setup_partial_trace(noq):
+    """ Trace out the second half of qubits """
+    density_matrix = QubitDensityMatrix(state=_random_state(noq))
+    bound = [noq // 2, noq - 1]
+    return lambda: partial_trace_out_index_range(density_matrix, bound)
+
+
+def _setup_projective_all(noq):
+    """ Probabilities of all computational basis states """
+    state = _random_state(noq)
+    return lambda: projective_all(state)
+
+
+def benchmark_cases(engine=STATEVECTOR_ENGINE):
+    """ All benchmark cases
+
+    ARGUMENTS
+
+    `engine` (`str`) : gate engine used by flow cases
+
+    RETURN
+
+    A list of `BenchmarkCase`.
+    """
+    return [
+        BenchmarkCase('enlarge_single_qubit_matrix', _setup_enlarge(False),
+                      min_qubits=1, max_qubits=11),
+        BenchmarkCase('enlarge_single_qubit_matrix_sparse',
+                      _setup_enlarge(True), min_qubits=1, max_qubits=14,
+                      requires_scipy=True),
+        BenchmarkCase('kernel', _setup_kernel(False),
+                      min_qubits=2, max_qubits=11),
+        BenchmarkCase('kernel_sparse', _setup_kernel(True),
+                      min_qubits=2, max_qubits=14, requires_scipy=True),
+        BenchmarkCase('qft_flow', _setup_qft(engine),
+                      min_qubits=1, max_qubits=14),
+        BenchmarkCase('grover_flow', _setup_grover(engine),
+                      min_qubits=3, max_qubits=12),
+        BenchmarkCase('phase_estimation_flow',
+                      _setup_phase_estimation(engine),
+                      min_qubits=2, max_qubits=14),
+        BenchmarkCase('partial_trace_out_index_range', _setup_partial_trace,
+                      min_qubits=2, max_qubits=10),
+        BenchmarkCase('projective_all', _setup_projective_all,
+                      min_qubits=1, max_qubits=14),
+    ] + [
+        BenchmarkCase('gate_flow_validation_' + level,
+                      _setup_validation(engine, level),
+                      min_qubits=1, max_qubits=12)
+        for level in VALIDATION_LEVELS
+    ]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+benchmark.compare.py
+
+PATH
+
+[app_root]/benchmark/compare.py
+
+INTRO
+
+Comparison of two benchmark results.
+
+Records of baseline and current results are matched by case and
+number of qubits. A record is a regression if its current time,
+or its current peak memory, exceeds the baseline by more than
+the threshold, e.g. 0.2 for 20 per cent; it is an improvement
+if it falls below the baseline by more than the threshold.
+
+Very short runs are dominated by noise. Times under `min_time`
+in both results are therefore never flagged.
+
+CONTENT
+
+`compare_results(baseline, current, ...)` - Compares two results
+
+`regressions(comparison)` - Returns regressed records
+
+`format_comparison(comparison)` - Returns comparison as a table
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from .base import BenchmarkError
+
+_MODULE_LOCATION_ = 'benchmark.compare'
+
+# status of a compared record
+REGRESSION = 'regression'
+IMPROVEMENT = 'improvement'
+UNCHANGED = 'unchanged'
+
+# time metrics of a record
+TIME_METRICS = ('min', 'median', 'mean')
+
+
+def _ratio(baseline, current):
+    """ Ratio of current to baseline, `None` if undefined """
+    if baseline is None or current is None or baseline <= 0:
+        return None
+    return current / baseline
+
+
+def _status(ratio, threshold):
+    if ratio is None:
+        return UNCHANGED
+    if ratio > 1.0 + threshold:
+        return REGRESSION
+    if ratio < 1.0 - threshold:
+        return IMPROVEMENT
+    return UNCHANGED
+
+
+def compare_results(baseline=None, current=None, threshold=0.2,
+                    metric='median', min_time=1.0e-4):
+    """ Compare two benchmark results
+
+    ARGUMENTS
+
+    `baseline`, `current` (`dict`) : results returned by
+    `run_benchmarks` or `load_results`
+
+    `threshold` (`float`) : relative change beyond which a record
+    is flagged
+
+    `metric` (`str`) : time metric compared; 'min', 'median' or
+    'mean'
+
+    `min_time` (`float`) : times below it, in seconds, are not
+    flagged
+
+    RETURN
+
+    A list of dictionaries, one per record present in both results,
+    with keys `case`, `noq`, `baseline_time`, `current_time`,
+    `time_ratio`, `baseline_peak_bytes`, `current_peak_bytes`,
+    `memory_ratio` and `status`.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.compare_results'
+    if metric not in TIME_METRICS:
+        raise BenchmarkError("Time metric '{}' ".format(metric) +\
+                "is not supported. Choose from {}.".format(TIME_METRICS),
+                location=_ERROR_LOCATION_)
+    if not isinstance(threshold, (int, float)) or threshold < 0:
+        raise BenchmarkError("Threshold must be a non-negative number.",
+                             location=_ERROR_LOCATION_)
+    baseline_records = {(rec['case'], rec['noq']): rec
+                        for rec in baseline['results']}
+    comparison = []
+    for rec in current['results']:
+        base = baseline_records.get((rec['case'], rec['noq']), None)
+        if base is None:
+            continue
+        time_ratio = _ratio(base[metric], rec[metric])
+        if max(base[metric], rec[metric]) < min_time:
+            time_status = UNCHANGED
+        else:
+            time_status = _status(time_ratio, threshold)
+        memory_ratio = _ratio(base.get('peak_bytes', None),
+                              rec.get('peak_bytes', None))
+        memory_status = _status(memory_ratio, threshold)
+        if REGRESSION in (time_status, memory_status):
+            status = REGRESSION
+        elif IMPROVEMENT in (time_status, memory_status):
+            status = IMPROVEMENT
+        else:
+            status = UNCHANGED
+        comparison.append({
+            'case': rec['case'],
+            'noq': rec['noq'],
+            'baseline_time': base[metric],
+            'current_time': rec[metric],
+            'time_ratio': time_ratio,
+            'baseline_peak_bytes': base.get('peak_bytes', None),
+            'current_peak_bytes': rec.get('peak_bytes', None),
+            'memory_ratio': memory_ratio,
+            'status': status
+        })
+    return comparison
+
+
+def regressions(comparison=None):
+    """ Regressed records of a comparison """
+    return [rec for rec in comparison if rec['status'] == REGRESSION]
+
+
+def format_comparison(comparison=None):
+    """ Comparison as a plain-text table """
+    def ratio_text(ratio):
+        return '-' if ratio is None else '{:.2f}'.format(ratio)
+    lines = ['{:<36} {:>3} {:>12} {:>12} {:>7} {:>7}  {}'.format(
+        'case', 'n', 'baseline(s)', 'current(s)', 'time', 'memory',
+        'status')]
+    for rec in comparison:
+        lines.append('{:<36} {:>3} {:>12.6f} {:>12.6f} {:>7} {:>7}  {}'.format(
+            rec['case'], rec['noq'], rec['baseline_time'],
+            rec['current_time'], ratio_text(rec['time_ratio']),
+            ratio_text(rec['memory_ratio']), rec['status']))
+    return '\n'.join(lines)
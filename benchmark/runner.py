@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+benchmark.runner.py
+
+PATH
+
+[app_root]/benchmark/runner.py
+
+INTRO
+
+Benchmark runner.
+
+Each case is run for every supported number of qubits in the
+requested range. Wall time of a run is measured by
+`time.perf_counter`; `repeat` runs are timed and their minimum,
+median and mean recorded. Peak memory allocated during one
+extra run is measured by `tracemalloc`, which slows the run
+down and is therefore never timed.
+
+Operator matrix cache of gate decorator is cleared before every
+run, so that each run constructs its operator matrices from
+scratch and timings don't depend on the order of cases.
+
+Results are a JSON-serialisable dictionary with keys `metadata`,
+describing the environment, `settings` and `results`, a list of
+records, one per case and number of qubits.
+
+CONTENT
+
+`measure(setup, noq, repeat, memory)` - Times and memory-profiles
+one case for one number of qubits
+
+`environment_metadata()` - Returns environment metadata
+
+`run_benchmarks(...)` - Runs benchmark cases over a range of
+number of qubits
+
+`save_results(results, path)` - Writes results into a JSON file
+
+`load_results(path)` - Reads results from a JSON file
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from gate.decorator import OPERATOR_MATRIX_CACHE
+from quantum_memory.base_memory import STATEVECTOR_ENGINE
+
+from .base import BenchmarkError
+from .cases import benchmark_cases
+
+_MODULE_LOCATION_ = 'benchmark.runner'
+
+# default range of number of qubits, both inclusive
+DEFAULT_QUBIT_RANGE = (2, 14)
+
+# version of the results format
+RESULTS_FORMAT = 1
+
+
+def measure(setup=None, noq=None, repeat=3, memory=True):
+    """ Time and memory-profile a case
+
+    ARGUMENTS
+
+    `setup` (callable) : setup of a benchmark case
+
+    `noq` (`int`) : number of qubits
+
+    `repeat` (`int`) : number of timed runs
+
+    `memory` (`bool`) : if `True`, peak memory of an extra run
+    is measured
+
+    RETURN
+
+    A dictionary with keys `times`, `min`, `median` and `mean`,
+    in seconds, and `peak_bytes`, `None` if memory isn't measured.
+    """
+    if not isinstance(repeat, int) or repeat < 1:
+        raise BenchmarkError("Number of repeats must be a positive " +\
+                "integer.", location=_MODULE_LOCATION_+'.measure')
+    times = []
+    for _ in range(0, repeat):
+        run = setup(noq)
+        OPERATOR_MATRIX_CACHE.clear()
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    peak_bytes = None
+    if memory:
+        run = setup(noq)
+        OPERATOR_MATRIX_CACHE.clear()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'peak_bytes': peak_bytes
+    }
+
+
+def _git_commit():
+    """ Commit hash of the source tree, `None` if unavailable """
+    app_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        output = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=app_root,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if output.returncode != 0:
+        return None
+    return output.stdout.strip()
+
+
+def environment_metadata():
+    """ Environment metadata
+
+    Records interpreter, platform, processor count, versions of
+    numpy and scipy (`None` if absent), commit of the source tree
+    and time of the run in UTC.
+    """
+    try:
+        import scipy
+        scipy_version = scipy.__version__
+    except ImportError:
+        scipy_version = None
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'scipy': scipy_version,
+        'git_commit': _git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat()
+    }
+
+
+def run_benchmarks(names=None, qubit_range=DEFAULT_QUBIT_RANGE, repeat=3,
+                   memory=True, engine=STATEVECTOR_ENGINE, cases=None,
+                   verbose=False):
+    """ Run benchmark cases
+
+    ARGUMENTS
+
+    `names` (`list`) : optional; names of cases to run; if `None`,
+    all available cases are run
+
+    `qubit_range` (`tuple`) : minimum and maximum number of qubits,
+    both inclusive; each case is only run within its own range
+
+    `repeat` (`int`) : number of timed runs
+
+    `memory` (`bool`) : if `True`, peak memory is measured
+
+    `engine` (`str`) : gate engine used by flow cases
+
+    `cases` (`list`) : optional; benchmark cases to choose from;
+    if `None`, cases of `benchmark_cases(engine)`
+
+    `verbose` (`bool`) : if `True`, prints a line per record
+
+    RETURN
+
+    A dictionary with keys `metadata`, `settings` and `results`.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.run_benchmarks'
+    if len(qubit_range) != 2 or qubit_range[0] > qubit_range[1] \
+            or qubit_range[0] < 1:
+        raise BenchmarkError("Qubit range must be a pair of positive " +\
+                "integers in ascending order.", location=_ERROR_LOCATION_)
+    if cases is None:
+        cases = benchmark_cases(engine=engine)
+    if names is not None:
+        known = [case.name for case in cases]
+        for name in names:
+            if name not in known:
+                raise BenchmarkError("Benchmark case '{}' ".format(name) +\
+                        "doesn't exist. Choose from {}.".format(known),
+                        location=_ERROR_LOCATION_)
+        cases = [case for case in cases if case.name in names]
+    records = []
+    for case in cases:
+        if not case.is_available:
+            continue
+        for noq in range(qubit_range[0], qubit_range[1] + 1):
+            if not case.supports(noq):
+                continue
+            record = {'case': case.name, 'noq': noq}
+            record.update(measure(setup=case.setup, noq=noq,
+                                  repeat=repeat, memory=memory))
+            records.append(record)
+            if verbose:
+                print("{:<36} n={:<3} median {:.6f} s  peak {} B".format(
+                    case.name, noq, record['median'], record['peak_bytes']))
+    return {
+        'format': RESULTS_FORMAT,
+        'metadata': environment_metadata(),
+        'settings': {
+            'qubit_range': list(qubit_range),
+            'repeat': repeat,
+            'memory': memory,
+            'engine': engine
+        },
+        'results': records
+    }
+
+
+def save_results(results=None, path=None):
+    """ Write results into a JSON file """
+    with open(path, 'w') as json_file:
+        json.dump(results, json_file, indent=2)
+
+
+def load_results(path=None):
+    """ Read results from a JSON file """
+    with open(path, 'r') as json_file:
+        results = json.load(json_file)
+    if not isinstance(results, dict) or 'results' not in results:
+        raise BenchmarkError("File {} doesn't contain ".format(path) +\
+                "benchmark results.", location=_MODULE_LOCATION_+'.load_results')
+    return results
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    benchmark.compare.py
+
+Main test
+    Records slower or larger than baseline beyond threshold
+    are flagged as regressions.
+
+Updated
+    17 October 2026
+"""
+import unittest
+
+from benchmark.base import BenchmarkError
+from benchmark.compare import compare_results, regressions, \
+    format_comparison, REGRESSION, IMPROVEMENT, UNCHANGED
+
+
+def results(records):
+    return {'results': [
+        {'case': case, 'noq': noq, 'min': time, 'median': time,
+         'mean': time, 'peak_bytes': peak}
+        for case, noq, time, peak in records]}
+
+
+BASELINE = results([
+    ('qft_flow', 4, 0.010, 1000),
+    ('qft_flow', 5, 0.020, 2000),
+    ('kernel', 4, 0.010, 1000),
+    ('kernel', 5, 0.020, 2000),
+])
+
+
+class Test_Compare(unittest.TestCase):
+    def test_status(self):
+        current = results([
+            ('qft_flow', 4, 0.011, 1000),
+            ('qft_flow', 5, 0.030, 2000),
+            ('kernel', 4, 0.005, 1000),
+            ('kernel', 5, 0.020, 4000),
+            ('kernel', 6, 0.040, 8000),
+        ])
+        comparison = compare_results(BASELINE, current, threshold=0.2)
+        status = {(rec['case'], rec['noq']): rec['status']
+                  for rec in comparison}
+        self.assertEqual(status, {
+            ('qft_flow', 4): UNCHANGED,
+            ('qft_flow', 5): REGRESSION,
+            ('kernel', 4): IMPROVEMENT,
+            # memory regression
+            ('kernel', 5): REGRESSION,
+        })
+        self.assertEqual(len(regressions(comparison)), 2)
+        self.assertTrue('regression' in format_comparison(comparison))
+
+    def test_noise(self):
+        baseline = results([('kernel', 2, 1.0e-6, None)])
+        current = results([('kernel', 2, 5.0e-6, None)])
+        comparison = compare_results(baseline, current)
+        self.assertEqual(comparison[0]['status'], UNCHANGED)
+        self.assertTrue(comparison[0]['memory_ratio'] is None)
+
+    def test_wrong_metric(self):
+        with self.assertRaises(BenchmarkError):
+            compare_results(BASELINE, BASELINE, metric='max')
+
+
+if __name__ == '__main__':
+    unittest.main()
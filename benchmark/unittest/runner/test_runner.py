@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    benchmark.runner.py
+
+Main test
+    All benchmark cases run on small numbers of qubits and
+    results survive a round trip through JSON.
+
+Updated
+    17 October 2026
+"""
+import os
+import tempfile
+import unittest
+
+from benchmark.base import BenchmarkError
+from benchmark.cases import benchmark_cases, validation_flow_gates
+from common.validator import VALIDATION_LEVELS, get_validation_level
+from benchmark.runner import measure, run_benchmarks, save_results, \
+    load_results
+
+
+class Test_Measure(unittest.TestCase):
+    def test_okay(self):
+        ret = measure(setup=lambda noq: (lambda: [0] * 2**noq), noq=4,
+                      repeat=2)
+        self.assertEqual(len(ret['times']), 2)
+        self.assertTrue(ret['min'] <= ret['median'])
+        self.assertTrue(ret['peak_bytes'] > 0)
+
+    def test_no_memory(self):
+        ret = measure(setup=lambda noq: (lambda: None), noq=1, repeat=1,
+                      memory=False)
+        self.assertTrue(ret['peak_bytes'] is None)
+
+    def test_wrong_repeat(self):
+        with self.assertRaises(BenchmarkError):
+            measure(setup=lambda noq: (lambda: None), noq=1, repeat=0)
+
+
+class Test_Run_Benchmarks(unittest.TestCase):
+    def test_all_cases(self):
+        results = run_benchmarks(qubit_range=(2, 3), repeat=1)
+        names = {rec['case'] for rec in results['results']}
+        available = {case.name for case in benchmark_cases()
+                     if case.is_available}
+        self.assertEqual(names, available)
+        for rec in results['results']:
+            self.assertTrue(rec['noq'] in (2, 3))
+        self.assertTrue('numpy' in results['metadata'])
+        self.assertEqual(results['settings']['qubit_range'], [2, 3])
+
+    def test_case_range(self):
+        # Grover requires at least 3 qubits
+        results = run_benchmarks(names=['grover_flow'], qubit_range=(2, 3),
+                                 repeat=1, memory=False)
+        self.assertEqual([rec['noq'] for rec in results['results']], [3])
+
+    def test_validation_cases(self):
+        names = ['gate_flow_validation_' + level
+                 for level in VALIDATION_LEVELS]
+        previous = get_validation_level()
+        results = run_benchmarks(names=names, qubit_range=(2, 2),
+                                 repeat=1, memory=False)
+        self.assertEqual([rec['case'] for rec in results['results']], names)
+        # level is restored after each run
+        self.assertEqual(get_validation_level(), previous)
+        self.assertEqual(validation_flow_gates(2), 24)
+
+    def test_unknown_case(self):
+        with self.assertRaises(BenchmarkError):
+            run_benchmarks(names=['no_such_case'], qubit_range=(2, 2))
+
+    def test_wrong_range(self):
+        with self.assertRaises(BenchmarkError):
+            run_benchmarks(qubit_range=(4, 2))
+
+    def test_json(self):
+        results = run_benchmarks(names=['qft_flow'], qubit_range=(2, 2),
+                                 repeat=1)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'results.json')
+            save_results(results, path)
+            self.assertEqual(load_results(path), results)
+
+
+if __name__ == '__main__':
+    unittest.main()
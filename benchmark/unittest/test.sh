@@ -0,0 +1,23 @@
+#!/bin/sh
+
+echo "*****************"
+echo "* Pacakge       *"
+echo "*     Benchmark *"
+echo "*****************"
+
+# Runner
+echo "=========="
+echo "| Runner |"
+echo "=========="
+echo "--- --- Cases on small numbers of qubits --- ---"
+python3 -m unittest benchmark/unittest/runner/test_runner.py
+
+# Comparison
+echo "=============="
+echo "| Comparison |"
+echo "=============="
+echo "--- --- Regression flags --- ---"
+python3 -m unittest benchmark/unittest/compare/test_compare.py
+
+echo "*****************"
+echo "*****************"
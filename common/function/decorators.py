@@ -42,19 +42,101 @@ original signature does not have to be declared in
 the argument type. This improves re-usability of a
 function.
 
+Arguments are verified according to the application-wide
+validation level and the class attribute `validation_scope`
+of the decorator. (See `common.validator.level`.) Otherwise,
+the original function is invoked directly.
+
+Declared arguments are compiled into checks at decoration
+time, so that an invocation only runs an `isinstance` per
+declared argument, and verifiers if the class doesn't match.
+Time spent checking is counted per decorated function.
+
 CONTENT
 
+`ArgumentCheckCounter` - Counter of argument checking
+
+`argument_check_statistics()` - Returns time spent checking
+arguments of decorated functions
+
+`reset_argument_check_statistics()` - Resets all counters
+
+`VerifierFunctionDecorator` - Verifier function decorator
+
+`FunctionInvocationDecorator` - Function invocation decorator
+
 LOG
 
-Updated on 06 October 2021 | Created on 27 September 2020
+Updated on 17 October 2026 | Created on 27 September 2020
 """
 from inspect import isclass as inspect_isclass
+from time import perf_counter
+
+from common.validator.level import BOUNDARY_SCOPE, is_scope_validated
 
 from .signature import function_signature
 from .errors import VerifierFunctionDecoratorError, \
     FunctionInvocationDecoratorError
 
 
+# counters of all decorated functions
+_ARGUMENT_CHECK_COUNTERS = []
+
+
+class ArgumentCheckCounter:
+    """ Counter of argument checking
+
+    One counter is attached to each function decorated by a
+    function invocation decorator, as its attribute
+    `argument_check_counter`.
+
+    ATTRIBUTES
+
+    `self.name` (`str`) : qualified name of original function
+
+    `self.calls` (`int`) : number of checked invocations
+
+    `self.seconds` (`float`) : time spent checking arguments
+
+    `self.reset()` : resets counters
+    """
+    def __init__(self, name=None):
+        """ Argument Check Counter :: Initialiser """
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+
+    def reset(self):
+        """ Argument Check Counter :: Reset counters """
+        self.calls = 0
+        self.seconds = 0.0
+
+
+def argument_check_statistics():
+    """ Time spent checking arguments of decorated functions
+
+    RETURN
+
+    A dictionary with keys `calls` and `seconds`, totals over all
+    decorated functions, and `functions`, a dictionary of the same
+    keys by qualified name of functions invoked at least once.
+    """
+    functions = {counter.name: {'calls': counter.calls,
+                                'seconds': counter.seconds}
+                 for counter in _ARGUMENT_CHECK_COUNTERS if counter.calls}
+    return {
+        'calls': sum(item['calls'] for item in functions.values()),
+        'seconds': sum(item['seconds'] for item in functions.values()),
+        'functions': functions
+    }
+
+
+def reset_argument_check_statistics():
+    """ Reset counters of all decorated functions """
+    for counter in _ARGUMENT_CHECK_COUNTERS:
+        counter.reset()
+
+
 class VerifierFunctionDecorator:
     """ Verifier fucntion decorator
 
@@ -101,7 +183,14 @@ class FunctionInvocationDecorator:
     `argument_type` : a dict with function argument
     names as keys, corresponding type (class)/verifier
     function as value
+
+    ATTRIBUTES
+
+    `cls.validation_scope` (`str`) : scope of argument
+    verification; `BOUNDARY_SCOPE` by default
     """
+    validation_scope = BOUNDARY_SCOPE
+
     def __new__(cls, *args, **kwargs):
         """ Function Invocation Decorator :: new
 
@@ -167,91 +256,86 @@ class FunctionInvocationDecorator:
                         "in decorator is not an argument of the "  +\
                         "original function.")
 
-    def _verify_against_single_type(self, argtype, argvalue):
-        """ Function Invocation Decorator :: Single type declared """
-        ret = False
-        if isinstance(argtype, VerifierFunctionDecorator):
-            if argtype(argvalue):
-                ret = True
-        # type is a class
-        else:
-            if isinstance(argvalue, argtype):
-                ret= True
-        return ret
+    def _compile_declared_type(self, declared_type):
+        """ Function Invocation Decorator :: Compile declared type
 
-    def _verify_against_type_tuple(self, argtype_tuple, argvalue):
-        """ Function Invocation Decorator :: Types declared in tuple """
-        ret = False
-        for argtype in argtype_tuple:
-            # if one fits, it is true
-            if self._verify_against_single_type(argtype, argvalue):
-                ret = True
-        return ret
-
-    def _verify_argument_value(self, argname, argvalue):
-        """ Function Invocation Decorator :: Verify positional args """
-        ret = False
-        if isinstance(self._argument_type[argname], tuple):
-            ret = self._verify_against_type_tuple(
-                    self._argument_type[argname], argvalue)
-        else:
-            # type is a verifier
-            ret = self._verify_against_single_type(
-                    self._argument_type[argname], argvalue)
-        return ret
+        Splits a declared type, or a tuple of them, into a tuple
+        of classes, checked by a single `isinstance`, and a tuple
+        of verifier functions.
+        """
+        if not isinstance(declared_type, tuple):
+            declared_type = (declared_type,)
+        classes = tuple(item for item in declared_type
+                        if not isinstance(item, VerifierFunctionDecorator))
+        verifiers = tuple(item for item in declared_type
+                          if isinstance(item, VerifierFunctionDecorator))
+        return classes, verifiers
 
     def __call__(self, original_function):
+        """ Function Invocation Decorator :: Decorate
+
+        Checks of declared arguments are compiled here, once per
+        original function: positional index or keyword of each
+        declared argument is mapped to its classes and verifiers.
+        """
         # signature dict has two keys 'args' and 'kwargs'
         sigdict = function_signature(original_function)
         self._validate_declaration(sigdict)
+        number_of_args = len(sigdict['args'])
+        positional_checks = tuple(
+                (idx, argname) + self._compile_declared_type(
+                    self._argument_type[argname])
+                for idx, argname in enumerate(sigdict['args'])
+                if argname in self._argument_type)
+        keyword_checks = tuple(
+                (argname,) + self._compile_declared_type(
+                    self._argument_type[argname])
+                for argname in sigdict['kwargs']
+                if argname in self._argument_type)
+        keywords = frozenset(sigdict['kwargs'])
+        counter = ArgumentCheckCounter(name=original_function.__module__ +\
+                '.' + original_function.__qualname__)
+        _ARGUMENT_CHECK_COUNTERS.append(counter)
 
         def function_parameter_acceptor(*args, **kwargs):
-            """ Invocation parameters are passed in here """
+            """ Invocation parameters are passed in here
+
+            Positional arguments beyond the original signature and
+            keyword arguments not in it are dropped; defaults are
+            filled by the original function.
+            """
+            if not is_scope_validated(self.validation_scope):
+                return original_function(*args, **kwargs)
+            start = perf_counter()
             error_message = None
-            invocargs = ()
-            invockwargs = {}
-            # prepare invocation positional arguments
-            for idx, argname in enumerate(sigdict['args']):
-                # if type is declared
-                if argname in self._argument_type.keys():
-                    if self._verify_argument_value(argname, args[idx]):
-                        invocargs = invocargs + (args[idx],)
-                    else:
-                        error_message = "Argument '{}' ".format(argname)  +\
-                                "value either failed verification or is " +\
-                                "not the required type."
-                # if type not declared, just take it
-                else:
-                    invocargs = invocargs + (args[idx],)
-            # prepare invocation kwargs
-            # signature carries the default value.
-            for argname, argdefault in sigdict['kwargs'].items():
-                # arg is declared
-                if argname in self._argument_type.keys():
-                    # arg also provided by caller
-                    if argname in kwargs.keys():
-                        if self._verify_argument_value(argname, kwargs[argname]):
-                            invockwargs[argname] = kwargs[argname]
-                        else:
-                            # raise error
-                            error_message = "Argument '{}' ".format(argname) +\
-                                    "is not of the required type " +\
-                                    "{}".format(self._argument_type[argname])
-                    # if not provided by caller, use default
-                    else:
-                        invockwargs[argname] = argdefault
-                # if type not declared, just take it
-                else:
-                    # if value is provided in kwargs
-                    if argname in kwargs.keys():
-                        invockwargs[argname] = kwargs[argname]
-                    # if not, use default.
-                    else:
-                        invockwargs[argname] = argdefault
+            for idx, argname, classes, verifiers in positional_checks:
+                argvalue = args[idx]
+                if not isinstance(argvalue, classes) and not any(
+                        verifier(argvalue) for verifier in verifiers):
+                    error_message = "Argument '{}' ".format(argname)  +\
+                            "value either failed verification or is " +\
+                            "not the required type."
+            for argname, classes, verifiers in keyword_checks:
+                if argname in kwargs:
+                    argvalue = kwargs[argname]
+                    if not isinstance(argvalue, classes) and not any(
+                            verifier(argvalue) for verifier in verifiers):
+                        error_message = "Argument '{}' ".format(argname) +\
+                                "is not of the required type " +\
+                                "{}".format(self._argument_type[argname])
+            counter.calls += 1
+            counter.seconds += perf_counter() - start
             # raise error
             if error_message is not None:
                 raise self.error_class(error_message,
                         location='linear_space.linear_object.algebra.'+\
                                 original_function.__name__)
-            return original_function(*invocargs, **invockwargs)
+            if len(args) > number_of_args:
+                args = args[:number_of_args]
+            if not keywords.issuperset(kwargs):
+                kwargs = {argname: argvalue
+                          for argname, argvalue in kwargs.items()
+                          if argname in keywords}
+            return original_function(*args, **kwargs)
+        function_parameter_acceptor.argument_check_counter = counter
         return function_parameter_acceptor
@@ -17,9 +17,9 @@ CONTENT
 
 LOG
 
-Updated on 22 September 2021 | Created on 19 December 2020
+Updated on 17 October 2026 | Created on 19 December 2020
 """
-from common.validator import Base_Validator
+from common.validator import Base_Validator, INTERNAL_SCOPE
 from common.string import is_string, is_empty_string, has_space
 
 from .errors import SkipListValidationError
@@ -31,6 +31,7 @@ class SkipListValidator(Base_Validator):
     """ Validate function signature skiplist """
     error_class = SkipListValidationError
     error_location = _MODULE_LOCATION_ + '.SkipListValidator'
+    validation_scope = INTERNAL_SCOPE
 
     def __init__(self, skip_list=None):
         super().__init__()
@@ -20,6 +20,9 @@ echo "===================="
 echo "--- --- Validators in common module --- ---"
 python3 -m unittest common/unittest/test_validator.py
 
+echo "--- --- Validation level --- ---"
+python3 -m unittest common/unittest/test_validation_level.py
+
 
 # Parameter module
 echo "===================="
@@ -5,12 +5,16 @@ Module under test:
     common.function.decorator.py
 
 Updated
-    06 April 2021
+    17 October 2026
 """
 import unittest
+from common.exception.errors import Validation_Error
+from common.validator import FULL_VALIDATION, NO_VALIDATION, \
+    validation_level
 from common.function.errors import VerifierFunctionDecoratorError
 from common.function.decorators import VerifierFunctionDecorator, \
-    FunctionInvocationDecorator
+    FunctionInvocationDecorator, ArgumentCheckCounter, \
+    argument_check_statistics, reset_argument_check_statistics
 
 
 
@@ -65,3 +69,67 @@ class Test_Fully_Declared(unittest.TestCase):
     def test_okay(self):
         res = test_fully_declared(1,1)
         self.assertEqual(res, 2)
+
+
+class SampleError(Validation_Error):
+    header = 'DecoratorTest'
+
+
+class sample_decorator(FunctionInvocationDecorator):
+    error_class = SampleError
+
+
+@VerifierFunctionDecorator
+def is_even(value):
+    return isinstance(value, int) and value % 2 == 0
+
+
+@sample_decorator(argument_type={
+    'alpha': (float, is_even),
+    'gamma': str
+})
+def compiled_sample(alpha, beta, gamma='c'):
+    return (alpha, beta, gamma)
+
+
+class Test_Compiled_Checks(unittest.TestCase):
+    def setUp(self):
+        reset_argument_check_statistics()
+
+    def test_class_or_verifier(self):
+        with validation_level(FULL_VALIDATION):
+            self.assertEqual(compiled_sample(1.5, 0), (1.5, 0, 'c'))
+            self.assertEqual(compiled_sample(2, 0), (2, 0, 'c'))
+            self.assertRaises(SampleError, compiled_sample, 3, 0)
+
+    def test_keyword(self):
+        with validation_level(FULL_VALIDATION):
+            self.assertEqual(compiled_sample(2, 0, gamma='g'), (2, 0, 'g'))
+            self.assertRaises(SampleError, compiled_sample, 2, 0, gamma=1)
+
+    def test_dropped_arguments(self):
+        # arguments beyond the original signature are dropped
+        with validation_level(FULL_VALIDATION):
+            self.assertEqual(compiled_sample(2, 0, 'g', delta=1),
+                             (2, 0, 'c'))
+
+    def test_counter(self):
+        counter = compiled_sample.argument_check_counter
+        self.assertTrue(isinstance(counter, ArgumentCheckCounter))
+        self.assertTrue(counter.name.endswith('.compiled_sample'))
+        with validation_level(FULL_VALIDATION):
+            compiled_sample(2, 0)
+            compiled_sample(1.5, 0, gamma='g')
+        # unchecked invocation isn't counted
+        with validation_level(NO_VALIDATION):
+            compiled_sample(3, 0)
+        self.assertEqual(counter.calls, 2)
+        self.assertTrue(counter.seconds > 0.0)
+        statistics = argument_check_statistics()
+        self.assertEqual(statistics['functions'][counter.name]['calls'], 2)
+        self.assertTrue(statistics['calls'] >= 2)
+        self.assertTrue(statistics['seconds'] >= counter.seconds)
+        reset_argument_check_statistics()
+        self.assertEqual(counter.calls, 0)
+        self.assertEqual(counter.seconds, 0.0)
+        self.assertEqual(argument_check_statistics()['functions'], {})
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+Module under test:
+    common.validator.level.py
+    common.validator.base_validator.py
+    common.function.decorators.py
+
+Main test:
+    Validators and function invocation decorators are skipped
+    according to validation level and their scope; flows give
+    the same result at every level.
+
+Updated
+    17 October 2026
+"""
+import unittest
+
+import numpy as np
+
+from common.exception.errors import Validation_Error
+from common.validator import Base_Validator, FULL_VALIDATION, \
+    BOUNDARY_VALIDATION, NO_VALIDATION, VALIDATION_LEVELS, BOUNDARY_SCOPE, \
+    INTERNAL_SCOPE, set_validation_level, get_validation_level, \
+    validation_level, is_scope_validated
+from common.validator.errors import BaseValidatorError
+from common.function.decorators import FunctionInvocationDecorator
+from gate.enlarge_matrix.common import GenericGateMatrixEnlargeValidator
+from quantum_instruction.gate.validators import GateInstructionDictValidator
+from quantum_register import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_flow.makers.fourier import quantum_fourier_flow_on_register
+from qubit import ComputationalBasis
+
+
+class ErrorSample(Validation_Error):
+    header = 'ValidationLevelTest'
+
+
+class AlwaysValidator(Base_Validator):
+    """ Reports an error whenever it validates """
+    error_class = ErrorSample
+
+    def __init__(self):
+        super().__init__()
+        self.report_errors('Always invalid.')
+
+
+class BoundaryValidator(AlwaysValidator):
+    validation_scope = BOUNDARY_SCOPE
+
+
+class InternalValidator(AlwaysValidator):
+    validation_scope = INTERNAL_SCOPE
+
+
+class InternalChildValidator(InternalValidator):
+    """ Initialiser chained to a scoped parent """
+    def __init__(self):
+        super().__init__()
+        self.report_errors('Child invalid.')
+
+
+class sample_decorator(FunctionInvocationDecorator):
+    error_class = ErrorSample
+
+
+class internal_decorator(FunctionInvocationDecorator):
+    error_class = ErrorSample
+    validation_scope = INTERNAL_SCOPE
+
+
+@sample_decorator(argument_type={'number': int})
+def boundary_double(number):
+    return 2 * number
+
+
+@internal_decorator(argument_type={'number': int})
+def internal_double(number):
+    return 2 * number
+
+
+class Test_Level(unittest.TestCase):
+    def setUp(self):
+        self.level = get_validation_level()
+
+    def tearDown(self):
+        set_validation_level(self.level)
+
+    def test_set_level(self):
+        for level in VALIDATION_LEVELS:
+            set_validation_level(level)
+            self.assertEqual(get_validation_level(), level)
+
+    def test_unknown_level(self):
+        self.assertRaises(BaseValidatorError, set_validation_level, 'some')
+        self.assertEqual(get_validation_level(), self.level)
+
+    def test_context_manager(self):
+        set_validation_level(FULL_VALIDATION)
+        with validation_level(NO_VALIDATION):
+            self.assertEqual(get_validation_level(), NO_VALIDATION)
+        self.assertEqual(get_validation_level(), FULL_VALIDATION)
+        with self.assertRaises(ValueError):
+            with validation_level(BOUNDARY_VALIDATION):
+                raise ValueError('inside block')
+        self.assertEqual(get_validation_level(), FULL_VALIDATION)
+
+    def test_scopes(self):
+        expected = {
+            FULL_VALIDATION: (True, True, True),
+            BOUNDARY_VALIDATION: (True, True, False),
+            NO_VALIDATION: (True, False, False)
+        }
+        for level, validated in expected.items():
+            with validation_level(level):
+                self.assertEqual(tuple(is_scope_validated(scope) for scope
+                                       in (None, BOUNDARY_SCOPE,
+                                           INTERNAL_SCOPE)), validated)
+
+
+class Test_Validator(unittest.TestCase):
+    def test_full(self):
+        with validation_level(FULL_VALIDATION):
+            for validator_class in (AlwaysValidator, BoundaryValidator,
+                                    InternalValidator):
+                self.assertFalse(validator_class().is_valid)
+            self.assertEqual(len(InternalChildValidator().get_errors()), 2)
+
+    def test_boundary(self):
+        with validation_level(BOUNDARY_VALIDATION):
+            self.assertFalse(AlwaysValidator().is_valid)
+            self.assertFalse(BoundaryValidator().is_valid)
+            self.assertTrue(InternalValidator().is_valid)
+            self.assertEqual(InternalChildValidator().get_errors(), [])
+
+    def test_off(self):
+        with validation_level(NO_VALIDATION):
+            self.assertFalse(AlwaysValidator().is_valid)
+            self.assertTrue(BoundaryValidator().is_valid)
+            self.assertTrue(InternalValidator().is_valid)
+            validator = InternalValidator()
+            # skipped validator raises nothing
+            self.assertTrue(validator.raise_last_error() is None)
+
+    def test_application_validators(self):
+        with validation_level(BOUNDARY_VALIDATION):
+            self.assertFalse(
+                    GateInstructionDictValidator(instruc_dict={}).is_valid)
+            self.assertTrue(GenericGateMatrixEnlargeValidator(
+                    number_of_qubits=-1).is_valid)
+        with validation_level(FULL_VALIDATION):
+            self.assertFalse(GenericGateMatrixEnlargeValidator(
+                    number_of_qubits=-1).is_valid)
+
+
+class Test_Decorator(unittest.TestCase):
+    def test_full(self):
+        with validation_level(FULL_VALIDATION):
+            self.assertRaises(ErrorSample, boundary_double, 1.5)
+            self.assertRaises(ErrorSample, internal_double, 1.5)
+            self.assertEqual(internal_double(2), 4)
+
+    def test_boundary(self):
+        with validation_level(BOUNDARY_VALIDATION):
+            self.assertRaises(ErrorSample, boundary_double, 1.5)
+            self.assertEqual(internal_double(1.5), 3.0)
+
+    def test_off(self):
+        with validation_level(NO_VALIDATION):
+            self.assertEqual(boundary_double(1.5), 3.0)
+            self.assertEqual(internal_double(number=2), 4)
+
+
+class Test_Flow(unittest.TestCase):
+    def final_state(self, level):
+        register = QubitRegister(state=ComputationalBasis(bitstring='101'),
+                                 label='COMPUTER')
+        memory = QubitMemory(register=[register])
+        flow = quantum_fourier_flow_on_register(register)
+        with validation_level(level):
+            flow.launch_on_memory(memory)
+        return memory.get_global_state().as_vector().as_array()
+
+    def test_same_state(self):
+        expected = self.final_state(FULL_VALIDATION)
+        for level in (BOUNDARY_VALIDATION, NO_VALIDATION):
+            self.assertTrue(np.allclose(self.final_state(level), expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
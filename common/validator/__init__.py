@@ -15,8 +15,15 @@ Application-wide base validator must not be instantiated.
 Any validator used in this application must subclass from
 this base validator
 
+Application-wide validation level decides which validators
+run: 'full', 'boundary' or 'off'.
+
 LOG
 
-Updated on 30 September 2021 | Created on 22 September 2021
+Updated on 17 October 2026 | Created on 22 September 2021
 """
 from .base_validator import Base_Validator
+from .level import FULL_VALIDATION, BOUNDARY_VALIDATION, NO_VALIDATION, \
+    VALIDATION_LEVELS, BOUNDARY_SCOPE, INTERNAL_SCOPE, \
+    set_validation_level, get_validation_level, validation_level, \
+    is_scope_validated
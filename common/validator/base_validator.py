@@ -17,6 +17,10 @@ INTRO
 
 Application-wide base validator.
 
+Validation of a subclass is skipped according to the
+application-wide validation level and the class attribute
+`validation_scope` of the subclass. (See `level.py`.)
+
 WARNING
 
 This base class is NOT to be instantiated. To make
@@ -25,14 +29,31 @@ an instantiable validator a subclass must have a
 
 LOG
 
-Updated on 30 September 2021 | Created on 29 June 2020
+Updated on 17 October 2026 | Created on 29 June 2020
 """
+from functools import wraps
+
 from common.exception.base import Base_Error
 from .errors import BaseValidatorError
+from .level import is_scope_validated
 
 _MODULE_LOCATION_ = 'common.validator.base_validator'
 
 
+def _scoped_initialiser(initialiser):
+    """ Validator initialiser skipped out of validation level
+
+    A skipped validator only has an empty error container.
+    """
+    @wraps(initialiser)
+    def scoped_initialiser(self, *args, **kwargs):
+        if is_scope_validated(self.validation_scope):
+            initialiser(self, *args, **kwargs)
+        else:
+            self._errors = []
+    return scoped_initialiser
+
+
 class Base_Validator:
     """ Base validator
 
@@ -58,6 +79,11 @@ class Base_Validator:
     be implemented by subclass as class attribute; it
     must be a subclass of `Base_Error`
 
+    `cls.validation_scope` (`str`) : optional; `BOUNDARY_SCOPE`
+    or `INTERNAL_SCOPE`; if not validated at the current level,
+    initialiser of subclass is skipped and validator is valid;
+    `None` for validators always validated
+
     `self._errors` (`list`) : a list acting as an error
     container; error instances are appended to it; most
     important error container
@@ -86,6 +112,18 @@ class Base_Validator:
 
     `self.as_error()` : return `self.stringigy()`
     """
+    validation_scope = None
+
+    def __init_subclass__(cls, **kwargs):
+        """ Base_Validator :: init subclass
+
+        Initialiser of subclass validates at instantiation;
+        it is wrapped to be skipped out of validation level.
+        """
+        super().__init_subclass__(**kwargs)
+        if '__init__' in cls.__dict__:
+            cls.__init__ = _scoped_initialiser(cls.__dict__['__init__'])
+
     def __new__(cls, *args, **kwargs):
         """ Base_Validator :: new
 
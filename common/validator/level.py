@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+common.validator.level.py
+
+PATH
+
+[app_root]/common/validator/level.py
+
+INTRO
+
+Application-wide validation level.
+
+Three levels are available.
+
+[1] 'full' - Default. Every validator runs; test runs keep this
+level for exhaustive checks.
+
+[2] 'boundary' - Only validators at the public boundary run,
+i.e. those validating user input such as instruction dicts,
+registers of a memory or arrays of linear objects. Internal
+validators, re-checking data on every gate, e.g. an operation
+against its memory or a matrix enlargement, are skipped.
+
+[3] 'off' - Neither boundary nor internal validators run.
+
+Scope of a validator is declared by its class attribute
+`validation_scope`: `BOUNDARY_SCOPE`, `INTERNAL_SCOPE` or `None`.
+A validator whose validated data is consumed by its caller has
+no scope, since it converts data as well, and always runs.
+
+Level is set by `set_validation_level(level)`, temporarily by
+the context manager `validation_level(level)`, or by setting
+the environment variable `PAUL_VALIDATION_LEVEL` before import.
+
+CONTENT
+
+`FULL_VALIDATION`, `BOUNDARY_VALIDATION`, `NO_VALIDATION` - Levels
+
+`BOUNDARY_SCOPE`, `INTERNAL_SCOPE` - Scopes of validators
+
+`set_validation_level(level)` - Sets validation level
+
+`get_validation_level()` - Returns validation level
+
+`validation_level(level)` - Context manager of validation level
+
+`is_scope_validated(scope)` - Checks if a scope is validated at
+the current level
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import os
+from contextlib import contextmanager
+
+from .errors import BaseValidatorError
+
+_MODULE_LOCATION_ = 'common.validator.level'
+
+# validation levels
+FULL_VALIDATION = 'full'
+BOUNDARY_VALIDATION = 'boundary'
+NO_VALIDATION = 'off'
+VALIDATION_LEVELS = (FULL_VALIDATION, BOUNDARY_VALIDATION, NO_VALIDATION)
+
+# validation scopes
+BOUNDARY_SCOPE = 'boundary'
+INTERNAL_SCOPE = 'internal'
+
+# scopes validated at each level
+_VALIDATED_SCOPES = {
+    FULL_VALIDATION: (None, BOUNDARY_SCOPE, INTERNAL_SCOPE),
+    BOUNDARY_VALIDATION: (None, BOUNDARY_SCOPE),
+    NO_VALIDATION: (None,)
+}
+
+
+def _verified_level(level, location):
+    if level not in VALIDATION_LEVELS:
+        raise BaseValidatorError("Validation level " +\
+                "'{}' is not supported. ".format(level) +\
+                "Choose from {}.".format(VALIDATION_LEVELS),
+                location=location)
+    return level
+
+
+_VALIDATION_LEVEL = {
+    'level': _verified_level(
+        os.environ.get('PAUL_VALIDATION_LEVEL', FULL_VALIDATION),
+        _MODULE_LOCATION_)
+}
+
+
+def set_validation_level(level=FULL_VALIDATION):
+    """ Set application-wide validation level """
+    _VALIDATION_LEVEL['level'] = _verified_level(level,
+            _MODULE_LOCATION_+'.set_validation_level')
+
+
+def get_validation_level():
+    """ Return application-wide validation level """
+    return _VALIDATION_LEVEL['level']
+
+
+@contextmanager
+def validation_level(level=FULL_VALIDATION):
+    """ Validation level inside a `with` block
+
+    Previous level is restored on exit, even if an error is raised.
+    """
+    previous = get_validation_level()
+    set_validation_level(level)
+    try:
+        yield
+    finally:
+        _VALIDATION_LEVEL['level'] = previous
+
+
+def is_scope_validated(scope=None):
+    """ Verify if validators of a scope run at the current level """
+    return scope in _VALIDATED_SCOPES[_VALIDATION_LEVEL['level']]
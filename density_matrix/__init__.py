@@ -15,6 +15,9 @@ Density matrix and related objects.
 
 LOG
 
-Updated on 13 October 2021 | Created on 23 February 2021
+Updated on 17 October 2026 | Created on 23 February 2021
 """
 from .density_matrix import DensityMatrix, QubitDensityMatrix
+from .factored import FactoredDensityMatrix
+from .evolution import evolve_density_matrix, apply_unitary, \
+    permute_density_matrix
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+density_matrix.evolution.py
+
+PATH
+
+[app_root]/density_matrix/evolution.py
+
+INTRO
+
+Evolution of density matrices by local contractions.
+
+A density matrix of `n` qubits, of shape `(2^n, 2^n)`, is viewed
+as a batch of `2^n` column vectors; a matrix `K` on the target
+qubits is applied on its row axes, giving `K rho`, and then again
+on the row axes of `(K rho)^dagger`, which gives `K rho K^dagger`
+after conjugate transpose. (See `gate.statevector.apply_matrix_on_qubits`.)
+Each matrix thus costs `O(4^n)`; no matrix of the whole memory is
+formed.
+
+A density matrix in factor form `F F^dagger` is transformed by
+applying each `K` on the columns of the factor; the factors `K F`
+are stacked side by side, at a cost of `O(2^n r)` per matrix for
+rank `r`, and recompressed should the rank exceed the dimension.
+
+A sum over several matrices `K_i rho K_i^dagger` is a channel in
+Kraus form (see package `noise`); a (controlled) unitary, e.g. a
+gate, is the special case of a single matrix, and controls are
+honoured as in the state-vector engine.
+
+CONTENT
+
+`apply_matrices_on_density_array(...)` - Applies matrices on a
+dense density array
+
+`apply_matrices_on_factor(...)` - Applies matrices on a factor
+
+`evolve_density_matrix(density_matrix, matrices, qubit_indices,
+control_list)` - Applies matrices on target qubits of a density
+matrix
+
+`apply_unitary(density_matrix, matrix, qubit_indices,
+control_list)` - Applies a (controlled) unitary on a density
+matrix
+
+`permute_density_matrix(density_matrix, axes)` - Permutes qubits
+of a density matrix
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import numpy as np
+
+from linear_space.matrix import SquareMatrix
+from gate.statevector import apply_matrix_on_qubits, permute_qubits
+
+from .density_matrix import DensityMatrix, QubitDensityMatrix
+from .errors import DensityMatrixError
+from .factored import FactoredDensityMatrix, compress_factor
+
+_MODULE_LOCATION_ = 'density_matrix.evolution'
+
+
+def _as_square_matrices(matrices):
+    """ Matrices as square matrices """
+    return [matrix if isinstance(matrix, SquareMatrix)
+            else SquareMatrix(array=matrix) for matrix in matrices]
+
+
+def apply_matrices_on_density_array(density_array=None,
+                                    number_of_qubits=None, matrices=None,
+                                    qubit_indices=None, control_list=None):
+    """ Apply matrices on a dense density array
+
+    ARGUMENTS
+
+    `density_array` (`ndarray`) : density matrix of shape
+    `(2^n, 2^n)`
+
+    `number_of_qubits` (`int`) : number of qubits `n`
+
+    `matrices` (`list`) : matrices `K_i` of dimension `2^m`
+
+    `qubit_indices` (`list`) : `m` distinct target qubits; the
+    first one is the most significant bit of a matrix
+
+    `control_list` (`list`) : optional; control tuples such as
+    `[(0, '1')]`, meant for a single unitary
+
+    RETURN
+
+    New density array, the sum of `K_i rho K_i^dagger`; input
+    array is not modified.
+    """
+    new_array = np.zeros(density_array.shape,
+                         dtype=np.result_type(density_array, np.complex64))
+    for matrix in _as_square_matrices(matrices):
+        left = apply_matrix_on_qubits(
+                state_array=density_array, number_of_qubits=number_of_qubits,
+                qubit_indices=qubit_indices, block_matrix=matrix,
+                control_list=control_list)
+        new_array += apply_matrix_on_qubits(
+                state_array=np.ascontiguousarray(left.conj().T),
+                number_of_qubits=number_of_qubits,
+                qubit_indices=qubit_indices, block_matrix=matrix,
+                control_list=control_list).conj().T
+    return new_array
+
+
+def apply_matrices_on_factor(factor=None, number_of_qubits=None,
+                             matrices=None, qubit_indices=None,
+                             control_list=None):
+    """ Apply matrices on a factor
+
+    Arguments are those of `apply_matrices_on_density_array`,
+    with `factor` of shape `(2^n, r)` in place of the density array.
+
+    RETURN
+
+    New factor, of shape `(2^n, k r)` for `k` matrices, compressed
+    to at most `2^n` columns.
+    """
+    factors = [apply_matrix_on_qubits(
+                state_array=factor, number_of_qubits=number_of_qubits,
+                qubit_indices=qubit_indices, block_matrix=matrix,
+                control_list=control_list)
+               for matrix in _as_square_matrices(matrices)]
+    return compress_factor(np.concatenate(factors, axis=1))
+
+
+def evolve_density_matrix(density_matrix=None, matrices=None,
+                          qubit_indices=None, control_list=None):
+    """ Apply matrices on target qubits of a density matrix
+
+    ARGUMENTS
+
+    `density_matrix` (`DensityMatrix`) : density matrix of `n`
+    qubits; a `FactoredDensityMatrix` stays in factor form
+
+    `matrices` (`list`) : matrices `K_i` on the target qubits
+
+    `qubit_indices` (`list`) : distinct target qubits
+
+    `control_list` (`list`) : optional; control tuples
+
+    RETURN
+
+    New density matrix, the sum of `K_i rho K_i^dagger`, of the
+    same form.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.evolve_density_matrix'
+    if not isinstance(density_matrix, DensityMatrix):
+        raise DensityMatrixError("Matrices are only applicable " +\
+                "to a density matrix.", location=_ERROR_LOCATION_)
+    number_of_qubits = int(density_matrix.nrows).bit_length() - 1
+    if 2**number_of_qubits != density_matrix.nrows:
+        raise DensityMatrixError("Density matrix isn't composed of " +\
+                "qubit states.", location=_ERROR_LOCATION_)
+    try:
+        if isinstance(density_matrix, FactoredDensityMatrix):
+            return FactoredDensityMatrix(factor=apply_matrices_on_factor(
+                    factor=density_matrix.as_factor(),
+                    number_of_qubits=number_of_qubits, matrices=matrices,
+                    qubit_indices=list(qubit_indices),
+                    control_list=control_list))
+        return QubitDensityMatrix(matrix=SquareMatrix(
+                array=apply_matrices_on_density_array(
+                    density_array=density_matrix.as_array(),
+                    number_of_qubits=number_of_qubits, matrices=matrices,
+                    qubit_indices=list(qubit_indices),
+                    control_list=control_list)))
+    except Exception as err:
+        raise DensityMatrixError(str(err),
+                                 location=_ERROR_LOCATION_) from err
+
+
+def apply_unitary(density_matrix=None, matrix=None, qubit_indices=None,
+                  control_list=None):
+    """ Apply a (controlled) unitary on a density matrix
+
+    ARGUMENTS
+
+    `density_matrix` (`DensityMatrix`) : density matrix of `n`
+    qubits; a `FactoredDensityMatrix` stays in factor form
+
+    `matrix` (`SquareMatrix`) : unitary on the target qubits
+
+    `qubit_indices` (`list`) : distinct target qubits
+
+    `control_list` (`list`) : optional; control tuples
+
+    RETURN
+
+    New density matrix `U rho U^dagger`.
+    """
+    return evolve_density_matrix(density_matrix=density_matrix,
+                                 matrices=[matrix],
+                                 qubit_indices=qubit_indices,
+                                 control_list=control_list)
+
+
+def permute_density_matrix(density_matrix=None, axes=None):
+    """ Permute qubits of a density matrix
+
+    Qubit `k` of the new density matrix is qubit `axes[k]` of
+    the old one. (See `gate.statevector.permute_qubits`.)
+    """
+    number_of_qubits = len(axes)
+    if isinstance(density_matrix, FactoredDensityMatrix):
+        return FactoredDensityMatrix(factor=permute_qubits(
+                state_array=density_matrix.as_factor(),
+                number_of_qubits=number_of_qubits, axes=axes))
+    rows = permute_qubits(state_array=density_matrix.as_array(),
+                          number_of_qubits=number_of_qubits, axes=axes)
+    return QubitDensityMatrix(matrix=SquareMatrix(array=permute_qubits(
+            state_array=np.ascontiguousarray(rows.T),
+            number_of_qubits=number_of_qubits, axes=axes).T))
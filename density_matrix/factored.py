@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+density_matrix.factored.py
+
+PATH
+
+[app_root]/density_matrix/factored.py
+
+INTRO
+
+Density matrix stored in low-rank factor form.
+
+A density matrix of `n` qubits built from a pure state or an
+ensemble
+    rho = p1 |s1><s1| + p2 |s2><s2| + ...
+is stored as a factor `F` of shape `(2^n, r)`, whose columns are
+`sqrt(p_i) |s_i>`, so that `rho = F F^dagger`. A pure state needs
+`2^n` numbers instead of `4^n`.
+
+Trace, diagonal, projection on a state and partial trace are
+computed from the factor. Partial trace reshapes the factor into
+a tensor of shape `(2,) * n + (r,)` and merges traced-out qubit
+axes into the rank axis; if the rank then exceeds the dimension,
+the factor is recompressed from the eigenvectors of the reduced
+matrix.
+
+Factored density matrix is a qubit density matrix. Its dense
+array is only formed on demand, on first access, and is cached;
+any code treating it as a dense matrix keeps working.
+
+CONTENT
+
+`FactoredDensityMatrix` - Qubit density matrix in factor form
+
+`compress_factor(factor)` - Factor of the same density matrix
+with at most as many columns as rows
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import numpy as np
+
+from linear_space.number import is_power_of_two
+from linear_space.precision import complex_dtype
+from quantum_state import QuantumState
+
+from .density_matrix import QubitDensityMatrix
+from .errors import DensityMatrixError
+from .validators import StateInitValidator
+
+_MODULE_LOCATION_ = 'density_matrix.factored'
+
+# eigenvalues below this fraction of the largest are dropped
+_RANK_TOLERANCE = 1.0e-14
+
+
+def compress_factor(factor):
+    """ Factor of the same matrix with at most `2^n` columns """
+    if factor.shape[1] <= factor.shape[0]:
+        return factor
+    eigenvalues, eigenvectors = np.linalg.eigh(factor @ factor.conj().T)
+    kept = eigenvalues > _RANK_TOLERANCE * max(eigenvalues[-1], 0.0)
+    if not np.any(kept):
+        kept[-1] = True
+    return eigenvectors[:, kept] * \
+            np.sqrt(np.clip(eigenvalues[kept], 0.0, None))
+
+
+class FactoredDensityMatrix(QubitDensityMatrix):
+    """ Qubit density matrix in factor form
+
+    CONSTRUCTOR
+
+    `state` : a qubit state or an ensemble of qubit states
+        [(prob, pure state 1), (prob, pure state 2), ...]
+    as for `DensityMatrix`; or
+
+    `factor` (`ndarray`) : a factor `F` of shape `(2^n, r)`, with
+    the density matrix `F F^dagger`
+
+    ATTRIBUTES
+
+    `self.noq`, `self.rank` : number of qubits, number of columns
+    of the factor
+
+    `self.trace` : trace, computed from the factor
+
+    `self.as_factor()` : returns the factor
+
+    `self.diagonal()` : real diagonal, i.e. probabilities of all
+    computational basis states
+
+    `self.projection(state)` : `<state|rho|state>`
+
+    `self.partial_trace_out_qubits(qubit_indices)` : reduced
+    density matrix, also in factor form
+
+    `self.as_array()` : dense array, formed on first access
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.FactoredDensityMatrix'
+
+    def __init__(self, state=None, factor=None):
+        """ Factored Density Matrix : init """
+        if (state is None) == (factor is None):
+            raise DensityMatrixError("To construct a factored density " +\
+                    "matrix, use either a state or a factor. Not both.",
+                    location=self._ERROR_LOCATION_+'.__init__')
+        if factor is None:
+            factor = self._factor_from_state(state)
+        elif not isinstance(factor, np.ndarray) or factor.ndim != 2 \
+                or not is_power_of_two(factor.shape[0]) \
+                or factor.dtype.kind not in 'fc':
+            raise DensityMatrixError("Factor of a density matrix " +\
+                    "must be a 2-D numeric array of 2^n rows.",
+                    location=self._ERROR_LOCATION_+'.__init__')
+        self._factor = factor
+        self._dense_array = None
+
+    def _factor_from_state(self, state):
+        """ Factored Density Matrix : Factor of a state or ensemble """
+        validator = StateInitValidator(state=state)
+        if not validator.is_valid:
+            validator.raise_last_error(
+                    location=self._ERROR_LOCATION_+'.__init__')
+        state = validator.validated_data()['state']
+        if isinstance(state, QuantumState):
+            state = [(1.0, state)]
+        if not is_power_of_two(state[0][1].dim):
+            raise DensityMatrixError("Dimension of the state used " +\
+                    "to construct a qubit density is incompatible " +\
+                    "with qubit system.",
+                    location=self._ERROR_LOCATION_+'.__init__')
+        columns = [np.sqrt(prob) * item.as_vector().as_array().reshape(-1)
+                   for prob, item in state if prob > 0]
+        return compress_factor(np.stack(columns, axis=1).astype(complex_dtype()))
+
+    @property
+    def _array(self):
+        """ Factored Density Matrix : Dense array, formed on demand """
+        if self._dense_array is None:
+            self._dense_array = self._factor @ self._factor.conj().T
+        return self._dense_array
+
+    @_array.setter
+    def _array(self, array):
+        self._dense_array = array
+        self._factor = None
+
+    def as_factor(self):
+        """ Factored Density Matrix : Returns factor
+
+        If the dense array has been replaced, the factor is
+        recomputed from its eigenvectors.
+        """
+        if self._factor is None:
+            eigenvalues, eigenvectors = np.linalg.eigh(self._dense_array)
+            kept = eigenvalues > _RANK_TOLERANCE * max(eigenvalues[-1], 0.0)
+            self._factor = eigenvectors[:, kept] * np.sqrt(eigenvalues[kept])
+        return self._factor
+
+    @property
+    def noq(self):
+        """ Factored Density Matrix : Number of qubits """
+        return int(self.as_factor().shape[0]).bit_length() - 1
+
+    @property
+    def rank(self):
+        """ Factored Density Matrix : Number of columns of factor """
+        return self.as_factor().shape[1]
+
+    @property
+    def trace(self):
+        """ Factored Density Matrix : Returns the trace """
+        factor = self.as_factor()
+        return complex(np.vdot(factor, factor))
+
+    @property
+    def size(self):
+        """ Factored Density Matrix : Size tuple """
+        return (self.nrows, self.ncols)
+
+    @property
+    def nrows(self):
+        """ Factored Density Matrix : Number of rows """
+        return self.as_factor().shape[0]
+
+    @property
+    def ncols(self):
+        """ Factored Density Matrix : Number of columns """
+        return self.as_factor().shape[0]
+
+    def diagonal(self):
+        """ Factored Density Matrix : Real diagonal """
+        factor = self.as_factor()
+        return np.einsum('ij,ij->i', factor.conj(), factor).real
+
+    def projection(self, state):
+        """ Factored Density Matrix : `<state|rho|state>`
+
+        ARGUMENTS
+
+        `state` (`QuantumState`) : state of the same dimension
+        """
+        overlap = self.as_factor().conj().T @ \
+                state.as_vector().as_array().reshape(-1)
+        return float(np.vdot(overlap, overlap).real)
+
+    def partial_trace_out_qubits(self, qubit_indices):
+        """ Factored Density Matrix : Trace out qubits
+
+        ARGUMENTS
+
+        `qubit_indices` (iterable) : distinct and valid indices of
+        qubits to be traced out; at least one qubit must be kept
+
+        RETURN
+
+        A `FactoredDensityMatrix` of the kept qubits.
+        """
+        number_of_qubits = self.noq
+        traced = sorted(set(qubit_indices))
+        kept = [index for index in range(number_of_qubits)
+                if index not in traced]
+        if len(kept) == 0:
+            raise DensityMatrixError("At least one qubit must be kept " +\
+                    "in a factored partial trace.",
+                    location=self._ERROR_LOCATION_+'.partial_trace_out_qubits')
+        tensor = self.as_factor().reshape((2,) * number_of_qubits + (-1,))
+        tensor = np.transpose(tensor, kept + traced + [number_of_qubits])
+        return FactoredDensityMatrix(factor=compress_factor(
+                tensor.reshape(2**len(kept), -1)))
@@ -16,4 +16,9 @@ echo "--- --- Initialisation --- ---"
 python3 -m unittest density_matrix/unittest/test_init.py
 
 #echo "--- --- Algebra --- ---"
-#python3 -m unittest density_matrix/unittest/test_algebra.py
\ No newline at end of file
+#python3 -m unittest density_matrix/unittest/test_algebra.py
+echo "--- --- Factor form --- ---"
+python3 -m unittest density_matrix/unittest/test_factored.py
+
+echo "--- --- Evolution --- ---"
+python3 -m unittest density_matrix/unittest/test_evolution.py
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    density_matrix.evolution.py
+
+Main test
+    Unitaries and qubit permutations applied by contraction along
+    target axes agree with the dense products and keep the form of
+    the density matrix.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from linear_space.matrix import HADAMARD
+from qubit import QubitState
+from density_matrix import DensityMatrix, FactoredDensityMatrix, \
+    apply_unitary, permute_density_matrix
+from density_matrix.errors import DensityMatrixError
+
+
+def random_state(noq, seed):
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=2**noq) + 1.j * rng.normal(size=2**noq)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def ensemble(noq):
+    return [(0.5, random_state(noq, 1)), (0.3, random_state(noq, 2)),
+            (0.2, random_state(noq, 3))]
+
+
+class Test_Apply_Unitary(unittest.TestCase):
+    def test_controlled_hadamard(self):
+        noq = 3
+        state = random_state(noq, 10)
+        rho = DensityMatrix(state=state)
+        new_rho = apply_unitary(rho, HADAMARD, [2], control_list=[(0, '1')])
+        controlled = np.eye(8, dtype=complex)
+        controlled[4:, 4:] = np.kron(np.eye(2), HADAMARD.as_array())
+        expected = controlled @ rho.as_array() @ controlled.conj().T
+        self.assertTrue(np.allclose(new_rho.as_array(), expected))
+        factored = apply_unitary(FactoredDensityMatrix(state=state),
+                                 HADAMARD, [2], control_list=[(0, '1')])
+        self.assertEqual(factored.rank, 1)
+        self.assertTrue(np.allclose(factored.as_array(), expected))
+
+    def test_not_density_matrix(self):
+        self.assertRaises(DensityMatrixError, apply_unitary,
+                          random_state(2, 9), HADAMARD, [0])
+
+
+class Test_Permutation(unittest.TestCase):
+    def test_permutation(self):
+        noq = 3
+        factored = FactoredDensityMatrix(state=ensemble(noq))
+        rho = DensityMatrix(state=ensemble(noq))
+        axes = [2, 0, 1]
+        tensor = rho.as_array().reshape((2,) * 2 * noq)
+        expected = tensor.transpose(axes + [noq + axis for axis in axes])
+        expected = expected.reshape(2**noq, 2**noq)
+        self.assertTrue(np.allclose(
+            permute_density_matrix(rho, axes).as_array(), expected))
+        self.assertTrue(np.allclose(
+            permute_density_matrix(factored, axes).as_array(), expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
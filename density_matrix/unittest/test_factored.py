@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    density_matrix.factored.py
+
+Main test
+    Density matrix in factor form agrees with the dense density
+    matrix; dense array is only formed on demand.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from density_matrix import DensityMatrix, FactoredDensityMatrix
+from density_matrix.errors import DensityMatrixError
+from measurement.partial_trace import partial_trace_out_qubits, \
+    trace_out_qubit_axes
+from measurement.projective import projective_all, projective_on_state
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_operation.partial_trace import partial_trace_on_memory
+
+
+def random_state(noq, seed):
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=2**noq) + 1.j * rng.normal(size=2**noq)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def ensemble(noq):
+    return [(0.5, random_state(noq, 1)), (0.3, random_state(noq, 2)),
+            (0.2, random_state(noq, 3))]
+
+
+class Test_Factored(unittest.TestCase):
+    def test_pure_state(self):
+        state = random_state(3, 4)
+        factored = FactoredDensityMatrix(state=state)
+        self.assertEqual(factored.rank, 1)
+        self.assertIsNone(factored._dense_array)
+        self.assertAlmostEqual(factored.trace, 1.0)
+        self.assertTrue(np.allclose(factored.diagonal(),
+                                    np.abs(state.as_vector().as_array()
+                                           .reshape(-1))**2))
+        self.assertIsNone(factored._dense_array)
+        self.assertTrue(np.allclose(factored.as_array(),
+                                    DensityMatrix(state=state).as_array()))
+
+    def test_ensemble(self):
+        factored = FactoredDensityMatrix(state=ensemble(3))
+        self.assertEqual(factored.rank, 3)
+        self.assertTrue(isinstance(factored, DensityMatrix))
+        self.assertTrue(np.allclose(factored.as_array(),
+                                    DensityMatrix(state=ensemble(3))
+                                    .as_array()))
+
+    def test_partial_trace(self):
+        factored = FactoredDensityMatrix(state=ensemble(4))
+        dense = factored.as_array().copy()
+        for traced in [[0], [3], [1, 2], [0, 2, 3]]:
+            reduced = FactoredDensityMatrix(
+                    state=ensemble(4)).partial_trace_out_qubits(traced)
+            self.assertTrue(isinstance(reduced, FactoredDensityMatrix))
+            self.assertLessEqual(reduced.rank, 2**reduced.noq)
+            self.assertTrue(np.allclose(reduced.as_array(),
+                trace_out_qubit_axes(dense, 4, traced), atol=1e-14))
+
+    def test_measurement_functions(self):
+        factored = FactoredDensityMatrix(state=ensemble(3))
+        dense = DensityMatrix(state=ensemble(3))
+        self.assertTrue(np.allclose(projective_all(factored, as_array=True),
+                                    projective_all(dense, as_array=True)))
+        state = random_state(3, 5)
+        self.assertAlmostEqual(projective_on_state(factored, state),
+                               projective_on_state(dense, state))
+        reduced = partial_trace_out_qubits(factored, [1])
+        self.assertTrue(isinstance(reduced, FactoredDensityMatrix))
+        self.assertIsNone(factored._dense_array)
+        self.assertAlmostEqual(partial_trace_out_qubits(factored, [0, 1, 2]),
+                               1.0)
+
+    def test_memory_partial_trace(self):
+        memory = QubitMemory(register=[
+            QubitRegister(label='reg1', state=random_state(2, 6)),
+            QubitRegister(label='reg2', state=random_state(2, 7))])
+        memory._make_global_density_matrix()
+        self.assertTrue(isinstance(memory.get_global_density_matrix(),
+                                   FactoredDensityMatrix))
+        partial_trace_on_memory({'register': 'reg2'}, memory)
+        reduced = memory.get_global_density_matrix()
+        self.assertTrue(isinstance(reduced, FactoredDensityMatrix))
+        self.assertTrue(np.allclose(reduced.as_array(),
+                                    DensityMatrix(state=random_state(2, 6))
+                                    .as_array()))
+
+    def test_invalid(self):
+        with self.assertRaises(DensityMatrixError):
+            FactoredDensityMatrix()
+        with self.assertRaises(DensityMatrixError):
+            FactoredDensityMatrix(factor=np.ones((3, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,10 +14,15 @@ in a quantum circuit.
 
 CONTENT
 
-TODO Add content
+`as_gate` - Primary quantum gate decorator
+
+`OperatorMatrixCache` - Byte-bounded LRU cache of operator matrices
+
+`OPERATOR_MATRIX_CACHE` - Operator matrix cache shared by all gates
 
 LOG
 
-Updated on 22 September 2021 | Created on 22 September 2021
+Updated on 17 October 2026 | Created on 22 September 2021
 """
 from .decorator import as_gate
+from .cache import OperatorMatrixCache, OPERATOR_MATRIX_CACHE
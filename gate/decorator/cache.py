@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+gate.decorator.cache.py
+
+PATH
+
+[app_root]/gate/decorator/cache.py
+
+INTRO
+
+Operator matrix cache for gate decorator.
+
+Identical gate operations are common in iterative algorithms.
+For example, Grover search repeats the same flow many times,
+and every repetition asks the decorator for exactly the same
+global operator matrices. Constructing an enlarged operator
+matrix is expensive, retrieving it from a cache is not.
+
+Cache key is made of gate prototype, gate parameters, target
+index or range, control list and number of qubits of the input
+state; content of the input state is irrelevant. Cache is
+bounded by the total number of bytes held by its matrices;
+the least recently used matrix is evicted first.
+
+NOTE Cached matrices are shared by all operations requesting
+them. Operator matrices must thus be treated as read-only.
+
+CONTENT
+
+`operator_matrix_key(prototype, **params)` - Returns cache key
+
+`matrix_nbytes(matrix)` - Returns number of bytes held by matrix
+
+`OperatorMatrixCache` - Byte-bounded LRU cache of operator
+matrices, with hit, miss and eviction counters
+
+`OPERATOR_MATRIX_CACHE` - Cache shared by all gates
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from linear_space.matrix import SparseSquareMatrix
+from linear_space.precision import get_precision
+
+from gate.base import GateBaseError
+
+_MODULE_LOCATION_ = 'gate.decorator.cache'
+
+# default bound of cache, in bytes
+DEFAULT_MAX_BYTES = 64 * 1024**2
+
+
+def _hashable(value):
+    """ Returns a hashable version of a parameter value """
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.dtype.str, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item))
+                            for key, item in value.items()))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def operator_matrix_key(prototype, **params):
+    """ Cache key of a global operator matrix
+
+    Input state is represented by its number of qubits. Control
+    index is normalised into a control list; control list is
+    sorted by index, as the order of control qubits doesn't
+    change the operator matrix. Complex precision is part of the
+    key, so that a matrix is not reused in another precision.
+
+    ARGUMENTS
+
+    `prototype` (`GatePrototype`) : gate prototype of the decorator
+
+    `params` (`dict`) : parameters passed to
+    `as_gate.global_operator_matrix`
+
+    RETURN
+
+    A hashable tuple.
+    """
+    control_list = None
+    if 'control_list' in params.keys():
+        control_list = params['control_list']
+    elif 'control_index' in params.keys():
+        control_list = [(params['control_index'],
+                         params.get('control_state', '1'))]
+    if control_list is not None:
+        control_list = tuple(sorted((int(index), str(state))
+                                    for index, state in control_list))
+    others = tuple(sorted(
+        (name, _hashable(value)) for name, value in params.items()
+        if name not in ('input_state', 'control_list',
+                        'control_index', 'control_state')))
+    return (type(prototype), prototype.alias, params['input_state'].noq,
+            control_list, others, get_precision())
+
+
+def matrix_nbytes(matrix):
+    """ Number of bytes held by an operator matrix """
+    if isinstance(matrix, SparseSquareMatrix):
+        sparse = matrix.as_sparse()
+        return sparse.data.nbytes + sparse.indices.nbytes \
+                + sparse.indptr.nbytes
+    return matrix.as_array().nbytes
+
+
+class OperatorMatrixCache:
+    """ Operator matrix cache
+
+    Least-recently-used cache bounded by total bytes. A matrix
+    larger than the bound is never stored.
+
+    CONSTRUCTOR
+
+    `max_bytes` (`int`) : maximum total bytes of cached matrices
+
+    ATTRIBUTES
+
+    `self.enabled` (`bool`) : if `False`, cache neither stores
+    nor returns matrices
+
+    `self.max_bytes` : property; maximum total bytes
+
+    `self.current_bytes` : property; total bytes of cached matrices
+
+    `self.number_of_entries` : property; number of cached matrices
+
+    `self.hits`, `self.misses`, `self.evictions` (`int`) : counters
+
+    `self.get(, key)` : returns cached matrix or `None`
+
+    `self.put(, key, matrix)` : stores matrix, evicting least
+    recently used matrices if needed
+
+    `self.configure(, max_bytes, enabled)` : changes bound and
+    status; matrices beyond the new bound are evicted
+
+    `self.clear()` : removes all matrices and resets counters
+
+    `self.statistics()` : returns a dictionary of counters
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.OperatorMatrixCache'
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """ Operator Matrix Cache :: Initialiser """
+        self._entries = OrderedDict()
+        self._max_bytes = None
+        self._current_bytes = 0
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.configure(max_bytes=max_bytes)
+
+    @property
+    def max_bytes(self):
+        """ Operator Matrix Cache :: Maximum total bytes """
+        return self._max_bytes
+
+    @property
+    def current_bytes(self):
+        """ Operator Matrix Cache :: Total bytes of cached matrices """
+        return self._current_bytes
+
+    @property
+    def number_of_entries(self):
+        """ Operator Matrix Cache :: Number of cached matrices """
+        return len(self._entries)
+
+    def _evict_until(self, max_bytes):
+        """ Operator Matrix Cache :: Evict least recently used """
+        while self._current_bytes > max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._current_bytes -= nbytes
+            self.evictions += 1
+
+    def configure(self, max_bytes=None, enabled=None):
+        """ Operator Matrix Cache :: Change bound or status """
+        if max_bytes is not None:
+            if not isinstance(max_bytes, int) or isinstance(max_bytes, bool) \
+                    or max_bytes < 0:
+                raise GateBaseError("Maximum bytes of operator " +\
+                        "matrix cache must be a non-negative integer.",
+                        location=self._ERROR_LOCATION_+'.configure')
+            self._max_bytes = max_bytes
+            self._evict_until(max_bytes)
+        if enabled is not None:
+            self.enabled = bool(enabled)
+
+    def get(self, key):
+        """ Operator Matrix Cache :: Returns cached matrix
+
+        Returns `None` on a miss.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, matrix):
+        """ Operator Matrix Cache :: Stores a matrix """
+        if not self.enabled:
+            return
+        nbytes = matrix_nbytes(matrix)
+        if nbytes > self._max_bytes:
+            return
+        if key in self._entries:
+            self._current_bytes -= self._entries.pop(key)[1]
+        self._evict_until(self._max_bytes - nbytes)
+        self._entries[key] = (matrix, nbytes)
+        self._current_bytes += nbytes
+
+    def clear(self):
+        """ Operator Matrix Cache :: Remove all and reset counters """
+        self._entries.clear()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def statistics(self):
+        """ Operator Matrix Cache :: Returns counters """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'number_of_entries': self.number_of_entries,
+            'current_bytes': self._current_bytes,
+            'max_bytes': self._max_bytes,
+            'enabled': self.enabled
+        }
+
+
+OPERATOR_MATRIX_CACHE = OperatorMatrixCache()
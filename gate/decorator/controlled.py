@@ -16,7 +16,7 @@ Two essential mixin classes.
 
 LOG
 
-Updated on 22 September 2021 | Created on 07 September 2021
+Updated on 17 October 2026 | Created on 07 September 2021
 """
 from linear_space.utils import minimum
 from linear_space.algebra import matrix_product
@@ -61,7 +61,8 @@ class ControlledTargetRange:
                 number_of_qubits=params['input_state'].noq,
                 control_list=params['control_list'],
                 target_range=params['target_range'],
-                original_matrix=original_matrix)
+                original_matrix=original_matrix,
+                sparse=params.get('sparse', False))
         return operator_matrix
 
     def _controlled_single(self, *args, **params):
@@ -219,7 +220,8 @@ class ControlledTargetIndex:
             number_of_qubits=params['input_state'].noq,
             target_tuple=original_suite['target_tuple'],
             control_list=original_suite['control_list'],
-            original_matrix=target_window_operator_matrix)
+            original_matrix=target_window_operator_matrix,
+            sparse=params.get('sparse', False))
         return operator_matrix
 
     def _operator_matrix_with_CISWAP(self, *args, **params):
@@ -245,10 +247,12 @@ class ControlledTargetIndex:
         # postciswap is after applying gate
         pre_CISWAP = pre_CISWAP_matrix(
             params['input_state'].noq,
-            swap_list=ciswaped_suite['swap_list'])
+            swap_list=ciswaped_suite['swap_list'],
+            sparse=params.get('sparse', False))
         post_CISWAP = post_CISWAP_matrix(
             params['input_state'].noq,
-            swap_list=ciswaped_suite['swap_list'])
+            swap_list=ciswaped_suite['swap_list'],
+            sparse=params.get('sparse', False))
         return matrix_product(
             post_CISWAP,
             matrix_product(operator_matrix_without_CISWAP, pre_CISWAP))
@@ -98,6 +98,9 @@ a multiple-qubit gate. (See NOTE 1).
 of controlled gate operator; combines the above two
 controlled-operator mixins
 
+`StatevectorOperatorMixin` - Mixin class for matrix-free
+application of gate on the input state
+
 `as_gate` - Primary quantum gate decorator. In principle,
 the only decorator any developer need to use
 
@@ -113,13 +116,25 @@ than circuit implementation.
 case (or with dash) to highlight that it is not intended
 to be instantiated as common class.
 
+[3] Operation parameter `sparse` requests a sparse global
+operator matrix (`SparseSquareMatrix`). Enlargement of gate
+matrix is then done in sparse format, avoiding allocation of
+a dense matrix for the global state.
+
+[4] Global operator matrices are cached in `OPERATOR_MATRIX_CACHE`
+(see module `gate.decorator.cache`), so that repeated operations,
+e.g. iterations of Grover search, don't reconstruct them. Cached
+matrices are shared and must not be modified in place.
+
 LOG
 
-Updated on 18 September 2021 | Created on 16 November 2020
+Updated on 17 October 2026 | Created on 16 November 2020
 """
+from common.validator import BOUNDARY_SCOPE, INTERNAL_SCOPE
 from quantum_state import NullState, null_state
 from qubit import QubitState
 from quantum_operator import QuantumOperator
+from linear_space.matrix import SquareMatrix, SparseSquareMatrix
 
 from gate.base import  GateBaseValidationError, GateBaseError, GateBaseValidator
 from gate.parameter import InputQubitState, QubitIndex, ControlIndexList
@@ -127,6 +142,8 @@ from gate.prototype.base import GatePrototype
 
 from .noncontrolled import NoncontrolledOperatorMixin
 from .controlled import ControlledOperatorMixin
+from .statevector import StatevectorOperatorMixin
+from .cache import OPERATOR_MATRIX_CACHE, operator_matrix_key
 
 
 class DecoratorPrototypeValidator(GateBaseValidator):
@@ -143,6 +160,7 @@ class DecoratorPrototypeValidator(GateBaseValidator):
     `prototype` (`QuantumOperator`) : gate prototype class
     """
     error_class = GateBaseValidationError
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, decorator=None, prototype=None):
         super().__init__()
@@ -171,6 +189,7 @@ class ParametersControlledMatrixValidator(GateBaseValidator):
     Used in `as_gate.__controlled_matrix()` method.
     """
     error_class = GateBaseError
+    validation_scope = INTERNAL_SCOPE
 
     def __init__(self, alias=None, **params):
         super().__init__()
@@ -207,8 +226,8 @@ class ParametersControlledMatrixValidator(GateBaseValidator):
                         "is None.")
 
 
-class as_gate(ControlledOperatorMixin, NoncontrolledOperatorMixin,
-              QuantumOperator):
+class as_gate(StatevectorOperatorMixin, ControlledOperatorMixin,
+              NoncontrolledOperatorMixin, QuantumOperator):
     """ Decorator class for all quantum gate
 
     Class decorator returns an instance of decorator class,
@@ -253,8 +272,12 @@ class as_gate(ControlledOperatorMixin, NoncontrolledOperatorMixin,
     the operatoe matrix of a controlled operation; parameters
     passed in must contain `control_index` or `control_list`
 
+    `self._operator_matrix_key(,**params)` : returns the key
+    of operator matrix cache, or `None` if not to be cached
+
     `self.global_operator_matrix(,*args,**params)` : returns
-    the desired operator matrix for the global state
+    the desired operator matrix for the global state; matrices
+    are cached
 
     `self.__call__(,*args,gate_matrix_only=None,**params)` :
     primary call dispatcher; depending on parameters passed in,
@@ -266,18 +289,26 @@ class as_gate(ControlledOperatorMixin, NoncontrolledOperatorMixin,
     `self.ctrl(,*args,**params)`: controlled operation
 
     `self.cop(,*args,**params)`: identical to `self.ctrl()`
+
+    [from `StatevectorOperatorMixin`]
+
+    `self.statevector_apply(,*args,**params)` : applies the gate
+    on the input state by tensor contraction, without constructing
+    the global operator matrix; returns the transformed state
     """
     state_class = QubitState
     # input state refers to the global state
     # input noq is the number of qubits of global state
     # target range refers to a range of qubits in the input state
+    # sparse requests a sparse global operator matrix
     operation_parameters = {
         'input_state': InputQubitState(),
         'input_noq': int,
         'target_index': QubitIndex(),
         'target_range': list,
         'control_index': QubitIndex(),
-        'control_list': ControlIndexList()
+        'control_list': ControlIndexList(),
+        'sparse': bool
     }
 
     def __new__(cls, *args):
@@ -419,6 +450,20 @@ class as_gate(ControlledOperatorMixin, NoncontrolledOperatorMixin,
             raise err
         return operator_matrix
 
+    def _operator_matrix_key(self, **params):
+        """ Decorator as_gate :: Returns operator matrix cache key
+
+        Returns `None` if the operator matrix is not to be cached,
+        i.e. the prototype constructs the matrix on its own via
+        `gate_apply()` and may thus depend on more than metadata,
+        or the input state is not a qubit state, in which case
+        errors are raised during construction.
+        """
+        if getattr(self.gate_prototype, "gate_apply", False) \
+                or not isinstance(params['input_state'], self.state_class):
+            return None
+        return operator_matrix_key(self.gate_prototype, **params)
+
     def global_operator_matrix(self, *args, **params):
         """ Decorator as_gate :: Returns global operator matrix
 
@@ -435,6 +480,13 @@ class as_gate(ControlledOperatorMixin, NoncontrolledOperatorMixin,
         state, this method actually can be used to construct a
         multiple-target gate operator matrix.
 
+        If parameter `sparse` is `True`, the returned matrix is
+        always a `SparseSquareMatrix`, even if gate prototype
+        constructs the matrix on its own.
+
+        Operator matrix is looked up in, and stored into, the
+        shared operator matrix cache. (See NOTE 4 of module.)
+
         Unittest of this method is
             unittest/controlled/test_global_operator_matrix.py
         """
@@ -442,6 +494,11 @@ class as_gate(ControlledOperatorMixin, NoncontrolledOperatorMixin,
         try:
             self.regulate_arguments(*args, **params)
             if not isinstance(params['input_state'], NullState):
+                cache_key = self._operator_matrix_key(**params)
+                if cache_key is not None:
+                    operator_matrix = OPERATOR_MATRIX_CACHE.get(cache_key)
+                if operator_matrix is not None:
+                    return operator_matrix
                 # neither control list nor index, non-controlled
                 if 'control_index' not in params.keys() \
                         and 'control_list' not in params.keys():
@@ -450,6 +507,12 @@ class as_gate(ControlledOperatorMixin, NoncontrolledOperatorMixin,
                 # either control list or control index, controlled
                 else:
                     operator_matrix = self._controlled_matrix(*args, **params)
+                if params.get('sparse', False) \
+                        and isinstance(operator_matrix, SquareMatrix):
+                    operator_matrix = SparseSquareMatrix(
+                            array=operator_matrix.as_array())
+                if cache_key is not None:
+                    OPERATOR_MATRIX_CACHE.put(cache_key, operator_matrix)
             else:
                 raise GateBaseError("To construct a meaningful " +\
                         "operator matrix, input state must not be a " +\
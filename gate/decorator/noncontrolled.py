@@ -15,7 +15,7 @@ Noncontrolled operator mixin class for decorator.
 
 LOG
 
-Updated on 22 September 2021 | Created on 07 September 2021
+Updated on 17 October 2026 | Created on 07 September 2021
 """
 from gate.base import  GateBaseError
 from gate.enlarge_matrix.noncontrolled import enlarge_single_qubit_matrix
@@ -126,7 +126,8 @@ class NoncontrolledOperatorMixin:
             operator_matrix = enlarge_single_qubit_matrix(
                     number_of_qubits=params['input_state'].noq,
                     target_index=params['target_index'],
-                    original_matrix=default_matrix)      
+                    original_matrix=default_matrix,
+                    sparse=params.get('sparse', False))
             return operator_matrix
         except Exception as err:
             raise err
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+gate.decorator.statevector.py
+
+PATH
+
+[app_root]/gate/decorator/statevector.py
+
+INTRO
+
+Statevector operator mixin for decorator.
+
+Instead of enlarging the gate matrix into a global operator
+matrix, the original gate matrix is contracted directly with
+the global state along the target axes. (See module
+`gate.statevector.contraction`.)
+
+A Pauli X (flip) gate with a single control is a CNOT, which
+only permutes amplitudes; it is applied by fancy indexing rather
+than by contraction. Such prototypes are marked by the class
+attribute `is_pauli_x`. (See module `gate.statevector.permutation`.)
+
+Prototypes that retain full control of operator construction
+via `gate_apply()`, or multiple-qubit prototypes addressed by
+discrete indices, fall back to the global operator matrix.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from quantum_state import NullState, null_state
+from linear_space.vector import ColumnVector
+from gate.statevector import apply_matrix_on_statevector, \
+    apply_cnot_on_statevector
+
+
+class StatevectorOperatorMixin:
+    """ Statevector operator mixin
+
+    Applies a gate on the input state by tensor contraction.
+    Resulting state is identical to what is produced by
+    applying the global operator matrix.
+    """
+    def _statevector_target_range(self, **params):
+        """ Statevector Operator Mixin :: Returns target range
+
+        Returns `None` if the target range cannot be inferred
+        from parameters, in which case the operator matrix is
+        required.
+        """
+        target_range = None
+        if getattr(self.gate_prototype, "gate_apply", False):
+            target_range = None
+        elif 'target_range' in params.keys():
+            target_range = params['target_range']
+        elif self.gate_prototype.minimal_number_of_qubits == 1:
+            if params['input_state'].noq == 1:
+                target_range = [0, 0]
+            elif 'target_index' in params.keys():
+                target_range = [params['target_index'],
+                                params['target_index']]
+        return target_range
+
+    def _is_cnot(self, target_range, control_list):
+        """ Statevector Operator Mixin :: Verify if gate is a CNOT """
+        return self.gate_prototype.is_pauli_x \
+                and target_range[0] == target_range[1] \
+                and control_list is not None and len(control_list) == 1
+
+    def statevector_apply(self, *args, **params):
+        """ Statevector Operator Mixin :: Applies gate on input state
+
+        Parameters are identical to those accepted by method
+        `global_operator_matrix`.
+
+        Return
+
+        `state` (`QubitState`) : the transformed input state
+        """
+        ret = None
+        try:
+            self.regulate_arguments(*args, **params)
+            if isinstance(params['input_state'], NullState):
+                return null_state
+            # convert control index into list
+            if 'control_index' in params.keys():
+                control_state = params.pop('control_state', '1')
+                params['control_list'] = \
+                        [(params.pop('control_index'), control_state)]
+            target_range = self._statevector_target_range(**params)
+            if target_range is None:
+                operator_matrix = self.global_operator_matrix(*args, **params)
+                self.update_matrix(matrix=operator_matrix)
+                ret = self.apply(params['input_state'])
+            elif self._is_cnot(target_range, params.get('control_list')):
+                input_state = params['input_state']
+                control_index, control_state = params['control_list'][0]
+                new_array = apply_cnot_on_statevector(
+                        state_array=input_state.as_vector().as_array(),
+                        number_of_qubits=input_state.noq,
+                        control_index=control_index,
+                        target_index=target_range[0],
+                        control_state=control_state)
+                ret = self.state_class.from_trusted_vector(
+                        ColumnVector.from_trusted_array(new_array))
+            else:
+                opargs, opkwargs = self.gate_prototype.validate_parameters(
+                        self.gate_prototype.gate_matrix, *args, **params)
+                original_matrix = \
+                        self.gate_prototype.gate_matrix(*opargs, **opkwargs)
+                input_state = params['input_state']
+                new_array = apply_matrix_on_statevector(
+                        state_array=input_state.as_vector().as_array(),
+                        number_of_qubits=input_state.noq,
+                        target_range=target_range,
+                        original_matrix=original_matrix,
+                        control_list=params.get('control_list'))
+                ret = self.state_class.from_trusted_vector(
+                        ColumnVector.from_trusted_array(new_array))
+        except Exception as err:
+            raise err
+        return ret
@@ -21,11 +21,12 @@ for parameters passed to matrix enlargement functions
 
 LOG
 
-Updated on 30 September 2021 | Created on 10 September 2021
+Updated on 17 October 2026 | Created on 10 September 2021
 """
+from common.validator import INTERNAL_SCOPE
 from linear_space.number import is_integer, power_of_two
-from linear_space.matrix import SquareMatrix, STATE_ZERO_PROJECTION, \
-    STATE_ONE_PROJECTION
+from linear_space.matrix import SquareMatrix, SparseSquareMatrix, \
+    STATE_ZERO_PROJECTION, STATE_ONE_PROJECTION
 
 from gate.base import GateBaseValidator
 from .errors import GateMatrixEnlargeValidationError
@@ -83,6 +84,7 @@ class GenericGateMatrixEnlargeValidator(GateBaseValidator):
     """
     error_class = GateMatrixEnlargeValidationError
     error_location = _MODULE_LOCATION_ + '.GenericGateMatrixEnlargeValidator'
+    validation_scope = INTERNAL_SCOPE
 
     def __init__(self, number_of_qubits=None, control_list=None,
                  target_range=None, original_matrix=None):
@@ -122,7 +124,8 @@ class GenericGateMatrixEnlargeValidator(GateBaseValidator):
 
         Two rules:
 
-        [1] Original matrix must be an instance of `SquareMatrix`.
+        [1] Original matrix must be an instance of `SquareMatrix`
+        or `SparseSquareMatrix`.
 
         [2] Total number of qubits cannot be less than what
         the original matrix requires.
@@ -130,7 +133,8 @@ class GenericGateMatrixEnlargeValidator(GateBaseValidator):
         Private member `self._om` stores pre-validated
         original gate matrix.
         """
-        if not isinstance(original_matrix, SquareMatrix):
+        if not isinstance(original_matrix,
+                          (SquareMatrix, SparseSquareMatrix)):
             self.report_errors("Original gate " +\
                     "matrix is not a square matrix.")
         elif power_of_two(self._noq) < original_matrix.nrows:
@@ -15,6 +15,16 @@ Construction of multiple-controlled multiple-qubit (mcmq)
 operator matrix. This function is the most generic kernel
 to construction of any controlled operator matrix.
 
+Operator matrix is built by index arithmetic over the
+computational basis, using a control mask to select the
+rows where control bits match. Projector tensor products
+are never materialised.
+
+Matrix makers accept a keyword argument `sparse`. If `True`,
+the very same indices are assembled into a sparse matrix,
+such that a dense array of size `2^n` by `2^n` is never
+allocated.
+
 CONTENT
 
 `multiple_controlled_multiple_qubit_operator_matrix()` -
@@ -23,6 +33,12 @@ operator matrix for a multiple-qubit gate
 
 `kernel()` - Alias to the function above
 
+`control_mask()` - boolean mask of basis states meeting the
+condition of a control list
+
+`kernel_apply()` - apply a controlled gate on a state array
+by selecting the amplitude slice where control bits match
+
 `universal_CNOT_matrix()` : construct a CNOT matrix for a
 multiple-qubit state
 
@@ -31,14 +47,15 @@ multiple-qubit state
 
 LOG
 
-Updated on 30 September 2021 | Created on 13 September 2021
+Updated on 17 October 2026 | Created on 13 September 2021
 """
-from bit.utils import integer_to_bitstring
+import numpy as np
+
 from linear_space.number import power_of_two
-from linear_space.matrix import STATE_ZERO_PROJECTION, STATE_ONE_PROJECTION,\
-    PAULI_X
-from linear_space.utils import identity_by_bits
-from linear_space.algebra import matrix_add, matrix_product, matrix_maker
+from linear_space.matrix import SquareMatrix, SparseSquareMatrix
+from linear_space.scipy_lib import sp_coo_matrix
+from gate.statevector import apply_matrix_on_statevector, \
+    qubit_permutation_indices, cnot_permutation_indices, permutation_matrix
 
 from .errors import GateMatrixEnlargeError
 from .common import GenericGateMatrixEnlargeValidator
@@ -46,69 +63,6 @@ from .common import GenericGateMatrixEnlargeValidator
 _MODULE_LOCATION_ = 'gate.enlarge_matrix.controlled_kernel'
 
 
-def do_nothing_part_matrix_list_per_bitstring(bitstring, number_of_qubits,
-                                              control_indices):
-    """ Matrix list for a bitstring that is not control string """
-    matrix_list = []
-    for i in range (0, number_of_qubits):
-        if i in control_indices:
-            if bitstring[control_indices.index(i)] == '0':
-                matrix_list.append(STATE_ZERO_PROJECTION)
-            else:
-                matrix_list.append(STATE_ONE_PROJECTION)
-        else:
-            matrix_list.append(identity_by_bits(1))
-    return matrix_list
-
-
-def apply_part_matrix_list_per_bitstring(bs, number_of_qubits, control_indices,
-                                         target_range, original_matrix):
-    """ Matrix list for a bitstring that is control string """
-    matrix_list = []
-    # target range starts from 0
-    if target_range[0] == 0:
-        matrix_list.append(original_matrix)
-        for i in range (target_range[1] + 1, number_of_qubits):
-            if i in control_indices:
-                if bs[control_indices.index(i)] == '0':
-                    matrix_list.append(STATE_ZERO_PROJECTION)
-                else:
-                    matrix_list.append(STATE_ONE_PROJECTION)
-            else:
-                matrix_list.append(identity_by_bits(1))
-    # target range covers the end
-    elif target_range[1] == number_of_qubits - 1:
-        for i in range (0, target_range[0]):
-            if i in control_indices:
-                if bs[control_indices.index(i)] == '0':
-                    matrix_list.append(STATE_ZERO_PROJECTION)
-                else:
-                    matrix_list.append(STATE_ONE_PROJECTION)
-            else:
-                matrix_list.append(identity_by_bits(1))
-        matrix_list.append(original_matrix)
-    # target range in the middle
-    else:
-        for i in range (0, target_range[0]):
-            if i in control_indices:
-                if bs[control_indices.index(i)] == '0':
-                    matrix_list.append(STATE_ZERO_PROJECTION)
-                else:
-                    matrix_list.append(STATE_ONE_PROJECTION)
-            else:
-                matrix_list.append(identity_by_bits(1))
-        matrix_list.append(original_matrix)
-        for i in range (target_range[1] + 1, number_of_qubits):
-            if i in control_indices:
-                if bs[control_indices.index(i)] == '0':
-                    matrix_list.append(STATE_ZERO_PROJECTION)
-                else:
-                    matrix_list.append(STATE_ONE_PROJECTION)
-            else:
-                matrix_list.append(identity_by_bits(1))
-    return matrix_list
-
-
 def sort_control_list(control_list):
     """ Sort control list
 
@@ -133,8 +87,32 @@ def sort_control_list(control_list):
     return ret
 
 
+def control_mask(number_of_qubits=None, control_list=None):
+    """ Control mask over computational basis
+
+    Returns a boolean array of size `2^n`, in which the element
+    at position `i` is `True` if basis state `|i>` meets the
+    condition set by control list. Qubit 0 is the most significant
+    bit of index `i`.
+
+    ARGUMENTS
+
+    `number_of_qubits` (`int`) : total number of qubits
+
+    `control_list` (`list`) : a list of control tuples such as
+    `[(0, '1'), (3, '0')]`
+    """
+    indices = np.arange(power_of_two(number_of_qubits))
+    mask = np.ones(indices.size, dtype=bool)
+    for control_index, control_state in control_list:
+        bit = (indices >> (number_of_qubits - 1 - control_index)) & 1
+        mask &= bit == int(control_state)
+    return mask
+
+
 def multiple_controlled_multiple_qubit_operator_matrix(number_of_qubits=None,
-        control_list=None, target_range=None, original_matrix=None):
+        control_list=None, target_range=None, original_matrix=None,
+        sparse=False):
     """ Multiple-controlled multiple-qubit operator matrix maker
 
     Construct a multiple-controlled multiple-qubit (MCMQ)
@@ -142,7 +120,18 @@ def multiple_controlled_multiple_qubit_operator_matrix(number_of_qubits=None,
 
     This function is the most generic routine for construction
     of controlled operator matrix with target range provided.
+
+    Operator matrix is constructed by index arithmetic. Rows of
+    basis states that fail the control condition are left as
+    identity. For each remaining row `i`, the target bits of `i`
+    select a row of the original matrix, which is scattered onto
+    the columns sharing all non-target bits with `i`. No projector
+    is tensored and no intermediate matrix is added up.
+
+    If `sparse` is `True`, a `SparseSquareMatrix` is returned.
     """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ +\
+            '.multiple_controlled_multiple_qubit_operator_matrix'
     total_matrix = None
     validator = GenericGateMatrixEnlargeValidator(
         number_of_qubits=number_of_qubits,
@@ -150,45 +139,75 @@ def multiple_controlled_multiple_qubit_operator_matrix(number_of_qubits=None,
         control_list=control_list,
         original_matrix=original_matrix)
     if validator.is_valid:
-        sorted_list = sort_control_list(control_list)
-        control_indices = sorted_list['control_indices']
-        control_bitstring = sorted_list['control_bitstring']
-        # Create all possible bitstrings corresponding
-        # to the number of control bits.
-        # iterate through all possible bitstrings
-        for integer in range(0, power_of_two(len(control_indices))):
-            # create bistring from the integer
-            bs = integer_to_bitstring(integer, len(control_indices))
-            # matrix list per bitstring
-            matrix_list = []
-            # if not control string
-            if bs != control_bitstring:
-                matrix_list = do_nothing_part_matrix_list_per_bitstring(
-                        bs, number_of_qubits, control_indices)
-            # control string
-            else:
-                matrix_list = apply_part_matrix_list_per_bitstring(bs,
-                        number_of_qubits, control_indices, target_range,
-                        original_matrix)
-            # matrix for a bit string
-            matrix_per_bitstring = \
-                    matrix_maker(list_of_matrices=matrix_list, method='tensor')
-            if integer == 0:
-                total_matrix = matrix_per_bitstring
-            else:
-                total_matrix = matrix_add(total_matrix, matrix_per_bitstring)
+        for control_index, _ in control_list:
+            if control_index in range(target_range[0], target_range[1] + 1):
+                raise GateMatrixEnlargeError("Control index " +\
+                        "{} is also a target.".format(control_index),
+                        location=_ERROR_LOCATION_)
+        original_array = original_matrix.as_array()
+        dimension = power_of_two(number_of_qubits)
+        number_of_targets = target_range[1] - target_range[0] + 1
+        shift = number_of_qubits - 1 - target_range[1]
+        target_mask = (power_of_two(number_of_targets) - 1) << shift
+        dtype = np.result_type(original_array.dtype, np.float32)
+        # rows meeting the control condition
+        mask = control_mask(number_of_qubits, control_list)
+        rows = np.arange(dimension)[mask]
+        row_targets = (rows & target_mask) >> shift
+        # columns share all non-target bits with their rows
+        column_targets = np.arange(power_of_two(number_of_targets))
+        columns = (rows & ~target_mask)[:, None] | (column_targets << shift)
+        values = original_array[row_targets[:, None], column_targets]
+        if sparse:
+            # identity on rows failing the control condition
+            idle = np.arange(dimension)[~mask]
+            total_sparse = sp_coo_matrix((
+                np.concatenate([np.ones(idle.size, dtype=dtype),
+                                values.ravel().astype(dtype)]),
+                (np.concatenate([idle, np.repeat(rows, column_targets.size)]),
+                 np.concatenate([idle, columns.ravel()]))),
+                shape=(dimension, dimension)).tocsr()
+            total_sparse.eliminate_zeros()
+            total_matrix = SparseSquareMatrix(array=total_sparse)
+        else:
+            total_array = np.identity(dimension, dtype=dtype)
+            total_array[rows[:, None], columns] = values
+            total_matrix = SquareMatrix.from_trusted_array(total_array)
     else:
         validator.raise_last_error()
     return total_matrix
 
 
 def kernel(number_of_qubits=None, control_list=None, target_range=None,
-           original_matrix=None):
+           original_matrix=None, sparse=False):
     """ Controlled operator kernel function
 
     Alias to mcmq routine.
     """
     return multiple_controlled_multiple_qubit_operator_matrix(
+        number_of_qubits=number_of_qubits,
+        target_range=target_range,
+        control_list=control_list,
+        original_matrix=original_matrix,
+        sparse=sparse
+    )
+
+
+def kernel_apply(state_array=None, number_of_qubits=None, control_list=None,
+                 target_range=None, original_matrix=None):
+    """ Controlled state kernel function
+
+    State counterpart of `kernel`. Original matrix is applied
+    only on the slice of amplitudes where control bits match
+    the control list; the operator matrix is never constructed.
+    (See `gate.statevector.apply_matrix_on_statevector`.)
+
+    RETURN
+
+    `new_array` (`ndarray`) : transformed state array
+    """
+    return apply_matrix_on_statevector(
+        state_array=state_array,
         number_of_qubits=number_of_qubits,
         target_range=target_range,
         control_list=control_list,
@@ -197,15 +216,16 @@ def kernel(number_of_qubits=None, control_list=None, target_range=None,
 
 
 def universal_CNOT_matrix(number_of_qubits=None, control_index=None,
-                          target_index=None):
+                          target_index=None, sparse=False):
     """ CNOT operator matrix for multiple-bit state
 
-    Returns a matrix that performs SWAP operation of any
-    two qubits in a multiple-qubit state. Two qubits to
-    be swapped are given in indices.
+    Returns a matrix that performs CNOT operation on any
+    two qubits in a multiple-qubit state, conditional on
+    state '1' of the control bit.
 
-    Matrix is constructed as a single-controlled single
-    qubit flip matrix.
+    CNOT only permutes basis states. Matrix is constructed
+    directly as a permutation matrix. (See module
+    `gate.statevector.permutation`.)
 
     ARGUMENTS
 
@@ -218,33 +238,44 @@ def universal_CNOT_matrix(number_of_qubits=None, control_index=None,
     `control_index` (`int`) : index of the control bit in
     the scientific indexing scheme starting from 0
 
+    `sparse` (`bool`) : if `True`, returns a sparse matrix
+
     RETURN
 
     `operator_matrix` (`SquareMatrix`) : newly constructed
     operator matrix
     """
-    single_qubit_flip_matrix = PAULI_X
-    operator_matrix = None
-    try:
-        operator_matrix = kernel(
-            number_of_qubits=number_of_qubits,
-            control_list=[(control_index,'1')],
-            target_range=[target_index, target_index],
-            original_matrix=single_qubit_flip_matrix)
-    except Exception as err:
-        raise err
-    return operator_matrix
-
-
-def universal_SWAP_matrix(number_of_qubits=None, alpha=None, beta=None):
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.universal_CNOT_matrix'
+    if control_index not in range(0, number_of_qubits):
+        raise GateMatrixEnlargeError("Failed to construct a CNOT matrix. "+\
+                "Control index is out of range.", location=_ERROR_LOCATION_)
+    if target_index not in range(0, number_of_qubits):
+        raise GateMatrixEnlargeError("Failed to construct a CNOT matrix. "+\
+                "Target index is out of range.", location=_ERROR_LOCATION_)
+    if control_index == target_index:
+        raise GateMatrixEnlargeError("Failed to construct a CNOT matrix. "+\
+                "Control and target indices are equal.",
+                location=_ERROR_LOCATION_)
+    return permutation_matrix(
+            indices=cnot_permutation_indices(
+                number_of_qubits=number_of_qubits,
+                control_index=control_index,
+                target_index=target_index),
+            sparse=sparse)
+
+
+def universal_SWAP_matrix(number_of_qubits=None, alpha=None, beta=None,
+                          sparse=False):
     """ SWAP matrix for multiple-bit state
 
     SWAP matrix is a two-bit operator that is enlarged
     to fit a multiple-bit state.
 
-    SWAP matrix is implemented as three sequential CNOT
-    operations with control and target bits swapped, i.e.
+    SWAP is equivalent to three sequential CNOT operations
+    with control and target bits swapped, i.e.
     SWAP(alpha,beta) -> CNOT(alpha, beta)CNOT(beta, alpha)CNOT(alpha, beta)
+    Instead of the product, matrix is constructed directly as
+    the permutation matrix that exchanges the two qubits.
 
     All arguments are integers.
 
@@ -256,6 +287,8 @@ def universal_SWAP_matrix(number_of_qubits=None, alpha=None, beta=None):
     `alpha` and `beta` (`int`): indices of the qubits to
     be swapped; both are in the scientific indexing scheme
     starting from 0; they must NOT be the same
+
+    `sparse` (`bool`) : if `True`, returns a sparse matrix
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.universal_SWAP_matrix'
     ret = None
@@ -270,19 +303,10 @@ def universal_SWAP_matrix(number_of_qubits=None, alpha=None, beta=None):
                 "Indices alpha and beta are equal. It is " +\
                 "meaningless to swap with itself.", location=_ERROR_LOCATION_)
     else:
-        # first CNOT
-        matrix_of_first_CNOT = universal_CNOT_matrix(
-            number_of_qubits=number_of_qubits,
-            control_index=alpha,
-            target_index=beta)
-        # second CNOT
-        matrix_of_second_CNOT = universal_CNOT_matrix(
-            number_of_qubits=number_of_qubits,
-            control_index=beta,
-            target_index=alpha)
-        # operator matrix
-        # TODO Use matrix maker
-        total_matrix = matrix_product(matrix_of_first_CNOT,
-            matrix_product(matrix_of_second_CNOT, matrix_of_first_CNOT))
-        ret = total_matrix
+        axes = list(range(number_of_qubits))
+        axes[alpha], axes[beta] = beta, alpha
+        ret = permutation_matrix(
+                indices=qubit_permutation_indices(
+                    number_of_qubits=number_of_qubits, axes=axes),
+                sparse=sparse)
     return ret
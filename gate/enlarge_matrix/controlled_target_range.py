@@ -19,16 +19,18 @@ function above
 
 LOG
 
-Updated on 17 September 2021 | Created on 17 September 2021
+Updated on 17 October 2026 | Created on 17 September 2021
 """
 from .controlled_kernel import kernel
 
 
 def controlled_target_range(number_of_qubits=None, target_range=None,
-                            control_list=None, original_matrix=None):
+                            control_list=None, original_matrix=None,
+                            sparse=False):
     """ Target range is provided. """
     return kernel(
             number_of_qubits=number_of_qubits,
             control_list=control_list,
             target_range=target_range,
-            original_matrix=original_matrix)
+            original_matrix=original_matrix,
+            sparse=sparse)
@@ -20,7 +20,7 @@ CONTENT
 
 LOG
 
-Updated on 17 September 2021 | Created on 17 September 2021
+Updated on 17 October 2026 | Created on 17 September 2021
 """
 from linear_space.utils import maximum, minimum
 from linear_space.algebra import matrix_maker
@@ -85,28 +85,31 @@ def control_index_swap(control_list=None, target_tuple=None):
     }
 
 
-def pre_CISWAP_matrix(number_of_qubits=None, swap_list=None):
+def pre_CISWAP_matrix(number_of_qubits=None, swap_list=None, sparse=False):
     """ Swap matrix before applying operator """
     pairwise_swap_matrix_list = []
     for pair in swap_list:
         pairwise_swap_matrix_list.append(universal_SWAP_matrix(
-                number_of_qubits=number_of_qubits, alpha=pair[0], beta=pair[1])
+                number_of_qubits=number_of_qubits, alpha=pair[0], beta=pair[1],
+                sparse=sparse)
         )
     return matrix_maker(list_of_matrices=pairwise_swap_matrix_list, method='dot')
 
 
-def post_CISWAP_matrix(number_of_qubits=None, swap_list=None):
+def post_CISWAP_matrix(number_of_qubits=None, swap_list=None, sparse=False):
     """ Swap matrix after applying operator """
     pairwise_swap_matrix_list = []
     for pair in reversed(swap_list):
         pairwise_swap_matrix_list.append(universal_SWAP_matrix(
-                number_of_qubits=number_of_qubits, alpha=pair[0], beta=pair[1])
+                number_of_qubits=number_of_qubits, alpha=pair[0], beta=pair[1],
+                sparse=sparse)
         )
     return matrix_maker(list_of_matrices=pairwise_swap_matrix_list, method='dot')
 
 
 def controlled_target_tuple(number_of_qubits=None, target_tuple=None,
-                            control_list=None, original_matrix=None):
+                            control_list=None, original_matrix=None,
+                            sparse=False):
     """ Controlled operator matrix with target index
 
     Target index can be an integer or a tuple of integers.
@@ -118,7 +121,8 @@ def controlled_target_tuple(number_of_qubits=None, target_tuple=None,
             number_of_qubits=number_of_qubits,
             control_list=control_list,
             target_range=[target_tuple[0], target_tuple[0]],
-            original_matrix=original_matrix)
+            original_matrix=original_matrix,
+            sparse=sparse)
     # multiple target indices, FIXME not different from the above
     elif len(target_tuple) > 1:
         # call target range utility function
@@ -126,7 +130,8 @@ def controlled_target_tuple(number_of_qubits=None, target_tuple=None,
             number_of_qubits=number_of_qubits,
             control_list=control_list,
             target_range=[minimum(target_tuple), maximum(target_tuple)],
-            original_matrix=original_matrix)
+            original_matrix=original_matrix,
+            sparse=sparse)
     else:
         raise GateMatrixEnlargeError("Target tuple is empty.")
     return ret
@@ -37,11 +37,15 @@ desired enlarged matrix. Construction of the enlarged
 matrix per se can be delayed to the last moment when the
 matrix object is actually required.
 
+NOTE Both enlarge functions accept a keyword argument `sparse`.
+If `True`, identities are sparse and so is the enlarged matrix.
+
 LOG
 
-Updated on 10 September 2021 | Created on 09 September 2021
+Updated on 17 October 2026 | Created on 09 September 2021
 """
-from linear_space.utils import identity_by_bits
+from linear_space.matrix import SparseSquareMatrix
+from linear_space.utils import identity_by_bits, sparse_identity_by_bits
 from linear_space.algebra import matrix_maker
 from .errors import GateMatrixEnlargeError
 from .common import GenericGateMatrixEnlargeValidator
@@ -49,8 +53,22 @@ from .common import GenericGateMatrixEnlargeValidator
 _MODULE_LOCATION_ = 'gate.enlarge_matrix.noncontrolled'
 
 
+def _identity_maker(sparse=False):
+    """ Identity maker for dense or sparse enlargement """
+    if sparse:
+        return sparse_identity_by_bits
+    return identity_by_bits
+
+
+def _as_sparse(matrix):
+    """ Convert an enlarged matrix to a sparse matrix """
+    if isinstance(matrix, SparseSquareMatrix):
+        return matrix
+    return SparseSquareMatrix(array=matrix.as_array())
+
+
 def enlarge_single_qubit_matrix(number_of_qubits=None, target_index=None,
-                                original_matrix=None):
+                                original_matrix=None, sparse=False):
     """ Enlarge single-qubit operator matrix
 
     For application on multiple-qubit state.
@@ -80,9 +98,12 @@ def enlarge_single_qubit_matrix(number_of_qubits=None, target_index=None,
     `original_matrix` (`SquareMatirx`): the original
     single qubit matrix to be resized
 
+    `sparse` (`bool`) : if `True`, returns a sparse matrix
+
     RETURN
 
-    `new_matrix` (`SquareMatrix`) : enlarged operator matrix
+    `new_matrix` (`SquareMatrix` or `SparseSquareMatrix`) :
+    enlarged operator matrix
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.enlarge_single_qubit_matrix'
     new_matrix = None
@@ -91,6 +112,7 @@ def enlarge_single_qubit_matrix(number_of_qubits=None, target_index=None,
         target_range=[target_index,target_index],
         original_matrix=original_matrix)
     matrix_list = []
+    identity_maker = _identity_maker(sparse)
     if validator.is_valid:
         try:
             if original_matrix.nrows != 2 or original_matrix.ncols != 2:
@@ -105,23 +127,25 @@ def enlarge_single_qubit_matrix(number_of_qubits=None, target_index=None,
                 # Case 1: target is the first bit, matrix must tensor
                 # an identity from the right
                 if target_index == 0:
-                    right_idm = identity_by_bits(number_of_qubits-1)
+                    right_idm = identity_maker(number_of_qubits-1)
                     matrix_list = [original_matrix, right_idm]
                 # Case 2: target is the last bit, an identity matrix
                 # must tensor the matrix from the left
                 elif target_index == number_of_qubits - 1:
-                    left_idm = identity_by_bits(number_of_qubits-1)
+                    left_idm = identity_maker(number_of_qubits-1)
                     matrix_list = [left_idm, original_matrix]
                 # Case 3: target is in the middle, matrix is then
                 # sandwiched between two identities
                 else:
-                    left_idm = identity_by_bits(target_index)
-                    right_idm = identity_by_bits(
+                    left_idm = identity_maker(target_index)
+                    right_idm = identity_maker(
                             number_of_qubits - 1 - target_index)
                     matrix_list = [left_idm, original_matrix, right_idm]
             # make new matrix
             new_matrix = matrix_maker(list_of_matrices=matrix_list,
                                       method='tensor')
+            if sparse:
+                new_matrix = _as_sparse(new_matrix)
         except Exception as e:
             raise e
     else:
@@ -130,7 +154,7 @@ def enlarge_single_qubit_matrix(number_of_qubits=None, target_index=None,
 
 
 def enlarge_multiple_qubit_matrix(number_of_qubits=None, target_range=None,
-                                  original_matrix=None):
+                                  original_matrix=None, sparse=False):
     """ Enlarge a multiple-qubit gate matrix
 
     For application on an even larger multiple-qubit state.
@@ -151,9 +175,12 @@ def enlarge_multiple_qubit_matrix(number_of_qubits=None, target_range=None,
     `original_matrix` (`SquareMatirx`): the original
     single qubit matrix to be resized
 
+    `sparse` (`bool`) : if `True`, returns a sparse matrix
+
     RETURN
 
-    `new_matrix` (`SquareMatrix`) : enlarged operator matrix
+    `new_matrix` (`SquareMatrix` or `SparseSquareMatrix`) :
+    enlarged operator matrix
     """
     new_matrix = None
     validator = GenericGateMatrixEnlargeValidator(
@@ -161,6 +188,7 @@ def enlarge_multiple_qubit_matrix(number_of_qubits=None, target_range=None,
         target_range=target_range,
         original_matrix=original_matrix)
     matrix_list = []
+    identity_maker = _identity_maker(sparse)
     if validator.is_valid:
         try:
             # if target range narrows to one index, single-qubit gate
@@ -168,7 +196,8 @@ def enlarge_multiple_qubit_matrix(number_of_qubits=None, target_range=None,
                 new_matrix = enlarge_single_qubit_matrix(
                     number_of_qubits=number_of_qubits,
                     target_index=target_range[0],
-                    original_matrix=original_matrix)
+                    original_matrix=original_matrix,
+                    sparse=sparse)
             # Case 0: exactly same number of qubits
             elif target_range[0] == 0 \
                     and target_range[1] == number_of_qubits - 1:
@@ -177,25 +206,27 @@ def enlarge_multiple_qubit_matrix(number_of_qubits=None, target_range=None,
                 # Case 1: target range starts from the first bit,
                 # matrix must tensor product an identity from the right
                 if target_range[0] == 0:
-                    right_idm = identity_by_bits(
+                    right_idm = identity_maker(
                             number_of_qubits - 1 - target_range[1])
                     matrix_list = [original_matrix, right_idm]
                 # Case 2: target range covers the last bit,
                 # an identity matrix must tensor the matrix from the left
                 elif target_range[1] == number_of_qubits - 1:
-                    left_idm = identity_by_bits(target_range[0])
+                    left_idm = identity_maker(target_range[0])
                     matrix_list = [left_idm, original_matrix]
                 # Case 3: target range is in the middle,
                 # matrix is then sandwiched between two identities
                 else:
-                    left_idm = identity_by_bits(target_range[0])
-                    right_idm = identity_by_bits(
+                    left_idm = identity_maker(target_range[0])
+                    right_idm = identity_maker(
                             number_of_qubits - 1 - target_range[1])
                     matrix_list = [left_idm, original_matrix, right_idm]
             # create matrix
             if new_matrix is None:
                 new_matrix = matrix_maker(list_of_matrices=matrix_list,
                                           method='tensor')
+                if sparse:
+                    new_matrix = _as_sparse(new_matrix)
         except Exception as e:
             # TODO re-raise this
             raise e
@@ -147,6 +147,10 @@ class GatePrototype(QuantumOperator):
 
     ATTRIBUTES
 
+    `cls.is_pauli_x` (`bool`) : `True` if the gate matrix is
+    Pauli X, so that a single-control gate is a CNOT and only
+    permutes amplitudes; `False` by default
+
     `self.is_parameter_valid(,name,value)` : verifies if
     the value given to a parameter is valid;
     returns `True`(`False`) if valid(invalid)
@@ -164,6 +168,7 @@ class GatePrototype(QuantumOperator):
     """
     state_class = QubitState
     error_location = _MODULE_LOCATION_ + '.GatePrototype'
+    is_pauli_x = False
 
     def __new__(cls, *args, **kwargs):
         prototype = cls
@@ -15,10 +15,11 @@ Validators dedicated to gate prototype validation.
 
 LOG
 
-Updated on 30 September 2021 | Created on 12 March 2021
+Updated on 17 October 2026 | Created on 12 March 2021
 """
 import warnings
 
+from common.validator import BOUNDARY_SCOPE
 # verifiers
 from common.string import is_string, has_space, is_empty_string
 from common.function import function_signature, is_function
@@ -73,6 +74,7 @@ class GatePrototypeValidator(GateBaseValidator):
     """
     error_class = GatePrototypeValidationError
     error_location = _MODULE_LOCATION_ + '.GatePrototypeValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, prototype=None):
         super().__init__()
@@ -49,7 +49,7 @@ phase rotation
 
 LOG
 
-Updated on 22 September 2021 | Created on 29 June 2020
+Updated on 17 October 2026 | Created on 29 June 2020
 """
 import sys
 import inspect
@@ -85,9 +85,10 @@ class Pauli_X(SingleQubitGatePrototype):
     alias = 'PauliX'
     symbol = 'X'
     parameters = {}
+    is_pauli_x = True
 
     def gate_matrix(self):
-        return PAULI_X
+        return SquareMatrix(array=PAULI_X.as_array())
 
 
 @as_gate
@@ -114,7 +115,7 @@ class Pauli_Y(SingleQubitGatePrototype):
     parameters = {}
 
     def gate_matrix(self):
-        return PAULI_Y
+        return SquareMatrix(array=PAULI_Y.as_array())
 
 
 @as_gate
@@ -141,7 +142,7 @@ class Pauli_Z(SingleQubitGatePrototype):
     parameters = {}
 
     def gate_matrix(self):
-        return PAULI_Z
+        return SquareMatrix(array=PAULI_Z.as_array())
 
 
 @as_gate
@@ -166,9 +167,10 @@ class Flip_Single_Qubit(SingleQubitGatePrototype):
     alias = 'Flip'
     symbol = 'X'
     parameters = {}
+    is_pauli_x = True
 
     def gate_matrix(self):
-        return PAULI_X
+        return SquareMatrix(array=PAULI_X.as_array())
 
 
 @as_gate
@@ -195,7 +197,7 @@ class Walsh_Hadamard(SingleQubitGatePrototype):
     parameters = {}
 
     def gate_matrix(self):
-        return HADAMARD
+        return SquareMatrix(array=HADAMARD.as_array())
 
 
 @as_gate
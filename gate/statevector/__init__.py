@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+SUBPACK
+
+Matrix-free statevector application
+
+PATH
+
+[app_root]/gate/statevector/
+
+INTRO
+
+Routines that apply a gate matrix directly on a state
+vector without constructing the enlarged operator matrix.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from .errors import StatevectorContractionError
+from .contraction import apply_matrix_on_statevector, state_tensor_shape, \
+    apply_matrix_on_qubits
+from .permutation import qubit_permutation_indices, \
+    cnot_permutation_indices, permutation_matrix, permute_qubits, \
+    swap_qubits, reverse_qubits, apply_cnot_on_statevector
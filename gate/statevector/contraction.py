@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+gate.statevector.contraction.py
+
+PATH
+
+[app_root]/gate/statevector/contraction.py
+
+INTRO
+
+Matrix-free application of a gate matrix on a state vector.
+
+Enlarging a gate matrix to fit a global state of `n` qubits
+produces a `2^n`-by-`2^n` operator matrix, which is then
+multiplied with the state vector. Both memory and time grow
+as `4^n`. Yet a single-qubit gate only ever mixes pairs of
+amplitudes that differ in the target bit.
+
+Here, the state vector of `n` qubits is reshaped into a
+rank-`n` tensor of shape `(2, 2, ..., 2)`, where axis `k`
+corresponds to qubit `k` (qubit 0 being the most significant
+bit, consistent with the tensor-product ordering used by
+`matrix_maker`). The original gate matrix, of dimension
+`2^m`-by-`2^m` for `m` target qubits, is contracted only
+along the target axes. Control bits are honoured by slicing
+the tensor at the required control states, so that only the
+amplitudes meeting the condition are transformed.
+
+Memory and per-gate cost are thus of order `2^n`.
+
+CONTENT
+
+`apply_matrix_on_statevector()` - applies an original gate
+matrix on the target range of a state array, optionally
+conditioned on a control list
+
+`state_tensor_shape()` - tensor shape of a (batched) state array
+
+`apply_matrix_on_qubits()` - applies a dense block on an
+arbitrary (not necessarily continuous) tuple of qubits,
+optionally conditioned on a control list
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import numpy as np
+
+from gate.enlarge_matrix.common import GenericGateMatrixEnlargeValidator
+from .errors import StatevectorContractionError
+
+_MODULE_LOCATION_ = 'gate.statevector.contraction'
+
+
+def apply_matrix_on_statevector(state_array=None, number_of_qubits=None,
+                                target_range=None, original_matrix=None,
+                                control_list=None):
+    """ Apply gate matrix on a state array via tensor contraction
+
+    Parameters are validated exactly the same way as those
+    passed to the matrix enlargement functions, so that the
+    two application paths accept and reject the same input.
+    Contraction itself is done by `apply_matrix_on_qubits`, with
+    the target range as qubit indices.
+
+    ARGUMENTS
+
+    `state_array` (`ndarray`) : internal array of the state
+    vector; either a column of shape `(2^n, 1)` or a flat
+    array of size `2^n`; a batch of states stacked as columns,
+    of shape `(2^n, m)`, is also accepted
+
+    `number_of_qubits` (`int`) : total number of qubits in
+    the state
+
+    `target_range` (`list`) : a list of 2 integers defining
+    the continuous range of qubits the original matrix is
+    applied to; two identical integers reduce to target index
+
+    `original_matrix` (`SquareMatrix`) : original gate matrix
+    compatible with the number of qubits in target range
+
+    `control_list` (`list`) : optional; a list of control tuples
+    such as `[(0, '1'), (3, '0')]`
+
+    RETURN
+
+    `new_array` (`ndarray`) : transformed state array of the
+    same shape as `state_array`; input array is not modified
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.apply_matrix_on_statevector'
+    validator = GenericGateMatrixEnlargeValidator(
+        number_of_qubits=number_of_qubits,
+        target_range=target_range,
+        control_list=control_list,
+        original_matrix=original_matrix)
+    if not validator.is_valid:
+        validator.raise_last_error(location=_ERROR_LOCATION_)
+    return apply_matrix_on_qubits(
+            state_array=state_array, number_of_qubits=number_of_qubits,
+            qubit_indices=list(range(target_range[0], target_range[1] + 1)),
+            block_matrix=original_matrix, control_list=control_list)
+
+
+def state_tensor_shape(state_array, number_of_qubits, location=None):
+    """ Tensor shape of a state array
+
+    A state array of size `2^n` is viewed as a tensor of shape
+    `(2,) * n`. An array of shape `(2^n, m)` is viewed as a batch
+    of `m` states, i.e. a tensor of shape `(2,) * n + (m,)`; the
+    batch axis is never contracted.
+    """
+    if state_array.size == 2**number_of_qubits:
+        return (2,) * number_of_qubits
+    if state_array.ndim == 2 and state_array.shape[0] == 2**number_of_qubits:
+        return (2,) * number_of_qubits + (state_array.shape[1],)
+    raise StatevectorContractionError("Size of state array " +\
+            "doesn't match the given number of qubits.", location=location)
+
+
+def apply_matrix_on_qubits(state_array=None, number_of_qubits=None,
+                           qubit_indices=None, block_matrix=None,
+                           control_list=None):
+    """ Apply a dense block on arbitrary qubits of a state array
+
+    Unlike `apply_matrix_on_statevector`, qubits need not form
+    a continuous range, nor be in ascending order. The first
+    qubit in `qubit_indices` corresponds to the most significant
+    bit of the block matrix.
+
+    ARGUMENTS
+
+    `state_array` (`ndarray`) : internal array of the state
+    vector; either a column of shape `(2^n, 1)` or a flat
+    array of size `2^n`; a batch of states stacked as columns,
+    of shape `(2^n, m)`, is also accepted
+
+    `number_of_qubits` (`int`) : total number of qubits in
+    the state
+
+    `qubit_indices` (`list`) : distinct indices of the qubits
+    the block acts on
+
+    `block_matrix` (`SquareMatrix`) : dense block of dimension
+    `2^m`-by-`2^m` for `m` qubits in `qubit_indices`
+
+    `control_list` (`list`) : optional; a list of control tuples
+    such as `[(0, '1'), (3, '0')]`; control qubits must not be
+    in `qubit_indices`
+
+    RETURN
+
+    `new_array` (`ndarray`) : transformed state array of the
+    same shape as `state_array`; input array is not modified
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.apply_matrix_on_qubits'
+    number_of_targets = len(qubit_indices)
+    if len(set(qubit_indices)) != number_of_targets:
+        raise StatevectorContractionError("Qubit indices " +\
+                "of a block must be distinct.", location=_ERROR_LOCATION_)
+    for index in qubit_indices:
+        if index not in range(0, number_of_qubits):
+            raise StatevectorContractionError("Qubit index " +\
+                    "{} is out of range.".format(index),
+                    location=_ERROR_LOCATION_)
+    if block_matrix.nrows != 2**number_of_targets:
+        raise StatevectorContractionError("Dimension of block " +\
+                "matrix doesn't match the number of qubits.",
+                location=_ERROR_LOCATION_)
+    tensor_shape = state_tensor_shape(state_array, number_of_qubits,
+                                      location=_ERROR_LOCATION_)
+    control_axes = [item[0] for item in (control_list or [])]
+    for axis in control_axes:
+        if axis in qubit_indices:
+            raise StatevectorContractionError("Control index " +\
+                    "{} is also a target.".format(axis),
+                    location=_ERROR_LOCATION_)
+    tensor = state_array.reshape(tensor_shape)
+    block_tensor = block_matrix.as_array().reshape(
+            (2,) * (2 * number_of_targets))
+    selection = [slice(None)] * number_of_qubits
+    for index, state in (control_list or []):
+        selection[index] = int(state)
+    selection = tuple(selection)
+    remaining_axes = [axis for axis in range(number_of_qubits)
+                      if axis not in control_axes]
+    sub_target_axes = [remaining_axes.index(axis) for axis in qubit_indices]
+    contracted = np.tensordot(
+            block_tensor, tensor[selection],
+            axes=(list(range(number_of_targets, 2 * number_of_targets)),
+                  sub_target_axes))
+    contracted = np.moveaxis(contracted, list(range(number_of_targets)),
+                             sub_target_axes)
+    if control_axes:
+        new_tensor = tensor.copy()
+        new_tensor[selection] = contracted
+    else:
+        new_tensor = contracted
+    return np.ascontiguousarray(new_tensor).reshape(state_array.shape)
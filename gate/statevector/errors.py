@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+gate.statevector.errors.py
+
+PATH
+
+[package_root]/gate/statevector/errors.py
+
+INTRO
+
+Dedicated errors for matrix-free statevector application.
+
+CONTENT
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from gate.base import GateBaseError
+
+
+class StatevectorContractionError(GateBaseError):
+    """ Statevector contraction error
+
+    Error class used in statevector contraction functions.
+
+    ENTRY
+
+    Module `contraction`
+    """
+    header = "Statevector_Contraction_Error"
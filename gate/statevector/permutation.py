@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+gate.statevector.permutation.py
+
+PATH
+
+[app_root]/gate/statevector/permutation.py
+
+INTRO
+
+Permutation gates applied without matrix product.
+
+SWAP, CNOT and reversal of qubit order only permute the
+amplitudes of a state; no amplitude is ever combined with
+another. They are thus applied as index permutations.
+
+[1] Permutation of qubits, e.g. SWAP or reversal, is a
+transpose of the state tensor of shape `(2,) * n`, where
+axis `k` corresponds to qubit `k`.
+
+[2] CNOT flips the target bit of all basis indices whose
+control bit matches the control state; the new state is
+gathered from the old one by numpy fancy indexing.
+
+The same index arrays construct the permutation operator
+matrix directly, i.e. a (sparse) identity with rows permuted,
+should the operator matrix be needed.
+
+CONTENT
+
+`qubit_permutation_indices()` - basis index array realising
+a permutation of qubits
+
+`cnot_permutation_indices()` - basis index array realising
+a CNOT
+
+`permutation_matrix()` - operator matrix of a basis index
+permutation
+
+`permute_qubits()` - permutes qubit axes of a state array
+
+`swap_qubits()` - swaps two qubits of a state array
+
+`reverse_qubits()` - reverses the order of qubits in a
+state array
+
+`apply_cnot_on_statevector()` - applies CNOT on a state array
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import numpy as np
+
+from linear_space.matrix import SquareMatrix, SparseSquareMatrix
+from linear_space.scipy_lib import sp_csr_matrix
+from linear_space.precision import complex_dtype
+
+from .errors import StatevectorContractionError
+from .contraction import state_tensor_shape
+
+_MODULE_LOCATION_ = 'gate.statevector.permutation'
+
+
+def _validate_indices(number_of_qubits, indices, location):
+    """ Raise if qubit indices are out of range or repeated """
+    for index in indices:
+        if index not in range(0, number_of_qubits):
+            raise StatevectorContractionError("Qubit index " +\
+                    "{} is out of range.".format(index), location=location)
+    if len(set(indices)) != len(indices):
+        raise StatevectorContractionError("Qubit indices " +\
+                "must be distinct.", location=location)
+
+
+def qubit_permutation_indices(number_of_qubits=None, axes=None):
+    """ Basis index array of a qubit permutation
+
+    Qubit permutation is given in the convention of numpy
+    transpose, i.e. qubit `k` of the new state is qubit
+    `axes[k]` of the old state.
+
+    ARGUMENTS
+
+    `number_of_qubits` (`int`) : number of qubits of the state
+
+    `axes` (`list`) : a permutation of `range(number_of_qubits)`
+
+    RETURN
+
+    An integer array `p`, such that `new_state = state[p]`.
+    """
+    _validate_indices(number_of_qubits, axes,
+            _MODULE_LOCATION_ + '.qubit_permutation_indices')
+    if len(axes) != number_of_qubits:
+        raise StatevectorContractionError("Permutation must " +\
+                "contain all qubits.",
+                location=_MODULE_LOCATION_ + '.qubit_permutation_indices')
+    new_indices = np.arange(2**number_of_qubits)
+    old_indices = np.zeros_like(new_indices)
+    for new_qubit, old_qubit in enumerate(axes):
+        bit = (new_indices >> (number_of_qubits - 1 - new_qubit)) & 1
+        old_indices |= bit << (number_of_qubits - 1 - old_qubit)
+    return old_indices
+
+
+def cnot_permutation_indices(number_of_qubits=None, control_index=None,
+                             target_index=None, control_state='1'):
+    """ Basis index array of a CNOT
+
+    RETURN
+
+    An integer array `p`, such that `new_state = state[p]`.
+    """
+    _validate_indices(number_of_qubits, [control_index, target_index],
+            _MODULE_LOCATION_ + '.cnot_permutation_indices')
+    indices = np.arange(2**number_of_qubits)
+    control_bit = (indices >> (number_of_qubits - 1 - control_index)) & 1
+    flip = (control_bit == int(control_state)).astype(indices.dtype)
+    return indices ^ (flip << (number_of_qubits - 1 - target_index))
+
+
+def permutation_matrix(indices=None, sparse=False):
+    """ Operator matrix of a basis index permutation
+
+    Row `j` of the matrix has a single 1 in column `indices[j]`.
+    No matrix product is involved.
+
+    ARGUMENTS
+
+    `indices` (`ndarray`) : basis index array, e.g. returned by
+    `qubit_permutation_indices`
+
+    `sparse` (`bool`) : if `True`, returns a sparse matrix
+
+    RETURN
+
+    A `SquareMatrix`, or a `SparseSquareMatrix` if sparse.
+    """
+    dimension = len(indices)
+    if sparse:
+        return SparseSquareMatrix(array=sp_csr_matrix(
+                (np.ones(dimension, dtype=complex_dtype()),
+                 (np.arange(dimension), indices)),
+                shape=(dimension, dimension)))
+    return SquareMatrix.from_trusted_array(
+            np.identity(dimension, dtype=complex_dtype())[indices])
+
+
+def permute_qubits(state_array=None, number_of_qubits=None, axes=None):
+    """ Permute qubits of a state array
+
+    Qubit `k` of the new state is qubit `axes[k]` of the old
+    state. Returned array has the shape of `state_array`.
+
+    NOTE Trailing axes beyond `axes` are left in place, which
+    allows a square array to be permuted as a state of twice
+    as many qubits, and a batch of states stacked as columns
+    to be permuted at once.
+    """
+    _validate_indices(number_of_qubits, axes,
+            _MODULE_LOCATION_ + '.permute_qubits')
+    tensor_shape = state_tensor_shape(state_array, number_of_qubits,
+            location=_MODULE_LOCATION_ + '.permute_qubits')
+    full_axes = list(axes) + list(range(len(axes), len(tensor_shape)))
+    tensor = state_array.reshape(tensor_shape)
+    return np.ascontiguousarray(
+            np.transpose(tensor, full_axes)).reshape(state_array.shape)
+
+
+def swap_qubits(state_array=None, number_of_qubits=None, alpha=None,
+                beta=None):
+    """ Swap qubits `alpha` and `beta` of a state array """
+    if alpha == beta:
+        raise StatevectorContractionError("Indices alpha and " +\
+                "beta are equal.", location=_MODULE_LOCATION_+'.swap_qubits')
+    axes = list(range(number_of_qubits))
+    axes[alpha], axes[beta] = beta, alpha
+    return permute_qubits(state_array=state_array,
+                          number_of_qubits=number_of_qubits, axes=axes)
+
+
+def reverse_qubits(state_array=None, number_of_qubits=None,
+                   qubit_indices=None):
+    """ Reverse the order of qubits of a state array
+
+    If `qubit_indices` is `None`, all qubits are reversed;
+    otherwise qubits in the list swap positions, the first
+    with the last, the second with the penultimate, etc.
+    """
+    if qubit_indices is None:
+        qubit_indices = list(range(number_of_qubits))
+    axes = list(range(number_of_qubits))
+    for position, index in enumerate(qubit_indices):
+        axes[index] = qubit_indices[len(qubit_indices) - 1 - position]
+    return permute_qubits(state_array=state_array,
+                          number_of_qubits=number_of_qubits, axes=axes)
+
+
+def apply_cnot_on_statevector(state_array=None, number_of_qubits=None,
+                              control_index=None, target_index=None,
+                              control_state='1'):
+    """ Apply CNOT on a state array by fancy indexing """
+    if state_array.size != 2**number_of_qubits:
+        raise StatevectorContractionError("Size of state array " +\
+                "doesn't match the given number of qubits.",
+                location=_MODULE_LOCATION_ + '.apply_cnot_on_statevector')
+    indices = cnot_permutation_indices(number_of_qubits=number_of_qubits,
+                                       control_index=control_index,
+                                       target_index=target_index,
+                                       control_state=control_state)
+    return state_array.reshape(-1)[indices].reshape(state_array.shape)
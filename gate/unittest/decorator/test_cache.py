@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test:
+    gate.decorator.cache.py
+    gate.decorator.decorator.py
+
+Main test:
+    Byte-bounded LRU cache of global operator matrices.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+from linear_space.matrix import SquareMatrix
+from qubit import ComputationalBasis
+
+from gate.base import GateBaseError
+from gate.decorator.cache import OperatorMatrixCache, OPERATOR_MATRIX_CACHE, \
+    operator_matrix_key
+from gate.single_qubit import Walsh_Hadamard, Rotation_About_X
+
+
+def matrix_of_bytes(dimension):
+    # complex128, 16 bytes per element
+    return SquareMatrix(array=np.zeros((dimension, dimension),
+                                       dtype=np.complex128))
+
+
+class TestOperatorMatrixCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = OperatorMatrixCache(max_bytes=1024)
+        self.assertTrue(cache.get('a') is None)
+        matrix = matrix_of_bytes(2)
+        cache.put('a', matrix)
+        self.assertTrue(cache.get('a') is matrix)
+        stats = cache.statistics()
+        self.assertTrue(stats['hits'] == 1)
+        self.assertTrue(stats['misses'] == 1)
+        self.assertTrue(stats['current_bytes'] == 64)
+
+    def test_least_recently_used_evicted(self):
+        cache = OperatorMatrixCache(max_bytes=256)
+        cache.put('a', matrix_of_bytes(2))
+        cache.put('b', matrix_of_bytes(2))
+        cache.put('c', matrix_of_bytes(2))
+        cache.put('d', matrix_of_bytes(2))
+        # 'a' is used recently, 'b' is evicted
+        cache.get('a')
+        cache.put('e', matrix_of_bytes(2))
+        self.assertTrue(cache.evictions == 1)
+        self.assertTrue(cache.get('b') is None)
+        self.assertTrue(cache.get('a') is not None)
+        self.assertTrue(cache.current_bytes == 256)
+
+    def test_oversized_matrix_not_stored(self):
+        cache = OperatorMatrixCache(max_bytes=100)
+        cache.put('a', matrix_of_bytes(4))
+        self.assertTrue(cache.number_of_entries == 0)
+
+    def test_configure(self):
+        cache = OperatorMatrixCache(max_bytes=256)
+        cache.put('a', matrix_of_bytes(2))
+        cache.put('b', matrix_of_bytes(2))
+        cache.configure(max_bytes=64)
+        self.assertTrue(cache.number_of_entries == 1)
+        cache.configure(enabled=False)
+        self.assertTrue(cache.get('b') is None)
+        self.assertRaises(GateBaseError, cache.configure, max_bytes=-1)
+
+
+class TestOperatorMatrixKey(unittest.TestCase):
+    def test_control_index_normalised(self):
+        prototype = Walsh_Hadamard.gate_prototype
+        state = ComputationalBasis(bitstring='000')
+        key_index = operator_matrix_key(prototype, input_state=state,
+                                        target_index=0, control_index=2)
+        key_list = operator_matrix_key(prototype, input_state=state,
+                                       target_index=0,
+                                       control_list=[(2, '1')])
+        self.assertTrue(key_index == key_list)
+
+    def test_control_order_ignored(self):
+        prototype = Walsh_Hadamard.gate_prototype
+        state = ComputationalBasis(bitstring='0000')
+        key_1 = operator_matrix_key(prototype, input_state=state,
+                target_index=0, control_list=[(1, '1'), (3, '0')])
+        key_2 = operator_matrix_key(prototype, input_state=state,
+                target_index=0, control_list=[(3, '0'), (1, '1')])
+        key_3 = operator_matrix_key(prototype, input_state=state,
+                target_index=0, control_list=[(3, '1'), (1, '1')])
+        self.assertTrue(key_1 == key_2)
+        self.assertTrue(key_1 != key_3)
+
+
+class TestGateCache(unittest.TestCase):
+    def setUp(self):
+        OPERATOR_MATRIX_CACHE.clear()
+
+    def tearDown(self):
+        OPERATOR_MATRIX_CACHE.clear()
+
+    def test_repeated_matrix_reused(self):
+        state = ComputationalBasis(bitstring='0000')
+        first = Walsh_Hadamard.global_operator_matrix(
+                input_state=state, target_index=1)
+        second = Walsh_Hadamard.global_operator_matrix(
+                input_state=ComputationalBasis(bitstring='1010'),
+                target_index=1)
+        self.assertTrue(first is second)
+        self.assertTrue(OPERATOR_MATRIX_CACHE.hits == 1)
+        self.assertTrue(OPERATOR_MATRIX_CACHE.misses == 1)
+
+    def test_parameters_distinguished(self):
+        state = ComputationalBasis(bitstring='000')
+        rx_1 = Rotation_About_X.global_operator_matrix(
+                input_state=state, target_index=0, theta=0.1)
+        rx_2 = Rotation_About_X.global_operator_matrix(
+                input_state=state, target_index=0, theta=0.2)
+        self.assertFalse(np.allclose(rx_1.as_array(), rx_2.as_array()))
+        self.assertTrue(OPERATOR_MATRIX_CACHE.misses == 2)
+
+    def test_cached_equals_constructed(self):
+        state = ComputationalBasis(bitstring='000')
+        params = {'input_state': state, 'target_index': 2,
+                  'control_list': [(0, '1')]}
+        cached = Walsh_Hadamard.global_operator_matrix(**params)
+        cached = Walsh_Hadamard.global_operator_matrix(**params)
+        OPERATOR_MATRIX_CACHE.configure(enabled=False)
+        try:
+            constructed = Walsh_Hadamard.global_operator_matrix(**params)
+        finally:
+            OPERATOR_MATRIX_CACHE.configure(enabled=True)
+        self.assertTrue(np.allclose(cached.as_array(),
+                                    constructed.as_array()))
+
+
+if __name__ == '__main__':
+    unittest.main()
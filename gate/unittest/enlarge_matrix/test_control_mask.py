@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test:
+    gate.enlarge_matrix.controlled_kernel.py
+
+Main test:
+    Control mask, index-arithmetic kernel and its state
+    counterpart `kernel_apply`.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.matrix import SquareMatrix, PAULI_X, \
+    STATE_ZERO_PROJECTION, STATE_ONE_PROJECTION
+from linear_space.utils import identity_by_bits
+from linear_space.algebra import matrix_maker, matrix_add
+
+from gate.enlarge_matrix.errors import GateMatrixEnlargeError
+from gate.enlarge_matrix.controlled_kernel import kernel, kernel_apply, \
+    control_mask
+
+
+class Test_Control_Mask(unittest.TestCase):
+    def test_single_control(self):
+        mask = control_mask(number_of_qubits=3, control_list=[(0, '1')])
+        self.assertTrue(list(np.nonzero(mask)[0]) == [4, 5, 6, 7])
+
+    def test_mixed_controls(self):
+        mask = control_mask(number_of_qubits=3,
+                            control_list=[(0, '0'), (2, '1')])
+        self.assertTrue(list(np.nonzero(mask)[0]) == [1, 3])
+
+
+class Test_Kernel_Against_Projectors(unittest.TestCase):
+    def test_cnot_with_zero_control(self):
+        # |0><0| x X x I + |1><1| x I x I
+        expected = matrix_add(
+            matrix_maker(list_of_matrices=[STATE_ZERO_PROJECTION, PAULI_X,
+                identity_by_bits(1)], method='tensor'),
+            matrix_maker(list_of_matrices=[STATE_ONE_PROJECTION,
+                identity_by_bits(2)], method='tensor'))
+        opmat = kernel(number_of_qubits=3, control_list=[(0, '0')],
+                       target_range=[1, 1], original_matrix=PAULI_X)
+        self.assertTrue(isinstance(opmat, SquareMatrix))
+        self.assertTrue(np.array_equal(opmat.as_array(), expected.as_array()))
+
+    def test_control_inside_target_range(self):
+        original_matrix = SquareMatrix(array=np.identity(8))
+        with self.assertRaises(GateMatrixEnlargeError):
+            kernel(number_of_qubits=4, control_list=[(1, '1')],
+                   target_range=[0, 2], original_matrix=original_matrix)
+
+    def test_large_toffoli(self):
+        # only one pair of rows is swapped
+        noq = 10
+        control_list = [(i, '1') for i in range(0, noq - 1)]
+        opmat = kernel(number_of_qubits=noq, control_list=control_list,
+                       target_range=[noq - 1, noq - 1],
+                       original_matrix=PAULI_X).as_array()
+        expected = np.identity(2**noq)
+        expected[[-2, -1]] = expected[[-1, -2]]
+        self.assertTrue(np.array_equal(opmat, expected))
+
+
+class Test_Kernel_Apply(unittest.TestCase):
+    def test_agrees_with_kernel(self):
+        noq = 5
+        state_array = np.arange(1, 2**noq + 1).reshape(2**noq, 1) + 0j
+        control_list = [(4, '1'), (0, '0')]
+        original_matrix = kernel(number_of_qubits=2, control_list=[(0, '1')],
+                target_range=[1, 1], original_matrix=PAULI_X)
+        opmat = kernel(number_of_qubits=noq, control_list=list(control_list),
+                       target_range=[1, 2], original_matrix=original_matrix)
+        new_array = kernel_apply(state_array=state_array,
+                number_of_qubits=noq, control_list=list(control_list),
+                target_range=[1, 2], original_matrix=original_matrix)
+        self.assertTrue(np.array_equal(new_array,
+                                       opmat.as_array() @ state_array))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test:
+    gate.enlarge_matrix.noncontrolled.py
+    gate.enlarge_matrix.controlled_kernel.py
+    gate.decorator.decorator.py
+
+Main test:
+    Sparse enlarged operator matrices must agree with
+    their dense counterparts.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+from linear_space.matrix import SquareMatrix, SparseSquareMatrix, \
+    HADAMARD, PAULI_Y
+from qubit.utils import qubit_from_bitlist
+from gate import single_qubit_gates as singles
+from gate.enlarge_matrix.noncontrolled import enlarge_single_qubit_matrix, \
+    enlarge_multiple_qubit_matrix
+from gate.enlarge_matrix.controlled_kernel import kernel, \
+    universal_SWAP_matrix
+
+
+def two_qubit_matrix():
+    return SquareMatrix(array=np.kron(HADAMARD.as_array(),
+                                      PAULI_Y.as_array()))
+
+
+class TestSparse_Noncontrolled(unittest.TestCase):
+    def test_single_qubit(self):
+        for ti in range(0, 4):
+            dense = enlarge_single_qubit_matrix(number_of_qubits=4,
+                    target_index=ti, original_matrix=PAULI_Y)
+            sparse = enlarge_single_qubit_matrix(number_of_qubits=4,
+                    target_index=ti, original_matrix=PAULI_Y, sparse=True)
+            self.assertTrue(isinstance(sparse, SparseSquareMatrix))
+            self.assertTrue(sparse.nnz == 16)
+            self.assertTrue(np.array_equal(dense.as_array(),
+                                           sparse.as_array()))
+
+    def test_multiple_qubit(self):
+        for tr in [[0, 1], [1, 2], [2, 3]]:
+            dense = enlarge_multiple_qubit_matrix(number_of_qubits=4,
+                    target_range=tr, original_matrix=two_qubit_matrix())
+            sparse = enlarge_multiple_qubit_matrix(number_of_qubits=4,
+                    target_range=tr, original_matrix=two_qubit_matrix(),
+                    sparse=True)
+            self.assertTrue(np.array_equal(dense.as_array(),
+                                           sparse.as_array()))
+
+
+class TestSparse_Controlled(unittest.TestCase):
+    def test_kernel(self):
+        params = {'number_of_qubits': 5, 'control_list': [(0, '0'), (4, '1')],
+                  'target_range': [2, 3], 'original_matrix': two_qubit_matrix()}
+        dense = kernel(**params)
+        sparse = kernel(sparse=True, **params)
+        self.assertTrue(isinstance(sparse, SparseSquareMatrix))
+        self.assertTrue(np.array_equal(dense.as_array(), sparse.as_array()))
+
+    def test_swap(self):
+        dense = universal_SWAP_matrix(number_of_qubits=4, alpha=0, beta=3)
+        sparse = universal_SWAP_matrix(number_of_qubits=4, alpha=0, beta=3,
+                                       sparse=True)
+        self.assertTrue(sparse.nnz == 16)
+        self.assertTrue(np.array_equal(dense.as_array(), sparse.as_array()))
+
+
+class TestSparse_Decorator(unittest.TestCase):
+    def test_global_operator_matrix(self):
+        state = qubit_from_bitlist([(1, '0100'), (1j, '1011')])
+        gate = singles['Hadamard']
+        for params in [{'target_index': 1},
+                       {'target_index': 3, 'control_index': 0},
+                       {'target_index': 0, 'control_list': [(2, '0')]}]:
+            dense = gate(input_state=state, **params)
+            sparse = gate(input_state=state, sparse=True, **params)
+            self.assertTrue(isinstance(gate.as_matrix(), SparseSquareMatrix))
+            self.assertTrue(np.allclose(dense.as_vector().as_array(),
+                                        sparse.as_vector().as_array(),
+                                        rtol=0, atol=1e-15))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test:
+    gate.statevector.contraction.py
+    gate.decorator.statevector.py
+
+Main test:
+    Matrix-free application of gate on state vector
+    must agree with the global operator matrix.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+from unittest import mock
+import numpy as np
+from linear_space.algebra import matrix_product
+from linear_space.matrix import SquareMatrix, PAULI_X
+from qubit import ComputationalBasis
+from qubit.utils import qubit_from_bitlist
+from gate import single_qubit_gates as singles
+from gate.enlarge_matrix.controlled_kernel import kernel
+from gate.statevector import apply_matrix_on_statevector, \
+    apply_matrix_on_qubits, StatevectorContractionError
+
+
+CONTRACTION = 'gate.decorator.statevector.apply_matrix_on_statevector'
+
+
+def test_state():
+    return qubit_from_bitlist([(1, '0100'), (1j, '1011'), (0.5, '1110'),
+                               (-0.5, '0001')])
+
+
+def dense_apply(gate, **params):
+    opmat = gate.global_operator_matrix(**params)
+    return matrix_product(opmat, params['input_state'].as_vector()).as_array()
+
+
+class TestContraction_Noncontrolled(unittest.TestCase):
+    def test_every_target(self):
+        state = test_state()
+        for alias in ['Hadamard', 'PauliY', 'Phase', 'EighthPi']:
+            gate = singles[alias]
+            for ti in range(0, 4):
+                params = {'input_state': state, 'target_index': ti}
+                new_state = gate.statevector_apply(**params)
+                self.assertTrue(np.allclose(new_state.as_vector().as_array(),
+                                            dense_apply(gate, **params),
+                                            rtol=0, atol=1e-15))
+
+    def test_single_qubit_state(self):
+        state = ComputationalBasis(bitstring='0')
+        new_state = singles['Flip'].statevector_apply(input_state=state)
+        self.assertTrue(new_state.as_vector()[1] == 1)
+
+    def test_parameterised_gate(self):
+        state = test_state()
+        gate = singles['PhaseRotation']
+        params = {'input_state': state, 'target_index': 2, 'n': 1, 'm': 3}
+        new_state = gate.statevector_apply(**params)
+        self.assertTrue(np.allclose(new_state.as_vector().as_array(),
+                                    dense_apply(gate, **params),
+                                    rtol=0, atol=1e-15))
+
+
+class TestContraction_Controlled(unittest.TestCase):
+    def test_toffoli(self):
+        state = ComputationalBasis(bitstring='110')
+        new_state = singles['Flip'].statevector_apply(input_state=state,
+                target_index=2, control_list=[(0, '1'), (1, '1')])
+        self.assertTrue(new_state.as_vector()[7] == 1)
+
+    def test_control_below_target(self):
+        state = test_state()
+        gate = singles['Hadamard']
+        params = {'input_state': state, 'target_index': 1,
+                  'control_list': [(3, '1'), (0, '0')]}
+        new_state = gate.statevector_apply(**params)
+        self.assertTrue(np.allclose(new_state.as_vector().as_array(),
+                                    dense_apply(gate, **params),
+                                    rtol=0, atol=1e-15))
+
+    def test_control_index(self):
+        state = test_state()
+        gate = singles['PauliX']
+        params = {'input_state': state, 'target_index': 3,
+                  'control_index': 1}
+        new_state = gate.statevector_apply(**params)
+        self.assertTrue(np.allclose(new_state.as_vector().as_array(),
+                                    dense_apply(gate, **params),
+                                    rtol=0, atol=1e-15))
+
+    def test_cnot_permutation(self):
+        # single-control flip permutes amplitudes without contraction
+        state = test_state()
+        for alias in ['Flip', 'PauliX']:
+            gate = singles[alias]
+            for control_state in ['0', '1']:
+                params = {'input_state': state, 'target_index': 0,
+                          'control_list': [(2, control_state)]}
+                with mock.patch(CONTRACTION) as contraction:
+                    new_state = gate.statevector_apply(**params)
+                contraction.assert_not_called()
+                self.assertTrue(np.allclose(
+                        new_state.as_vector().as_array(),
+                        dense_apply(gate, **params), rtol=0, atol=1e-15))
+        # other single-control gates are contracted
+        params = {'input_state': state, 'target_index': 0,
+                  'control_list': [(2, '1')]}
+        with mock.patch(CONTRACTION,
+                        wraps=apply_matrix_on_statevector) as contraction:
+            singles['PauliY'].statevector_apply(**params)
+        contraction.assert_called_once()
+
+
+class TestContraction_Function(unittest.TestCase):
+    def test_target_range(self):
+        state = test_state()
+        cnot = kernel(number_of_qubits=2, control_list=[(0, '1')],
+                      target_range=[1, 1], original_matrix=PAULI_X)
+        opmat = kernel(number_of_qubits=4, control_list=[(0, '1')],
+                       target_range=[2, 3], original_matrix=cnot)
+        new_array = apply_matrix_on_statevector(
+                state_array=state.as_vector().as_array(),
+                number_of_qubits=4,
+                target_range=[2, 3],
+                original_matrix=cnot,
+                control_list=[(0, '1')])
+        expected = matrix_product(opmat, state.as_vector()).as_array()
+        self.assertTrue(np.allclose(new_array, expected, rtol=0, atol=1e-15))
+
+    def test_batch_of_states(self):
+        # contraction is shared with apply_matrix_on_qubits
+        first = test_state().as_vector().as_array()
+        second = ComputationalBasis(bitstring='1010').as_vector().as_array()
+        params = {'number_of_qubits': 4, 'target_range': [1, 1],
+                  'original_matrix': PAULI_X, 'control_list': [(3, '0')]}
+        batch = apply_matrix_on_statevector(
+                state_array=np.hstack([first, second]), **params)
+        for column, array in enumerate([first, second]):
+            self.assertTrue(np.allclose(
+                    batch[:, [column]],
+                    apply_matrix_on_statevector(state_array=array, **params),
+                    rtol=0, atol=1e-15))
+
+    def test_input_untouched(self):
+        state = test_state()
+        state_array = state.as_vector().as_array()
+        original = state_array.copy()
+        apply_matrix_on_statevector(state_array=state_array,
+                number_of_qubits=4, target_range=[0, 0],
+                original_matrix=PAULI_X, control_list=[(1, '1')])
+        self.assertTrue(np.array_equal(state_array, original))
+
+    def test_control_inside_target_range(self):
+        state = test_state()
+        cnot = kernel(number_of_qubits=2, control_list=[(0, '1')],
+                      target_range=[1, 1], original_matrix=PAULI_X)
+        widened = np.kron(cnot.as_array(), np.identity(2))
+        with self.assertRaises(StatevectorContractionError):
+            apply_matrix_on_statevector(
+                    state_array=state.as_vector().as_array(),
+                    number_of_qubits=4, target_range=[0, 2],
+                    original_matrix=SquareMatrix(array=widened),
+                    control_list=[(1, '1')])
+
+
+class TestContraction_Qubits(unittest.TestCase):
+    def test_scattered_qubits(self):
+        # controlled-X with control 3 and target 1, as a block on (3, 1)
+        state = test_state()
+        cnot = kernel(number_of_qubits=2, control_list=[(0, '1')],
+                      target_range=[1, 1], original_matrix=PAULI_X)
+        new_array = apply_matrix_on_qubits(
+                state_array=state.as_vector().as_array(),
+                number_of_qubits=4, qubit_indices=[3, 1], block_matrix=cnot)
+        expected = apply_matrix_on_statevector(
+                state_array=state.as_vector().as_array(),
+                number_of_qubits=4, target_range=[1, 1],
+                original_matrix=PAULI_X, control_list=[(3, '1')])
+        self.assertTrue(np.allclose(new_array, expected, rtol=0, atol=1e-15))
+
+    def test_repeated_qubits(self):
+        state = test_state()
+        with self.assertRaises(StatevectorContractionError):
+            apply_matrix_on_qubits(state_array=state.as_vector().as_array(),
+                    number_of_qubits=4, qubit_indices=[2, 2],
+                    block_matrix=SquareMatrix(array=np.identity(4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
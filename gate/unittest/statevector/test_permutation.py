@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test:
+    gate.statevector.permutation.py
+    gate.enlarge_matrix.controlled_kernel.py
+
+Main test:
+    SWAP, CNOT and reversal applied as index permutations
+    must agree with the kernel operator matrices.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+from linear_space.matrix import PAULI_X
+from qubit.utils import qubit_from_bitlist
+from gate.enlarge_matrix.controlled_kernel import kernel, \
+    universal_CNOT_matrix, universal_SWAP_matrix
+from gate.statevector import swap_qubits, reverse_qubits, permute_qubits, \
+    apply_cnot_on_statevector, qubit_permutation_indices, \
+    permutation_matrix, StatevectorContractionError
+
+
+def test_array():
+    return qubit_from_bitlist([(1, '0100'), (1j, '1011'), (0.5, '1110'),
+                               (-0.5, '0001'), (2, '0110')]
+                              ).as_vector().as_array()
+
+
+def kernel_cnot(noq, control_index, target_index, control_state='1'):
+    return kernel(number_of_qubits=noq,
+                  control_list=[(control_index, control_state)],
+                  target_range=[target_index, target_index],
+                  original_matrix=PAULI_X).as_array()
+
+
+def cnot_product_swap(noq, alpha, beta):
+    first = kernel_cnot(noq, alpha, beta)
+    second = kernel_cnot(noq, beta, alpha)
+    return first @ second @ first
+
+
+class TestPermutation_CNOT(unittest.TestCase):
+    def test_every_pair(self):
+        array = test_array()
+        for ci in range(4):
+            for ti in range(4):
+                if ci == ti:
+                    continue
+                for cs in ['0', '1']:
+                    expected = kernel_cnot(4, ci, ti, cs) @ array
+                    new_array = apply_cnot_on_statevector(
+                            state_array=array, number_of_qubits=4,
+                            control_index=ci, target_index=ti,
+                            control_state=cs)
+                    self.assertTrue(new_array.shape == array.shape)
+                    self.assertTrue(np.allclose(new_array, expected))
+
+    def test_matrix(self):
+        for ci, ti in [(0, 3), (2, 1)]:
+            self.assertTrue(np.allclose(
+                universal_CNOT_matrix(number_of_qubits=4, control_index=ci,
+                                      target_index=ti).as_array(),
+                kernel_cnot(4, ci, ti)))
+
+
+class TestPermutation_SWAP(unittest.TestCase):
+    def test_every_pair(self):
+        array = test_array()
+        for alpha in range(4):
+            for beta in range(alpha + 1, 4):
+                expected = cnot_product_swap(4, alpha, beta) @ array
+                new_array = swap_qubits(state_array=array,
+                                        number_of_qubits=4,
+                                        alpha=alpha, beta=beta)
+                self.assertTrue(np.allclose(new_array, expected))
+                self.assertTrue(np.allclose(
+                    universal_SWAP_matrix(number_of_qubits=4, alpha=alpha,
+                                          beta=beta).as_array(),
+                    cnot_product_swap(4, alpha, beta)))
+
+    def test_same_index(self):
+        self.assertRaises(StatevectorContractionError, swap_qubits,
+                          state_array=test_array(), number_of_qubits=4,
+                          alpha=1, beta=1)
+
+
+class TestPermutation_Reversal(unittest.TestCase):
+    def test_all_qubits(self):
+        array = test_array()
+        expected = cnot_product_swap(4, 0, 3) \
+                @ cnot_product_swap(4, 1, 2) @ array
+        new_array = reverse_qubits(state_array=array, number_of_qubits=4)
+        self.assertTrue(np.allclose(new_array, expected))
+
+    def test_selected_qubits(self):
+        array = test_array()
+        expected = cnot_product_swap(4, 1, 3) @ array
+        new_array = reverse_qubits(state_array=array, number_of_qubits=4,
+                                   qubit_indices=[1, 2, 3])
+        self.assertTrue(np.allclose(new_array, expected))
+
+    def test_matrix_agrees_with_transpose(self):
+        array = test_array()
+        axes = [2, 0, 3, 1]
+        opmat = permutation_matrix(
+                indices=qubit_permutation_indices(number_of_qubits=4,
+                                                  axes=axes))
+        self.assertTrue(np.allclose(
+            opmat.as_array() @ array,
+            permute_qubits(state_array=array, number_of_qubits=4, axes=axes)))
+        sparse = permutation_matrix(
+                indices=qubit_permutation_indices(number_of_qubits=4,
+                                                  axes=axes), sparse=True)
+        self.assertTrue(np.allclose(sparse.as_array(), opmat.as_array()))
+
+
+if __name__ == '__main__':
+    unittest.main()
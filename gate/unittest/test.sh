@@ -13,6 +13,9 @@ echo "********************"
 # Enlarge matrix routines
 ./gate/unittest/test_shell/enlarge_matrix_test.sh
 
+# Statevector contraction
+./gate/unittest/test_shell/statevector_test.sh
+
 # Decorator
 ./gate/unittest/test_shell/decorator_test.sh
 
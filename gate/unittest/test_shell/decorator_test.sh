@@ -4,4 +4,6 @@ echo "===================="
 echo "| Decorator Module |"
 echo "===================="
 echo "--- --- Gate decorator --- ---"
-python3 -m unittest gate/unittest/decorator/test_decorator.py
\ No newline at end of file
+python3 -m unittest gate/unittest/decorator/test_decorator.py
+echo "--- --- Operator matrix cache --- ---"
+python3 -m unittest gate/unittest/decorator/test_cache.py
\ No newline at end of file
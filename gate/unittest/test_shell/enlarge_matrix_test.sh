@@ -25,4 +25,10 @@ echo "--- --- CISWAP routines --- ---"
 python3 -m unittest gate/unittest/enlarge_matrix/test_ciswap.py
 
 echo "--- --- Single-Controlled Multiple-Qubit (SCMQ) --- ---"
-python3 -m unittest gate/unittest/enlarge_matrix/test_scmq.py
\ No newline at end of file
+python3 -m unittest gate/unittest/enlarge_matrix/test_scmq.py
+
+echo "--- --- Control mask and kernel apply --- ---"
+python3 -m unittest gate/unittest/enlarge_matrix/test_control_mask.py
+
+echo "--- --- Sparse enlarged matrix --- ---"
+python3 -m unittest gate/unittest/enlarge_matrix/test_sparse_enlarge.py
@@ -0,0 +1,11 @@
+#!/bin/sh
+
+echo "=========================================="
+echo "| Statevector : Matrix-free contraction |"
+echo "=========================================="
+
+echo "--- --- Contraction versus global operator matrix --- ---"
+python3 -m unittest gate/unittest/statevector/test_contraction.py
+
+echo "--- --- Permutation versus kernel matrices --- ---"
+python3 -m unittest gate/unittest/statevector/test_permutation.py
@@ -47,9 +47,20 @@ or `Matrix` instances; return can be a scalar, vector, or matrix
 `matrix_maker(list_of_matrices, method)` - Construct a matrix
 using a list of matrices via designated method
 
+Sparse square matrices are accepted by `scale`, `kronecker`,
+`transpose`, `complex_conjugate`, `hermitian_conjugate`,
+`matrix_product`, `matrix_add` and thus `matrix_maker`.
+Operations among sparse matrices stay sparse; mixing a sparse
+matrix with a dense one results in a dense object, except for
+the Kronecker product of square matrices.
+
+Arguments are validated by the function decorator; results,
+computed by numpy from validated operands, are then wrapped by
+`from_trusted_array` without running the validator chain again.
+
 LOG
 
-Updated on 30 September 2021 | Created on 15 April 2021
+Updated on 17 October 2026 | Created on 15 April 2021
 """
 from linear_space.numpy_lib import np_ndarray, np_array, np_norm
 from linear_space.number import is_number, is_one
@@ -60,7 +71,9 @@ from linear_space.linear_object.utils import is_column_like, is_row_like, \
 import linear_space.linear_object.algebra as LOAF
 
 from linear_space.vector import BaseVector, ColumnVector, UnitVector, RowVector
-from linear_space.matrix import Matrix, SquareMatrix, IdentityMatrix
+from linear_space.matrix import Matrix, SquareMatrix, IdentityMatrix, \
+    SparseSquareMatrix
+from linear_space.scipy_lib import sp_kron
 
 from .errors import LinearSpaceAlgebraFunctionError as LSAFE
 from .decorator import linear_space_algebra_function_decorator as LSAF_Decorator
@@ -76,26 +89,28 @@ def scale(factor, obj):
     try:
         if is_number(obj):
             ret = factor * obj
+        elif isinstance(obj, SparseSquareMatrix):
+            ret = SparseSquareMatrix(array=factor * obj.as_sparse())
         elif isinstance(obj, LinearObject):
             new_array = factor * obj.as_array()
             if isinstance(obj, UnitVector):
                 if is_one(factor):
                     ret = obj
                 else:
-                    ret = ColumnVector(array=new_array)
+                    ret = ColumnVector.from_trusted_array(new_array)
             elif isinstance(obj, ColumnVector):
-                ret = ColumnVector(array=new_array)
+                ret = ColumnVector.from_trusted_array(new_array)
             elif isinstance(obj, RowVector):
-                ret = RowVector(array=new_array)
+                ret = RowVector.from_trusted_array(new_array)
             elif isinstance(obj, IdentityMatrix):
                 if is_one(factor):
                     ret = obj
                 else:
-                    ret = SquareMatrix(array=new_array)
+                    ret = SquareMatrix.from_trusted_array(new_array)
             elif isinstance(obj, SquareMatrix):
-                ret = SquareMatrix(array=new_array)
+                ret = SquareMatrix.from_trusted_array(new_array)
             elif isinstance(obj, Matrix):
-                ret = Matrix(array=new_array)
+                ret = Matrix.from_trusted_array(new_array)
             else:
                 pass
         else:
@@ -236,9 +251,9 @@ def outer(left_vector, right_vector):
     try:
         linobj = LOAF.outer(left_vector, right_vector)
         if len(linobj.as_array()) == len(linobj.as_array()[0]):
-            ret = SquareMatrix(array=linobj.as_array())
+            ret = SquareMatrix.from_trusted_array(linobj.as_array())
         else:
-            ret = Matrix(array=linobj.as_array())
+            ret = Matrix.from_trusted_array(linobj.as_array())
     except Exception as err:
         raise err.relocate(_ERROR_LOCATION_)
     return ret
@@ -246,8 +261,8 @@ def outer(left_vector, right_vector):
 
 @LSAF_Decorator(
     argument_type={
-        'left_object': LinearObject,
-        'right_object': LinearObject
+        'left_object': (LinearObject, SparseSquareMatrix),
+        'right_object': (LinearObject, SparseSquareMatrix)
     }
 )
 def kronecker(left_object, right_object):
@@ -259,23 +274,30 @@ def kronecker(left_object, right_object):
     Kronecker function returns either a `ColumnVector`
     (`UnitVector`), `RowVector` or `Matrix` (`SquareMatrix`)
     instance.
+
+    If either object is a `SparseSquareMatrix`, the other
+    must be a square matrix and the product is a
+    `SparseSquareMatrix`.
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.kronecker'
 
+    if isinstance(left_object, SparseSquareMatrix) \
+            or isinstance(right_object, SparseSquareMatrix):
+        return _sparse_kronecker(left_object, right_object)
     ret = None
     try:
         linobj = LOAF.kronecker(left_object, right_object)
         if is_column_like(linobj):
-            ret = ColumnVector(array=linobj.as_array())
-            if is_one(ret.norm):
-                ret = UnitVector(array=linobj.as_array())
+            ret = ColumnVector.from_trusted_array(linobj.as_array())
+            if ret.is_normalized:
+                ret = UnitVector.from_trusted_array(linobj.as_array())
         elif is_row_like(linobj):
-            ret = RowVector(array=linobj.as_array())
+            ret = RowVector.from_trusted_array(linobj.as_array())
         elif is_matrix_like(linobj):
             if linobj.get_ncols() == linobj.get_nrows():
-                ret = SquareMatrix(array=linobj.as_array())
+                ret = SquareMatrix.from_trusted_array(linobj.as_array())
             else:
-                ret = Matrix(array=linobj.as_array())
+                ret = Matrix.from_trusted_array(linobj.as_array())
         else:
             raise LSAFE('Kronecker product of two '+\
                     'linear objects results in a non '   +\
@@ -285,7 +307,7 @@ def kronecker(left_object, right_object):
     return ret
 
 
-@LSAF_Decorator(argument_type={'obj': LinearObject})
+@LSAF_Decorator(argument_type={'obj': (LinearObject, SparseSquareMatrix)})
 def transpose(obj):
     """ Transpose vector or matrix
 
@@ -296,22 +318,25 @@ def transpose(obj):
     RowVector -> ColumnVector
     IdentityMatrix -> IdentityMatrix (returns itself)
     SquareMatrix -> SquareMatrix
+    SparseSquareMatrix -> SparseSquareMatrix
     Matrix -> Matrix
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.transpose'
 
     ret = None
     try:
-        if isinstance(obj, ColumnVector):
-            ret = RowVector(array=LOAF.transpose(obj).as_array())
+        if isinstance(obj, SparseSquareMatrix):
+            ret = SparseSquareMatrix(array=obj.as_sparse().transpose())
+        elif isinstance(obj, ColumnVector):
+            ret = RowVector.from_trusted_array(LOAF.transpose(obj).as_array())
         elif isinstance(obj, RowVector):
-            ret = ColumnVector(array=LOAF.transpose(obj).as_array())
+            ret = ColumnVector.from_trusted_array(LOAF.transpose(obj).as_array())
         elif isinstance(obj, IdentityMatrix):
             ret = obj
         elif isinstance(obj, SquareMatrix):
-            ret = SquareMatrix(array=LOAF.transpose(obj).as_array())
+            ret = SquareMatrix.from_trusted_array(LOAF.transpose(obj).as_array())
         elif isinstance(obj, Matrix):
-            ret = Matrix(array=LOAF.transpose(obj).as_array())
+            ret = Matrix.from_trusted_array(LOAF.transpose(obj).as_array())
         else:
             raise LSAFE('Transpose function is applicable ' +\
                     'only to vector and matrix objects.',
@@ -321,7 +346,7 @@ def transpose(obj):
     return ret
 
 
-@LSAF_Decorator(argument_type={'obj': LinearObject})
+@LSAF_Decorator(argument_type={'obj': (LinearObject, SparseSquareMatrix)})
 def complex_conjugate(obj):
     """ Complex conjugate
 
@@ -331,16 +356,18 @@ def complex_conjugate(obj):
 
     ret = None
     try:
-        if isinstance(obj, ColumnVector):
-            ret = ColumnVector(array=LOAF.complex_conjugate(obj).as_array())
+        if isinstance(obj, SparseSquareMatrix):
+            ret = SparseSquareMatrix(array=obj.as_sparse().conjugate())
+        elif isinstance(obj, ColumnVector):
+            ret = ColumnVector.from_trusted_array(LOAF.complex_conjugate(obj).as_array())
         elif isinstance(obj, RowVector):
-            ret = RowVector(array=LOAF.complex_conjugate(obj).as_array())
+            ret = RowVector.from_trusted_array(LOAF.complex_conjugate(obj).as_array())
         elif isinstance(obj, IdentityMatrix):
             ret = obj
         elif isinstance(obj, SquareMatrix):
-            ret = SquareMatrix(array=LOAF.complex_conjugate(obj).as_array())
+            ret = SquareMatrix.from_trusted_array(LOAF.complex_conjugate(obj).as_array())
         elif isinstance(obj, Matrix):
-            ret = Matrix(array=LOAF.complex_conjugate(obj).as_array())
+            ret = Matrix.from_trusted_array(LOAF.complex_conjugate(obj).as_array())
         else:
             raise LSAFE('Complex conjugate function ' +\
                     'is applicable only to vector and '     +\
@@ -350,7 +377,7 @@ def complex_conjugate(obj):
     return ret
 
 
-@LSAF_Decorator(argument_type={'obj': LinearObject})
+@LSAF_Decorator(argument_type={'obj': (LinearObject, SparseSquareMatrix)})
 def hermitian_conjugate(obj):
     """ Hermitian conjugate
 
@@ -362,7 +389,8 @@ def hermitian_conjugate(obj):
     try:
         if isinstance(obj, IdentityMatrix):
             ret = obj
-        elif isinstance(obj, (ColumnVector, RowVector, SquareMatrix, Matrix)):
+        elif isinstance(obj, (ColumnVector, RowVector, SquareMatrix, Matrix,
+                              SparseSquareMatrix)):
             ret = complex_conjugate(transpose(obj))
         else:
             raise LSAFE('Hermitian conjugate function is ' +\
@@ -375,8 +403,8 @@ def hermitian_conjugate(obj):
 
 @LSAF_Decorator(
     argument_type={
-        'left_object': LinearObject,
-        'right_object': LinearObject
+        'left_object': (LinearObject, SparseSquareMatrix),
+        'right_object': (LinearObject, SparseSquareMatrix)
     }
 )
 def matrix_product(left_object, right_object):
@@ -394,24 +422,38 @@ def matrix_product(left_object, right_object):
 
     If both objects are matrix-like, the result is a matrix,
     indicating regular matrix product.
+
+    Product of two sparse square matrices is a sparse square
+    matrix. Product of a sparse square matrix and a dense object
+    is dense, e.g. a sparse operator applied to a vector results
+    in a vector.
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.matrix_product'
 
     ret = None
     if left_object.get_ncols() == right_object.get_nrows():
+        if isinstance(left_object, SparseSquareMatrix) \
+                and isinstance(right_object, SparseSquareMatrix):
+            return SparseSquareMatrix(
+                    array=left_object.as_sparse() @ right_object.as_sparse())
         try:
-            linobj = LOAF.dot(left_object, right_object)
+            if isinstance(left_object, SparseSquareMatrix) \
+                    or isinstance(right_object, SparseSquareMatrix):
+                linobj = LinearObject(
+                        array=_sparse_dot(left_object, right_object))
+            else:
+                linobj = LOAF.dot(left_object, right_object)
             if is_column_like(linobj):
-                ret = ColumnVector(array=linobj.as_array())
+                ret = ColumnVector.from_trusted_array(linobj.as_array())
                 if ret.is_normalized:
-                    ret = UnitVector(array=linobj.as_array())
+                    ret = UnitVector.from_trusted_array(linobj.as_array())
             elif is_row_like(linobj):
-                ret = RowVector(array=linobj.as_array())
+                ret = RowVector.from_trusted_array(linobj.as_array())
             elif is_matrix_like(linobj):
                 if linobj.get_ncols() == linobj.get_nrows():
-                    ret = SquareMatrix(array=linobj.as_array())
+                    ret = SquareMatrix.from_trusted_array(linobj.as_array())
                 else:
-                    ret = Matrix(array=linobj.as_array())
+                    ret = Matrix.from_trusted_array(linobj.as_array())
             elif is_scalar_like(linobj):
                 ret = linobj.as_array()[0][0]
             else:
@@ -447,11 +489,17 @@ def matrix_add(left_object, right_object):
 
     If both objects are matrix-like, the result is a matrix.
 
+    Sum of two sparse square matrices is a sparse square matrix.
+    If only one of them is sparse, the sum is a dense matrix.
+
     NOTE Not unit tested! But successfully used in gate operations.
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.matrix_add'
     ret = None
-    if is_number(left_object) and is_number(right_object):
+    if isinstance(left_object, SparseSquareMatrix) \
+            or isinstance(right_object, SparseSquareMatrix):
+        ret = _sparse_add(left_object, right_object)
+    elif is_number(left_object) and is_number(right_object):
         ret = left_object + right_object
     elif is_scalar_like(left_object) and is_scalar_like(right_object):
         ret = left_object.as_array()[0][0] + right_object.as_array()[0][0]
@@ -461,16 +509,16 @@ def matrix_add(left_object, right_object):
             try:
                 linobj = LOAF.add(left_object, right_object)
                 if is_column_like(linobj):
-                    ret = ColumnVector(array=linobj.as_array())
+                    ret = ColumnVector.from_trusted_array(linobj.as_array())
                     if ret.is_normalized:
-                        ret = UnitVector(array=linobj.as_array())
+                        ret = UnitVector.from_trusted_array(linobj.as_array())
                 elif is_row_like(linobj):
-                    ret = RowVector(array=linobj.as_array())
+                    ret = RowVector.from_trusted_array(linobj.as_array())
                 elif is_matrix_like(linobj):
                     if linobj.get_ncols() == linobj.get_nrows():
-                        ret = SquareMatrix(array=linobj.as_array())
+                        ret = SquareMatrix.from_trusted_array(linobj.as_array())
                     else:
-                        ret = Matrix(array=linobj.as_array())
+                        ret = Matrix.from_trusted_array(linobj.as_array())
                 else:
                     raise LSAFE('Matrix addition ' +\
                             'created a non linear object.',
@@ -488,6 +536,51 @@ def matrix_add(left_object, right_object):
     return ret
 
 
+def _as_scipy_operand(obj):
+    """ Internal sparse matrix or numpy array of an object """
+    if isinstance(obj, SparseSquareMatrix):
+        return obj.as_sparse()
+    return obj.as_array()
+
+
+def _sparse_kronecker(left_object, right_object):
+    """ Kronecker product involving a sparse square matrix """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.kronecker'
+    if not isinstance(left_object, (SquareMatrix, SparseSquareMatrix)) \
+            or not isinstance(right_object, (SquareMatrix, SparseSquareMatrix)):
+        raise LSAFE('Kronecker product involving a sparse ' +\
+                'matrix is applicable only to square matrices.',
+                location=_ERROR_LOCATION_)
+    return SparseSquareMatrix(array=sp_kron(_as_scipy_operand(left_object),
+            _as_scipy_operand(right_object), format='csr'))
+
+
+def _sparse_dot(left_object, right_object):
+    """ Dense array of product of sparse and dense objects """
+    return np_array(
+        _as_scipy_operand(left_object) @ _as_scipy_operand(right_object))
+
+
+def _sparse_add(left_object, right_object):
+    """ Addition involving a sparse square matrix """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.matrix_add'
+    if not isinstance(left_object, (SquareMatrix, SparseSquareMatrix)) \
+            or not isinstance(right_object, (SquareMatrix, SparseSquareMatrix)):
+        raise LSAFE('Matrix addition involving a sparse ' +\
+                'matrix is applicable only to square matrices.',
+                location=_ERROR_LOCATION_)
+    if left_object.size != right_object.size:
+        raise LSAFE('Matrix addition requires two ' +\
+                'linear objects to have the same size '   +\
+                'along either dimension.', location=_ERROR_LOCATION_)
+    sum_array = _as_scipy_operand(left_object) \
+            + _as_scipy_operand(right_object)
+    if isinstance(left_object, SparseSquareMatrix) \
+            and isinstance(right_object, SparseSquareMatrix):
+        return SparseSquareMatrix(array=sum_array)
+    return SquareMatrix.from_trusted_array(np_array(sum_array))
+
+
 # FIXME Function name doesn't really fit as a algebra function
 def matrix_maker(list_of_matrices=None, method=None):
     """ Construct a matrix from a list of matrices
@@ -61,11 +61,15 @@ number of functions. In fact, almost all linear algebra
 operations in the down-stream packages are delegated or
 redirected to algebra functions introduced here.
 
+Internal results are wrapped by `from_trusted_array`, which
+skips validation; see module `trusted`.
+
 LOG
 
-Updated on 27 September 2021 | Created on 22 April 2021
+Updated on 17 October 2026 | Created on 22 April 2021
 """
 from .linear_object import LinearObject
+from .trusted import set_trusted_validation, is_trusted_validation_enabled
 from .utils import is_column_like, is_row_like, is_scalar_like, is_matrix_like,\
     maximum, minimum
 from .types import Column_Like, Row_Like, Matrix_Like
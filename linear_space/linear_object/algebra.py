@@ -59,9 +59,12 @@ instance
 is a scalar, returns a scalar or scaled linear object;
 if both are linear objects, returns the Kronecker product
 
+Results are computed from validated operands and are thus wrapped
+by `LinearObject.from_trusted_array`, without validation.
+
 LOG
 
-Updated on 27 September 2021 | Created on 22 April 2021
+Updated on 17 October 2026 | Created on 22 April 2021
 """
 from linear_space.numpy_lib import np_transpose, np_conj, np_norm, np_dot, \
     np_outer, np_kron, np_array
@@ -89,7 +92,7 @@ def transpose(linobj):
     A `LinearObject` instance.
     """
     new_array = np_transpose(linobj.as_array())
-    return LinearObject(array=new_array)
+    return LinearObject.from_trusted_array(new_array)
 
 
 @algebra_function_decorator(argument_type = {'linobj': LinearObject})
@@ -105,7 +108,7 @@ def complex_conjugate(linobj):
     A `LinearObject` instance.
     """
     new_array = np_conj(linobj.as_array())
-    return LinearObject(array=new_array)
+    return LinearObject.from_trusted_array(new_array)
 
 
 @algebra_function_decorator(argument_type = {'linobj': LinearObject})
@@ -118,7 +121,7 @@ def hermitian_conjugate(linobj):
     A column-like is transformed into row-like, vice verse.
     """
     new_array = np_transpose(np_conj(linobj.as_array()))
-    return LinearObject(array=new_array)
+    return LinearObject.from_trusted_array(new_array)
 
 
 @algebra_function_decorator(
@@ -164,7 +167,7 @@ def scale(factor, linobj):
     A `LinearObject` instance.
     """
     new_array = factor * linobj.as_array()
-    ret = LinearObject(array=new_array)
+    ret = LinearObject.from_trusted_array(new_array)
     return ret
 
 
@@ -198,7 +201,7 @@ def inner(left_item, right_item):
         raise LinearObjectAlgebraError('Sizes of two linear ' +\
                 'objects involved in inner product are incompatible.',
                 location=_MODULE_LOCATION_+'.inner')
-    return LinearObject(array=new_array)
+    return LinearObject.from_trusted_array(new_array)
 
 
 @algebra_function_decorator(
@@ -221,7 +224,7 @@ def outer(left_item, right_item):
     right_array = right_item.as_array() if is_row_like(right_item) \
             else hermitian_conjugate(right_item).as_array()
     new_array = np_outer(left_array, right_array)
-    return LinearObject(array=new_array)
+    return LinearObject.from_trusted_array(new_array)
 
 
 @algebra_function_decorator(
@@ -265,7 +268,7 @@ def dot(left_item, right_item):
         raise LinearObjectAlgebraError('Sizes of two linear ' +\
                 'objects involved in multiplication are incompatible.',
                 location=_MODULE_LOCATION_+'.dot')
-    return LinearObject(array=new_array)
+    return LinearObject.from_trusted_array(new_array)
 
 
 @algebra_function_decorator(
@@ -301,7 +304,7 @@ def add(left_item, right_item):
                 'method requires two linear objects that ' +\
                 'are of the same size.',
                 location=_MODULE_LOCATION_+'.add')
-    return LinearObject(array=new_array)
+    return LinearObject.from_trusted_array(new_array)
 
 
 @algebra_function_decorator(
@@ -340,7 +343,7 @@ def subtract(left_item, right_item):
                 'method requires two linear objects that are '+\
                 'of the same size.',
                 location=_MODULE_LOCATION_+'.subtract')
-    return LinearObject(array=new_array)
+    return LinearObject.from_trusted_array(new_array)
 
 
 @algebra_function_decorator(
@@ -364,7 +367,7 @@ def kronecker(left_item, right_item):
     `LinearObject` or its subclass
     """
     new_array = np_kron(left_item.as_array(), right_item.as_array())
-    return LinearObject(array=new_array)
+    return LinearObject.from_trusted_array(new_array)
 
 
 @algebra_function_decorator(
@@ -398,16 +401,16 @@ def multiply(left_item, right_item):
     # left number, right LO
     if is_number(left_item) and isinstance(right_item, LinearObject):
         new_array = left_item * right_item.as_array()
-        ret = LinearObject(array=new_array)
+        ret = LinearObject.from_trusted_array(new_array)
     # left LO, right number
     elif isinstance(left_item, LinearObject) and is_number(right_item):
         new_array = right_item * left_item.as_array()
-        ret = LinearObject(array=new_array)
+        ret = LinearObject.from_trusted_array(new_array)
     # both numbers
     elif is_number(left_item) and is_number(right_item):
         # This is a scalar
         new_array = np_array([[right_item * left_item]])
-        ret = LinearObject(array=new_array)
+        ret = LinearObject.from_trusted_array(new_array)
     # both LOs
     else:
         ret = kronecker(left_item, right_item)
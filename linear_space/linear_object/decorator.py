@@ -13,6 +13,9 @@ Decorator for linear algebra operation functions.
 Function parameters are validated against their
 declaration in decorator.
 
+Algebra functions are invoked on every gate; their
+arguments are only verified at full validation level.
+
 CONTENT
 
 `algebra_function_decorator` - Decorator class for most
@@ -21,9 +24,10 @@ instantiation, class name consists of lower case and dash
 
 LOG
 
-Updated on 27 September 2021 | Created on 27 September 2021
+Updated on 17 October 2026 | Created on 27 September 2021
 """
 from common.function.decorators import FunctionInvocationDecorator
+from common.validator import INTERNAL_SCOPE
 from .errors import LinearObjectAlgebraError
 
 _MODULE_LOCATION_ = 'linear_space.linear_object.decorator'
@@ -40,3 +44,4 @@ class algebra_function_decorator(FunctionInvocationDecorator):
     based decorator.
     """
     error_class = LinearObjectAlgebraError
+    validation_scope = INTERNAL_SCOPE
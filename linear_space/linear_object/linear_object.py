@@ -30,10 +30,11 @@ class
 
 LOG
 
-Updated on 30 September 2021 | Created on 22 April 2021
+Updated on 17 October 2026 | Created on 22 April 2021
 """
 from .errors import LinearObjectError
 from .validators import LinearObjectValidator
+from .trusted import is_trusted_validation_enabled
 
 __MODULE_LOCATION__ = 'linear_space.linear_object.linear_object'
 
@@ -106,6 +107,12 @@ class LinearObject:
 
     `self.get_element(,row_index,column_index)`: returns an element
     at given row and column indices
+
+    [Construction]
+
+    `cls.from_trusted_array(array)` : classmethod; wraps an array
+    produced internally, e.g. by an algebra function, without
+    validation
     """
     __ERROR_LOCATION__ = __MODULE_LOCATION__ + '.LinearObject'
 
@@ -117,6 +124,21 @@ class LinearObject:
         else:
             validator.raise_last_error(self.__ERROR_LOCATION__+'.__init__')
 
+    @classmethod
+    def from_trusted_array(cls, array):
+        """ Linear Object :: Construct without validation
+
+        Array must be one the constructor of the class would
+        accept, e.g. a numpy result computed from validated
+        linear objects. Validation is only run if switched on by
+        `set_trusted_validation`.
+        """
+        if is_trusted_validation_enabled():
+            return cls(array=array)
+        linobj = cls.__new__(cls)
+        linobj._array = array
+        return linobj
+
     def as_array(self):
         """ Linear Object :: Returns internal array """
         return self._array
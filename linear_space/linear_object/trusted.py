@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+linear_space.linear_object.trusted.py
+
+PATH
+
+[app_root]/linear_space/linear_object/trusted.py
+
+INTRO
+
+Trusted construction of linear objects.
+
+Arrays produced internally by numpy, e.g. the result of an
+algebra function on validated linear objects, are wrapped by
+`LinearObject.from_trusted_array` without running the validator
+chain. User-facing constructors keep their full validation.
+
+For debugging, validation of trusted construction is switched
+back on globally, either by `set_trusted_validation(True)` or by
+setting the environment variable `LINEAR_SPACE_VALIDATE_TRUSTED`
+to a non-empty value other than '0' before import.
+
+CONTENT
+
+`set_trusted_validation(enabled)` - Switches validation of trusted
+construction on or off
+
+`is_trusted_validation_enabled()` - Checks if trusted construction
+is validated
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import os
+
+_TRUSTED_VALIDATION = {
+    'enabled': os.environ.get('LINEAR_SPACE_VALIDATE_TRUSTED', '0') \
+            not in ('', '0')
+}
+
+
+def set_trusted_validation(enabled=True):
+    """ Switch validation of trusted construction on or off """
+    _TRUSTED_VALIDATION['enabled'] = bool(enabled)
+
+
+def is_trusted_validation_enabled():
+    """ Verify if trusted construction is validated """
+    return _TRUSTED_VALIDATION['enabled']
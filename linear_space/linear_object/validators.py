@@ -11,14 +11,28 @@ INTRO
 
 Validators
 
+Subarrays of a two-dimensional numpy array of a numeric dtype,
+i.e. boolean, integer, floating or complex, are validated by
+dtype and shape, and finiteness is checked by a single call to
+`numpy.isfinite`; a matrix of `2^14` rows thus costs a handful of
+Python calls instead of one per element. Arrays of object dtype,
+and arrays of subarrays, fall back to checking every element.
+
 CONTENT
 
+`LinearObjectSubarrayValidator`
+
 `LinearObjectValidator`
 
 LOG
 
-Updated on 02 October 2021 | Created on 27 September 2021
+Updated on 17 October 2026 | Created on 27 September 2021
 """
+from cmath import isfinite
+
+from numpy import isfinite as np_isfinite
+
+from common.validator import BOUNDARY_SCOPE
 from linear_space.numpy_lib import np_ndarray
 from linear_space.base import LinearSpaceBaseValidator
 from linear_space.number import is_number
@@ -26,11 +40,21 @@ from .errors import LinearObjectValidationError
 
 _MODULE_LOCATION_ = 'linear_space.linear_object.validators'
 
+# dtype kinds of numeric arrays: boolean, (unsigned) integer,
+# floating and complex
+NUMERIC_DTYPE_KINDS = 'biufc'
+
+
+def _is_2d_ndarray(array):
+    """ Two-dimensional numpy array, whose rows are subarrays """
+    return isinstance(array, np_ndarray) and array.ndim == 2
+
 
 class LinearObjectSubarrayValidator(LinearSpaceBaseValidator):
     """ Validate subarray of a linear object """
     error_class = LinearObjectValidationError
     error_location = _MODULE_LOCATION_ + '.LinearObjectSubarrayValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, array=None):
         super().__init__()
@@ -44,6 +68,8 @@ class LinearObjectSubarrayValidator(LinearSpaceBaseValidator):
 
     def validate_subarray_type(self, array=None):
         """ Each subarray must be `numpy.ndarray` """
+        if _is_2d_ndarray(array):
+            return
         wrong_type_counter = 0
         for _ , subarray in enumerate(array):
             if not isinstance(subarray, np_ndarray) :
@@ -57,6 +83,10 @@ class LinearObjectSubarrayValidator(LinearSpaceBaseValidator):
 
         Subarray `ndim` property must return 1
         """
+        if _is_2d_ndarray(array):
+            if array.shape[0] > 0 and array.shape[1] == 0:
+                self.report_errors('Subarray is empty')
+            return
         wrong_dim_counter = 0
         for _ , subarray in enumerate(array):
             if subarray.ndim != 1:
@@ -70,15 +100,33 @@ class LinearObjectSubarrayValidator(LinearSpaceBaseValidator):
                    'is(are) not one-dimensional numpy array(s).')
 
     def validate_subarray_element_type(self, array=None):
-        """ Elements of subarray must be number """
+        """ Elements of subarray must be finite numbers
+
+        Numeric dtypes are accepted as a whole; only arrays of
+        object dtype are checked element by element.
+        """
+        if _is_2d_ndarray(array) and array.dtype.kind != 'O':
+            if array.dtype.kind not in NUMERIC_DTYPE_KINDS:
+                self.report_errors('Subarray(s) in the array passed in ' +\
+                       'contain non-numeric elements.')
+            elif not np_isfinite(array).all():
+                self.report_errors('Subarray(s) in the array passed in ' +\
+                       'contain infinite or NaN elements.')
+            return
         non_numeric_counter = 0
+        non_finite_counter = 0
         for _ , subarray in enumerate(array):
             for el in subarray:
                 if not is_number(el):
                     non_numeric_counter += 1
+                elif not isfinite(complex(el)):
+                    non_finite_counter += 1
         if non_numeric_counter > 0:
             self.report_errors('Subarray(s) in the array passed in ' +\
                    'contain non-numeric elements.')
+        elif non_finite_counter > 0:
+            self.report_errors('Subarray(s) in the array passed in ' +\
+                   'contain infinite or NaN elements.')
 
 
 class LinearObjectValidator(LinearSpaceBaseValidator):
@@ -13,11 +13,12 @@ Various types of matrices.
 
 LOG
 
-Updated on 24 September 2021 | Created on 15 November 2020
+Updated on 17 October 2026 | Created on 15 November 2020
 """
 from .matrix import Matrix
 from .square_matrix import SquareMatrix
 from .identity_matrix import IdentityMatrix
+from .sparse_matrix import SparseSquareMatrix
 # special matrices
 from .special import SINGLE_IDENTITY, HADAMARD, STATE_ONE_PROJECTION, \
     STATE_ZERO_PROJECTION, PAULI_X, PAULI_Y, PAULI_Z, \
@@ -19,7 +19,7 @@ CONTENT
 
 LOG
 
-Updated on 30 September 2021 | Created on 15 November 2020
+Updated on 17 October 2026 | Created on 15 November 2020
 """
 from linear_space.base import LinearSpaceBaseError, \
     LinearSpaceBaseValidationError
@@ -56,3 +56,11 @@ class IdentityMatrixValidationError(MatrixInitValidationError):
     `validators.IdentityMatrixSizeValidator`
     """
     header = 'Identity_Matrix_Validation_Error'
+
+
+class SparseSquareMatrixInitValidationError(LinearSpaceBaseValidationError):
+    """
+    ENTRY
+    `validators.SparseSquareMatrixInitValidator`
+    """
+    header = 'Sparse_Square_Matrix_Init_Validation_Error'
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+linear_space.matrix.sparse_matrix.py
+
+PATH
+
+[app_root]/linear_space/matrix/sparse_matrix.py
+
+INTRO
+
+Sparse square matrix stores only its nonzero elements.
+
+Enlarged gate operators, such as `I x...x U x...x I` and
+controlled operators, have at most a handful of nonzero
+elements per row. Storing them in a dense array wastes
+both memory and time as the number of qubits grows.
+
+Sparse square matrix is a sibling of `SquareMatrix`, not
+a subclass: it is not a linear object, since its internal
+storage is not a numpy array. Linear-space algebra functions
+`kronecker`, `matrix_product`, `matrix_add` and `matrix_maker`
+accept sparse square matrices alongside linear objects.
+
+NOTE Requires scipy, which is an optional dependency.
+
+CONTENT
+
+`SparseSquareMatrix` - Square matrix in compressed sparse
+row (CSR) format
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from .square_matrix import SquareMatrix
+from .errors import MatrixError
+from .validators import SparseSquareMatrixInitValidator
+
+_MODULE_LOCATION_ = 'linear_space.matrix.sparse_matrix'
+
+
+class SparseSquareMatrix:
+    """ Sparse square matrix
+
+    Sparse square matrix wraps a scipy CSR matrix, referred
+    to as internal sparse array.
+
+    CONSTRUCTOR
+
+    `array` : a scipy sparse matrix or a two-dimensional numpy
+    array; converted into CSR format
+
+    ATTRIBUTES
+
+    `self.as_sparse()` : returns internal sparse array
+
+    `self.as_array()` : returns a dense numpy array; use with
+    caution for large matrices
+
+    `self.as_dense()` : returns a dense `SquareMatrix`
+
+    `self.size` : property; returns size tuple
+
+    `self.nrows` : property; returns number of rows
+
+    `self.ncols` : property; returns number of columns
+
+    `self.nnz` : property; returns number of stored elements
+
+    `self.trace` : property; returns the trace
+
+    `self.__getitem__(, row_index)` : returns a row as a dense
+    one-dimensional numpy array
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.SparseSquareMatrix'
+
+    def __init__(self, array=None):
+        """ Sparse Square Matrix :: init """
+        validator = SparseSquareMatrixInitValidator(array=array)
+        if validator.is_valid:
+            self._sparse = validator.validated_data()['array']
+        else:
+            validator.raise_last_error(
+                    location=self._ERROR_LOCATION_+'.__init__')
+
+    def as_sparse(self):
+        """ Sparse Square Matrix :: Returns internal sparse array """
+        return self._sparse
+
+    def as_array(self):
+        """ Sparse Square Matrix :: Returns dense numpy array """
+        return self._sparse.toarray()
+
+    def as_dense(self):
+        """ Sparse Square Matrix :: Returns dense square matrix """
+        return SquareMatrix(array=self.as_array())
+
+    def get_nrows(self):
+        """ Sparse Square Matrix :: Number of rows """
+        return self._sparse.shape[0]
+
+    def get_ncols(self):
+        """ Sparse Square Matrix :: Number of columns """
+        return self._sparse.shape[1]
+
+    def get_size(self):
+        """ Sparse Square Matrix :: Size tuple """
+        return self._sparse.shape
+
+    @property
+    def size(self):
+        """ Sparse Square Matrix :: size tuple """
+        return self.get_size()
+
+    @property
+    def nrows(self):
+        """ Sparse Square Matrix :: number of rows """
+        return self.get_nrows()
+
+    @property
+    def ncols(self):
+        """ Sparse Square Matrix :: number of columns """
+        return self.get_ncols()
+
+    @property
+    def nnz(self):
+        """ Sparse Square Matrix :: number of stored elements """
+        return self._sparse.nnz
+
+    @property
+    def trace(self):
+        """ Sparse Square Matrix :: Returns the trace """
+        return complex(self._sparse.diagonal().sum())
+
+    def __getitem__(self, row_index):
+        """ Sparse Square Matrix :: Returns a row as dense array """
+        if row_index in range(0, self.nrows, 1):
+            return self._sparse.getrow(row_index).toarray()[0]
+        raise MatrixError('Index used to reference a row of ' +\
+                'sparse square matrix is out of range.',
+                location=self._ERROR_LOCATION_+'.__getitem__')
@@ -11,7 +11,9 @@ PATH
 
 INTRO
 
-Square matrix has equal number of rows and columns.
+Square matrix has equal number of rows and columns. Array of a
+square matrix is stored in the complex datatype of the current
+precision, see `linear_space.precision`.
 
 CONTENT
 
@@ -19,8 +21,10 @@ CONTENT
 
 LOG
 
-Updated on 30 September 2021 | Created on 15 November 2020
+Updated on 17 October 2026 | Created on 15 November 2020
 """
+from linear_space.precision import as_complex_array
+
 from .matrix import Matrix
 from .validators import SquareMatrixInitValidator
 
@@ -44,11 +48,20 @@ class SquareMatrix(Matrix):
         """ Square Matrix :: init """
         validator = SquareMatrixInitValidator(array=array)
         if validator.is_valid:
-            super().__init__(array=array)
+            super().__init__(array=as_complex_array(array))
         else:
             validator.raise_last_error(
                 location=self._ERROR_LOCATION_+'.__init__')
 
+    @classmethod
+    def from_trusted_array(cls, array):
+        """ Square Matrix :: Construct without validation
+
+        Array is cast into the complex datatype of the current
+        precision; it is not copied if already in that datatype.
+        """
+        return super().from_trusted_array(as_complex_array(array))
+
     @property
     def trace(self):
         """ Square Matrix :: Returns the trace """
@@ -17,14 +17,17 @@ CONTENT
 
 LOG
 
-Updated on 30 September 2021 | Created on 15 November 2020
+Updated on 17 October 2026 | Created on 15 November 2020
 """
+from common.validator import BOUNDARY_SCOPE
 from linear_space.base import LinearSpaceBaseValidator
 from linear_space.linear_object.linear_object import LinearObjectValidator
 from linear_space.number import is_integer
+from linear_space.numpy_lib import np_ndarray
+from linear_space.scipy_lib import HAS_SCIPY, sp_csr_matrix, sp_issparse
 
 from .errors import MatrixInitValidationError, SquareMatrixInitValidationError,\
-    IdentityMatrixValidationError
+    IdentityMatrixValidationError, SparseSquareMatrixInitValidationError
 
 _MODULE_LOCATION_ = 'linear_space.matrix.validators'
 
@@ -92,6 +95,7 @@ class IdentityMatrixSizeValidator(LinearSpaceBaseValidator):
     """
     error_class = IdentityMatrixValidationError
     error_location = _MODULE_LOCATION_ + '.IdentityMatrixSizeValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, row_size):
         """ Identity Matrix Size Validator :: init """
@@ -108,3 +112,59 @@ class IdentityMatrixSizeValidator(LinearSpaceBaseValidator):
                 self.report_errors("Row size is smaller "  +\
                         "than 2. An identity matrix must " +\
                         "be at least of size 2 by 2.")
+
+
+class SparseSquareMatrixInitValidator(LinearSpaceBaseValidator):
+    """ Sparse square matrix validator
+
+    Sparse square matrix accepts either a scipy sparse matrix
+    or a two-dimensional numpy array. Validated array is
+    converted into compressed sparse row (CSR) format.
+
+    Unlike the validator of a dense matrix, elements are not
+    inspected individually: the data type of the array must
+    be numeric.
+
+    NOTE Requires scipy.
+    """
+    error_class = SparseSquareMatrixInitValidationError
+    error_location = _MODULE_LOCATION_ + '.SparseSquareMatrixInitValidator'
+
+    def __init__(self, array=None):
+        super().__init__()
+        self._validated_array = None
+        self.validate(array=array)
+
+    def validate(self, array=None):
+        """ Sparse Square Matrix Init Validator :: main """
+        if not HAS_SCIPY:
+            self.report_errors('Sparse square matrix requires ' +\
+                    'scipy, which is not installed.')
+        elif array is None:
+            self.report_errors('To instantiate a sparse square ' +\
+                    'matrix, please provide a sparse matrix or ' +\
+                    'a numpy array.')
+        elif not sp_issparse(array) and not isinstance(array, np_ndarray):
+            self.report_errors('Array passed in to instantiate ' +\
+                    'a sparse square matrix is neither a scipy ' +\
+                    'sparse matrix nor a numpy array.')
+        elif array.ndim != 2:
+            self.report_errors('Array passed in to instantiate ' +\
+                    'a sparse square matrix is not two-dimensional.')
+        elif array.dtype.kind not in 'iufc':
+            self.report_errors('Array passed in to instantiate ' +\
+                    'a sparse square matrix contains non-numeric values.')
+        elif array.shape[0] != array.shape[1]:
+            self.report_errors('Array is incompatible with a '   +\
+                    'square matrix. Number of rows of a sqaure ' +\
+                    'matrix must be the same as number of columns')
+        elif array.shape[0] < 2:
+            self.report_errors('Sparse square matrix must be ' +\
+                    'at least of size 2 by 2.')
+        else:
+            self._validated_array = sp_csr_matrix(array)
+
+    def validated_data(self):
+        return {
+            'array': self._validated_array
+        }
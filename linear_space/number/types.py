@@ -21,22 +21,22 @@ CONTENT
 
 LOG
 
-Updated on 30 September 2021 | Created on 14 April 2021
+Updated on 17 October 2026 | Created on 14 April 2021
 """
 from linear_space.numpy_lib import np_intc, np_int8, np_int16, \
     np_int32, np_int64
-from linear_space.numpy_lib import np_float, np_float64, \
-    np_complex, np_complex128
+from linear_space.numpy_lib import np_float, np_float32, np_float64, \
+    np_complex, np_complex64, np_complex128
 from common.mixins import Non_Instantiable_Mixin, Non_Subclassable_Mixin
 
 
 VALID_INTEGER_TYPES = (int, np_intc, np_int8, np_int16, np_int32, np_int64,)
 # integer is NOT float
-VALID_FLOAT_TYPES = (float, np_float, np_float64,)
+VALID_FLOAT_TYPES = (float, np_float, np_float32, np_float64,)
 # real -> integer + float
 VALID_REAL_TYPES = VALID_INTEGER_TYPES + VALID_FLOAT_TYPES
 # real is NOT complex
-VALID_COMPLEX_TYPES = (complex, np_complex, np_complex128,)
+VALID_COMPLEX_TYPES = (complex, np_complex, np_complex64, np_complex128,)
 # all -> real + complex
 VALID_NUMERIC_TYPES = VALID_REAL_TYPES + VALID_COMPLEX_TYPES
 
@@ -30,14 +30,14 @@ returns `True` or `False`
 `is_complex(value)` - Verifies if a given value is complex,
 returns `True` or `False`
 
-`is_zero(value)` - Verifies if a given number is in the
+`is_zero(value, tolerance)` - Verifies if a given number is in the
 neighbourhood of zero by an error tolerance; returns
 `True` or `False`
 
 `is_not_zero(value)` - Returns `True`(`False`) if is_zero
 returns `False`(`True`)
 
-`is_one(value)` - Verifies if a given number is in the
+`is_one(value, tolerance)` - Verifies if a given number is in the
 neighbourhood of 1 by an error tolerance; returns
 `True` or `False`
 
@@ -53,7 +53,7 @@ the given value must be a number, otherwise raises `NumberError`
 
 LOG
 
-Updated on 30 September 2021 | Created on 14 April 2021
+Updated on 17 October 2026 | Created on 14 April 2021
 """
 from math import log as math_log
 from linear_space.numpy_lib import np_abs, np_power
@@ -102,14 +102,15 @@ def is_complex(value):
         ret = True
     return ret
 
-def is_zero(value):
+def is_zero(value, tolerance=NUMERIC_ERROR_TOLERANCE):
     """ Verify if a number is close to zero
 
     Returns `True` if the given value is close to zero in the error
-    tolerance; otherwise `False`.
+    tolerance; otherwise `False`. Default tolerance is that of
+    double precision.
     """
     ret = False
-    if np_abs(value - 0.0) < NUMERIC_ERROR_TOLERANCE:
+    if np_abs(value - 0.0) < tolerance:
         ret = True
     return ret
 
@@ -120,7 +121,7 @@ def is_not_zero(value):
         ret = False
     return ret
 
-def is_one(value):
+def is_one(value, tolerance=NUMERIC_ERROR_TOLERANCE):
     """ Verify if a number is close to one
 
     NOTE The error tolerance cannot be stricter than 1e-15.
@@ -128,7 +129,7 @@ def is_one(value):
     """
     ret = False
     #error_tolerance = 1e-15
-    if np_abs(value - 1.0) < 5 * NUMERIC_ERROR_TOLERANCE:
+    if np_abs(value - 1.0) < 5 * tolerance:
         ret = True
     return ret
 
@@ -20,7 +20,7 @@ CONTENT
 
 LOG
 
-Updated on 02 October 2021 | Created on 07 November 2020
+Updated on 17 October 2026 | Created on 07 November 2020
 """
 # integer type
 from numpy import intc as np_intc, \
@@ -31,10 +31,12 @@ from numpy import intc as np_intc, \
 
 # float
 from numpy import float as np_float, \
+    float32 as np_float32, \
     float64 as np_float64
 
 # complex
 from numpy import complex as np_complex, \
+    complex64 as np_complex64, \
     complex128 as np_complex128
 
 from numpy import power as np_power
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+linear_space.precision.py
+
+PATH
+
+[app_root]/linear_space/precision.py
+
+INTRO
+
+Package-level complex precision.
+
+Column and row vectors, square matrices, and thus quantum
+states, density matrices and gate matrices, store their arrays
+in the complex dtype of the current precision: double precision
+'complex128' by default, or single precision 'complex64', which
+halves memory and bandwidth of large state vectors.
+
+Precision is set by `set_precision(precision)`, temporarily by
+the context manager `complex_precision(precision)`, or by setting
+the environment variable `PAUL_PRECISION` before import. Objects
+keep the dtype they were created with; results of algebra on
+objects of mixed precisions are cast to the current precision.
+
+Tolerance of comparisons follows the dtype of the arrays that
+are compared, so that a single-precision vector is normalised
+within single-precision rounding.
+
+CONTENT
+
+`SINGLE_PRECISION`, `DOUBLE_PRECISION` - Precisions
+
+`set_precision(precision)` - Sets precision
+
+`get_precision()` - Returns precision
+
+`complex_precision(precision)` - Context manager of precision
+
+`complex_dtype()` - Returns complex dtype of the precision
+
+`as_complex_array(array)` - Returns array in complex dtype of the
+precision; not copied if already in that dtype
+
+`precision_tolerance(*arrays)` - Returns numeric error tolerance
+for arrays
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import os
+from contextlib import contextmanager
+
+from numpy import asarray as np_asarray, \
+    dtype as np_dtype
+
+from linear_space.numpy_lib import np_complex64, np_complex128
+from linear_space.base import LinearSpaceBaseError
+from linear_space.number.utils import NUMERIC_ERROR_TOLERANCE
+
+_MODULE_LOCATION_ = 'linear_space.precision'
+
+# precisions
+SINGLE_PRECISION = 'complex64'
+DOUBLE_PRECISION = 'complex128'
+PRECISIONS = (SINGLE_PRECISION, DOUBLE_PRECISION)
+
+# numeric error tolerance of single-precision arrays
+SINGLE_PRECISION_TOLERANCE = 1.0e-6
+
+_COMPLEX_DTYPES = {
+    SINGLE_PRECISION: np_complex64,
+    DOUBLE_PRECISION: np_complex128
+}
+
+
+def _verified_precision(precision, location):
+    if precision not in PRECISIONS:
+        raise LinearSpaceBaseError("Precision " +\
+                "'{}' is not supported. ".format(precision) +\
+                "Choose from {}.".format(PRECISIONS), location=location)
+    return precision
+
+
+_PRECISION = {
+    'precision': _verified_precision(
+        os.environ.get('PAUL_PRECISION', DOUBLE_PRECISION),
+        _MODULE_LOCATION_)
+}
+
+
+def set_precision(precision=DOUBLE_PRECISION):
+    """ Set package-level complex precision """
+    _PRECISION['precision'] = _verified_precision(precision,
+            _MODULE_LOCATION_+'.set_precision')
+
+
+def get_precision():
+    """ Return package-level complex precision """
+    return _PRECISION['precision']
+
+
+@contextmanager
+def complex_precision(precision=DOUBLE_PRECISION):
+    """ Precision inside a `with` block
+
+    Previous precision is restored on exit, even if an error is
+    raised.
+    """
+    previous = get_precision()
+    set_precision(precision)
+    try:
+        yield
+    finally:
+        _PRECISION['precision'] = previous
+
+
+def complex_dtype():
+    """ Complex dtype of the current precision """
+    return _COMPLEX_DTYPES[_PRECISION['precision']]
+
+
+def as_complex_array(array):
+    """ Array in the complex dtype of the current precision
+
+    Array is returned as it is if already in that dtype, otherwise
+    a copy is cast.
+    """
+    return np_asarray(array, dtype=_COMPLEX_DTYPES[_PRECISION['precision']])
+
+
+def _is_single(dtype):
+    """ Floating or complex dtype of at most single precision """
+    dtype = np_dtype(dtype)
+    if dtype.kind == 'c':
+        return dtype.itemsize <= 8
+    if dtype.kind == 'f':
+        return dtype.itemsize <= 4
+    return False
+
+
+def precision_tolerance(*arrays):
+    """ Numeric error tolerance for arrays
+
+    Single-precision tolerance if any array is of single precision,
+    otherwise double-precision tolerance. Without arrays, tolerance
+    of the current precision.
+    """
+    if len(arrays) == 0:
+        single = _PRECISION['precision'] == SINGLE_PRECISION
+    else:
+        single = any(_is_single(array.dtype) for array in arrays)
+    return SINGLE_PRECISION_TOLERANCE if single else NUMERIC_ERROR_TOLERANCE
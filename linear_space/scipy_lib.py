@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+linear_space.scipy_lib.py
+
+PATH
+
+[app_root]/linear_space/scipy_lib.py
+
+INTRO
+
+Functions imported from scipy.
+
+Scipy is an optional dependency. It is only required by
+sparse matrices. Should scipy be absent, `HAS_SCIPY` is
+`False` and all aliases are set to `None`.
+
+CONTENT
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+try:
+    from scipy.sparse import csr_matrix as sp_csr_matrix, \
+        coo_matrix as sp_coo_matrix, \
+        identity as sp_identity, \
+        kron as sp_kron, \
+        issparse as sp_issparse
+    HAS_SCIPY = True
+except ImportError:
+    sp_csr_matrix = None
+    sp_coo_matrix = None
+    sp_identity = None
+    sp_kron = None
+    sp_issparse = None
+    HAS_SCIPY = False
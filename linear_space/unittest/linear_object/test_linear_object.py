@@ -8,9 +8,10 @@ Main test:
     Instantiation and basic properties of linear object
 
 Updated:
-    23 September 2021
+    17 October 2026
 """
 import unittest
+from unittest import mock
 import numpy as np
 
 from linear_space.linear_object.linear_object import LinearObjectError
@@ -65,6 +66,44 @@ class Test_Validator(unittest.TestCase):
         self.assertTrue(validator.is_valid)
 
 
+class Test_Element_Type(unittest.TestCase):
+    def test_numeric_dtypes(self):
+        for dtype in [bool, np.int8, np.uint16, np.float32, complex]:
+            test_array = np.ones((4, 3), dtype=dtype)
+            validator = LinearObjectValidator(array=test_array)
+            self.assertTrue(validator.is_valid)
+
+    def test_numeric_without_element_loop(self):
+        test_array = np.ones((64, 64), dtype=complex)
+        with mock.patch('linear_space.linear_object.validators.is_number') \
+                as is_number:
+            validator = LinearObjectValidator(array=test_array)
+        self.assertTrue(validator.is_valid)
+        is_number.assert_not_called()
+
+    def test_non_numeric_dtype(self):
+        test_array = np.array([['a', 'b']])
+        validator = LinearObjectValidator(array=test_array)
+        self.assertFalse(validator.is_valid)
+
+    def test_not_finite(self):
+        for value in [np.nan, np.inf, complex(0, -np.inf)]:
+            test_array = np.array([[1, value]])
+            validator = LinearObjectValidator(array=test_array)
+            self.assertFalse(validator.is_valid)
+
+    def test_object_dtype(self):
+        test_array = np.array([[1, 2.5, 1j]], dtype=object)
+        validator = LinearObjectValidator(array=test_array)
+        self.assertTrue(validator.is_valid)
+        test_array = np.array([[1, 'a']], dtype=object)
+        validator = LinearObjectValidator(array=test_array)
+        self.assertFalse(validator.is_valid)
+        test_array = np.array([[1, float('nan')]], dtype=object)
+        validator = LinearObjectValidator(array=test_array)
+        self.assertFalse(validator.is_valid)
+
+
 class Test_Dimension(unittest.TestCase):
     def test_init(self):
         test_array = np.array([[1,2,3,4]])
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test:
+    linear_space.linear_object.trusted.py
+    linear_space.linear_object.linear_object.py
+
+Main test:
+    Trusted construction skips validation, unless switched on
+    for debugging; results of algebra functions are trusted.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+from unittest import mock
+import numpy as np
+
+from linear_space.linear_object import LinearObject, \
+    set_trusted_validation, is_trusted_validation_enabled
+from linear_space.linear_object.errors import LinearObjectValidationError
+from linear_space.vector import ColumnVector, RowVector, UnitVector
+from linear_space.matrix import SquareMatrix
+from linear_space.algebra import scale, matrix_product
+from qubit import QubitState
+
+VALIDATOR = 'linear_space.linear_object.linear_object.LinearObjectValidator'
+
+
+class Test_Trusted(unittest.TestCase):
+    def setUp(self):
+        self.enabled = is_trusted_validation_enabled()
+        set_trusted_validation(False)
+
+    def tearDown(self):
+        set_trusted_validation(self.enabled)
+
+    def test_without_validation(self):
+        array = np.array([[1, 2], [3, 4]], dtype=complex)
+        with mock.patch(VALIDATOR) as validator:
+            matrix = SquareMatrix.from_trusted_array(array)
+        validator.assert_not_called()
+        self.assertTrue(isinstance(matrix, SquareMatrix))
+        self.assertTrue(matrix.as_array() is array)
+        self.assertEqual(matrix.nrows, 2)
+
+    def test_vector_datatype(self):
+        array = np.array([[1], [2]])
+        vector = ColumnVector.from_trusted_array(array)
+        self.assertEqual(vector.as_array().dtype, complex)
+        self.assertFalse(np.shares_memory(vector.as_array(), array))
+        row = RowVector.from_trusted_array(np.array([[1, 2, 3]]))
+        self.assertEqual(row.size, 3)
+
+    def test_vector_not_copied(self):
+        array = np.array([[1], [2]], dtype=complex)
+        vector = ColumnVector.from_trusted_array(array)
+        self.assertTrue(vector.as_array() is array)
+
+    def test_unit_vector_not_normalised(self):
+        array = np.array([[0.6], [0.8]], dtype=complex)
+        with mock.patch.object(UnitVector, 'normalize') as normalize:
+            vector = UnitVector.from_trusted_array(array)
+        normalize.assert_not_called()
+        self.assertTrue(vector.as_array() is array)
+
+    def test_qubit_state(self):
+        array = np.array([[1.], [1.]], dtype=complex) / np.sqrt(2)
+        with mock.patch(VALIDATOR) as validator:
+            state = QubitState.from_trusted_vector(
+                ColumnVector.from_trusted_array(array))
+        validator.assert_not_called()
+        self.assertTrue(isinstance(state, QubitState))
+        self.assertTrue(isinstance(state.as_vector(), UnitVector))
+        self.assertEqual(state.noq, 1)
+        # array is wrapped once, not copied
+        self.assertTrue(state.as_vector().as_array() is array)
+
+    def test_algebra_results(self):
+        matrix = SquareMatrix(array=np.array([[0, 1], [1, 0]]))
+        vector = ColumnVector(array=np.array([[1], [0]]))
+        with mock.patch(VALIDATOR) as validator:
+            scaled = scale(2.0, matrix)
+            product = matrix_product(matrix, vector)
+        validator.assert_not_called()
+        self.assertTrue(isinstance(scaled, SquareMatrix))
+        self.assertTrue(np.allclose(scaled.as_array(), [[0, 2], [2, 0]]))
+        self.assertTrue(isinstance(product, ColumnVector))
+        self.assertTrue(np.allclose(product.as_array(), [[0], [1]]))
+
+    def test_debug_switch(self):
+        invalid = np.array([[np.nan, 1]])
+        self.assertTrue(isinstance(LinearObject.from_trusted_array(invalid),
+                                   LinearObject))
+        set_trusted_validation(True)
+        self.assertTrue(is_trusted_validation_enabled())
+        self.assertRaises(LinearObjectValidationError,
+                          LinearObject.from_trusted_array, invalid)
+
+
+if __name__ == '__main__':
+    unittest.main()
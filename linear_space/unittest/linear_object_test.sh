@@ -10,6 +10,9 @@ python3 -m unittest linear_space/unittest/linear_object/test_linear_object.py
 echo "--- --- Linear object subtypes --- ---"
 python3 -m unittest linear_space/unittest/linear_object/test_types.py
 
+echo "--- --- Trusted construction --- ---"
+python3 -m unittest linear_space/unittest/linear_object/test_trusted.py
+
 echo "--- --- Algebra function decorator --- ---"
 python3 -m unittest linear_space/unittest/linear_object/test_decorator.py
 
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test:
+    linear_space.matrix.sparse_matrix.py
+    linear_space.algebra.functions.py
+
+Main test:
+    Sparse square matrix and algebra functions on it.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+from linear_space.matrix import SparseSquareMatrix, SquareMatrix, HADAMARD
+from linear_space.matrix.errors import SparseSquareMatrixInitValidationError
+from linear_space.vector import ColumnVector, UnitVector
+from linear_space.utils import sparse_identity_by_bits
+from linear_space.algebra import kronecker, matrix_product, matrix_add, \
+    matrix_maker, hermitian_conjugate, scale
+
+
+class TestSparseSquareMatrix(unittest.TestCase):
+    def test_from_array(self):
+        array = np.array([[0, 1j], [1j, 0]])
+        spm = SparseSquareMatrix(array=array)
+        self.assertTrue(spm.size == (2, 2))
+        self.assertTrue(spm.nnz == 2)
+        self.assertTrue(np.array_equal(spm.as_array(), array))
+        self.assertTrue(np.array_equal(spm[1], array[1]))
+
+    def test_not_square(self):
+        with self.assertRaises(SparseSquareMatrixInitValidationError):
+            SparseSquareMatrix(array=np.ones((2, 3)))
+
+    def test_not_numeric(self):
+        with self.assertRaises(SparseSquareMatrixInitValidationError):
+            SparseSquareMatrix(array=np.array([['a', 'b'], ['c', 'd']]))
+
+    def test_identity(self):
+        idm = sparse_identity_by_bits(3)
+        self.assertTrue(idm.nnz == 8)
+        self.assertTrue(idm.trace == 8)
+
+
+class TestSparseAlgebra(unittest.TestCase):
+    def test_kronecker(self):
+        spm = kronecker(sparse_identity_by_bits(2), HADAMARD)
+        self.assertTrue(isinstance(spm, SparseSquareMatrix))
+        self.assertTrue(np.allclose(spm.as_array(),
+                np.kron(np.identity(4), HADAMARD.as_array())))
+
+    def test_matrix_maker(self):
+        spm = matrix_maker(list_of_matrices=[sparse_identity_by_bits(1),
+                HADAMARD, sparse_identity_by_bits(1)], method='tensor')
+        dense = np.kron(np.kron(np.identity(2), HADAMARD.as_array()),
+                        np.identity(2))
+        self.assertTrue(np.allclose(spm.as_array(), dense))
+
+    def test_product_with_vector(self):
+        spm = kronecker(HADAMARD, sparse_identity_by_bits(1))
+        vec = ColumnVector(array=np.array([[1], [0], [0], [0]]))
+        new_vec = matrix_product(spm, vec)
+        self.assertTrue(isinstance(new_vec, UnitVector))
+        self.assertTrue(np.allclose(new_vec.as_array(),
+                spm.as_array() @ vec.as_array()))
+
+    def test_product_and_sum(self):
+        spm = kronecker(HADAMARD, sparse_identity_by_bits(1))
+        self.assertTrue(isinstance(matrix_product(spm, spm),
+                                   SparseSquareMatrix))
+        self.assertTrue(np.allclose(matrix_product(spm, spm).as_array(),
+                                    np.identity(4)))
+        self.assertTrue(isinstance(matrix_add(spm, spm), SparseSquareMatrix))
+        self.assertTrue(isinstance(matrix_add(spm, spm.as_dense()),
+                                   SquareMatrix))
+
+    def test_conjugate_and_scale(self):
+        spm = SparseSquareMatrix(array=np.array([[0, 1j], [2, 0]]))
+        self.assertTrue(np.array_equal(hermitian_conjugate(spm).as_array(),
+                                       np.array([[0, 2], [-1j, 0]])))
+        self.assertTrue(np.array_equal(scale(2, spm).as_array(),
+                                       np.array([[0, 2j], [4, 0]])))
+
+
+if __name__ == '__main__':
+    unittest.main()
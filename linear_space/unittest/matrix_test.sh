@@ -12,4 +12,7 @@ echo "--- --- Square matrix module --- ---"
 python3 -m unittest linear_space/unittest/matrix/test_square.py
 
 echo "--- --- Identity matrix module --- ---"
-python3 -m unittest linear_space/unittest/matrix/test_identity.py
\ No newline at end of file
+python3 -m unittest linear_space/unittest/matrix/test_identity.py
+
+echo "--- --- Sparse square matrix module --- ---"
+python3 -m unittest linear_space/unittest/matrix/test_sparse.py
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test:
+    linear_space.precision.py
+
+Main test:
+    Vectors, square matrices, states, density matrices and gate
+    matrices follow the package-level complex precision; tolerance
+    of comparisons follows the precision of arrays.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.base import LinearSpaceBaseError
+from linear_space.number import is_number
+from linear_space.number.utils import NUMERIC_ERROR_TOLERANCE
+from linear_space.precision import SINGLE_PRECISION, DOUBLE_PRECISION, \
+    set_precision, get_precision, complex_precision, complex_dtype, \
+    as_complex_array, precision_tolerance, SINGLE_PRECISION_TOLERANCE
+from linear_space.vector import ColumnVector, RowVector
+from linear_space.matrix import SquareMatrix
+from qubit import QubitState, ComputationalBasis
+from density_matrix import DensityMatrix
+from gate.single_qubit import gatelib
+from gate.decorator.cache import operator_matrix_key
+from quantum_register import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_flow.makers.fourier import quantum_fourier_flow_on_register
+
+GATE_PARAMETERS = {
+    'Rx': {'theta': 0.3},
+    'Ry': {'theta': 0.3},
+    'Rz': {'theta': 0.3},
+    'PhaseRotation': {'n': 1, 'm': 3},
+    'InversePhaseRotation': {'n': 1, 'm': 3}
+}
+
+
+def fourier_state():
+    register = QubitRegister(state=ComputationalBasis(bitstring='10110'),
+                             label='COMPUTER')
+    memory = QubitMemory(register=[register])
+    quantum_fourier_flow_on_register(register).launch_on_memory(memory)
+    return memory.get_global_state().as_vector().as_array()
+
+
+class Test_Setting(unittest.TestCase):
+    def setUp(self):
+        self.precision = get_precision()
+
+    def tearDown(self):
+        set_precision(self.precision)
+
+    def test_set_precision(self):
+        set_precision(SINGLE_PRECISION)
+        self.assertEqual(get_precision(), SINGLE_PRECISION)
+        self.assertTrue(complex_dtype() is np.complex64)
+        set_precision(DOUBLE_PRECISION)
+        self.assertTrue(complex_dtype() is np.complex128)
+
+    def test_unknown_precision(self):
+        self.assertRaises(LinearSpaceBaseError, set_precision, 'complex256')
+        self.assertEqual(get_precision(), self.precision)
+
+    def test_context_manager(self):
+        set_precision(DOUBLE_PRECISION)
+        with self.assertRaises(ValueError):
+            with complex_precision(SINGLE_PRECISION):
+                self.assertEqual(get_precision(), SINGLE_PRECISION)
+                raise ValueError('inside block')
+        self.assertEqual(get_precision(), DOUBLE_PRECISION)
+
+    def test_as_complex_array(self):
+        array = np.zeros((2, 2), dtype=np.complex64)
+        with complex_precision(SINGLE_PRECISION):
+            self.assertTrue(as_complex_array(array) is array)
+        with complex_precision(DOUBLE_PRECISION):
+            self.assertEqual(as_complex_array(array).dtype, np.complex128)
+
+    def test_tolerance(self):
+        single = np.zeros(2, dtype=np.complex64)
+        double = np.zeros(2, dtype=np.complex128)
+        self.assertEqual(precision_tolerance(single),
+                         SINGLE_PRECISION_TOLERANCE)
+        self.assertEqual(precision_tolerance(double),
+                         NUMERIC_ERROR_TOLERANCE)
+        self.assertEqual(precision_tolerance(single, double),
+                         SINGLE_PRECISION_TOLERANCE)
+        self.assertTrue(is_number(np.complex64(1.0)))
+        self.assertTrue(is_number(np.float32(1.0)))
+
+
+class Test_Objects(unittest.TestCase):
+    def test_datatype(self):
+        for precision, dtype in ((SINGLE_PRECISION, np.complex64),
+                                 (DOUBLE_PRECISION, np.complex128)):
+            with complex_precision(precision):
+                column = ColumnVector(array=np.array([[1], [0]]))
+                row = RowVector(array=np.array([[1, 0, 1]]))
+                matrix = SquareMatrix(array=np.array([[1, 2], [3, 4]]))
+                trusted = SquareMatrix.from_trusted_array(
+                        np.identity(2, dtype=complex))
+                state = QubitState(vector=ColumnVector(
+                        array=np.array([[1], [1]]) / np.sqrt(2)))
+                density = DensityMatrix(state=state)
+                for obj in (column, row, matrix, trusted, state.as_vector(),
+                            density):
+                    self.assertEqual(obj.as_array().dtype, dtype)
+
+    def test_gate_matrices(self):
+        for precision, dtype in ((SINGLE_PRECISION, np.complex64),
+                                 (DOUBLE_PRECISION, np.complex128)):
+            with complex_precision(precision):
+                for alias, gate in gatelib.items():
+                    matrix = gate.gate_prototype.gate_matrix(
+                            **GATE_PARAMETERS.get(alias, {}))
+                    self.assertEqual(matrix.as_array().dtype, dtype, alias)
+
+    def test_normalised(self):
+        # norm is off by 1e-7, beyond double rounding
+        array = np.array([[0.6], [0.8 + 1e-7]])
+        with complex_precision(SINGLE_PRECISION):
+            self.assertTrue(ColumnVector(array=array).is_normalized)
+        with complex_precision(DOUBLE_PRECISION):
+            self.assertFalse(ColumnVector(array=array).is_normalized)
+
+    def test_equal(self):
+        array = np.array([[0.6], [0.8]])
+        shifted = array + 1e-7
+        with complex_precision(SINGLE_PRECISION):
+            self.assertTrue(ColumnVector(array=array).is_equal_to(
+                ColumnVector(array=shifted)))
+        with complex_precision(DOUBLE_PRECISION):
+            self.assertFalse(ColumnVector(array=array).is_equal_to(
+                ColumnVector(array=shifted)))
+
+    def test_cache_key(self):
+        prototype = gatelib['Hadamard'].gate_prototype
+        state = ComputationalBasis(bitstring='00')
+        with complex_precision(SINGLE_PRECISION):
+            single = operator_matrix_key(prototype, input_state=state,
+                                         target_index=0)
+        with complex_precision(DOUBLE_PRECISION):
+            double = operator_matrix_key(prototype, input_state=state,
+                                         target_index=0)
+        self.assertTrue(single != double)
+
+
+class Test_Flow(unittest.TestCase):
+    def test_fourier(self):
+        with complex_precision(DOUBLE_PRECISION):
+            expected = fourier_state()
+        with complex_precision(SINGLE_PRECISION):
+            final = fourier_state()
+        self.assertEqual(final.dtype, np.complex64)
+        self.assertEqual(final.nbytes * 2, expected.nbytes)
+        self.assertTrue(np.allclose(final, expected, rtol=0, atol=1e-6))
+
+
+if __name__ == '__main__':
+    unittest.main()
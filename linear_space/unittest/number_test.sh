@@ -9,3 +9,6 @@ python3 -m unittest linear_space/unittest/number/test_type_checking.py
 
 echo "--- --- Power of two --- ---"
 python3 -m unittest linear_space/unittest/number/test_power.py
+
+echo "--- --- Precision --- ---"
+python3 -m unittest linear_space/unittest/number/test_precision.py
@@ -20,4 +20,5 @@ from .makers import vector_from_list, vector_from_tuple, vector, \
     unitvector_from_list, unitvector_from_tuple, unitvector, \
     equally_weighted_vector, \
     matrix_from_array, matrix_from_list, matrix, \
-    identity_by_rows, identity_by_bits, identity_one_bit
+    identity_by_rows, identity_by_bits, identity_one_bit, \
+    sparse_identity_by_bits
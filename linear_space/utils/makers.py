@@ -60,9 +60,12 @@ using the number of rows
 the number of qubits n; the number of rows of the returned
 matrix is thus 2^n
 
+`sparse_identity_by_bits(n=1)` - Construct a sparse identity
+matrix using the number of qubits n; requires scipy
+
 LOG
 
-Updated on 30 September 2021 | Created on 15 April 2021
+Updated on 17 October 2026 | Created on 15 April 2021
 """
 from linear_space.numpy_lib import np_ndarray, np_power, np_array, \
     np_transpose, np_ones, np_sqrt
@@ -72,6 +75,8 @@ from linear_space.vector.unit_vector import UnitVector
 from linear_space.matrix.matrix import Matrix
 from linear_space.matrix.square_matrix import SquareMatrix
 from linear_space.matrix.identity_matrix import IdentityMatrix
+from linear_space.matrix.sparse_matrix import SparseSquareMatrix
+from linear_space.scipy_lib import sp_identity
 
 from .errors import LinearSpaceUtilityFunctionError as UtilityError
 
@@ -416,3 +421,25 @@ def identity_by_bits(nbits=1):
     An identity matrix of size (2^n, 2^n).
     """
     return IdentityMatrix(row_size=np_power(2, nbits))
+
+
+def sparse_identity_by_bits(nbits=1):
+    """ Make a sparse identity matrix for a state of n qubits
+
+    Size of the resulting matrix is 2^n by 2^n. Unlike
+    `identity_by_bits`, only the diagonal is stored.
+
+    ARGUMENTS
+
+    `nbits` (`int`) : number of qubits
+
+    RETURN
+
+    A sparse square matrix of size (2^n, 2^n).
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.sparse_identity_by_bits'
+    if sp_identity is None:
+        raise UtilityError('Sparse identity matrix requires scipy.',
+                location=_ERROR_LOCATION_)
+    return SparseSquareMatrix(
+            array=sp_identity(int(np_power(2, nbits)), format='csr'))
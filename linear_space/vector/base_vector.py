@@ -25,11 +25,12 @@ is subclass of `LinearObject`.
 
 LOG
 
-Updated on 30 September 2021 | Created on 07 November 2020
+Updated on 17 October 2026 | Created on 07 November 2020
 """
 from linear_space.numpy_lib import np_norm
 from linear_space.number import is_zero, is_one
 from linear_space.linear_object.linear_object import LinearObject
+from linear_space.precision import precision_tolerance
 
 from .errors import VectorError
 from .validators import BaseVectorInitValidator
@@ -176,10 +177,10 @@ class BaseVector(LinearObject):
 
         It is a bad taste to compare norm - 1.0 with zero.
         In numerical analysis, zero must be replaced by a very
-        small number.
+        small number, which follows the precision of the array.
         """
         ret = False
-        if is_one(self.norm):
+        if is_one(self.norm, precision_tolerance(self.as_array())):
             ret = True
         return ret
 
@@ -25,11 +25,12 @@ also serves as base class to other column vectors.
 
 LOG
 
-Updated on 30 September 2021 | Created on 07 November 2020
+Updated on 17 October 2026 | Created on 07 November 2020
 """
 from linear_space.numpy_lib import np_conj, np_transpose
 from linear_space.number import is_zero
 from linear_space.linear_object.algebra import subtract, norm
+from linear_space.precision import as_complex_array, precision_tolerance
 
 from .base_vector import BaseVector
 from .errors import ColumnVectorError
@@ -81,7 +82,8 @@ class ColumnVector(BaseVector):
 
         Should `datatype` be provided, the validated array is
         converted into that type. Otherwise, default datatype
-        is `np.complex`. See validator.
+        is the complex datatype of the current precision. See
+        validator and `linear_space.precision`.
         """
         validator = ColumnVectorInitValidator(array=array, datatype=datatype)
         if validator.is_valid:
@@ -90,6 +92,16 @@ class ColumnVector(BaseVector):
         else:
             validator.raise_last_error(self._ERROR_LOCATION_+'.__init__')
 
+    @classmethod
+    def from_trusted_array(cls, array):
+        """ Column Vector :: Construct without validation
+
+        Array is cast into the complex datatype of the current
+        precision, as by the constructor; it is not copied if
+        already in that datatype.
+        """
+        return super().from_trusted_array(as_complex_array(array))
+
     @property
     def size(self):
         """ Column Vector :: Number of elements in array
@@ -134,7 +146,8 @@ class ColumnVector(BaseVector):
         if isinstance(other_vector, ColumnVector):
             difflinobj = subtract(self, other_vector)
             # if difference is close zero, consider them equal.
-            value = is_zero(norm(difflinobj))
+            value = is_zero(norm(difflinobj), precision_tolerance(
+                    self.as_array(), other_vector.as_array()))
         else:
             raise ColumnVectorError("Column vector 'is_equal_to' " +\
                     "method compares only column vectors.",
@@ -22,11 +22,12 @@ as 1-by-N numpy array as the internal array.
 
 LOG
 
-Updated on 02 October 2021 | Created on 07 November 2020
+Updated on 17 October 2026 | Created on 07 November 2020
 """
 from linear_space.numpy_lib import np_conj
 from linear_space.number import is_zero
 from linear_space.linear_object.algebra import subtract, norm
+from linear_space.precision import as_complex_array, precision_tolerance
 
 from .base_vector import BaseVector
 from .errors import RowVectorError
@@ -51,6 +52,16 @@ class RowVector(BaseVector):
         else:
             validator.raise_last_error(self._ERROR_LOCATION_+'.__init__')
 
+    @classmethod
+    def from_trusted_array(cls, array):
+        """ Row Vector :: Construct without validation
+
+        Array is cast into the complex datatype of the current
+        precision, as by the constructor; it is not copied if
+        already in that datatype.
+        """
+        return super().from_trusted_array(as_complex_array(array))
+
     @property
     def size(self):
         """ Row Vector :: Number of elements in the array
@@ -97,7 +108,8 @@ class RowVector(BaseVector):
         if isinstance(other_vector, RowVector):
             difflinobj = subtract(self, other_vector)
             # if difference is close zero, consider them equal.
-            value = is_zero(norm(difflinobj))
+            value = is_zero(norm(difflinobj), precision_tolerance(
+                    self.as_array(), other_vector.as_array()))
         else:
             raise RowVectorError("Row vector is_equal_to method " +\
                     "compares only row vectors.",
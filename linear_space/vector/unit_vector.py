@@ -21,7 +21,7 @@ has length 1 and is thus a subclass of `ColumnVector`
 
 LOG
 
-Updated on 24 September 2021 | Created on 07 November 2020
+Updated on 17 October 2026 | Created on 07 November 2020
 """
 from .column_vector import ColumnVector
 
@@ -48,3 +48,12 @@ class UnitVector(ColumnVector):
             self.normalize()
         except Exception as err:
             raise err.relocate(_MODULE_LOCATION_+'UnitVector.__init__')
+
+    @classmethod
+    def from_trusted_array(cls, array):
+        """ Unit Vector :: Construct without validation
+
+        Array must already be normalised, e.g. the result of a
+        unitary on a state; it is not normalised again.
+        """
+        return super().from_trusted_array(array)
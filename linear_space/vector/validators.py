@@ -21,12 +21,12 @@ CONTENT
 
 LOG
 
-Updated on 30 September 2021 | Created on 07 November 2020
+Updated on 17 October 2026 | Created on 07 November 2020
 """
-from linear_space.numpy_lib import np_complex
 from linear_space.number import VALID_NUMERIC_TYPES, is_integer
 from linear_space.base import LinearSpaceBaseValidator
 from linear_space.linear_object.linear_object import LinearObjectValidator
+from linear_space.precision import complex_dtype
 
 from .errors import VectorValidationError, ColumnVectorValidationError, \
     StandardBasisVectorValidationError, RowVectorValidationError
@@ -77,9 +77,9 @@ class ColumnVectorInitValidator(BaseVectorInitValidator):
             if datatype is not None:
                 self.validate_datatype(datatype)
         if self.is_valid:
-            # no datatype specified, default to np.complex
+            # no datatype specified, default to complex of precision
             if datatype is None:
-                self._validated_array = array.astype(np_complex)
+                self._validated_array = array.astype(complex_dtype())
             else:
                 self._validated_array = array.astype(datatype)
 
@@ -174,9 +174,9 @@ class RowVectorInitValidator(BaseVectorInitValidator):
             if datatype is not None:
                 self.validate_datatype(datatype)
         if self.is_valid:
-            # no datatype specified, default to np.complex
+            # no datatype specified, default to complex of precision
             if datatype is None:
-                self._validated_array = array.astype(np_complex)
+                self._validated_array = array.astype(complex_dtype())
             else:
                 self._validated_array = array.astype(datatype)
 
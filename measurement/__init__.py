@@ -24,7 +24,9 @@ CONTENT
 
 LOG
 
-Updated on 27 September 2021 | Created on 08 April 2021
+Updated on 17 October 2026 | Created on 08 April 2021
 """
 from .partial_trace import partial_trace
 from .projective import projective
+from .sampling import sample, sample_memory
+from .observables import expectation, expectation_values
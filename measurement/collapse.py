@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+measurement.collapse.py
+
+PATH
+
+[app_root]/measurement/collapse.py
+
+INTRO
+
+Collapse of a pure state after measurement.
+
+Measuring a subset of qubits in computational basis yields
+an outcome, sampled from their marginal probabilities, and a
+post-measurement state. Amplitudes of basis states whose
+measured bits don't match the outcome are set to zero, found
+by an index mask; the rest are renormalised by the square
+root of the outcome probability. No density matrix is formed.
+
+CONTENT
+
+`outcome_mask(number_of_qubits, qubit_indices, outcome)` -
+Boolean mask of basis states matching an outcome
+
+`collapse_state_array(...)` - Projects a state array onto an
+outcome and renormalises it
+
+`measure_and_collapse(state, qubit_indices, seed)` - Samples
+an outcome and returns the post-measurement state
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+
+from .errors import SamplingError
+from .projective import projective_marginal
+from .sampling import sample_outcomes
+
+_MODULE_LOCATION_ = 'measurement.collapse'
+
+
+def outcome_mask(number_of_qubits, qubit_indices, outcome):
+    """ Mask of basis states matching an outcome
+
+    ARGUMENTS
+
+    `number_of_qubits` (`int`) : number of qubits `n` of the state
+
+    `qubit_indices` (`list`) : indices of measured qubits; qubit
+    `qubit_indices[0]` is the most significant bit of the outcome
+
+    `outcome` (`int`) : outcome as a basis index of measured qubits
+
+    RETURN
+
+    A boolean array of size `2^n`.
+    """
+    indices = np.arange(2**number_of_qubits)
+    mask = np.ones(2**number_of_qubits, dtype=bool)
+    number_of_measured = len(qubit_indices)
+    for position, qubit in enumerate(qubit_indices):
+        bit = (outcome >> (number_of_measured - 1 - position)) & 1
+        mask &= ((indices >> (number_of_qubits - 1 - qubit)) & 1) == bit
+    return mask
+
+
+def collapse_state_array(state_array, number_of_qubits, qubit_indices,
+                         outcome, probability):
+    """ Project a state array onto an outcome
+
+    Non-matching amplitudes of `state_array` are set to zero in
+    place; the array is then renormalised in place.
+
+    ARGUMENTS
+
+    `probability` (`float`) : probability of the outcome, used to
+    renormalise; must be positive
+
+    RETURN
+
+    `state_array`, after collapse.
+    """
+    if not probability > 0.0:
+        raise SamplingError("State can't collapse onto an outcome " +\
+                "of zero probability.",
+                location=_MODULE_LOCATION_+'.collapse_state_array')
+    flat = state_array.reshape(-1)
+    flat[~outcome_mask(number_of_qubits, qubit_indices, outcome)] = 0.0
+    flat /= np.sqrt(probability)
+    return state_array
+
+
+def measure_and_collapse(state, qubit_indices, seed=None):
+    """ Measure qubits of a pure state and collapse it
+
+    ARGUMENTS
+
+    `state` (`QubitState`) : state measured; left unchanged
+
+    `qubit_indices` (`list`) : distinct indices of measured qubits,
+    in the order of digits in the outcome bit string
+
+    `seed` : see `sampling.make_generator`
+
+    RETURN
+
+    A tuple `(bitstring, probability, new_state)`.
+    """
+    probabilities = projective_marginal(state, qubit_indices, as_array=True)
+    outcome = int(sample_outcomes(probabilities, 1, seed=seed)[0])
+    probability = float(probabilities[outcome])
+    new_array = collapse_state_array(
+            state.as_vector().as_array().copy(),
+            state.noq, qubit_indices, outcome, probability)
+    bitstring = format(outcome, '0{}b'.format(len(qubit_indices)))
+    return bitstring, probability, \
+            QubitState.from_trusted_vector(
+                    ColumnVector.from_trusted_array(new_array))
@@ -15,7 +15,7 @@ Dedicated error classes.
 
 LOG
 
-Updated on 28 September 2021 | Created on 05 April 2021
+Updated on 17 October 2026 | Created on 05 April 2021
 """
 from .base import MeasurementBaseError, MeasurementBaseValidationError
 
@@ -48,3 +48,23 @@ class ProjectiveMeasurementError(MeasurementBaseError):
     Module `projective`
     """
     header = "Projective_Measurement_Error"
+
+
+class SamplingError(MeasurementBaseError):
+    """ Sampling error
+
+    ENTRY
+
+    Module `sampling`
+    """
+    header = "Sampling_Error"
+
+
+class ObservableError(MeasurementBaseError):
+    """ Observable error
+
+    ENTRY
+
+    Module `observables`
+    """
+    header = "Observable_Error"
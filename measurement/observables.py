@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+measurement.observables.py
+
+PATH
+
+[app_root]/measurement/observables.py
+
+INTRO
+
+Expectation values of Pauli-string observables.
+
+A Pauli string of `n` qubits is a tensor product of `n` single-
+qubit Pauli matrices or identities, e.g. 'XIZ', where the `k`-th
+symbol acts on qubit `k`. Symbols are those of gates `Pauli_X`,
+`Pauli_Y` and `Pauli_Z`, with 'I' for identity; the gates may
+also be given in place of their symbols.
+
+A Pauli string maps a basis state to a single basis state with
+a phase,
+    P|b> = i^(nY) (-1)^(|b & z|) |b ^ x>,
+where the bit mask `x` marks X and Y, the bit mask `z` marks Z
+and Y, and `nY` is the number of Y. Expectation values are thus
+obtained by an index flip and a sign per basis state,
+    <psi|P|psi> = sum_b conj(psi[b ^ x]) psi[b] phase(b)
+    Tr(rho P) = sum_b rho[b, b ^ x] phase(b),
+in O(2^n) per term; no operator matrix is formed. A density
+matrix in factor form `F F^dagger` is treated as an ensemble of
+the columns of `F`, without forming the dense matrix. Terms sharing
+a bit-flip mask share the flipped overlap; the sign of a term is
+the parity of `b & z`, folded on the integer basis indices, so
+no auxiliary array beyond one of `2^n` integers is formed.
+
+An observable is a weighted sum of Pauli strings, given as a
+dictionary
+    {
+        'ZZ': 1.0,
+        'XI': 0.5
+    }
+of Pauli strings and their coefficients.
+
+CONTENT
+
+`pauli_masks(pauli_string, number_of_qubits)` - Bit-flip mask,
+phase mask and number of Y of a Pauli string
+
+`expectation_values(pauli_strings, system)` - Expectation values
+of several Pauli strings
+
+`expectation(observable, system)` - Expectation value of a Pauli
+string or a weighted sum of Pauli strings
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import numpy as np
+
+from gate.single_qubit import Pauli_X, Pauli_Y, Pauli_Z
+from qubit import QubitState
+from density_matrix import DensityMatrix, FactoredDensityMatrix
+
+from .errors import ObservableError
+from .decorators import as_measurement_function
+
+_MODULE_LOCATION_ = 'measurement.observables'
+
+# Pauli gates and their symbols
+PAULI_GATES = (Pauli_X, Pauli_Y, Pauli_Z)
+IDENTITY_SYMBOL = 'I'
+PAULI_SYMBOLS = (IDENTITY_SYMBOL,) + \
+        tuple(gate.gate_prototype.symbol for gate in PAULI_GATES)
+
+
+def _pauli_symbol(item, location):
+    """ Symbol of an item of a Pauli string """
+    if item is None:
+        return IDENTITY_SYMBOL
+    if isinstance(item, str) and item in PAULI_SYMBOLS:
+        return item
+    for gate in PAULI_GATES:
+        if item is gate:
+            return gate.gate_prototype.symbol
+    raise ObservableError("Pauli string may only contain " +\
+            "symbols {}, Pauli gates or None, ".format(PAULI_SYMBOLS) +\
+            "not {}.".format(item), location=location)
+
+
+def pauli_masks(pauli_string, number_of_qubits):
+    """ Masks of a Pauli string
+
+    ARGUMENTS
+
+    `pauli_string` (`str` or sequence) : symbols, Pauli gates or
+    `None` for identity, one per qubit
+
+    `number_of_qubits` (`int`) : number of qubits `n`
+
+    RETURN
+
+    A tuple `(x_mask, z_mask, number_of_y)`, where `x_mask` and
+    `z_mask` are integers of `n` bits; qubit `k` is bit `n-1-k`.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.pauli_masks'
+    symbols = [_pauli_symbol(item, _ERROR_LOCATION_) for item in pauli_string]
+    if len(symbols) != number_of_qubits:
+        raise ObservableError("Pauli string of {} ".format(len(symbols)) +\
+                "qubits doesn't match system of " +\
+                "{} qubits.".format(number_of_qubits),
+                location=_ERROR_LOCATION_)
+    x_symbol, y_symbol, z_symbol = PAULI_SYMBOLS[1:]
+    x_mask, z_mask, number_of_y = 0, 0, 0
+    for qubit, symbol in enumerate(symbols):
+        bit = 1 << (number_of_qubits - 1 - qubit)
+        if symbol in (x_symbol, y_symbol):
+            x_mask |= bit
+        if symbol in (z_symbol, y_symbol):
+            z_mask |= bit
+        if symbol == y_symbol:
+            number_of_y += 1
+    return x_mask, z_mask, number_of_y
+
+
+def _odd_parity(values, number_of_qubits):
+    """ Parity of bits of integers of `n` bits, as a boolean array
+
+    Bits are folded in place with exclusive or; `values` is
+    overwritten.
+    """
+    shift = 1
+    while shift < number_of_qubits:
+        values ^= values >> shift
+        shift <<= 1
+    return (values & 1).astype(bool)
+
+
+def _system_array(system):
+    """ Number of qubits and array of a qubit system """
+    if isinstance(system, QubitState):
+        return system.noq, system.as_vector().as_array().reshape(-1)
+    if isinstance(system, FactoredDensityMatrix):
+        return system.noq, system.as_factor()
+    array = system.as_array()
+    number_of_qubits = int(array.shape[0]).bit_length() - 1
+    if 2**number_of_qubits != array.shape[0]:
+        raise ObservableError("Density matrix isn't composed of " +\
+                "qubit states.", location=_MODULE_LOCATION_+'._system_array')
+    return number_of_qubits, array
+
+
+@as_measurement_function(argument_type={
+    'system': (DensityMatrix, QubitState,)
+})
+def expectation_values(pauli_strings, system):
+    """ Expectation values of Pauli strings
+
+    ARGUMENTS
+
+    `pauli_strings` (`list`) : Pauli strings
+
+    `system` (`QubitState` or `DensityMatrix`) : system of `n`
+    qubits
+
+    RETURN
+
+    A real numpy array of expectation values, one per string.
+    """
+    number_of_qubits, array = _system_array(system)
+    masks = [pauli_masks(pauli_string, number_of_qubits)
+             for pauli_string in pauli_strings]
+    values = np.zeros(len(masks), dtype=float)
+    indices = np.arange(2**number_of_qubits, dtype=np.int64)
+    groups = {}
+    for term, (x_mask, _, _) in enumerate(masks):
+        groups.setdefault(x_mask, []).append(term)
+    for x_mask, terms in groups.items():
+        if isinstance(system, QubitState):
+            overlap = np.conj(array[indices ^ x_mask]) * array
+        elif isinstance(system, FactoredDensityMatrix):
+            overlap = np.einsum('ij,ij->i',
+                                np.conj(array[indices ^ x_mask]), array)
+        else:
+            overlap = array[indices, indices ^ x_mask]
+        total = overlap.sum()
+        for term in terms:
+            _, z_mask, number_of_y = masks[term]
+            # sum of overlap with sign (-1)^(|b & z|)
+            value = total
+            if z_mask != 0:
+                odd = _odd_parity(indices & z_mask, number_of_qubits)
+                value = total - 2.0 * overlap[odd].sum()
+            values[term] = np.real(1.j**number_of_y * value)
+    return values
+
+
+def expectation(observable, system):
+    """ Expectation value of an observable
+
+    ARGUMENTS
+
+    `observable` (`str`, sequence or `dict`) : a Pauli string, or
+    a dictionary of Pauli strings and their coefficients
+
+    `system` (`QubitState` or `DensityMatrix`) : system of `n`
+    qubits
+
+    RETURN
+
+    A float, or a complex number if a coefficient is complex.
+    """
+    if not isinstance(observable, dict):
+        return float(expectation_values([observable], system)[0])
+    if len(observable) == 0:
+        raise ObservableError("Observable has no Pauli strings.",
+                location=_MODULE_LOCATION_+'.expectation')
+    coefficients = np.array(list(observable.values()))
+    if not np.issubdtype(coefficients.dtype, np.number):
+        raise ObservableError("Coefficients of an observable must be " +\
+                "numbers.", location=_MODULE_LOCATION_+'.expectation')
+    value = np.dot(coefficients,
+                   expectation_values(list(observable.keys()), system))
+    if np.iscomplexobj(coefficients):
+        return complex(value)
+    return float(value)
@@ -21,14 +21,33 @@ but also other quantum-mechanical operators.
 The design philosophy is that partial trace must be
 functional, not descriptive.
 
+Partial trace over computational basis, i.e. tracing out a set
+of qubits, is performed on the density matrix viewed as a tensor
+of shape `(2,) * 2n`, where axes `k` and `n + k` are the row and
+column axes of qubit `k`. Qubits are traced out by contracting
+their row and column axes in a single `einsum`, at a cost of
+`O(4^n)`, rather than sandwiching the density matrix between
+enlarged basis matrices for each of the `2^k` basis states.
+Qubits to be traced out need not be contiguous.
+
+A pure state needs no density matrix at all. Its state vector,
+with the kept qubits moved to the front, is reshaped into a
+`(2^a, 2^b)` matrix `M`, where `a` qubits are kept and `b` are
+traced out; the reduced density matrix is `M M^dagger`, at a
+cost of `O(2^n 2^a)`. A density matrix in factor form, i.e.
+`FactoredDensityMatrix`, is traced out in the same way, column by
+column of its factor, and stays in factor form.
+
 LOG
 
-Updated on 13 October 2021 | Created on 08 April 2021
+Updated on 17 October 2026 | Created on 08 April 2021
 """
-from bit import integer_to_bitstring, Bitstring_Literal_Type
-from linear_space.number import exponent_of_two, power_of_two
+import numpy as np
+
+from bit import Bitstring_Literal_Type
+from linear_space.number import exponent_of_two
 from linear_space.matrix import Matrix, SquareMatrix
-from linear_space.algebra import matrix_product, matrix_add, kronecker,\
+from linear_space.algebra import matrix_product, kronecker, \
     hermitian_conjugate
 from linear_space.utils import identity_by_bits
 
@@ -36,6 +55,7 @@ from quantum_state import QuantumState
 from qubit.qubit import QubitState, ComputationalBasis
 from qubit.index_range import IndexRangeValidator
 from density_matrix.density_matrix import DensityMatrix, QubitDensityMatrix
+from density_matrix.factored import FactoredDensityMatrix
 
 from .errors import PartialTraceError
 from .decorators import as_measurement_function
@@ -44,6 +64,102 @@ _MODULE_LOCATION_ = 'measurement.partial_trace'
 
 
 # Support functions
+def trace_out_qubit_axes(array, number_of_qubits, qubit_indices):
+    """ Trace out qubits of a density matrix array
+
+    ARGUMENTS
+
+    `array` (`ndarray`) : density matrix of shape `(2^n, 2^n)`
+
+    `number_of_qubits` (`int`) : number of qubits `n`
+
+    `qubit_indices` (`list`) : distinct indices of qubits to be
+    traced out, in any order
+
+    RETURN
+
+    Reduced array of shape `(2^m, 2^m)`, where `m` is the number
+    of remaining qubits, kept in their original order; a scalar
+    if all qubits are traced out.
+    """
+    traced = set(qubit_indices)
+    kept = [index for index in range(0, number_of_qubits)
+            if index not in traced]
+    # row axis k and column axis n + k share a label if traced out
+    column_labels = [index if index in traced else number_of_qubits + index
+                     for index in range(0, number_of_qubits)]
+    output_labels = kept + [number_of_qubits + index for index in kept]
+    tensor = array.reshape((2,) * (2 * number_of_qubits))
+    reduced = np.einsum(tensor, list(range(0, number_of_qubits)) +
+                        column_labels, output_labels)
+    if len(kept) == 0:
+        return reduced[()]
+    return reduced.reshape(2**len(kept), 2**len(kept))
+
+
+def trace_out_qubit_axes_of_state(state_array, number_of_qubits,
+                                  qubit_indices):
+    """ Trace out qubits of a pure state array
+
+    Same as `trace_out_qubit_axes` applied to the density matrix
+    of the state, without forming that density matrix.
+
+    ARGUMENTS
+
+    `state_array` (`ndarray`) : state vector of size `2^n`
+
+    `number_of_qubits` (`int`) : number of qubits `n`
+
+    `qubit_indices` (`list`) : distinct indices of qubits to be
+    traced out, in any order
+
+    RETURN
+
+    Reduced density array of shape `(2^a, 2^a)`, where `a` is the
+    number of remaining qubits, kept in their original order; a
+    scalar if all qubits are traced out.
+    """
+    traced = set(qubit_indices)
+    kept = [index for index in range(0, number_of_qubits)
+            if index not in traced]
+    if len(kept) == 0:
+        return np.vdot(state_array, state_array)
+    tensor = state_array.reshape((2,) * number_of_qubits)
+    matrix = np.transpose(tensor, kept + sorted(traced)).reshape(
+            2**len(kept), -1)
+    return matrix @ matrix.conj().T
+
+
+def _reduce(density_matrix, system_noq, qubit_indices):
+    """ Reduced density matrix, or a number if nothing is kept """
+    if isinstance(density_matrix, FactoredDensityMatrix):
+        if len(set(qubit_indices)) == system_noq:
+            return density_matrix.trace
+        return density_matrix.partial_trace_out_qubits(qubit_indices)
+    reduced = trace_out_qubit_axes(density_matrix.as_array(), system_noq,
+                                   qubit_indices)
+    if isinstance(reduced, np.ndarray):
+        return QubitDensityMatrix(matrix=SquareMatrix(array=reduced))
+    return reduced
+
+
+def _validate_qubit_indices(system_noq, qubit_indices, location):
+    """ Raise if qubit indices are not distinct and in range """
+    if not isinstance(qubit_indices, (list, tuple)) or \
+            len(qubit_indices) == 0:
+        raise PartialTraceError("Qubits to be traced out must be " +\
+                "given as a non-empty list of indices.", location=location)
+    for index in qubit_indices:
+        if not isinstance(index, int) or isinstance(index, bool) or \
+                index not in range(0, system_noq):
+            raise PartialTraceError("Qubit index {} ".format(index) +\
+                    "is invalid for a system of " +\
+                    "{} qubits.".format(system_noq), location=location)
+    if len(set(qubit_indices)) != len(qubit_indices):
+        raise PartialTraceError("Qubits to be traced out must be " +\
+                "distinct.", location=location)
+
+
 @as_measurement_function(argument_type={
     'bitstring': Bitstring_Literal_Type
 })
@@ -349,13 +465,12 @@ def partial_trace_out_index_range(density_matrix, index_range_bound):
 
     Partially trace out one qubit register from a joint system.
 
-    NOTE Don't create all matrices simultaneously; better
-    create them per request.
+    NOTE Range is traced out by `trace_out_qubit_axes`; see
+    also `partial_trace_out_qubits` for non-contiguous qubits.
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.partial_trace_out_index_range'
     ret = None
     validated_bound = None
-    reduced = 0
     first_index = 0
     system_noq = exponent_of_two(density_matrix.nrows)
     # Must validate against total noq
@@ -373,37 +488,73 @@ def partial_trace_out_index_range(density_matrix, index_range_bound):
         # only 1 bit to be traced out
         number_of_bits = 1
         first_index = validated_bound[0]
-    # create first bitstring for computational basis
-    initstring = integer_to_bitstring(integer=0, total_digits=number_of_bits)
-    reduced = matrix_product(
-        _left_matrix(system_noq,first_index, bitstring=initstring),
-        matrix_product(
-            density_matrix,
-            _right_matrix(system_noq, first_index, bitstring=initstring)
-        )
-    )
-    for integer in range(1, power_of_two(number_of_bits), 1):
-        bit_string = integer_to_bitstring(integer=integer,
-                total_digits=number_of_bits)
-        reduced = matrix_add(
-            reduced,
-            matrix_product(
-                _left_matrix(system_noq, first_index, bitstring=bit_string),
-                matrix_product(
-                    density_matrix,
-                    _right_matrix(system_noq, first_index, bitstring=bit_string)
-                )
-            )
-        )
     # reduced density matrix is either a matrix or a scalar/number
-    if isinstance(reduced, Matrix):
-        ret = QubitDensityMatrix(matrix=SquareMatrix(array=reduced.as_array()))
-    else:
-        # a scalar
-        ret = reduced
+    ret = _reduce(density_matrix, system_noq,
+                  list(range(first_index, first_index + number_of_bits)))
     return ret
 
 
+@as_measurement_function(argument_type={
+    'density_matrix': QubitDensityMatrix
+})
+def partial_trace_out_qubits(density_matrix, qubit_indices):
+    """ Partial tracing out a set of qubits
+
+    Qubits are traced out via computational basis; they need
+    not be contiguous. For example, tracing out qubits [0, 2]
+    of a 4-qubit system leaves qubits 1 and 3, in that order.
+
+    ARGUMENTS
+
+    `density_matrix` (`QubitDensityMatrix`) : system represented
+    by a density matrix
+
+    `qubit_indices` (`list`) : distinct indices of qubits to be
+    traced out
+
+    RETURN
+
+    Density matrix with reduced dimension; or a number if all
+    qubits are traced out.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.partial_trace_out_qubits'
+    system_noq = exponent_of_two(density_matrix.nrows)
+    _validate_qubit_indices(system_noq, qubit_indices, _ERROR_LOCATION_)
+    return _reduce(density_matrix, system_noq, qubit_indices)
+
+
+@as_measurement_function(argument_type={
+    'state': QubitState
+})
+def partial_trace_out_qubits_of_state(state, qubit_indices):
+    """ Partial tracing out a set of qubits of a pure state
+
+    Returns the same as `partial_trace_out_qubits` applied to
+    `QubitDensityMatrix(state=state)`, but the density matrix of
+    the entire state is never formed.
+
+    ARGUMENTS
+
+    `state` (`QubitState`) : pure state of the system
+
+    `qubit_indices` (`list`) : distinct indices of qubits to be
+    traced out
+
+    RETURN
+
+    Reduced density matrix; or a number if all qubits are
+    traced out.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + \
+            '.partial_trace_out_qubits_of_state'
+    _validate_qubit_indices(state.noq, qubit_indices, _ERROR_LOCATION_)
+    reduced = trace_out_qubit_axes_of_state(
+            state.as_vector().as_array(), state.noq, qubit_indices)
+    if isinstance(reduced, np.ndarray):
+        return QubitDensityMatrix(matrix=SquareMatrix(array=reduced))
+    return reduced
+
+
 @as_measurement_function(argument_type={
     'density_matrix': QubitDensityMatrix,
     'bitstring': Bitstring_Literal_Type
@@ -34,16 +34,26 @@ is the separation of logics and functionalities.
 Projective measurement mechanism is provided via helper
 functions. Measurement is functional, not descriptive.
 
+Projective measurement on all computational basis states is
+vectorised. Probabilities are `|psi|^2` of a state, or the
+diagonal of a density matrix, obtained in one pass as a numpy
+array. Marginal probabilities of a subset of qubits are summed
+out of the array viewed as a tensor of shape `(2,) * n`. For a
+density matrix in factor form, the diagonal and projections on
+a state are computed from the factor; no dense matrix is formed.
+
 LOG
 
-Updated on 08 October 2021 | Created on 10 April 2021
+Updated on 17 October 2026 | Created on 10 April 2021
 """
-from bit import integer_to_bitstring, Bitstring_Literal_Type
+import numpy as np
+
+from bit import Bitstring_Literal_Type
 from linear_space.number import exponent_of_two, power_of_two
 from linear_space.algebra import matrix_product
 from quantum_state.quantum_state import QuantumState
 from qubit import QubitState, ComputationalBasis
-from density_matrix import DensityMatrix
+from density_matrix import DensityMatrix, FactoredDensityMatrix
 
 from .errors import ProjectiveMeasurementError
 from .decorators import as_measurement_function
@@ -71,6 +81,10 @@ def projective_on_state(system, state):
     system_density_matrix = None
     projection_matrix = None
     probability = None
+    if isinstance(system, FactoredDensityMatrix) and \
+            system.nrows == state.dim:
+        # no dense matrix is formed
+        return complex(system.projection(state))
     if isinstance(system, DensityMatrix):
         system_density_matrix = system
     else:
@@ -135,15 +149,92 @@ def projective_on_basis(system, basis):
     return probability
 
 
+def _probability_array(system, location):
+    """ Probabilities of all computational basis states """
+    if isinstance(system, FactoredDensityMatrix):
+        return system.diagonal()
+    if isinstance(system, DensityMatrix):
+        # density matrix must originate from qubit states
+        exponent_of_two(system.nrows)
+        return np.real(np.diagonal(system.as_array())).copy()
+    if isinstance(system, QubitState):
+        return np.abs(system.as_vector().as_array().reshape(-1))**2
+    raise ProjectiveMeasurementError('Measurement in ' +\
+            'basis requires the system be composed '   +\
+            'of qubit states.', location=location)
+
+
+def probability_dict(probabilities):
+    """ Probability array as a dictionary
+
+    ARGUMENTS
+
+    `probabilities` (`ndarray`) : probabilities of all basis states
+    in ascending order, of size `2^n`
+
+    RETURN
+
+    A dictionary that contains bit strings of `n` digits as keys
+    and the corresponding probabilities as values.
+    """
+    noq = exponent_of_two(len(probabilities))
+    form = '0{}b'.format(noq)
+    return {format(index, form): prob
+            for index, prob in enumerate(probabilities.tolist())}
+
+
+def marginal_probability_array(probabilities, qubit_indices):
+    """ Marginal probabilities of a subset of qubits
+
+    ARGUMENTS
+
+    `probabilities` (`ndarray`) : probabilities of all basis states,
+    of size `2^n`
+
+    `qubit_indices` (`list`) : distinct indices of qubits to keep;
+    qubit `qubit_indices[0]` is the most significant bit of the
+    marginal basis index, as in a bit string
+
+    RETURN
+
+    An array of size `2^m`, where `m` is the number of qubits kept.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.marginal_probability_array'
+    noq = exponent_of_two(len(probabilities))
+    if len(qubit_indices) == 0 or len(set(qubit_indices)) != \
+            len(qubit_indices) or any(index not in range(0, noq)
+                                      for index in qubit_indices):
+        raise ProjectiveMeasurementError("Qubits of a marginal " +\
+                "distribution must be a non-empty list of distinct " +\
+                "indices of the system.", location=_ERROR_LOCATION_)
+    tensor = probabilities.reshape((2,) * noq)
+    traced = tuple(index for index in range(0, noq)
+                   if index not in qubit_indices)
+    marginal = tensor.sum(axis=traced)
+    # remaining axes are in ascending order of qubit index
+    order = sorted(qubit_indices)
+    marginal = np.transpose(marginal,
+                            [order.index(index) for index in qubit_indices])
+    return marginal.reshape(-1)
+
+
 @as_measurement_function(argument_type={
     'system': (DensityMatrix, QubitState,)
 })
-def projective_all(system):
+def projective_all(system, as_array=False):
     """ Projective measurement on all computational basis
 
     Density matrix or system must be originating from
     qubit state.
 
+    ARGUMENTS
+
+    `system` (`DensityMatrix` or `QubitState`) : system to
+    be measured
+
+    `as_array` (`bool`) : if `True`, returns probabilities as
+    an array
+
     RETURN
 
     A dictionary that contains bit string as keys and
@@ -155,27 +246,47 @@ def projective_all(system):
             '11': 0.5,
         }
     where all basis states allowed by the number of qubits
-    are listed.
+    are listed. If `as_array` is `True`, an array of all
+    probabilities, indexed by basis state.
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.projective_all'
-    noq = None
-    probdict = {}
-    # validate system
-    if isinstance(system, DensityMatrix):
-        noq = exponent_of_two(system.nrows)
-    elif isinstance(system, QubitState):
-        noq = system.noq
-    else:
-        raise ProjectiveMeasurementError('Measurement in ' +\
-                'basis requires the system be composed '   +\
-                'of qubit states.', location=_ERROR_LOCATION_)
-    # indeed qubit state based system
-    if not noq is None:
-        for i in range(0, power_of_two(noq), 1):
-            bitstring = integer_to_bitstring(integer=i, total_digits=noq)
-            prob = projective_on_basis(system, bitstring)
-            probdict[bitstring] = prob
-    return probdict
+    probabilities = _probability_array(system, _ERROR_LOCATION_)
+    if as_array:
+        return probabilities
+    return probability_dict(probabilities)
+
+
+@as_measurement_function(argument_type={
+    'system': (DensityMatrix, QubitState,)
+})
+def projective_marginal(system, qubit_indices, as_array=False):
+    """ Projective measurement on a subset of qubits
+
+    Marginal probabilities of the given qubits; all other
+    qubits are summed over. No partial trace is performed.
+
+    ARGUMENTS
+
+    `system` (`DensityMatrix` or `QubitState`) : system to
+    be measured
+
+    `qubit_indices` (`list`) : distinct indices of qubits to
+    be measured, in the order of digits in bit strings
+
+    `as_array` (`bool`) : if `True`, returns probabilities as
+    an array
+
+    RETURN
+
+    A dictionary of bit strings of the measured qubits and the
+    probabilities; or an array if `as_array` is `True`.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.projective_marginal'
+    marginal = marginal_probability_array(
+            _probability_array(system, _ERROR_LOCATION_), qubit_indices)
+    if as_array:
+        return marginal
+    return probability_dict(marginal)
 
 
 # Primary function
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    measurement.observables.py
+
+Main test
+    Expectation values by bit-flip and phase masks agree with
+    dense operators built from Pauli gate matrices.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import itertools
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from density_matrix.density_matrix import DensityMatrix, QubitDensityMatrix
+from density_matrix.factored import FactoredDensityMatrix
+from gate.single_qubit import Pauli_X, Pauli_Y, Pauli_Z
+from measurement.observables import pauli_masks, expectation, \
+    expectation_values
+from measurement.observables import _odd_parity
+from measurement.errors import ObservableError
+
+MATRICES = {
+    'I': np.eye(2),
+    'X': Pauli_X.gate_prototype.gate_matrix().as_array(),
+    'Y': Pauli_Y.gate_prototype.gate_matrix().as_array(),
+    'Z': Pauli_Z.gate_prototype.gate_matrix().as_array()
+}
+
+
+def random_state(noq, seed):
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=2**noq) + 1.j * rng.normal(size=2**noq)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def dense(pauli_string):
+    matrix = np.eye(1)
+    for symbol in pauli_string:
+        matrix = np.kron(matrix, MATRICES[symbol])
+    return matrix
+
+
+class Test_Masks(unittest.TestCase):
+    def test_masks(self):
+        self.assertEqual(pauli_masks('XIYZ', 4), (0b1010, 0b0011, 1))
+        self.assertEqual(pauli_masks([Pauli_Z, None, Pauli_Y], 3),
+                         (0b001, 0b101, 1))
+
+    def test_invalid(self):
+        with self.assertRaises(ObservableError):
+            pauli_masks('XZ', 3)
+        with self.assertRaises(ObservableError):
+            pauli_masks('XA', 2)
+
+
+class Test_Expectation(unittest.TestCase):
+    def test_all_strings_on_state(self):
+        state = random_state(3, 1)
+        psi = state.as_vector().as_array().reshape(-1)
+        strings = [''.join(item) for item in itertools.product('IXYZ',
+                                                                repeat=3)]
+        values = expectation_values(strings, state)
+        for pauli_string, value in zip(strings, values):
+            self.assertAlmostEqual(value, np.real(
+                np.vdot(psi, dense(pauli_string) @ psi)), places=12)
+
+    def test_density_matrix(self):
+        state = random_state(4, 2)
+        density_matrix = QubitDensityMatrix(state=state)
+        rho = density_matrix.as_array()
+        for pauli_string in ['XYZI', 'YYII', 'ZIZX', 'IIII', 'XXXX']:
+            self.assertAlmostEqual(expectation(pauli_string, density_matrix),
+                np.real(np.trace(rho @ dense(pauli_string))), places=12)
+            self.assertAlmostEqual(expectation(pauli_string, density_matrix),
+                expectation(pauli_string, state), places=12)
+
+    def test_factored_density_matrix(self):
+        ensemble = [(0.6, random_state(3, 7)), (0.4, random_state(3, 8))]
+        factored = FactoredDensityMatrix(state=ensemble)
+        rho = DensityMatrix(state=ensemble).as_array()
+        for pauli_string in ['XYZ', 'ZZI', 'IYX']:
+            self.assertAlmostEqual(expectation(pauli_string, factored),
+                np.real(np.trace(rho @ dense(pauli_string))), places=12)
+        self.assertIsNone(factored._dense_array)
+
+    def test_gates_in_string(self):
+        state = random_state(2, 3)
+        self.assertAlmostEqual(expectation([Pauli_Y, Pauli_X], state),
+                               expectation('YX', state), places=14)
+
+    def test_weighted_sum(self):
+        state = random_state(3, 4)
+        psi = state.as_vector().as_array().reshape(-1)
+        observable = {'ZZI': 1.0, 'IXX': -0.5, 'YIY': 0.25}
+        matrix = sum(coefficient * dense(pauli_string)
+                     for pauli_string, coefficient in observable.items())
+        value = expectation(observable, state)
+        self.assertTrue(isinstance(value, float))
+        self.assertAlmostEqual(value, np.real(np.vdot(psi, matrix @ psi)),
+                               places=12)
+        value = expectation({'ZZI': 1.j}, state)
+        self.assertTrue(isinstance(value, complex))
+
+    def test_many_terms(self):
+        state = random_state(5, 5)
+        psi = state.as_vector().as_array().reshape(-1)
+        rng = np.random.default_rng(6)
+        strings = [''.join(rng.choice(list('IXYZ'), size=5))
+                   for _ in range(200)]
+        values = expectation_values(strings, state)
+        for pauli_string, value in zip(strings[:20], values[:20]):
+            self.assertAlmostEqual(value, np.real(
+                np.vdot(psi, dense(pauli_string) @ psi)), places=12)
+
+    def test_parity(self):
+        values = np.random.default_rng(7).integers(0, 2**20, size=100)
+        expected = [bin(value).count('1') % 2 == 1 for value in values]
+        self.assertEqual(_odd_parity(values.copy(), 20).tolist(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    measurement.partial_trace.py
+
+Main test
+    Partial trace via tensor contraction agrees with the
+    sum over basis states sandwiched by enlarged basis
+    matrices; non-contiguous qubits are traced out.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from bit import integer_to_bitstring
+from linear_space.vector import ColumnVector
+from linear_space.algebra import matrix_product
+from qubit import QubitState
+
+from density_matrix.density_matrix import QubitDensityMatrix
+from measurement.errors import PartialTraceError
+from measurement.partial_trace import _left_matrix, _right_matrix, \
+    trace_out_qubit_axes, partial_trace_out_index_range, \
+    partial_trace_out_qubits
+
+
+def random_density_matrix(noq, seed=3):
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=2**noq) + 1.j * rng.normal(size=2**noq)
+    array = array / np.linalg.norm(array)
+    state = QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+    return QubitDensityMatrix(state=state)
+
+
+def reference_trace(density_matrix, noq, first_index, number_of_bits):
+    """ Sum over basis states of the traced range """
+    reduced = 0
+    for integer in range(0, 2**number_of_bits):
+        bitstring = integer_to_bitstring(integer=integer,
+                                         total_digits=number_of_bits)
+        term = matrix_product(
+            _left_matrix(noq, first_index, bitstring=bitstring),
+            matrix_product(density_matrix,
+                _right_matrix(noq, first_index, bitstring=bitstring)))
+        if hasattr(term, 'as_array'):
+            term = term.as_array()
+        reduced = reduced + term
+    return reduced
+
+
+class Test_Index_Range(unittest.TestCase):
+    def test_against_reference(self):
+        noq = 4
+        density_matrix = random_density_matrix(noq)
+        for first in range(0, noq):
+            for last in range(first, noq):
+                reduced = partial_trace_out_index_range(density_matrix,
+                                                        [first, last])
+                expected = reference_trace(density_matrix, noq, first,
+                                           last - first + 1)
+                if last - first + 1 == noq:
+                    self.assertTrue(np.isclose(reduced, expected))
+                else:
+                    self.assertTrue(isinstance(reduced, QubitDensityMatrix))
+                    self.assertTrue(np.allclose(reduced.as_array(),
+                                                expected, atol=1e-14))
+
+
+class Test_Qubits(unittest.TestCase):
+    def test_non_contiguous(self):
+        # product state |a>|b>|c>; tracing out 0 and 2 leaves |b><b|
+        a = np.array([0.6, 0.8])
+        b = np.array([1.0, 1.j]) / np.sqrt(2.0)
+        c = np.array([0.0, 1.0])
+        array = np.kron(np.kron(a, b), c)
+        density = np.outer(array, array.conj())
+        reduced = trace_out_qubit_axes(density, 3, [2, 0])
+        self.assertTrue(np.allclose(reduced, np.outer(b, b.conj())))
+
+    def test_order_of_kept_qubits(self):
+        noq = 3
+        density_matrix = random_density_matrix(noq)
+        # tracing out the middle qubit from the permuted matrix
+        reduced = partial_trace_out_qubits(density_matrix, [1])
+        tensor = density_matrix.as_array().reshape((2,) * 6)
+        expected = np.einsum('ajbcjd->abcd', tensor).reshape(4, 4)
+        self.assertTrue(np.allclose(reduced.as_array(), expected))
+
+    def test_all_qubits(self):
+        density_matrix = random_density_matrix(3)
+        self.assertTrue(np.isclose(
+            partial_trace_out_qubits(density_matrix, [0, 1, 2]), 1.0))
+
+    def test_invalid(self):
+        density_matrix = random_density_matrix(3)
+        for indices in [[], [3], [0, 0], 'a', [True]]:
+            with self.assertRaises(PartialTraceError):
+                partial_trace_out_qubits(density_matrix, indices)
+
+
+if __name__ == '__main__':
+    unittest.main()
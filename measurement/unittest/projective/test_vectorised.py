@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    measurement.projective.py
+
+Main test
+    Vectorised projective measurement on all basis states
+    agrees with projection on each basis state; marginal
+    probabilities of a subset of qubits.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from bit import integer_to_bitstring
+from linear_space.vector import ColumnVector
+from qubit import QubitState, qubit_from_bitlist
+from density_matrix.density_matrix import DensityMatrix
+from measurement.errors import ProjectiveMeasurementError
+from measurement.projective import projective_all, projective_on_basis, \
+    projective_marginal, marginal_probability_array, probability_dict
+
+
+def random_state(noq, seed=11):
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=2**noq) + 1.j * rng.normal(size=2**noq)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+class Test_Projective_All(unittest.TestCase):
+    def test_against_basis_projection(self):
+        state = random_state(4)
+        for system in [state, DensityMatrix(state=state)]:
+            probs = projective_all(system)
+            self.assertEqual(len(probs), 16)
+            for index in range(0, 16):
+                bitstring = integer_to_bitstring(integer=index,
+                                                 total_digits=4)
+                expected = projective_on_basis(system, bitstring)
+                self.assertTrue(abs(probs[bitstring] - expected) < 1e-14)
+
+    def test_array(self):
+        state = random_state(3)
+        probs = projective_all(state, as_array=True)
+        self.assertTrue(isinstance(probs, np.ndarray))
+        self.assertEqual(probs.dtype, np.float64)
+        self.assertTrue(np.isclose(probs.sum(), 1.0))
+        self.assertTrue(np.allclose(
+            probs, projective_all(DensityMatrix(state=state), as_array=True)))
+        self.assertEqual(probability_dict(probs), projective_all(state))
+
+
+class Test_Marginal(unittest.TestCase):
+    def test_product_state(self):
+        # |0>(|0>+|1>)|1>
+        state = qubit_from_bitlist([(1.0, '001'), (1.0, '011')])
+        self.assertTrue(np.allclose(
+            projective_marginal(state, [1], as_array=True), [0.5, 0.5]))
+        probs = projective_marginal(state, [2, 0])
+        self.assertTrue(np.isclose(probs['10'], 1.0))
+        self.assertTrue(np.isclose(probs['01'], 0.0))
+
+    def test_against_sum(self):
+        probs = projective_all(random_state(4), as_array=True)
+        marginal = marginal_probability_array(probs, [3, 1])
+        expected = np.zeros(4)
+        for index in range(0, 16):
+            bits = integer_to_bitstring(integer=index, total_digits=4)
+            expected[int(bits[3] + bits[1], 2)] += probs[index]
+        self.assertTrue(np.allclose(marginal, expected))
+
+    def test_invalid(self):
+        probs = projective_all(random_state(2), as_array=True)
+        for indices in [[], [2], [0, 0]]:
+            with self.assertRaises(ProjectiveMeasurementError):
+                marginal_probability_array(probs, indices)
+
+
+if __name__ == '__main__':
+    unittest.main()
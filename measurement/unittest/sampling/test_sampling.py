@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    measurement.sampling.py
+
+Main test
+    Shots follow the probability distribution of the system;
+    a seed reproduces the same shots.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from qubit import qubit_from_bitlist
+from density_matrix.density_matrix import DensityMatrix
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from measurement.errors import SamplingError
+from measurement.sampling import sample_counts, sample_outcomes, sample, \
+    sample_memory
+
+
+PROBABILITIES = np.array([0.1, 0.2, 0.3, 0.4])
+
+
+class Test_Counts(unittest.TestCase):
+    def test_distribution(self):
+        shots = 10**6
+        counts = sample_counts(PROBABILITIES, shots, seed=1)
+        self.assertEqual(counts.sum(), shots)
+        # within 5 standard deviations
+        sigma = np.sqrt(shots * PROBABILITIES * (1 - PROBABILITIES))
+        self.assertTrue(np.all(np.abs(counts - shots * PROBABILITIES)
+                               < 5 * sigma))
+
+    def test_outcomes(self):
+        shots = 10**6
+        outcomes = sample_outcomes(PROBABILITIES, shots, seed=2)
+        self.assertEqual(outcomes.shape, (shots,))
+        frequencies = np.bincount(outcomes, minlength=4) / shots
+        self.assertTrue(np.allclose(frequencies, PROBABILITIES, atol=5e-3))
+        # zero probability is never drawn
+        outcomes = sample_outcomes([0.5, 0.0, 0.5, 0.0], 10**5, seed=3)
+        self.assertTrue(set(np.unique(outcomes)) <= {0, 2})
+
+    def test_seed(self):
+        self.assertTrue(np.array_equal(
+            sample_counts(PROBABILITIES, 1000, seed=7),
+            sample_counts(PROBABILITIES, 1000, seed=7)))
+        self.assertTrue(np.array_equal(
+            sample_outcomes(PROBABILITIES, 1000, seed=7),
+            sample_outcomes(PROBABILITIES, 1000, seed=7)))
+        generator = np.random.default_rng(5)
+        first = sample_outcomes(PROBABILITIES, 100, seed=generator)
+        second = sample_outcomes(PROBABILITIES, 100, seed=generator)
+        self.assertFalse(np.array_equal(first, second))
+
+    def test_invalid(self):
+        with self.assertRaises(SamplingError):
+            sample_counts(PROBABILITIES, -1)
+        with self.assertRaises(SamplingError):
+            sample_counts([0.0, 0.0], 10)
+
+
+class Test_Sample_System(unittest.TestCase):
+    def test_state(self):
+        state = qubit_from_bitlist([(1.0, '001'), (1.0, '110')])
+        counts = sample(state, 1000, seed=4)
+        self.assertEqual(set(counts.keys()), {'001', '110'})
+        self.assertEqual(sum(counts.values()), 1000)
+        self.assertEqual(counts, sample(DensityMatrix(state=state), 1000,
+                                        seed=4))
+
+    def test_marginal(self):
+        state = qubit_from_bitlist([(1.0, '001'), (1.0, '111')])
+        counts = sample(state, 500, qubit_indices=[2, 0], seed=4)
+        self.assertEqual(set(counts.keys()), {'10', '11'})
+
+
+class Test_Sample_Memory(unittest.TestCase):
+    def test_register(self):
+        memory = QubitMemory(register=[
+            QubitRegister(label='reg1',
+                          state=qubit_from_bitlist([(1, '10')])),
+            QubitRegister(label='reg2',
+                          state=qubit_from_bitlist([(1, '0'), (1, '1')]))])
+        global_state = memory.get_global_state()
+        self.assertEqual(sample_memory(memory, 100, register='reg1', seed=1),
+                         {'10': 100})
+        counts = sample_memory(memory, 100, register='reg2', seed=1)
+        self.assertEqual(set(counts.keys()), {'0', '1'})
+        self.assertTrue(memory.get_global_state() is global_state)
+        with self.assertRaises(SamplingError):
+            sample_memory(memory, 100, register='reg3')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,9 @@ python3 -m unittest measurement/unittest/partial_trace/test_manual.py
 echo "--- --- Partial trace function --- ---"
 python3 -m unittest measurement/unittest/partial_trace/test_function.py
 
+echo "--- --- Partial trace via tensor contraction --- ---"
+python3 -m unittest measurement/unittest/partial_trace/test_einsum.py
+
 # Projective measurement
 echo "================================="
 echo "| Projective Measurement Module |"
@@ -35,5 +38,24 @@ python3 -m unittest measurement/unittest/projective/test_single_measurement.py
 echo "--- --- All projective measurement --- ---"
 python3 -m unittest measurement/unittest/projective/test_all.py
 
+echo "--- --- Vectorised projective measurement --- ---"
+python3 -m unittest measurement/unittest/projective/test_vectorised.py
+
+# Sampling
+echo "==================="
+echo "| Sampling Module |"
+echo "==================="
+
+echo "--- --- Shots of projective measurement --- ---"
+python3 -m unittest measurement/unittest/sampling/test_sampling.py
+
+# Observables
+echo "======================"
+echo "| Observables Module |"
+echo "======================"
+
+echo "--- --- Expectation values of Pauli strings --- ---"
+python3 -m unittest measurement/unittest/observables/test_observables.py
+
 echo "**********************"
 echo "**********************"
\ No newline at end of file
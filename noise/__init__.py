@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+PACKAGE
+
+Noise channels
+
+PATH
+
+[app_root]/noise/
+
+INTRO
+
+Noise package provides quantum channels in Kraus form, e.g.
+depolarising, amplitude damping, phase damping and bit flip,
+and applies them on density matrices by local tensor
+contractions on the target qubits; no superoperator matrix
+is formed.
+
+CONTENT
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from .errors import KrausChannelValidationError, NoiseChannelError
+from .channels import KrausChannel, depolarising_channel, \
+    amplitude_damping_channel, phase_damping_channel, bit_flip_channel, \
+    NOISE_CHANNELS, has_channel, channel_from_alias
+from .kraus import apply_kraus_on_density_array, apply_kraus_on_factor, \
+    apply_channel, sample_kraus_branch
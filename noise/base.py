@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+noise.base.py
+
+PATH
+
+[app_root]/noise/base.py
+
+INTRO
+
+Error and validator error classes used in noise package.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from common.exception import Generic_Error, Validation_Error
+from common.validator import Base_Validator
+
+
+class NoiseBaseError(Generic_Error):
+    header = "Noise_Base_Error"
+
+
+class NoiseBaseValidationError(Validation_Error):
+    header = "Noise_Base_Validation_Error"
+
+
+class NoiseBaseValidator(Base_Validator):
+    error_class = NoiseBaseValidationError
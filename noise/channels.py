@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+noise.channels.py
+
+PATH
+
+[app_root]/noise/channels.py
+
+INTRO
+
+Quantum channels in Kraus form.
+
+A channel on `m` qubits is described by its Kraus matrices
+`K_i`, each of dimension `2^m`-by-`2^m`, with
+    rho -> sum_i K_i rho K_i^dagger
+and completeness `sum_i K_i^dagger K_i = I`, which preserves
+the trace.
+
+Channels of the repertoire are made by functions, referenced
+by alias in `NOISE_CHANNELS`:
+
+    'depolarising' - with probability `p`, a uniformly chosen
+    non-identity Pauli string of `m` qubits, `m` being 1 or 2, is
+    applied; i.e. Kraus matrices `sqrt(1-p) I` and
+    `sqrt(p/(4^m-1)) P`
+
+    'amplitude_damping' - decay from |1> to |0> with probability
+    `gamma`
+
+    'phase_damping' - loss of phase coherence with probability
+    `lam`, leaving populations intact
+
+    'bit_flip' - Pauli X with probability `p`
+
+CONTENT
+
+`KrausChannelValidator` - Validates Kraus matrices
+
+`KrausChannel` - Quantum channel described by Kraus matrices
+
+`depolarising_channel(p, number_of_qubits)`,
+`amplitude_damping_channel(gamma)`, `phase_damping_channel(lam)`,
+`bit_flip_channel(p)` - Channels of the repertoire
+
+`has_channel(alias)` - Checks if alias is in repertoire
+
+`channel_from_alias(alias, **parameters)` - Makes a channel of
+the repertoire
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import itertools
+import numpy as np
+
+from linear_space.matrix import SquareMatrix, PAULI_X, PAULI_Y, PAULI_Z
+from linear_space.precision import complex_dtype
+
+from .base import NoiseBaseValidator
+from .errors import KrausChannelValidationError, NoiseChannelError
+
+_MODULE_LOCATION_ = 'noise.channels'
+
+# tolerance of completeness relation
+_COMPLETENESS_TOLERANCE = 1.0e-10
+
+
+class KrausChannelValidator(NoiseBaseValidator):
+    """ Validate Kraus matrices of a channel
+
+    Kraus matrices must be a non-empty list of square matrices
+    (or 2-D arrays) of the same dimension, a power of two, that
+    satisfy the completeness relation.
+    """
+    error_class = KrausChannelValidationError
+    error_location = _MODULE_LOCATION_ + '.KrausChannelValidator'
+
+    def __init__(self, kraus_matrices=None):
+        super().__init__()
+        self._validated_arrays = None
+        self.validate(kraus_matrices)
+
+    def validate(self, kraus_matrices):
+        """ Main validate method """
+        if not isinstance(kraus_matrices, (list, tuple)) \
+                or len(kraus_matrices) == 0:
+            self.report_errors("Kraus matrices of a channel must be " +\
+                    "given in a non-empty list.")
+            return
+        arrays = []
+        for matrix in kraus_matrices:
+            if isinstance(matrix, SquareMatrix):
+                matrix = matrix.as_array()
+            if not isinstance(matrix, np.ndarray) or matrix.ndim != 2 \
+                    or matrix.shape[0] != matrix.shape[1] \
+                    or matrix.dtype.kind not in 'biufc':
+                self.report_errors("Kraus matrix must be a numeric " +\
+                        "square matrix.")
+                return
+            arrays.append(matrix.astype(complex))
+        dimension = arrays[0].shape[0]
+        if dimension < 2 or dimension & (dimension - 1) != 0:
+            self.report_errors("Dimension of Kraus matrices must be " +\
+                    "a power of two, compatible with qubits.")
+        elif any(array.shape[0] != dimension for array in arrays):
+            self.report_errors("Kraus matrices of a channel must " +\
+                    "have the same dimension.")
+        else:
+            arrays = np.stack(arrays)
+            completeness = np.einsum('kji,kjl->il', arrays.conj(), arrays)
+            if not np.allclose(completeness, np.eye(dimension),
+                               atol=_COMPLETENESS_TOLERANCE):
+                self.report_errors("Kraus matrices don't satisfy the " +\
+                        "completeness relation; channel wouldn't " +\
+                        "preserve the trace.")
+            else:
+                # completeness is checked in double precision
+                self._validated_arrays = arrays.astype(complex_dtype())
+
+    def validated_data(self):
+        return self._validated_arrays
+
+
+class KrausChannel:
+    """ Quantum channel in Kraus form
+
+    CONSTRUCTOR
+
+    `kraus_matrices` (`list`) : Kraus matrices, `SquareMatrix`
+    instances or 2-D arrays
+
+    `alias` (`str`) : optional; name of the channel
+
+    ATTRIBUTES
+
+    `self.alias` : name of the channel
+
+    `self.number_of_qubits` : number of qubits a Kraus matrix
+    acts on
+
+    `self.kraus_arrays` : Kraus matrices stacked in an array of
+    shape `(k, 2^m, 2^m)`
+
+    `self.kraus_matrices` : Kraus matrices as `SquareMatrix`
+    instances
+    """
+    error_location = _MODULE_LOCATION_ + '.KrausChannel'
+
+    def __init__(self, kraus_matrices=None, alias=None):
+        """ Kraus Channel : Initialiser """
+        validator = KrausChannelValidator(kraus_matrices=kraus_matrices)
+        if not validator.is_valid:
+            validator.raise_last_error(
+                    location=self.error_location+'.__init__')
+        self._kraus_arrays = validator.validated_data()
+        self.alias = alias
+
+    @property
+    def number_of_qubits(self):
+        """ Kraus Channel : Number of qubits """
+        return int(self._kraus_arrays.shape[1]).bit_length() - 1
+
+    @property
+    def kraus_arrays(self):
+        """ Kraus Channel : Kraus matrices as an array """
+        return self._kraus_arrays
+
+    @property
+    def kraus_matrices(self):
+        """ Kraus Channel : Kraus matrices as square matrices """
+        return [SquareMatrix(array=array) for array in self._kraus_arrays]
+
+
+def _validate_probability(value, name, location):
+    """ Probability parameter of a channel """
+    if isinstance(value, bool) or not isinstance(value, (int, float)) \
+            or not 0.0 <= value <= 1.0:
+        raise NoiseChannelError("Parameter '{}' of a channel ".format(name) +\
+                "must be a probability in [0, 1].", location=location)
+    return float(value)
+
+
+def depolarising_channel(p=None, number_of_qubits=1):
+    """ Depolarising channel on one or two qubits
+
+    ARGUMENTS
+
+    `p` (`float`) : probability that a non-identity Pauli string
+    is applied
+
+    `number_of_qubits` (`int`) : 1 or 2
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.depolarising_channel'
+    p = _validate_probability(p, 'p', _ERROR_LOCATION_)
+    if number_of_qubits not in (1, 2):
+        raise NoiseChannelError("Depolarising channel acts on one " +\
+                "or two qubits.", location=_ERROR_LOCATION_)
+    paulis = [np.eye(2)] + [matrix.as_array()
+                            for matrix in (PAULI_X, PAULI_Y, PAULI_Z)]
+    kraus_matrices = []
+    for product in itertools.product(paulis, repeat=number_of_qubits):
+        matrix = np.eye(1)
+        for pauli in product:
+            matrix = np.kron(matrix, pauli)
+        kraus_matrices.append(matrix)
+    weight = p / (4**number_of_qubits - 1)
+    kraus_matrices = [np.sqrt(1.0 - p) * kraus_matrices[0]] + \
+            [np.sqrt(weight) * matrix for matrix in kraus_matrices[1:]]
+    return KrausChannel(kraus_matrices=kraus_matrices, alias='depolarising')
+
+
+def amplitude_damping_channel(gamma=None):
+    """ Amplitude damping channel on one qubit
+
+    ARGUMENTS
+
+    `gamma` (`float`) : probability of decay from |1> to |0>
+    """
+    gamma = _validate_probability(gamma, 'gamma',
+            _MODULE_LOCATION_+'.amplitude_damping_channel')
+    return KrausChannel(kraus_matrices=[
+        np.array([[1.0, 0.0], [0.0, np.sqrt(1.0 - gamma)]]),
+        np.array([[0.0, np.sqrt(gamma)], [0.0, 0.0]])
+    ], alias='amplitude_damping')
+
+
+def phase_damping_channel(lam=None):
+    """ Phase damping channel on one qubit
+
+    ARGUMENTS
+
+    `lam` (`float`) : probability of phase damping; off-diagonal
+    elements are scaled by `sqrt(1 - lam)`
+    """
+    lam = _validate_probability(lam, 'lam',
+            _MODULE_LOCATION_+'.phase_damping_channel')
+    return KrausChannel(kraus_matrices=[
+        np.array([[1.0, 0.0], [0.0, np.sqrt(1.0 - lam)]]),
+        np.array([[0.0, 0.0], [0.0, np.sqrt(lam)]])
+    ], alias='phase_damping')
+
+
+def bit_flip_channel(p=None):
+    """ Bit flip channel on one qubit
+
+    ARGUMENTS
+
+    `p` (`float`) : probability of a flip
+    """
+    p = _validate_probability(p, 'p', _MODULE_LOCATION_+'.bit_flip_channel')
+    return KrausChannel(kraus_matrices=[
+        np.sqrt(1.0 - p) * np.eye(2),
+        np.sqrt(p) * PAULI_X.as_array()
+    ], alias='bit_flip')
+
+
+# channel repertoire
+NOISE_CHANNELS = {
+    'depolarising': depolarising_channel,
+    'amplitude_damping': amplitude_damping_channel,
+    'phase_damping': phase_damping_channel,
+    'bit_flip': bit_flip_channel
+}
+
+
+def has_channel(alias):
+    """ Verifies if a channel is in repertoire """
+    return alias in NOISE_CHANNELS
+
+
+def channel_from_alias(alias, **parameters):
+    """ Channel of the repertoire
+
+    ARGUMENTS
+
+    `alias` (`str`) : alias of the channel in `NOISE_CHANNELS`
+
+    `parameters` : parameters of the channel, e.g. `p=0.1`
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.channel_from_alias'
+    if not has_channel(alias):
+        raise NoiseChannelError("Channel '{}' ".format(alias) +\
+                "cannot be found in channel repertoire. Choose from " +\
+                "{}.".format(list(NOISE_CHANNELS.keys())),
+                location=_ERROR_LOCATION_)
+    try:
+        return NOISE_CHANNELS[alias](**parameters)
+    except TypeError as err:
+        raise NoiseChannelError("Invalid parameters " +\
+                "{} for channel '{}'.".format(list(parameters.keys()), alias),
+                location=_ERROR_LOCATION_) from err
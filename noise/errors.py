@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+noise.errors.py
+
+PATH
+
+[app_root]/noise/errors.py
+
+INTRO
+
+Dedicated error classes.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from .base import NoiseBaseError, NoiseBaseValidationError
+
+
+class KrausChannelValidationError(NoiseBaseValidationError):
+    """ Kraus channel validation error
+
+    ENTRY
+
+    `channels.KrausChannelValidator`
+    """
+    header = 'Kraus_Channel_Validation_Error'
+
+
+class NoiseChannelError(NoiseBaseError):
+    """ Noise channel error
+
+    ENTRY
+
+    Modules `channels` and `kraus`
+    """
+    header = 'Noise_Channel_Error'
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+noise.kraus.py
+
+PATH
+
+[app_root]/noise/kraus.py
+
+INTRO
+
+Application of Kraus channels on density matrices.
+
+A channel on `n` qubits would conventionally be written as a
+superoperator, a matrix of dimension `4^n`, applied to the
+vectorised density matrix at a cost of `O(16^n)`. Here, Kraus
+matrices are only contracted along the target axes, as a sum of
+`K rho K^dagger` over Kraus matrices `K`, at a cost of `O(4^n)`
+each, or `O(2^n r)` for a density matrix of rank `r` in factor
+form. (See `density_matrix.evolution`, which also evolves density
+matrices under gates.)
+
+A pure state, e.g. one trajectory of a Monte-Carlo wave-function
+simulation, is instead sent through a single Kraus branch `i`,
+chosen with probability `||K_i psi||^2`, and renormalised. Branches
+are tried in order until the cumulative probability exceeds a
+uniform random number, so that the likely branch, listed first
+in the channels of the repertoire, is often the only one formed.
+
+CONTENT
+
+`apply_kraus_on_density_array(...)` - Applies Kraus matrices on
+a dense density array
+
+`apply_kraus_on_factor(...)` - Applies Kraus matrices on a factor
+
+`apply_channel(density_matrix, channel, qubit_indices)` - Applies
+a channel on target qubits of a density matrix
+
+`sample_kraus_branch(...)` - Sends a state array through a
+randomly chosen Kraus branch
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import numpy as np
+
+from linear_space.matrix import SquareMatrix
+from density_matrix.errors import DensityMatrixError
+from density_matrix.evolution import apply_matrices_on_density_array, \
+    apply_matrices_on_factor, evolve_density_matrix
+from gate.statevector import apply_matrix_on_qubits
+
+from .channels import KrausChannel
+from .errors import NoiseChannelError
+
+_MODULE_LOCATION_ = 'noise.kraus'
+
+
+def apply_kraus_on_density_array(density_array=None, number_of_qubits=None,
+                                 kraus_matrices=None, qubit_indices=None,
+                                 control_list=None):
+    """ Apply Kraus matrices on a dense density array
+
+    ARGUMENTS
+
+    `density_array` (`ndarray`) : density matrix of shape
+    `(2^n, 2^n)`
+
+    `number_of_qubits` (`int`) : number of qubits `n`
+
+    `kraus_matrices` (`list`) : Kraus matrices of dimension `2^m`
+
+    `qubit_indices` (`list`) : `m` distinct target qubits; the
+    first one is the most significant bit of a Kraus matrix
+
+    `control_list` (`list`) : optional; control tuples such as
+    `[(0, '1')]`
+
+    RETURN
+
+    New density array; input array is not modified.
+    """
+    return apply_matrices_on_density_array(
+            density_array=density_array, number_of_qubits=number_of_qubits,
+            matrices=kraus_matrices, qubit_indices=qubit_indices,
+            control_list=control_list)
+
+
+def apply_kraus_on_factor(factor=None, number_of_qubits=None,
+                          kraus_matrices=None, qubit_indices=None,
+                          control_list=None):
+    """ Apply Kraus matrices on a factor
+
+    Arguments are those of `apply_kraus_on_density_array`, with
+    `factor` of shape `(2^n, r)` in place of the density array.
+
+    RETURN
+
+    New factor, of shape `(2^n, k r)` for `k` Kraus matrices,
+    compressed to at most `2^n` columns.
+    """
+    return apply_matrices_on_factor(
+            factor=factor, number_of_qubits=number_of_qubits,
+            matrices=kraus_matrices, qubit_indices=qubit_indices,
+            control_list=control_list)
+
+
+def apply_channel(density_matrix=None, channel=None, qubit_indices=None):
+    """ Apply a channel on target qubits of a density matrix
+
+    ARGUMENTS
+
+    `density_matrix` (`DensityMatrix`) : density matrix of `n`
+    qubits; a `FactoredDensityMatrix` stays in factor form
+
+    `channel` (`KrausChannel`) : channel on `m` qubits
+
+    `qubit_indices` (`list`) : `m` distinct target qubits
+
+    RETURN
+
+    New density matrix.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.apply_channel'
+    if not isinstance(channel, KrausChannel):
+        raise NoiseChannelError("Channel must be a Kraus channel.",
+                                location=_ERROR_LOCATION_)
+    if len(qubit_indices) != channel.number_of_qubits:
+        raise NoiseChannelError("Channel on " +\
+                "{} qubit(s) ".format(channel.number_of_qubits) +\
+                "requires as many target qubits.",
+                location=_ERROR_LOCATION_)
+    try:
+        return evolve_density_matrix(density_matrix=density_matrix,
+                                     matrices=list(channel.kraus_arrays),
+                                     qubit_indices=qubit_indices)
+    except DensityMatrixError as err:
+        raise NoiseChannelError(str(err), location=_ERROR_LOCATION_) from err
+
+
+def sample_kraus_branch(state_array=None, number_of_qubits=None,
+                        kraus_matrices=None, qubit_indices=None,
+                        uniform=None):
+    """ Send a state array through a randomly chosen Kraus branch
+
+    ARGUMENTS
+
+    `state_array` (`ndarray`) : normalised state of `n` qubits, of
+    shape `(2^n, 1)` or `(2^n,)`
+
+    `number_of_qubits` (`int`) : number of qubits `n`
+
+    `kraus_matrices` (`list`) : Kraus matrices of a channel
+
+    `qubit_indices` (`list`) : distinct target qubits
+
+    `uniform` (`float`) : random number in `[0, 1)` choosing the
+    branch
+
+    RETURN
+
+    A tuple of the new normalised state array and the index of
+    the branch.
+    """
+    cumulative = 0.0
+    last = None
+    for branch, matrix in enumerate(kraus_matrices):
+        new_array = apply_matrix_on_qubits(
+                state_array=state_array, number_of_qubits=number_of_qubits,
+                qubit_indices=qubit_indices,
+                block_matrix=matrix if isinstance(matrix, SquareMatrix)
+                else SquareMatrix(array=matrix))
+        probability = np.vdot(new_array, new_array).real
+        if probability <= 0.0:
+            continue
+        cumulative += probability
+        last = (new_array, probability, branch)
+        if uniform < cumulative:
+            break
+    if last is None:
+        raise NoiseChannelError("Kraus matrices annihilate the state.",
+                location=_MODULE_LOCATION_+'.sample_kraus_branch')
+    new_array, probability, branch = last
+    return new_array / np.sqrt(probability), branch
@@ -0,0 +1,23 @@
+#!/bin/sh
+
+echo "*************"
+echo "* Pacakge   *"
+echo "*     Noise *"
+echo "*************"
+
+# Channels
+echo "============"
+echo "| Channels |"
+echo "============"
+echo "--- --- Repertoire and user-defined channels --- ---"
+python3 -m unittest noise/unittest/test_channels.py
+
+# Kraus contraction
+echo "====================="
+echo "| Kraus Contraction |"
+echo "====================="
+echo "--- --- Channels on density matrices --- ---"
+python3 -m unittest noise/unittest/test_kraus.py
+
+echo "*************"
+echo "*************"
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    noise.channels.py
+
+Main test
+    Kraus matrices of the channel repertoire satisfy the
+    completeness relation; invalid Kraus matrices and parameters
+    are rejected.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from noise import KrausChannel, KrausChannelValidationError, \
+    NoiseChannelError, depolarising_channel, amplitude_damping_channel, \
+    phase_damping_channel, bit_flip_channel, NOISE_CHANNELS, has_channel, \
+    channel_from_alias
+
+
+def completeness(channel):
+    arrays = channel.kraus_arrays
+    return np.einsum('kji,kjl->il', arrays.conj(), arrays)
+
+
+class Test_Repertoire(unittest.TestCase):
+    def test_completeness(self):
+        channels = [depolarising_channel(0.3),
+                    depolarising_channel(0.3, number_of_qubits=2),
+                    amplitude_damping_channel(0.4),
+                    phase_damping_channel(0.2), bit_flip_channel(0.1)]
+        for channel in channels:
+            dimension = 2**channel.number_of_qubits
+            self.assertTrue(np.allclose(completeness(channel),
+                                        np.eye(dimension)))
+
+    def test_number_of_kraus_matrices(self):
+        self.assertEqual(len(depolarising_channel(0.1).kraus_matrices), 4)
+        self.assertEqual(len(depolarising_channel(
+            0.1, number_of_qubits=2).kraus_matrices), 16)
+        self.assertEqual(depolarising_channel(
+            0.1, number_of_qubits=2).number_of_qubits, 2)
+
+    def test_from_alias(self):
+        self.assertTrue(has_channel('bit_flip'))
+        self.assertFalse(has_channel('amplitude_flip'))
+        channel = channel_from_alias('amplitude_damping', gamma=0.5)
+        self.assertEqual(channel.alias, 'amplitude_damping')
+        self.assertTrue(np.allclose(channel.kraus_arrays[1],
+                                    [[0, np.sqrt(0.5)], [0, 0]]))
+        for alias in NOISE_CHANNELS:
+            self.assertTrue(has_channel(alias))
+
+    def test_invalid_parameters(self):
+        self.assertRaises(NoiseChannelError, bit_flip_channel, 1.5)
+        self.assertRaises(NoiseChannelError, bit_flip_channel, True)
+        self.assertRaises(NoiseChannelError, depolarising_channel, 0.1, 3)
+        self.assertRaises(NoiseChannelError, channel_from_alias,
+                          'amplitude_flip', p=0.1)
+        self.assertRaises(NoiseChannelError, channel_from_alias,
+                          'bit_flip', gamma=0.1)
+
+
+class Test_User_Channel(unittest.TestCase):
+    def test_okay(self):
+        channel = KrausChannel(kraus_matrices=[
+            np.sqrt(0.5) * np.eye(4), np.sqrt(0.5) * np.eye(4)[::-1]])
+        self.assertEqual(channel.number_of_qubits, 2)
+        self.assertIsNone(channel.alias)
+
+    def test_incomplete(self):
+        self.assertRaises(KrausChannelValidationError, KrausChannel,
+                          [0.5 * np.eye(2)])
+
+    def test_wrong_dimension(self):
+        self.assertRaises(KrausChannelValidationError, KrausChannel,
+                          [np.eye(3)])
+        self.assertRaises(KrausChannelValidationError, KrausChannel,
+                          [np.eye(2), np.eye(4)])
+        self.assertRaises(KrausChannelValidationError, KrausChannel, [])
+        self.assertRaises(KrausChannelValidationError, KrausChannel,
+                          [np.array(['a', 'b'])])
+
+
+if __name__ == '__main__':
+    unittest.main()
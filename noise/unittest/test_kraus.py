@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    noise.kraus.py
+
+Main test
+    Channels applied by contraction along target axes agree with
+    the explicit sum over enlarged Kraus matrices, preserve the
+    trace and keep the form of the density matrix.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from density_matrix import QubitDensityMatrix, FactoredDensityMatrix
+from noise import NoiseChannelError, depolarising_channel, \
+    amplitude_damping_channel, phase_damping_channel, bit_flip_channel, \
+    apply_channel
+
+
+def random_state(noq, seed):
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=2**noq) + 1.j * rng.normal(size=2**noq)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def enlarge(matrix, noq, qubit_indices):
+    """ Kraus matrix on all qubits, by explicit index mapping """
+    m = len(qubit_indices)
+    dimension = 2**noq
+    big = np.zeros((dimension, dimension), dtype=complex)
+    for row in range(dimension):
+        for col in range(dimension):
+            row_bits = format(row, '0{}b'.format(noq))
+            col_bits = format(col, '0{}b'.format(noq))
+            if any(row_bits[k] != col_bits[k] for k in range(noq)
+                   if k not in qubit_indices):
+                continue
+            sub_row = int(''.join(row_bits[k] for k in qubit_indices), 2)
+            sub_col = int(''.join(col_bits[k] for k in qubit_indices), 2)
+            big[row, col] = matrix[sub_row, sub_col]
+    return big
+
+
+def explicit(rho, channel, noq, qubit_indices):
+    result = np.zeros(rho.shape, dtype=complex)
+    for matrix in channel.kraus_arrays:
+        big = enlarge(matrix, noq, qubit_indices)
+        result += big @ rho @ big.conj().T
+    return result
+
+
+class Test_Apply_Channel(unittest.TestCase):
+    def test_against_explicit_sum(self):
+        noq = 3
+        cases = [(depolarising_channel(0.3), [1]),
+                 (depolarising_channel(0.2, number_of_qubits=2), [2, 0]),
+                 (amplitude_damping_channel(0.4), [0]),
+                 (phase_damping_channel(0.3), [2]),
+                 (bit_flip_channel(0.25), [1])]
+        for channel, qubit_indices in cases:
+            dense = QubitDensityMatrix(state=random_state(noq, 5))
+            factored = FactoredDensityMatrix(state=random_state(noq, 5))
+            expected = explicit(dense.as_array(), channel, noq, qubit_indices)
+            new_dense = apply_channel(dense, channel, qubit_indices)
+            new_factored = apply_channel(factored, channel, qubit_indices)
+            self.assertTrue(isinstance(new_dense, QubitDensityMatrix))
+            self.assertTrue(isinstance(new_factored, FactoredDensityMatrix))
+            self.assertTrue(np.allclose(new_dense.as_array(), expected))
+            self.assertTrue(np.allclose(new_factored.as_array(), expected))
+            self.assertAlmostEqual(np.trace(new_dense.as_array()), 1.0)
+            self.assertAlmostEqual(new_factored.trace, 1.0)
+
+    def test_trace_preserved_over_many_channels(self):
+        rho = FactoredDensityMatrix(state=random_state(4, 6))
+        for step in range(12):
+            rho = apply_channel(rho, depolarising_channel(
+                0.1, number_of_qubits=2), [step % 4, (step + 1) % 4])
+            rho = apply_channel(rho, amplitude_damping_channel(0.1),
+                                [step % 4])
+        self.assertAlmostEqual(rho.trace, 1.0)
+        self.assertLessEqual(rho.rank, 16)
+        eigenvalues = np.linalg.eigvalsh(rho.as_array())
+        self.assertTrue(np.all(eigenvalues > -1.0e-12))
+
+    def test_full_damping(self):
+        rho = QubitDensityMatrix(state=random_state(1, 7))
+        rho = apply_channel(rho, amplitude_damping_channel(1.0), [0])
+        self.assertTrue(np.allclose(rho.as_array(), [[1, 0], [0, 0]]))
+
+    def test_full_depolarising(self):
+        rho = QubitDensityMatrix(state=random_state(1, 8))
+        rho = apply_channel(rho, depolarising_channel(0.75), [0])
+        self.assertTrue(np.allclose(rho.as_array(), np.eye(2) / 2))
+
+    def test_wrong_number_of_targets(self):
+        rho = QubitDensityMatrix(state=random_state(2, 9))
+        self.assertRaises(NoiseChannelError, apply_channel, rho,
+                          bit_flip_channel(0.1), [0, 1])
+        self.assertRaises(NoiseChannelError, apply_channel,
+                          random_state(2, 9), bit_flip_channel(0.1), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
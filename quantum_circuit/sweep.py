@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_circuit.sweep.py
+
+PATH
+
+[app_root]/quantum_circuit/sweep.py
+
+INTRO
+
+Parameter sweep runner.
+
+Circuits such as phase estimation or Grover search, or flows
+of parameterised gates such as `Rx`, are routinely run over
+many parameter values. Each run is entirely independent and
+runs are therefore distributed over a process pool.
+
+A run is described by a flow factory, a callable that receives
+one set of parameters as keyword arguments and returns a tuple
+`(flow, memory)`. Flow is launched on memory inside the worker
+process and the final global state is written into an output
+buffer in shared memory, row by row in the input order. Input
+states, if given, are shipped the same way. State objects are
+thus never pickled; only parameters and launch return values,
+e.g. measurement outcomes, cross process boundaries.
+
+Dimension of the buffers is taken from input states, or else
+from the number of qubits given to the sweep; no flow is built
+in the parent process. Input states are validated once, as a
+whole, and wrapped as trusted states in each run.
+
+NOTE Flow factory must be picklable, i.e. defined at module
+level, since it is shipped to worker processes.
+
+CONTENT
+
+`parameter_grid(grid)` - Returns a list of parameter sets
+
+`run_sweep(flow_factory, grid, ...)` - Runs flow factory over
+a parameter grid in a process pool
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from linear_space.number import is_one, is_power_of_two
+from linear_space.vector import ColumnVector
+from linear_space.precision import complex_dtype, precision_tolerance
+from qubit import QubitState
+
+from .base import QuantumCircuitError
+
+_MODULE_LOCATION_ = 'quantum_circuit.sweep'
+
+# outputs of a sweep
+SWEEP_OUTPUTS = ('state', 'probability')
+
+
+def parameter_grid(grid=None):
+    """ List of parameter sets
+
+    ARGUMENTS
+
+    `grid` : either a dictionary that maps parameter names to
+    lists of values, expanded to their Cartesian product in the
+    order of keys; or a list of dictionaries, used as it is
+
+    RETURN
+
+    A list of dictionaries.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.parameter_grid'
+    if isinstance(grid, dict):
+        names = list(grid.keys())
+        return [dict(zip(names, values))
+                for values in product(*[list(grid[name]) for name in names])]
+    if isinstance(grid, list) and all(isinstance(el, dict) for el in grid):
+        return list(grid)
+    raise QuantumCircuitError("Parameter grid must be a dictionary " +\
+            "of lists or a list of dictionaries.", location=_ERROR_LOCATION_)
+
+
+def _attach(name):
+    """ Attach to an existing shared memory block in a worker
+
+    Block is owned, and eventually unlinked, by the parent process.
+    Workers share the resource tracker of the parent, so repeated
+    registration of the block is harmless.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _buffer_view(spec):
+    """ Attach to a shared buffer; returns block and array view """
+    name, shape, dtype = spec
+    block = _attach(name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _run_one(index, parameters, flow_factory, inputs, outputs, engine):
+    """ Run one parameter set
+
+    Final global state is written into row `index` of `outputs`.
+    Launch return value is returned. Input state, validated by
+    `run_sweep`, is copied out of the shared buffer and wrapped
+    without further validation.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '._run_one'
+    flow, memory = flow_factory(**parameters)
+    if engine is not None:
+        flow.set_engine(engine)
+    if 2**len(memory.global_index_range()) != outputs.shape[1]:
+        raise QuantumCircuitError("Memory of run " +\
+                "{} isn't of dimension {}.".format(index, outputs.shape[1]),
+                location=_ERROR_LOCATION_)
+    if inputs is not None:
+        memory.set_global_state(QubitState.from_trusted_vector(
+                ColumnVector.from_trusted_array(
+                    inputs[index].reshape(-1, 1).copy())))
+    ret = flow.launch_on_memory(memory)
+    final_array = memory.get_global_state().as_vector().as_array()
+    if final_array.size != outputs.shape[1]:
+        raise QuantumCircuitError("Global state of run " +\
+                "{} has changed its dimension; ".format(index) +\
+                "flows with partial trace can't be swept.",
+                location=_ERROR_LOCATION_)
+    outputs[index] = final_array.reshape(-1)
+    return ret
+
+
+def _sweep_task(task):
+    """ Run one parameter set in a worker process
+
+    Input and output buffers are attached from shared memory.
+    """
+    index, parameters, flow_factory, input_spec, output_spec, engine = task
+    blocks = []
+    try:
+        inputs = None
+        if input_spec is not None:
+            block, inputs = _buffer_view(input_spec)
+            blocks.append(block)
+        block, outputs = _buffer_view(output_spec)
+        blocks.append(block)
+        return _run_one(index, parameters, flow_factory, inputs, outputs,
+                        engine)
+    finally:
+        # views must be released before closing
+        inputs = None
+        outputs = None
+        for block in blocks:
+            block.close()
+
+
+def _shared_buffer(shape, dtype):
+    """ Create a shared buffer; returns block, array view and spec """
+    nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+    block = shared_memory.SharedMemory(create=True, size=nbytes)
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    return block, array, (block.name, shape, np.dtype(dtype).str)
+
+
+def _run_in_pool(parameters, flow_factory, input_states, dimension,
+                 max_workers, chunksize, engine):
+    """ Run all parameter sets in a process pool
+
+    Returns final outputs, copied out of shared memory, and the
+    list of launch return values.
+    """
+    blocks = []
+    outputs = None
+    inputs = None
+    try:
+        output_block, outputs, output_spec = _shared_buffer(
+                (len(parameters), dimension), complex_dtype())
+        blocks.append(output_block)
+        input_spec = None
+        if input_states is not None:
+            input_block, inputs, input_spec = _shared_buffer(
+                    input_states.shape, complex_dtype())
+            blocks.append(input_block)
+            inputs[:] = input_states
+        tasks = [(index, params, flow_factory, input_spec, output_spec,
+                  engine) for index, params in enumerate(parameters)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_sweep_task, tasks,
+                                        chunksize=chunksize))
+        final_outputs = np.array(outputs)
+    finally:
+        outputs = None
+        inputs = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return final_outputs, results
+
+
+def run_sweep(flow_factory=None, grid=None, input_states=None,
+              number_of_qubits=None, output='state', max_workers=None,
+              chunksize=1, engine=None):
+    """ Run a flow factory over a parameter grid
+
+    ARGUMENTS
+
+    `flow_factory` (callable) : receives one parameter set as
+    keyword arguments and returns a tuple `(flow, memory)`
+
+    `grid` : parameter grid (see `parameter_grid`)
+
+    `input_states` (`ndarray`) : optional; normalised initial
+    global states of shape `(runs, 2^n)`, one row per parameter
+    set; if `None`, each run starts from the global state of its
+    own memory
+
+    `number_of_qubits` (`int`) : number of qubits `n` of the
+    memory returned by the factory; required if `input_states`
+    is `None`
+
+    `output` (`str`) : 'state' or 'probability'
+
+    `max_workers` (`int`) : number of worker processes; if `None`,
+    number of processors; `0` runs all in the current process
+
+    `chunksize` (`int`) : number of runs sent to a worker at once
+
+    `engine` (`str`) : optional; engine set on each flow
+
+    RETURN
+
+    A dictionary with keys `parameters`, the list of parameter
+    sets; `outputs`, an array of shape `(runs, 2^n)` of final
+    states or probabilities; `results`, list of values returned
+    by `launch_on_memory`. All are in input order.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.run_sweep'
+    if not callable(flow_factory):
+        raise QuantumCircuitError("Flow factory must be callable.",
+                                  location=_ERROR_LOCATION_)
+    if output not in SWEEP_OUTPUTS:
+        raise QuantumCircuitError("Sweep output '{}' ".format(output) +\
+                "is not supported. Choose from {}.".format(SWEEP_OUTPUTS),
+                location=_ERROR_LOCATION_)
+    if max_workers is not None and (not isinstance(max_workers, int)
+                                    or max_workers < 0):
+        raise QuantumCircuitError("Number of workers must be a " +\
+                "non-negative integer.", location=_ERROR_LOCATION_)
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise QuantumCircuitError("Chunk size must be a positive " +\
+                "integer.", location=_ERROR_LOCATION_)
+    parameters = parameter_grid(grid)
+    number_of_runs = len(parameters)
+    if number_of_runs == 0:
+        raise QuantumCircuitError("Parameter grid is empty.",
+                                  location=_ERROR_LOCATION_)
+    if number_of_qubits is not None and (
+            not isinstance(number_of_qubits, int) or number_of_qubits < 1):
+        raise QuantumCircuitError("Number of qubits must be a " +\
+                "positive integer.", location=_ERROR_LOCATION_)
+    if input_states is None:
+        if number_of_qubits is None:
+            raise QuantumCircuitError("Number of qubits is required " +\
+                    "without input states.", location=_ERROR_LOCATION_)
+        dimension = 2**number_of_qubits
+    else:
+        input_states = np.asarray(input_states, dtype=complex_dtype())
+        if input_states.ndim != 2 or len(input_states) != number_of_runs \
+                or input_states.shape[1] < 2 \
+                or not is_power_of_two(input_states.shape[1]) \
+                or (number_of_qubits is not None
+                    and input_states.shape[1] != 2**number_of_qubits):
+            raise QuantumCircuitError("Input states must be of " +\
+                    "shape ({}, 2^n), one row per run.".format(
+                        number_of_runs), location=_ERROR_LOCATION_)
+        dimension = input_states.shape[1]
+        tolerance = precision_tolerance(input_states)
+        if not all(is_one(norm, tolerance)
+                   for norm in np.linalg.norm(input_states, axis=1)):
+            raise QuantumCircuitError("Input states must be " +\
+                    "normalised.", location=_ERROR_LOCATION_)
+    if max_workers == 0:
+        final_outputs = np.zeros((number_of_runs, dimension),
+                                 dtype=complex_dtype())
+        results = [_run_one(index, params, flow_factory, input_states,
+                            final_outputs, engine)
+                   for index, params in enumerate(parameters)]
+    else:
+        final_outputs, results = _run_in_pool(
+                parameters, flow_factory, input_states, dimension,
+                max_workers, chunksize, engine)
+    if output == 'probability':
+        final_outputs = np.abs(final_outputs)**2
+    return {
+        'parameters': parameters,
+        'outputs': final_outputs,
+        'results': results
+    }
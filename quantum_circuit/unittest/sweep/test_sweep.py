@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_circuit.sweep.py
+
+Main test
+    Parameter sweep in a process pool agrees with runs in
+    the current process, in input order.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from qubit.utils import qubit_from_bitlist
+from quantum_register import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_operation.gate import gate_operation_from_instruction_dict as GOfID
+from quantum_flow import QuantumFlow
+
+from quantum_circuit.base import QuantumCircuitError
+from quantum_circuit.sweep import parameter_grid, run_sweep
+
+
+def rotation_flow(theta=0.0, index=0):
+    """ Flow factory : Rx on one qubit followed by a CNOT """
+    register = QubitRegister(state=qubit_from_bitlist([(1, '00')]),
+                             label='reg')
+    memory = QubitMemory(register=[register])
+    rotation = GOfID({
+        'gate': {'alias': 'Rx', 'parameters': {'theta': theta}},
+        'target': {'register': 'reg', 'local_index': index}
+    })
+    cnot = GOfID({
+        'gate': {'alias': 'Flip'},
+        'target': {'register': 'reg', 'local_index': 1 - index},
+        'control': {'list': [
+            {'register': 'reg', 'local_index': index, 'state': '1'}]}
+    })
+    return QuantumFlow(operation=[rotation, cnot]), memory
+
+
+class Test_ParameterGrid(unittest.TestCase):
+    def test_product(self):
+        grid = parameter_grid({'theta': [0.1, 0.2, 0.3], 'index': [0, 1]})
+        self.assertTrue(len(grid) == 6)
+        self.assertTrue(grid[1] == {'theta': 0.1, 'index': 1})
+
+    def test_list(self):
+        grid = parameter_grid([{'theta': 0.5}])
+        self.assertTrue(grid == [{'theta': 0.5}])
+
+    def test_wrong_type(self):
+        self.assertRaises(QuantumCircuitError, parameter_grid, 0.5)
+
+
+class Test_RunSweep(unittest.TestCase):
+    def test_pool_agrees_with_serial(self):
+        grid = {'theta': list(np.linspace(0, np.pi, 7)), 'index': [0, 1]}
+        serial = run_sweep(rotation_flow, grid, number_of_qubits=2,
+                           max_workers=0)
+        pooled = run_sweep(rotation_flow, grid, number_of_qubits=2,
+                           max_workers=2, chunksize=3)
+        self.assertTrue(pooled['outputs'].shape == (14, 4))
+        self.assertTrue(pooled['parameters'] == serial['parameters'])
+        self.assertTrue(np.allclose(pooled['outputs'], serial['outputs']))
+
+    def test_outputs_in_input_order(self):
+        grid = [{'theta': theta} for theta in [np.pi, 0.0, 0.5 * np.pi]]
+        sweep = run_sweep(rotation_flow, grid, number_of_qubits=2,
+                          output='probability', max_workers=2)
+        # Rx(pi) flips qubit 0, then CNOT flips qubit 1
+        self.assertTrue(np.allclose(sweep['outputs'][0], [0, 0, 0, 1]))
+        self.assertTrue(np.allclose(sweep['outputs'][1], [1, 0, 0, 0]))
+        self.assertTrue(np.allclose(sweep['outputs'][2],
+                                    [0.5, 0, 0, 0.5]))
+
+    def test_input_states(self):
+        grid = [{'theta': 0.0}, {'theta': np.pi}]
+        inputs = np.array([[0, 0, 1, 0], [0, 1, 0, 0]], dtype=complex)
+        sweep = run_sweep(rotation_flow, grid, input_states=inputs,
+                          output='probability', max_workers=2)
+        # |10> -> CNOT -> |11>
+        self.assertTrue(np.allclose(sweep['outputs'][0], [0, 0, 0, 1]))
+        # |01> -> Rx(pi) -> |11> -> CNOT -> |10>
+        self.assertTrue(np.allclose(sweep['outputs'][1], [0, 0, 1, 0]))
+
+    def test_wrong_input_shape(self):
+        self.assertRaises(QuantumCircuitError, run_sweep, rotation_flow,
+                          [{'theta': 0.0}], input_states=np.zeros((2, 4)))
+
+    def test_unnormalised_input(self):
+        self.assertRaises(QuantumCircuitError, run_sweep, rotation_flow,
+                          [{'theta': 0.0}], input_states=np.ones((1, 4)))
+
+    def test_number_of_qubits(self):
+        self.assertRaises(QuantumCircuitError, run_sweep, rotation_flow,
+                          [{'theta': 0.0}], max_workers=0)
+        # memory of the factory has two qubits
+        self.assertRaises(QuantumCircuitError, run_sweep, rotation_flow,
+                          [{'theta': 0.0}], number_of_qubits=3,
+                          max_workers=0)
+
+    def test_wrong_output(self):
+        self.assertRaises(QuantumCircuitError, run_sweep, rotation_flow,
+                          [{'theta': 0.0}], number_of_qubits=2,
+                          output='density')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,5 +19,12 @@ echo "============================"
 echo "--- --- Phase estimation via flows --- ---"
 python3 -m unittest quantum_circuit/unittest/phase_estimation/test_pe.py
 
+# Parameter sweep
+echo "==================="
+echo "| Parameter Sweep |"
+echo "==================="
+echo "--- --- Sweep in process pool --- ---"
+python3 -m unittest quantum_circuit/unittest/sweep/test_sweep.py
+
 echo "***********************"
 echo "***********************"
\ No newline at end of file
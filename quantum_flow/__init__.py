@@ -26,6 +26,7 @@ LOG
 Updated on 02 October 2021 | Created on 18 July 2021
 """
 from .quantum_flow.quantum_flow import QuantumFlow, QuantumFlowError
+from .quantum_flow.unified_operator import UnifiedOperator
 from .makers import WalshHadamardFlowError, hadamard_flow, \
     hadamard_flow_on_memory, hadamard_flow_on_register, \
     SwapFlowError, swap_flow, swap_flow_on_memory, \
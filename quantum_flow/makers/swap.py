@@ -29,9 +29,9 @@ TODO Introduce decorator to validate indices and memories.
 
 LOG
 
-Updated on 02 October 2021 | Created on 27 August 2021
+Updated on 17 October 2026 | Created on 27 August 2021
 """
-from quantum_operation.gate import gate_operation_from_instruction_dict as GOfID
+from quantum_operation.gate import QubitPermutationOperation
 
 from quantum_flow.quantum_flow.utils import validate_memory_for_flow, \
     validate_register_for_flow, validate_local_index_on_register
@@ -50,9 +50,10 @@ class SwapFlowError(QuantumFlowError):
 def swap_flow(local_index_a, local_index_b, register=None):
     """ Bit-Swap Flow Register: swap a pair of selected bits
 
-    For a pair of qubits, swap is implemented as three
-    sequential CNOT gate operations. The flow is hence
-    consisting of three gate operation instances.
+    For a pair of qubits, swap is equivalent to three
+    sequential CNOT gate operations. The flow consists of
+    a single qubit permutation operation instead, which
+    swaps the qubits without any operator matrix.
 
     ARGUMENTS
 
@@ -77,47 +78,9 @@ def swap_flow(local_index_a, local_index_b, register=None):
         local_index=local_index_b,
         register=register,
         caller_location=_MODULE_LOCATION_ + '.swap_flow')
-    oplist = []
-    CNOT_1st = {
-        'gate': {
-            'alias': 'Flip',
-        },
-        'target': {
-            'register': register.label,
-            'local_index': local_index_a
-        },
-        'control': {
-            'list': [
-                {
-                    'register': register.label,
-                    'local_index': local_index_b,
-                    'state': '1'
-                }
-            ]
-        }
-    }
-    CNOT_2nd = {
-        'gate': {
-            'alias': 'Flip',
-        },
-        'target': {
-            'register': register.label,
-            'local_index': local_index_b
-        },
-        'control': {
-            'list': [
-                {
-                    'register': register.label,
-                    'local_index': local_index_a,
-                    'state': '1'
-                }
-            ]
-        }
-    }
-    oplist.append(GOfID(CNOT_1st))
-    oplist.append(GOfID(CNOT_2nd))
-    oplist.append(GOfID(CNOT_1st))
-    return QuantumFlow(operation=oplist)
+    swaps = [((register.label, local_index_a),
+              (register.label, local_index_b))]
+    return QuantumFlow(operation=QubitPermutationOperation(swaps))
 
 
 def swap_flow_on_memory(global_index_a, global_index_b, memory=None):
@@ -144,47 +107,9 @@ def swap_flow_on_memory(global_index_a, global_index_b, memory=None):
         caller_location=_MODULE_LOCATION_ + '.swap_flow_on_memory')
     local_a = memory.to_local_index(global_index_a)
     local_b = memory.to_local_index(global_index_b)
-    oplist = []
-    CNOT_1st = {
-        'gate': {
-            'alias': 'Flip',
-        },
-        'target': {
-            'register': local_a['label'],
-            'local_index': local_a['local_index']
-        },
-        'control': {
-            'list': [
-                {
-                    'register': local_b['label'],
-                    'local_index': local_b['local_index'],
-                    'state': '1'
-                }
-            ]
-        }
-    }
-    CNOT_2nd = {
-        'gate': {
-            'alias': 'Flip',
-        },
-        'target': {
-            'register': local_b['label'],
-            'local_index': local_b['local_index']
-        },
-        'control': {
-            'list': [
-                {
-                    'register': local_a['label'],
-                    'local_index': local_a['local_index'],
-                    'state': '1'
-                }
-            ]
-        }
-    }
-    oplist.append(GOfID(CNOT_1st))
-    oplist.append(GOfID(CNOT_2nd))
-    oplist.append(GOfID(CNOT_1st))
-    return QuantumFlow(operation=oplist)
+    swaps = [((local_a['label'], local_a['local_index']),
+              (local_b['label'], local_b['local_index']))]
+    return QuantumFlow(operation=QubitPermutationOperation(swaps))
 
 
 def overall_swap_flow_on_register(register=None):
@@ -196,6 +121,10 @@ def overall_swap_flow_on_register(register=None):
     penultimate, so on. For an odd number of qubits, middle
     bit is untouched.
 
+    All swaps are carried out by one qubit permutation
+    operation, i.e. one pass over the global state, instead
+    of three CNOT gate operations per pair.
+
     ARGUMENTS
 
     `register` (`QubitRegister` or `QubitRegisterMetadata`):
@@ -211,51 +140,13 @@ def overall_swap_flow_on_register(register=None):
         caller_location=_MODULE_LOCATION_ + \
                 '.overall_swap_flow_on_register()'
     )
-    # operation list
-    oplist = []
     upper = 0
     if register.noq % 2: # noq is odd
         upper = int((register.noq - 1) / 2)
     else: # noq is even
         upper = int(register.noq / 2)
-    for i in range(0, upper):
-        CNOT_1st = {
-            'gate': {
-                'alias': 'Flip',
-            },
-            'target': {
-                'register': register.label,
-                'local_index': i
-            },
-            'control': {
-                'list': [
-                    {
-                        'register': register.label,
-                        'local_index': register.noq - 1 - i,
-                        'state': '1'
-                    }
-                ]
-            }
-        }
-        CNOT_2nd = {
-            'gate': {
-                'alias': 'Flip',
-            },
-            'target': {
-                'register': register.label,
-                'local_index': register.noq - 1 - i
-            },
-            'control': {
-                'list': [
-                    {
-                        'register': register.label,
-                        'local_index': i,
-                        'state': '1'
-                    }
-                ]
-            }
-        }
-        oplist.append(GOfID(CNOT_1st))
-        oplist.append(GOfID(CNOT_2nd))
-        oplist.append(GOfID(CNOT_1st))
-    return QuantumFlow(operation=oplist)
+    swaps = [((register.label, i), (register.label, register.noq - 1 - i))
+             for i in range(0, upper)]
+    if len(swaps) == 0:
+        return QuantumFlow(operation=[])
+    return QuantumFlow(operation=QubitPermutationOperation(swaps))
@@ -4,3 +4,5 @@ SUBPACK
 Quantum flow
 """
 from .quantum_flow import QuantumFlow, QuantumFlowError
+from .unified_operator import UnifiedOperator
+from .trajectories import compile_trajectory_steps, run_trajectories
@@ -1,9 +1,12 @@
 
 
+from copy import copy
+
 from quantum_register.registers import QubitRegister
 from quantum_memory.qubit_memory import QubitMemory, QubitRegisterMetadata
 from quantum_operation.base_operation import BaseOperation
 from .errors import BaseQuantumFlowError
+from .fusion import fuse_gate_sequence
 
 _MODULE_LOCATION_ = 'quantum_flow.quantum_flow.base_flow'
 
@@ -43,6 +46,12 @@ class BaseQuantumFlow:
     `self.is_valid_operation(,ops)` : verify if an operation or
     a list of operations is valid; returns `True` if valid,
     otherwise `False`
+
+    `self.fuse(,max_qubits)` : returns a new flow in which adjacent
+    gate operations are fused into dense blocks
+
+    `self.fusion_report` (`dict`) : report of the fusion pass that
+    created this flow; `None` if flow is not fused
     """
     error_location = _MODULE_LOCATION_ + '.BaseQuantumFlow'
 
@@ -50,6 +59,7 @@ class BaseQuantumFlow:
         """ Base Quantum Flow : Initialiser """
         self.label = label
         self._operation_sequence = []
+        self.fusion_report = None
         if self.is_valid_operation(operation):
             self._append_to_sequence(operation)
         else:
@@ -217,3 +227,30 @@ class BaseQuantumFlow:
                     "merge with another flow object.",
                     location=self.error_location+'.merge')
         return self
+
+    def fuse(self, max_qubits=2):
+        """ Base Quantum Flow : Gate-fusion pass
+
+        Runs of adjacent gate operations acting on at most
+        `max_qubits` qubits are fused into one dense block,
+        such that each run costs a single pass over the global
+        state. (See `quantum_flow.quantum_flow.fusion`.)
+
+        This flow is left untouched.
+
+        Arguments
+
+        `max_qubits` (`int`) : maximum number of qubits a fused
+        block can act on; default to 2
+
+        Returns
+
+        A new flow of the same class with the fused sequence; its
+        attribute `fusion_report` tells how many passes are saved
+        """
+        fused = fuse_gate_sequence(sequence=self._operation_sequence,
+                                   max_qubits=max_qubits)
+        fused_flow = copy(self)
+        fused_flow._operation_sequence = fused['sequence']
+        fused_flow.fusion_report = fused['report']
+        return fused_flow
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_flow.quantum_flow.fusion.py
+
+PATH
+
+[app_root]/quantum_flow/quantum_flow/fusion.py
+
+INTRO
+
+Gate-fusion pass over an operation sequence.
+
+Adjacent gate operations are grouped greedily as long as the
+qubits they act on, taken together, don't exceed a maximum
+number. A group of more than one operation is replaced by a
+fused gate operation, applied in one pass over the global
+state. Any other operation, e.g. measurement or partial trace,
+closes the current group and is kept as it is.
+
+For example, a quantum Fourier flow is made of a Hadamard
+followed by controlled phase rotations. With at most 2 qubits
+per block, a Hadamard merges with the first controlled rotation
+sharing its target.
+
+CONTENT
+
+`fuse_gate_sequence(sequence, max_qubits)` - Returns fused
+sequence and a report
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from quantum_operation.gate import GateOperation, FusedGateOperation, \
+    operation_qubits
+
+from .errors import BaseQuantumFlowError
+
+_MODULE_LOCATION_ = 'quantum_flow.quantum_flow.fusion'
+
+
+def fuse_gate_sequence(sequence=None, max_qubits=2):
+    """ Fuse adjacent gate operations in a sequence
+
+    ARGUMENTS
+
+    `sequence` (`list`) : a list of operations
+
+    `max_qubits` (`int`) : maximum number of qubits a fused
+    block can act on; block dimension is `2^max_qubits`
+
+    RETURN
+
+    A dictionary of two keys, `sequence`, the fused sequence,
+    and `report`, a dictionary with the following keys:
+
+    `number_of_operations` (`int`) : operations before fusion
+
+    `number_of_passes` (`int`) : operations after fusion, each
+    being one pass over the global state
+
+    `passes_saved` (`int`) : difference between the above two
+
+    `number_of_fused_blocks` (`int`) : fused operations created
+
+    `max_qubits` (`int`) : maximum number of qubits per block
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.fuse_gate_sequence'
+    if not isinstance(max_qubits, int) or max_qubits < 1:
+        raise BaseQuantumFlowError("Maximum number of qubits " +\
+                "in a fused block must be a positive integer.",
+                location=_ERROR_LOCATION_)
+    fused_sequence = []
+    number_of_fused_blocks = 0
+    block = []
+    block_qubits = set()
+
+    def flush():
+        nonlocal number_of_fused_blocks
+        if len(block) == 1:
+            fused_sequence.append(block[0])
+        elif len(block) > 1:
+            fused_sequence.append(FusedGateOperation(list(block)))
+            number_of_fused_blocks += 1
+        block.clear()
+        block_qubits.clear()
+
+    for operation in sequence:
+        if isinstance(operation, GateOperation):
+            qubits = set(operation_qubits(operation))
+            if len(block_qubits | qubits) > max_qubits:
+                flush()
+            block.append(operation)
+            block_qubits.update(qubits)
+        else:
+            flush()
+            fused_sequence.append(operation)
+    flush()
+    return {
+        'sequence': fused_sequence,
+        'report': {
+            'number_of_operations': len(sequence),
+            'number_of_passes': len(fused_sequence),
+            'passes_saved': len(sequence) - len(fused_sequence),
+            'number_of_fused_blocks': number_of_fused_blocks,
+            'max_qubits': max_qubits
+        }
+    }
@@ -28,16 +28,22 @@ with a lower rank is executed earlier.
 
 LOG
 
-Updated on 02 October 2021 | Created on 26 August 2021
+Updated on 17 October 2026 | Created on 26 August 2021
 """
-from linear_space.algebra import matrix_product
-from quantum_operator import QubitOperator
+import numpy as np
+
+from quantum_memory.base_memory import GATE_ENGINES
 
 from .errors import QuantumFlowError
 from .base_flow import BaseQuantumFlow
+from .unified_operator import UnifiedOperator
+from .trajectories import DEFAULT_CHUNK_SIZE, run_trajectories
 
 _MODULE_LOCATION_ = 'quantum_flow.quantum_flow.quantum_flow'
 
+# outputs of batched execution
+BATCH_OUTPUTS = ('state', 'probability')
+
 
 class QuantumFlow(BaseQuantumFlow):
     """ Quantum Flow
@@ -49,17 +55,58 @@ class QuantumFlow(BaseQuantumFlow):
     `self.unified_matrix(, memory)` : constructs and returns a unified
     operator matrix applicable to global state in the given memory
 
-    `self.as_unified_operator(,memory)` : returns and `QubitOperator`
-    instance that is compatible with the global state in the user
-    provided memory
+    `self.as_unified_operator(,memory)` : returns a lazy
+    `UnifiedOperator` instance that is compatible with the global
+    state in the user provided memory
 
     `self.ready(,memory)` : verifies if flow and memory are ready
 
     `self.launch(,memory)` : executes operation sequence in the
     designated memory
+
+    `self.launch_on_batch(,memory,states,output)` : executes flow
+    on a stack of input states, using memory as a template
+
+    `self.launch_trajectories(,memory,number_of_trajectories,...)` :
+    executes a noisy flow as Monte-Carlo trajectories of pure
+    states, using memory as a template
+
+    `self.engine` : property; engine used to launch gate operations;
+    if `None`, the engine selected in memory is used
+
+    `self.set_engine(,engine)` : setter; selects the engine, either
+    'matrix', 'statevector', 'sparse' or `None`
     """
     error_location = _MODULE_LOCATION_ + '.QuantumFlow'
 
+    def __init__(self, operation=None, label=None, engine=None):
+        """ Quantum Flow : Initialiser """
+        super().__init__(operation=operation, label=label)
+        self._engine = None
+        self.set_engine(engine)
+
+    @property
+    def engine(self):
+        """ Quantum Flow : Returns engine """
+        return self._engine
+
+    def set_engine(self, engine):
+        """ Quantum Flow : Sets engine
+
+        Engine selected in flow overrides the one in memory
+        during `self.launch_on_memory()`.
+
+        Arguments
+
+        `engine` (`str`) : 'matrix', 'statevector', 'sparse' or `None`
+        """
+        if engine is None or engine in GATE_ENGINES:
+            self._engine = engine
+        else:
+            raise QuantumFlowError("Engine '{}' ".format(engine) +\
+                    "is not supported. Choose from {}.".format(GATE_ENGINES),
+                    location=self.error_location+'.set_engine')
+
     def unified_matrix(self, memory):
         """ Quantum Flow : Construct a unified operator matrix
 
@@ -69,42 +116,39 @@ class QuantumFlow(BaseQuantumFlow):
         FIXME What happens if one or more operations are partial
         trace or measurement?
 
-        NOTE Construction of unified matrix involves a chained matrix
-        product, which presumably consumes most of computational time.
-        This is where parallelisation is needed.
+        NOTE Unified matrix is materialised from the lazy unified
+        operator, by contracting operator factors with the identity
+        rather than chaining full matrix products.
         """
-        unified_matrix = None
-        if not self.is_empty:
-            unified_matrix = \
-                    self.get_operation_by_rank(0).get_operator_matrix(memory)
-            if self.number_of_operations > 1:
-                for rank in range(1, self.number_of_operations):
-                    opmat = self.get_operation_by_rank(rank).get_operator_matrix(memory)
-                    if unified_matrix.ncols == opmat.ncols \
-                            and unified_matrix.nrows == opmat.nrows:
-                        unified_matrix = matrix_product(opmat, unified_matrix)
-                    else:
-                        raise QuantumFlowError("Failed to construct " +\
-                                "unified operator matrix due to mismatch " +\
-                                "in operator matrices.",
-                                location=self.error_location+'.unified_matrix')
-        else:
-            raise QuantumFlowError("Failed to construct unified " +\
-                    "operator matrix due to empty operation sequence.",
-                    location=self.error_location+'.unified_matrix')
-        return unified_matrix
+        return self.as_unified_operator(memory).as_matrix()
 
     def as_unified_operator(self, memory):
         """ Quantum Flow : Construct a quantum operator
 
-        Constructs and returns a quantum operator object for
-        the target memory.
+        Constructs and returns a lazy quantum operator object for
+        the target memory. Operator holds one factor per operation,
+        i.e. a small gate matrix with its global qubit indices; the
+        full operator matrix is only constructed on request.
 
         Return
 
-        A qubit operator object.
+        A unified operator object, an instance of `UnifiedOperator`.
         """
-        return QubitOperator(matrix=self.unified_matrix(memory))
+        if self.is_empty:
+            raise QuantumFlowError("Failed to construct unified " +\
+                    "operator due to empty operation sequence.",
+                    location=self.error_location+'.as_unified_operator')
+        factors = []
+        for operation in self.get_sequence():
+            if not hasattr(operation, 'get_operator_factor'):
+                raise QuantumFlowError("Failed to construct unified " +\
+                        "operator, since operation '{}' ".format(
+                            type(operation).__name__) +\
+                        "has no operator factor.",
+                        location=self.error_location+'.as_unified_operator')
+            factors.append(operation.get_operator_factor(memory))
+        return UnifiedOperator(factors=factors,
+                               number_of_qubits=len(memory.global_index_range()))
 
     def ready(self, memory):
         """ Quantum Flow : Check if flow and memory are ready """
@@ -123,16 +167,26 @@ class QuantumFlow(BaseQuantumFlow):
 
         Launches operations on the target memory by sequentially
         passing operations to memory's operation socket.
+
+        If flow has an engine selected, memory uses that engine
+        during the launch and restores its own afterwards.
         """
+        memory_engine = None
         try:
             ret = None
             self.ready(memory)
+            if self.engine is not None:
+                memory_engine = memory.engine
+                memory.set_engine(self.engine)
             for _ , operation in enumerate(self.get_sequence()):
                 ret = memory.operation_socket(operation)
             if ret is not None:
                 return ret
         except Exception as err:
             raise err
+        finally:
+            if memory_engine is not None:
+                memory.set_engine(memory_engine)
 
     def launch_on_global_state(self, memory):
         """ Quantum Flow : Execute unified operator on global state
@@ -154,3 +208,85 @@ class QuantumFlow(BaseQuantumFlow):
             raise err
         if ret is not None:
             return ret
+
+    def launch_on_batch(self, memory, states, output='state'):
+        """ Quantum Flow : Execute flow on a batch of input states
+
+        Memory only serves as a template: registers and indices
+        of the flow are resolved against it, while its global state
+        is neither used nor modified. Operator factors are thus
+        constructed once and each one is applied to the whole
+        batch at once.
+
+        Only operations that have an operator factor are allowed,
+        i.e. no measurement or partial trace.
+
+        Arguments
+
+        `memory` (`QubitMemory`) : template memory
+
+        `states` (`ndarray`) : input state vectors stacked as rows,
+        of shape `(batch, 2^n)` where `n` is the number of qubits
+        of the global state in memory
+
+        `output` (`str`) : 'state' returns the output state vectors;
+        'probability' returns the probability of each basis state
+
+        Returns
+
+        An array of shape `(batch, 2^n)`; complex amplitudes, or
+        real probabilities.
+        """
+        if output not in BATCH_OUTPUTS:
+            raise QuantumFlowError("Batch output '{}' ".format(output) +\
+                    "is not supported. Choose from {}.".format(BATCH_OUTPUTS),
+                    location=self.error_location+'.launch_on_batch')
+        self.ready(memory)
+        new_states = self.as_unified_operator(memory).apply_to_batch(states)
+        if output == 'probability':
+            return np.abs(new_states)**2
+        return new_states
+
+    def launch_trajectories(self, memory, number_of_trajectories,
+                            observables=None, seed=None, processes=None,
+                            chunk_size=DEFAULT_CHUNK_SIZE, as_array=False):
+        """ Quantum Flow : Execute flow as quantum trajectories
+
+        Noise operations send each trajectory, a pure state, through
+        a randomly chosen Kraus branch; probabilities of basis states
+        and expectation values of observables are averaged over
+        trajectories. Memory only serves as a template and is not
+        modified. (See `quantum_flow.quantum_flow.trajectories`.)
+
+        Only gate and noise operations are allowed.
+
+        Arguments
+
+        `memory` (`QubitMemory`) : template memory, in a pure state
+
+        `number_of_trajectories` (`int`) : number of trajectories
+
+        `observables` (`list`) : optional; observables, e.g. Pauli
+        strings or dictionaries of weighted Pauli strings
+
+        `seed` (`int`) : optional; seed for reproducible results
+
+        `processes` (`int`) : optional; number of worker processes
+
+        `chunk_size` (`int`) : number of trajectories per chunk
+
+        `as_array` (`bool`) : if `True`, probabilities are returned
+        as an array
+
+        Returns
+
+        A dictionary; see `run_trajectories`.
+        """
+        if self.is_empty:
+            raise QuantumFlowError("Flow is empty.",
+                    location=self.error_location+'.launch_trajectories')
+        return run_trajectories(sequence=self.get_sequence(), memory=memory,
+                                number_of_trajectories=number_of_trajectories,
+                                observables=observables, seed=seed,
+                                processes=processes, chunk_size=chunk_size,
+                                as_array=as_array)
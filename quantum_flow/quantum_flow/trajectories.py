@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_flow.quantum_flow.trajectories.py
+
+PATH
+
+[app_root]/quantum_flow/quantum_flow/trajectories.py
+
+INTRO
+
+Monte-Carlo wave-function (quantum trajectories) execution of a
+noisy flow.
+
+A density matrix of `n` qubits holds `4^n` numbers, which rules
+it out beyond a dozen qubits or so. A trajectory instead keeps a
+pure state of `2^n` amplitudes: gate operations are applied as
+in the state-vector engine, and a noise operation sends the
+state through one of its Kraus branches, chosen at random with
+the Born probability. (See `noise.sample_kraus_branch`.) Averaged
+over trajectories, probabilities of basis states and expectation
+values of observables converge to those of the density matrix,
+with a standard error of order `1/sqrt(trajectories)`.
+
+Flow is first compiled against the template memory into steps,
+i.e. operator factors of gate operations and Kraus matrices of
+noise operations with global target indices. Steps are plain
+arrays; they are sent once to each worker process.
+
+Each trajectory draws from its own random generator, seeded by
+a child of one `numpy.random.SeedSequence`. Trajectories are run
+in chunks of fixed size and chunk sums are added in the order of
+chunks, so that results only depend on the seed, not on the
+number of worker processes.
+
+CONTENT
+
+`compile_trajectory_steps(sequence, memory)` - Compiles operations
+into trajectory steps
+
+`run_trajectories(sequence, memory, ...)` - Runs trajectories and
+averages their results
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from qubit import QubitState
+from linear_space.vector import ColumnVector
+from gate.statevector import apply_matrix_on_qubits, permute_qubits
+from noise import sample_kraus_branch
+from measurement.observables import expectation
+from measurement.projective import probability_dict
+from quantum_operation.noise import NoiseOperation
+
+from .errors import QuantumFlowError
+
+_MODULE_LOCATION_ = 'quantum_flow.quantum_flow.trajectories'
+
+# default number of trajectories per chunk
+DEFAULT_CHUNK_SIZE = 16
+
+
+def compile_trajectory_steps(sequence=None, memory=None):
+    """ Compile operations into trajectory steps
+
+    ARGUMENTS
+
+    `sequence` (`list`) : operations of a flow; each operation is
+    either a noise operation or has an operator factor
+
+    `memory` (`QubitMemory`) : template memory
+
+    RETURN
+
+    A list of operator factors; a noise operation becomes a channel
+    factor, with keys `kraus_matrices` and `qubit_indices`.
+    """
+    steps = []
+    for operation in sequence:
+        if isinstance(operation, NoiseOperation):
+            steps.append(operation.get_channel_factor(memory))
+        elif hasattr(operation, 'get_operator_factor'):
+            steps.append(operation.get_operator_factor(memory))
+        else:
+            raise QuantumFlowError("Flow cannot be run in " +\
+                    "trajectories, since operation " +\
+                    "'{}' is neither a gate ".format(
+                        type(operation).__name__) +\
+                    "nor a noise operation.",
+                    location=_MODULE_LOCATION_+'.compile_trajectory_steps')
+    return steps
+
+
+def _run_trajectory(steps, state_array, number_of_qubits, generator):
+    """ Final state array of one trajectory """
+    for step in steps:
+        if step.get('kraus_matrices', None) is not None:
+            state_array, _ = sample_kraus_branch(
+                    state_array=state_array,
+                    number_of_qubits=number_of_qubits,
+                    kraus_matrices=step['kraus_matrices'],
+                    qubit_indices=step['qubit_indices'],
+                    uniform=generator.random())
+        elif step.get('permutation', None) is not None:
+            state_array = permute_qubits(state_array=state_array,
+                                         number_of_qubits=number_of_qubits,
+                                         axes=step['permutation'])
+        else:
+            state_array = apply_matrix_on_qubits(
+                    state_array=state_array,
+                    number_of_qubits=number_of_qubits,
+                    qubit_indices=step['qubit_indices'],
+                    block_matrix=step['matrix'],
+                    control_list=step['control_list'])
+    return state_array
+
+
+def _run_chunk(steps, state_array, number_of_qubits, seeds, observables):
+    """ Sums of results over a chunk of trajectories
+
+    Returns sum of probabilities of basis states, and sums of
+    expectation values and of their squared moduli.
+    """
+    probability_sum = np.zeros(2**number_of_qubits, dtype=float)
+    value_sum = 0.0
+    square_sum = 0.0
+    for seed in seeds:
+        final_array = _run_trajectory(steps, state_array, number_of_qubits,
+                                      np.random.default_rng(seed))
+        probability_sum += np.abs(final_array.reshape(-1))**2
+        if observables:
+            final_state = QubitState.from_trusted_vector(
+                    ColumnVector.from_trusted_array(
+                        final_array.reshape(-1, 1)))
+            values = np.array([expectation(observable, final_state)
+                               for observable in observables])
+            value_sum = value_sum + values
+            square_sum = square_sum + np.abs(values)**2
+    return probability_sum, value_sum, square_sum
+
+
+def _validate_positive_integer(value, name, location):
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise QuantumFlowError("{} must be a positive ".format(name) +\
+                "integer.", location=location)
+
+
+def run_trajectories(sequence=None, memory=None, number_of_trajectories=None,
+                     observables=None, seed=None, processes=None,
+                     chunk_size=DEFAULT_CHUNK_SIZE, as_array=False):
+    """ Run trajectories of a noisy flow
+
+    Memory only serves as a template: its global state is the
+    initial state of every trajectory and is not modified.
+
+    ARGUMENTS
+
+    `sequence` (`list`) : operations of a flow
+
+    `memory` (`QubitMemory`) : template memory; must be pure
+
+    `number_of_trajectories` (`int`) : number of trajectories
+
+    `observables` (`list`) : optional; observables, each accepted
+    by `measurement.observables.expectation`
+
+    `seed` (`int`) : optional; entropy of the seed sequence; if
+    `None`, fresh entropy is drawn and returned with the results
+
+    `processes` (`int`) : optional; number of worker processes;
+    if `None` or 1, trajectories run in this process
+
+    `chunk_size` (`int`) : number of trajectories per chunk
+
+    `as_array` (`bool`) : if `True`, probabilities are returned as
+    an array, otherwise as a dictionary of bit strings
+
+    RETURN
+
+    A dictionary with keys `number_of_trajectories`, `entropy` of
+    the seed sequence, `probability` of basis states averaged as in
+    `projective_all`, and `expectation` and `standard_error`, lists
+    in the order of observables.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.run_trajectories'
+    _validate_positive_integer(number_of_trajectories,
+                               'Number of trajectories', _ERROR_LOCATION_)
+    _validate_positive_integer(chunk_size, 'Chunk size', _ERROR_LOCATION_)
+    if processes is not None:
+        _validate_positive_integer(processes, 'Number of processes',
+                                   _ERROR_LOCATION_)
+    if memory.has_global_density_matrix:
+        raise QuantumFlowError("Trajectories start from a pure " +\
+                "state; memory holds a density matrix.",
+                location=_ERROR_LOCATION_)
+    if not memory.has_global_state:
+        memory.form_global_state()
+    observables = list(observables) if observables is not None else []
+    steps = compile_trajectory_steps(sequence=sequence, memory=memory)
+    state_array = memory.get_global_state().as_vector().as_array()
+    number_of_qubits = len(memory.global_index_range())
+    seed_sequence = np.random.SeedSequence(seed)
+    seeds = seed_sequence.spawn(number_of_trajectories)
+    chunks = [seeds[start:start + chunk_size]
+              for start in range(0, number_of_trajectories, chunk_size)]
+    arguments = [(steps, state_array, number_of_qubits, chunk, observables)
+                 for chunk in chunks]
+    if processes is None or processes == 1:
+        sums = [_run_chunk(*argument) for argument in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            sums = list(executor.map(_run_chunk, *zip(*arguments)))
+    probability_sum, value_sum, square_sum = sums[0]
+    for chunk_sums in sums[1:]:
+        probability_sum = probability_sum + chunk_sums[0]
+        value_sum = value_sum + chunk_sums[1]
+        square_sum = square_sum + chunk_sums[2]
+    probabilities = probability_sum / number_of_trajectories
+    expectations = []
+    standard_errors = []
+    if observables:
+        expectations = value_sum / number_of_trajectories
+        if number_of_trajectories > 1:
+            variance = (square_sum / number_of_trajectories
+                        - np.abs(expectations)**2) \
+                    * number_of_trajectories / (number_of_trajectories - 1)
+            standard_errors = np.sqrt(np.maximum(variance, 0.0)
+                                      / number_of_trajectories)
+        else:
+            standard_errors = np.zeros(len(observables))
+        expectations = expectations.tolist()
+        standard_errors = standard_errors.tolist()
+    return {
+        'number_of_trajectories': number_of_trajectories,
+        'entropy': seed_sequence.entropy,
+        'probability': probabilities if as_array
+                       else probability_dict(probabilities),
+        'expectation': expectations,
+        'standard_error': standard_errors
+    }
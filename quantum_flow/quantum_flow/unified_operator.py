@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_flow.quantum_flow.unified_operator.py
+
+PATH
+
+[app_root]/quantum_flow/quantum_flow/unified_operator.py
+
+INTRO
+
+Lazy unified operator of a quantum flow.
+
+A unified operator matrix, the product of all operator matrices
+of a flow, costs `O(m 8^n)` to construct for `m` operations on
+`n` qubits. Unified operator here only records its factors,
+each being a small gate matrix with global target and control
+indices, or a permutation of qubits, and contracts them on
+demand.
+
+[1] Applied to a state, factors are contracted one after another
+with the state vector, at a cost of `O(m 2^n)`.
+
+[2] Operator matrix is only materialised when explicitly requested,
+e.g. via `as_matrix()`. Factors are then contracted, in order,
+with the identity, viewed as a state of `2n` qubits of which
+the first `n` are acted upon. This costs `O(m 4^n)`, instead of
+chaining `m` full matrix products.
+
+CONTENT
+
+`UnifiedOperator` - Lazy qubit operator made of operator factors
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+import numpy as np
+
+from linear_space.matrix import SquareMatrix
+from linear_space.vector import ColumnVector
+from linear_space.precision import complex_dtype
+from quantum_state import NullState, NULL_STATE
+from quantum_operator import QubitOperator
+from gate.statevector import apply_matrix_on_qubits, permute_qubits
+
+from .errors import QuantumFlowError
+
+_MODULE_LOCATION_ = 'quantum_flow.quantum_flow.unified_operator'
+
+
+class UnifiedOperator(QubitOperator):
+    """ Unified operator
+
+    Qubit operator that holds a list of operator factors in the
+    order of execution, rather than an internal matrix. (See
+    `GateOperation.get_operator_factor`.)
+
+    ATTRIBUTES
+
+    `self.factors` : property; list of operator factors
+
+    `self.noq` : property; number of qubits of the global state
+
+    `self.number_of_factors` : property; number of factors
+
+    `self.apply(, state)` : applies factors one after another to
+    the state; the operator matrix is not constructed
+
+    `self.apply_to_batch(, states)` : applies factors to a stack
+    of state arrays at once
+
+    `self.as_matrix()` : materialises and returns the operator
+    matrix; the matrix is cached
+
+    CONSTRUCTOR
+
+    `factors` (`list`) : a list of operator factors, dictionaries
+    with keys `matrix`, `qubit_indices` and `control_list`; a
+    factor with key `permutation` permutes qubits instead
+
+    `number_of_qubits` (`int`) : number of qubits of the state
+    the operator acts on
+    """
+    error_location = _MODULE_LOCATION_ + '.UnifiedOperator'
+
+    def __init__(self, factors=None, number_of_qubits=None):
+        """ Unified Operator : Initialiser """
+        super().__init__(matrix=None)
+        if not isinstance(factors, list) or len(factors) == 0:
+            raise QuantumFlowError("Unified operator requires " +\
+                    "a non-empty list of operator factors.",
+                    location=self.error_location+'.__init__')
+        self._factors = factors
+        self._noq = number_of_qubits
+
+    @property
+    def factors(self):
+        """ Unified Operator : Returns operator factors """
+        return self._factors
+
+    @property
+    def noq(self):
+        """ Unified Operator : Returns number of qubits """
+        return self._noq
+
+    @property
+    def number_of_factors(self):
+        """ Unified Operator : Returns number of factors """
+        return len(self._factors)
+
+    def _contract(self, array, number_of_qubits):
+        """ Unified Operator : Contract all factors with an array """
+        for factor in self._factors:
+            if factor.get('permutation', None) is not None:
+                array = permute_qubits(state_array=array,
+                                       number_of_qubits=number_of_qubits,
+                                       axes=factor['permutation'])
+            else:
+                array = apply_matrix_on_qubits(
+                        state_array=array,
+                        number_of_qubits=number_of_qubits,
+                        qubit_indices=factor['qubit_indices'],
+                        block_matrix=factor['matrix'],
+                        control_list=factor['control_list'])
+        return array
+
+    def as_matrix(self):
+        """ Unified Operator : Materialise operator matrix """
+        if self._matrix is None:
+            identity = np.identity(2**self._noq, dtype=complex_dtype())
+            self._matrix = SquareMatrix(
+                    array=self._contract(identity, 2 * self._noq))
+        return self._matrix
+
+    def has_matrix(self):
+        """ Unified Operator : Always `True`, matrix is made on demand """
+        return True
+
+    def apply_to_batch(self, states):
+        """ Unified Operator : Apply factors to a batch of states
+
+        Each factor is contracted once with the whole batch.
+
+        Arguments
+
+        `states` (`ndarray`) : a stack of state vectors of shape
+        `(batch, 2^n)`, one state per row
+
+        Returns
+
+        A new array of the same shape.
+        """
+        if not isinstance(states, np.ndarray) or states.ndim != 2 \
+                or states.shape[1] != 2**self._noq:
+            raise QuantumFlowError("Batch of states must be a " +\
+                    "two-dimensional array of shape " +\
+                    "(batch, {}).".format(2**self._noq),
+                    location=self.error_location+'.apply_to_batch')
+        return np.ascontiguousarray(
+                self._contract(np.ascontiguousarray(states.T), self._noq).T)
+
+    def does_state_match(self, state):
+        """ Unified Operator : Verify state dimension """
+        return state.noq == self._noq
+
+    def apply(self, state):
+        """ Unified Operator : Apply factors to a state
+
+        Returns a new state, an instance of `QubitState`.
+        """
+        new_state = None
+        if isinstance(state, self.state_class):
+            if self.does_state_match(state):
+                new_array = self._contract(state.as_vector().as_array(),
+                                           self._noq)
+                new_state = self.state_class.from_trusted_vector(
+                        ColumnVector.from_trusted_array(new_array))
+            else:
+                raise QuantumFlowError("Dimension of the " +\
+                        "state doesn't match the unified operator.",
+                        location=self.error_location+'.apply')
+        elif isinstance(state, NullState):
+            new_state = NULL_STATE
+        else:
+            raise QuantumFlowError("Unified operator is " +\
+                    "applied to a wrong type.",
+                    location=self.error_location+'.apply')
+        return new_state
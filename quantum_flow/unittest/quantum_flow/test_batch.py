@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_flow.quantum_flow.quantum_flow.py
+    quantum_flow.quantum_flow.unified_operator.py
+
+Main test:
+    Batched execution agrees with launching the flow on one
+    memory per input state.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from qubit.utils import qubit_from_bitlist
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_flow import QuantumFlowError, quantum_fourier_flow_on_register
+
+
+def first_register():
+    s1 = qubit_from_bitlist([(1, '000')])
+    return QubitRegister(label='reg1', state=s1)
+
+
+def template_memory():
+    s2 = qubit_from_bitlist([(1, '0')])
+    reg2 = QubitRegister(label='reg2', state=s2)
+    return QubitMemory(register=[first_register(), reg2])
+
+
+def random_states(batch, noq, seed=7):
+    rng = np.random.default_rng(seed)
+    states = rng.normal(size=(batch, 2**noq)) \
+            + 1j * rng.normal(size=(batch, 2**noq))
+    return states / np.linalg.norm(states, axis=1, keepdims=True)
+
+
+def launch_one_by_one(flow, states):
+    outputs = []
+    for state_array in states:
+        memory = template_memory()
+        memory.set_global_state(QubitState(
+                vector=ColumnVector(array=state_array.reshape(-1, 1))))
+        flow.launch_on_memory(memory)
+        outputs.append(
+                memory.get_global_state().as_vector().as_array().reshape(-1))
+    return np.array(outputs)
+
+
+class TestBatch_Fourier(unittest.TestCase):
+    def test_states(self):
+        flow = quantum_fourier_flow_on_register(first_register())
+        states = random_states(6, 4)
+        batch = flow.launch_on_batch(template_memory(), states)
+        self.assertTrue(batch.shape == (6, 16))
+        self.assertTrue(np.allclose(batch, launch_one_by_one(flow, states)))
+
+    def test_probability(self):
+        flow = quantum_fourier_flow_on_register(first_register())
+        states = random_states(5, 4)
+        probability = flow.launch_on_batch(template_memory(), states,
+                                           output='probability')
+        self.assertTrue(np.allclose(probability.sum(axis=1), 1.0))
+        self.assertTrue(np.allclose(
+                probability, np.abs(launch_one_by_one(flow, states))**2))
+
+    def test_single_state_batch(self):
+        flow = quantum_fourier_flow_on_register(first_register())
+        states = random_states(1, 4)
+        batch = flow.launch_on_batch(template_memory(), states)
+        self.assertTrue(batch.shape == (1, 16))
+        self.assertTrue(np.allclose(batch, launch_one_by_one(flow, states)))
+
+    def test_template_unchanged(self):
+        memory = template_memory()
+        before = memory.get_global_state().as_vector().as_array().copy()
+        flow = quantum_fourier_flow_on_register(first_register())
+        flow.launch_on_batch(memory, random_states(3, 4))
+        self.assertTrue(np.allclose(
+                memory.get_global_state().as_vector().as_array(), before))
+
+
+class TestBatch_Errors(unittest.TestCase):
+    def test_wrong_dimension(self):
+        flow = quantum_fourier_flow_on_register(first_register())
+        self.assertRaises(QuantumFlowError, flow.launch_on_batch,
+                          template_memory(), random_states(3, 3))
+
+    def test_wrong_output(self):
+        flow = quantum_fourier_flow_on_register(first_register())
+        self.assertRaises(QuantumFlowError, flow.launch_on_batch,
+                          template_memory(), random_states(3, 4),
+                          output='density')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_flow.quantum_flow.base_flow.py
+    quantum_flow.quantum_flow.fusion.py
+    quantum_operation.gate.fused.py
+
+Main test:
+    Gate-fusion pass yields the same global state with
+    fewer passes.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+from qubit.utils import qubit_from_bitlist
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_operation.gate import gate_operation_from_instruction_dict as GOfID
+from quantum_operation.gate import FusedGateOperation
+from quantum_flow import QuantumFlow, quantum_fourier_flow_on_register
+
+
+def first_register():
+    s1 = qubit_from_bitlist([(1, '0101'), (1j, '1110'), (0.5, '0011')])
+    return QubitRegister(label='reg1', state=s1)
+
+
+def memory_sample():
+    s2 = qubit_from_bitlist([(1, '10'), (-1, '01')])
+    reg2 = QubitRegister(label='reg2', state=s2)
+    return QubitMemory(register=[first_register(), reg2])
+
+
+def gate_on(alias, register, local_index, control=None):
+    instruc_dict = {
+        'gate': {'alias': alias},
+        'target': {'register': register, 'local_index': local_index}
+    }
+    if control is not None:
+        instruc_dict['control'] = {'list': [
+            {'register': control[0], 'local_index': control[1],
+             'state': control[2]}]}
+    return GOfID(instruc_dict)
+
+
+def global_array(memory):
+    return memory.get_global_state().as_vector().as_array()
+
+
+class TestFusion_Report(unittest.TestCase):
+    def test_single_qubit_run(self):
+        flow = QuantumFlow(operation=[gate_on('Hadamard', 'reg1', 0),
+                                      gate_on('Phase', 'reg1', 0),
+                                      gate_on('Hadamard', 'reg1', 0),
+                                      gate_on('PauliX', 'reg2', 1)])
+        fused = flow.fuse(max_qubits=1)
+        self.assertTrue(flow.number_of_operations == 4)
+        self.assertTrue(flow.fusion_report is None)
+        self.assertTrue(fused.number_of_operations == 2)
+        self.assertTrue(isinstance(fused.get_operation_by_rank(0),
+                                   FusedGateOperation))
+        self.assertTrue(fused.fusion_report['passes_saved'] == 2)
+        self.assertTrue(fused.fusion_report['number_of_fused_blocks'] == 1)
+
+    def test_controlled_pair(self):
+        flow = QuantumFlow(operation=[
+            gate_on('Hadamard', 'reg1', 1),
+            gate_on('Phase', 'reg1', 1, control=('reg2', 0, '1')),
+            gate_on('PauliY', 'reg2', 0, control=('reg1', 1, '0')),
+            gate_on('Hadamard', 'reg1', 2)])
+        fused = flow.fuse()
+        self.assertTrue(fused.fusion_report['number_of_passes'] == 2)
+        memory = memory_sample()
+        fused_memory = memory_sample()
+        flow.launch_on_memory(memory)
+        fused.launch_on_memory(fused_memory)
+        self.assertTrue(np.allclose(global_array(memory),
+                                    global_array(fused_memory),
+                                    rtol=0, atol=1e-15))
+
+
+class TestFusion_Fourier(unittest.TestCase):
+    def test_same_global_state(self):
+        flow = quantum_fourier_flow_on_register(first_register())
+        for max_qubits in [2, 3]:
+            fused = flow.fuse(max_qubits=max_qubits)
+            self.assertTrue(fused.fusion_report['passes_saved'] > 0)
+            memory = memory_sample()
+            fused_memory = memory_sample()
+            flow.launch_on_memory(memory)
+            fused.launch_on_memory(fused_memory)
+            self.assertTrue(np.allclose(global_array(memory),
+                                        global_array(fused_memory),
+                                        rtol=0, atol=1e-14))
+
+    def test_unified_matrix(self):
+        flow = quantum_fourier_flow_on_register(first_register())
+        fused = flow.fuse()
+        memory = memory_sample()
+        self.assertTrue(np.allclose(flow.unified_matrix(memory).as_array(),
+                                    fused.unified_matrix(memory).as_array(),
+                                    rtol=0, atol=1e-14))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_flow.quantum_flow.trajectories.py
+
+Main test
+    Noisy flow run as Monte-Carlo trajectories agrees with the
+    density matrix, within a few standard errors; results only
+    depend on the seed, not on the number of processes.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from noise import sample_kraus_branch, amplitude_damping_channel
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_operation.gate import gate_operation_from_instruction_dict
+from quantum_operation.noise import noise_operation_from_instruction_dict
+from quantum_operation.partial_trace import \
+    partial_trace_operation_from_instruction_dict
+from measurement.observables import expectation
+from measurement.projective import projective_all
+from quantum_flow import QuantumFlow, QuantumFlowError
+from quantum_flow.quantum_flow.trajectories import compile_trajectory_steps
+
+OBSERVABLES = ['ZII', 'IZZ', 'XIX', {'ZZI': 0.5, 'YIY': 0.25}]
+
+
+def state_from(array):
+    array = np.array(array, dtype=complex)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def new_memory():
+    """ Register 'A' of two qubits and register 'B' of one qubit """
+    return QubitMemory(register=[
+        QubitRegister(label='A', state=state_from([1, 0, 0, 0])),
+        QubitRegister(label='B', state=state_from([1, 0]))])
+
+
+def gate(alias, register, local_index, control=None):
+    instruc_dict = {
+        'gate': {'alias': alias},
+        'target': {'register': register, 'local_index': local_index}
+    }
+    if control is not None:
+        instruc_dict['control'] = {'list': [
+            {'register': control[0], 'local_index': control[1],
+             'state': '1'}]}
+    return gate_operation_from_instruction_dict(instruc_dict)
+
+
+def noise(alias, parameters, targets):
+    return noise_operation_from_instruction_dict({
+        'channel': {'alias': alias, 'parameters': parameters},
+        'target': [{'register': register, 'local_index': local_index}
+                   for register, local_index in targets]
+    })
+
+
+def noisy_flow():
+    return QuantumFlow(operation=[
+        gate('Hadamard', 'A', 0),
+        noise('depolarising', {'p': 0.2}, [('A', 0)]),
+        gate('Flip', 'B', 0, control=('A', 0)),
+        noise('amplitude_damping', {'gamma': 0.3}, [('B', 0)]),
+        gate('Hadamard', 'A', 1),
+        noise('depolarising', {'p': 0.1, 'number_of_qubits': 2},
+              [('A', 1), ('B', 0)]),
+        gate('Flip', 'A', 0, control=('A', 1)),
+        noise('phase_damping', {'lam': 0.4}, [('A', 0)])
+    ])
+
+
+def density_matrix_result():
+    memory = new_memory()
+    noisy_flow().launch_on_memory(memory)
+    rho = memory.get_global_density_matrix()
+    return projective_all(rho, as_array=True), \
+        [expectation(observable, rho) for observable in OBSERVABLES]
+
+
+class Test_Kraus_Branch(unittest.TestCase):
+    def test_branch_choice(self):
+        channel = amplitude_damping_channel(0.36)
+        array = np.array([0.6, 0.8], dtype=complex).reshape(-1, 1)
+        # probability of decay is 0.36 * 0.64
+        new_array, branch = sample_kraus_branch(array, 1,
+                channel.kraus_arrays, [0], uniform=0.5)
+        self.assertEqual(branch, 0)
+        self.assertAlmostEqual(np.vdot(new_array, new_array).real, 1.0)
+        new_array, branch = sample_kraus_branch(array, 1,
+                channel.kraus_arrays, [0], uniform=0.9)
+        self.assertEqual(branch, 1)
+        self.assertTrue(np.allclose(new_array.reshape(-1), [1, 0]))
+
+
+class Test_Trajectories(unittest.TestCase):
+    def test_against_density_matrix(self):
+        probabilities, values = density_matrix_result()
+        memory = new_memory()
+        result = noisy_flow().launch_trajectories(
+                memory, 2000, observables=OBSERVABLES, seed=11,
+                as_array=True)
+        self.assertEqual(result['number_of_trajectories'], 2000)
+        self.assertAlmostEqual(np.sum(result['probability']), 1.0)
+        # binomial standard error of a probability is at most 0.5/sqrt(N)
+        self.assertTrue(np.all(np.abs(result['probability'] - probabilities)
+                               < 5 * 0.5 / np.sqrt(2000)))
+        for value, estimate, error in zip(values, result['expectation'],
+                                          result['standard_error']):
+            self.assertLess(abs(value - estimate), 5 * error + 1.0e-12)
+        # memory is a template
+        self.assertFalse(memory.has_global_density_matrix)
+        self.assertTrue(np.allclose(
+            memory.get_global_state().as_vector().as_array().reshape(-1),
+            np.eye(8)[0]))
+
+    def test_reproducible(self):
+        first = noisy_flow().launch_trajectories(
+                new_memory(), 40, observables=OBSERVABLES, seed=3,
+                chunk_size=8)
+        second = noisy_flow().launch_trajectories(
+                new_memory(), 40, observables=OBSERVABLES, seed=3,
+                chunk_size=8, processes=2)
+        self.assertEqual(first['probability'], second['probability'])
+        self.assertEqual(first['expectation'], second['expectation'])
+        self.assertEqual(first['entropy'], 3)
+        third = noisy_flow().launch_trajectories(
+                new_memory(), 40, observables=OBSERVABLES, seed=4,
+                chunk_size=8)
+        self.assertNotEqual(first['expectation'], third['expectation'])
+
+    def test_noiseless(self):
+        flow = QuantumFlow(operation=[gate('Hadamard', 'A', 0),
+                                      gate('Flip', 'B', 0,
+                                           control=('A', 0))])
+        result = flow.launch_trajectories(new_memory(), 3,
+                                          observables=['ZIZ'], seed=0)
+        self.assertAlmostEqual(result['probability']['000'], 0.5)
+        self.assertAlmostEqual(result['probability']['101'], 0.5)
+        self.assertAlmostEqual(result['expectation'][0], 1.0)
+        self.assertAlmostEqual(result['standard_error'][0], 0.0)
+
+    def test_invalid(self):
+        flow = noisy_flow()
+        self.assertRaises(QuantumFlowError, flow.launch_trajectories,
+                          new_memory(), 0)
+        self.assertRaises(QuantumFlowError, flow.launch_trajectories,
+                          new_memory(), 10, processes=0)
+        memory = new_memory()
+        flow.launch_on_memory(memory)
+        self.assertRaises(QuantumFlowError, flow.launch_trajectories,
+                          memory, 10)
+        trace = partial_trace_operation_from_instruction_dict(
+                {'register': 'B'})
+        self.assertRaises(QuantumFlowError, compile_trajectory_steps,
+                          [trace], new_memory())
+
+
+if __name__ == '__main__':
+    unittest.main()
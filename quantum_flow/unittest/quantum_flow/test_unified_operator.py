@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_flow.quantum_flow.quantum_flow.py
+    quantum_flow.quantum_flow.unified_operator.py
+
+Main test:
+    Lazy unified operator agrees with the chained product of
+    operator matrices.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+from linear_space.algebra import matrix_product
+from qubit.utils import qubit_from_bitlist
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_operation.gate import gate_operation_from_instruction_dict as GOfID
+from quantum_flow import QuantumFlow, UnifiedOperator, \
+    quantum_fourier_flow_on_register
+
+
+def first_register():
+    s1 = qubit_from_bitlist([(1, '0101'), (1j, '1110'), (0.5, '0011')])
+    return QubitRegister(label='reg1', state=s1)
+
+
+def memory_sample():
+    s2 = qubit_from_bitlist([(1, '10'), (-1, '01')])
+    reg2 = QubitRegister(label='reg2', state=s2)
+    return QubitMemory(register=[first_register(), reg2])
+
+
+def gate_on(alias, register, local_index, control=None):
+    instruc_dict = {
+        'gate': {'alias': alias},
+        'target': {'register': register, 'local_index': local_index}
+    }
+    if control is not None:
+        instruc_dict['control'] = {'list': [
+            {'register': control[0], 'local_index': control[1],
+             'state': control[2]}]}
+    return GOfID(instruc_dict)
+
+
+def chained_product(flow, memory):
+    unified = flow.get_operation_by_rank(0).get_operator_matrix(memory)
+    for rank in range(1, flow.number_of_operations):
+        unified = matrix_product(
+                flow.get_operation_by_rank(rank).get_operator_matrix(memory),
+                unified)
+    return unified.as_array()
+
+
+def sample_flow():
+    return QuantumFlow(operation=[gate_on('Hadamard', 'reg1', 2),
+                                  gate_on('Flip', 'reg2', 0,
+                                          control=('reg1', 2, '1')),
+                                  gate_on('Phase', 'reg1', 0,
+                                          control=('reg2', 1, '0')),
+                                  gate_on('PauliY', 'reg1', 3)])
+
+
+class TestUnifiedOperator_Factors(unittest.TestCase):
+    def test_one_factor_per_operation(self):
+        memory = memory_sample()
+        operator = sample_flow().as_unified_operator(memory)
+        self.assertTrue(isinstance(operator, UnifiedOperator))
+        self.assertTrue(operator.number_of_factors == 4)
+        self.assertTrue(operator.noq == 6)
+        # small matrices only
+        for factor in operator.factors:
+            self.assertTrue(factor['matrix'].nrows == 2)
+        self.assertTrue(operator.factors[1]['qubit_indices'] == [4])
+        self.assertTrue(operator.factors[1]['control_list'] == [(2, '1')])
+
+
+class TestUnifiedOperator_Matrix(unittest.TestCase):
+    def test_controlled_flow(self):
+        memory = memory_sample()
+        flow = sample_flow()
+        self.assertTrue(np.allclose(flow.unified_matrix(memory).as_array(),
+                                    chained_product(flow, memory)))
+
+    def test_fourier_flow(self):
+        memory = memory_sample()
+        flow = quantum_fourier_flow_on_register(first_register())
+        self.assertTrue(np.allclose(flow.unified_matrix(memory).as_array(),
+                                    chained_product(flow, memory)))
+
+    def test_fused_flow(self):
+        memory = memory_sample()
+        flow = quantum_fourier_flow_on_register(first_register())
+        fused = flow.fuse(max_qubits=2)
+        self.assertTrue(np.allclose(fused.unified_matrix(memory).as_array(),
+                                    chained_product(flow, memory)))
+
+
+class TestUnifiedOperator_Apply(unittest.TestCase):
+    def test_apply_without_matrix(self):
+        memory = memory_sample()
+        flow = quantum_fourier_flow_on_register(first_register())
+        operator = flow.as_unified_operator(memory)
+        state = memory.get_global_state()
+        expected = chained_product(flow, memory) @ state.as_vector().as_array()
+        new_state = operator.apply(state)
+        # applying factors doesn't materialise the matrix
+        self.assertTrue(operator._matrix is None)
+        self.assertTrue(np.allclose(new_state.as_vector().as_array(),
+                                    expected))
+
+    def test_launch_on_global_state(self):
+        memory = memory_sample()
+        flow = quantum_fourier_flow_on_register(first_register())
+        expected = chained_product(flow, memory) \
+                @ memory.get_global_state().as_vector().as_array()
+        flow.launch_on_global_state(memory)
+        self.assertTrue(np.allclose(
+                memory.get_global_state().as_vector().as_array(), expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
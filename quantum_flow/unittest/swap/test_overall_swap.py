@@ -8,13 +8,15 @@ Main test:
     Dedicated flow makers -> Flow of overall swap operations
 
 Updated:
-    28 August 2021
+    17 October 2026
 """
 import unittest
+import numpy as np
 from qubit.utils import qubit_from_bitlist
 from quantum_register.registers import QubitRegister
 from quantum_memory.qubit_memory import QubitMemory
 
+from quantum_operation.gate import QubitPermutationOperation
 from quantum_flow import overall_swap_flow_on_register
 
 
@@ -78,3 +80,37 @@ class Test_OverallSwap_OnRegister(unittest.TestCase):
         flow.launch_on_memory(memory=test_memory)
         expected = qubit_from_bitlist([(1, '1001010')])
         self.assertTrue(test_memory.get_global_state() == expected)
+
+
+class Test_OverallSwap_Permutation(unittest.TestCase):
+    def test_single_operation(self):
+        s3 = qubit_from_bitlist([(1, '0101001')])
+        reg3 = QubitRegister(label='reg3', state=s3)
+        flow = overall_swap_flow_on_register(register=reg3)
+        self.assertTrue(flow.number_of_operations == 1)
+        self.assertTrue(isinstance(flow.get_operation_by_rank(0),
+                                   QubitPermutationOperation))
+
+    def test_register_in_memory(self):
+        # reg2 occupies global qubits 2, 3, 4
+        memory = get_test_memory()
+        s2 = qubit_from_bitlist([(1, '001')])
+        flow = overall_swap_flow_on_register(
+                register=QubitRegister(label='reg2', state=s2))
+        operator_matrix = flow.get_operation_by_rank(0).get_operator_matrix(memory)
+        state_array = memory.get_global_state().as_vector().as_array()
+        expected = operator_matrix.as_array() @ state_array
+        flow.launch_on_memory(memory=memory)
+        self.assertTrue(np.allclose(
+            memory.get_global_state().as_vector().as_array(), expected))
+        expected_state = qubit_from_bitlist([(1, '0110010'), (1, '1010010')])
+        self.assertTrue(memory.get_global_state() == expected_state)
+
+    def test_unified_operator(self):
+        memory = get_test_memory()
+        s1 = qubit_from_bitlist([(1, '01'), (1, '10')])
+        flow = overall_swap_flow_on_register(
+                register=QubitRegister(label='reg1', state=s1))
+        unified = flow.unified_matrix(memory)
+        opmat = flow.get_operation_by_rank(0).get_operator_matrix(memory)
+        self.assertTrue(np.allclose(unified.as_array(), opmat.as_array()))
@@ -21,6 +21,14 @@ echo "--- --- Launch quantum flow on memory --- ---"
 python3 -m unittest quantum_flow/unittest/quantum_flow/test_launch_on_memory.py
 echo "--- --- Apply unified matrix to global state --- ---"
 python3 -m unittest quantum_flow/unittest/quantum_flow/test_unified_matrix.py
+echo "--- --- Gate-fusion pass --- ---"
+python3 -m unittest quantum_flow/unittest/quantum_flow/test_fusion.py
+echo "--- --- Lazy unified operator --- ---"
+python3 -m unittest quantum_flow/unittest/quantum_flow/test_unified_operator.py
+echo "--- --- Batched execution --- ---"
+python3 -m unittest quantum_flow/unittest/quantum_flow/test_batch.py
+echo "--- --- Quantum trajectories --- ---"
+python3 -m unittest quantum_flow/unittest/quantum_flow/test_trajectories.py
 
 
 # Dedicated flow makers
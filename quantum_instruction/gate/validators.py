@@ -13,9 +13,10 @@ Dedicated validators for gate instruction subpack.
 
 LOG
 
-Updated on 01 October 2021 | Created on 12 August 2021
+Updated on 17 October 2026 | Created on 12 August 2021
 """
 from warnings import warn
+from common.validator import BOUNDARY_SCOPE
 from gate.decorator import as_gate
 from gate import has_gate
 from gate import single_qubit_gates as singles
@@ -74,6 +75,7 @@ class GateSubdictValidator(InstructionBaseValidator):
     """
     error_class = GateInstructionDictValidationError
     error_location = _MODULE_LOCATION_ + '.GateSubdictValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, gate_dict=None):
         super().__init__()
@@ -150,6 +152,7 @@ class TargetSubdictValidator(InstructionBaseValidator):
     """
     error_class = GateInstructionDictValidationError
     error_location = _MODULE_LOCATION_ + '.TargetSubdictValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, target_dict=None):
         super().__init__()
@@ -186,6 +189,7 @@ class ControlSubdictElementValidator(InstructionBaseValidator):
     """
     error_class = GateInstructionDictValidationError
     error_location = _MODULE_LOCATION_ + '.ControlSubdictElementValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     accepted_control_state = ['0', '1']
     accepted_control_keys = ['register', 'local_index', 'state']
@@ -258,6 +262,7 @@ class ControlSubdictValidator(InstructionBaseValidator):
     """
     error_class = GateInstructionDictValidationError
     error_location = _MODULE_LOCATION_ + '.ControlSubdictValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, control_dict=None, target_dict=None):
         super().__init__()
@@ -308,6 +313,7 @@ class GateInstructionDictValidator(InstructionBaseValidator):
     dictionary.
     """
     error_class = GateInstructionDictValidationError
+    validation_scope = BOUNDARY_SCOPE
     accepted_keys = ['gate', 'target', 'control']
     error_location = _MODULE_LOCATION_ + '.GateOperationInstructionValidator'
 
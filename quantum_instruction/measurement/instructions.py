@@ -33,9 +33,19 @@ qubit state, operation dictionary
     }
 where value to `state` is a `QubitState` instance.
 
+[Measure a register and collapse the global state]
+To measure a register labelled 'COMPREG' in computational
+basis and collapse the global state onto the outcome,
+    {
+        'register': 'COMPREG',
+        'collapse': True,
+        'seed': 7
+    }
+where the optional `seed` makes the outcome reproducible.
+
 LOG
 
-Updated on 01 October 2021 | Created on 13 August 2021
+Updated on 17 October 2026 | Created on 13 August 2021
 """
 from .validators import MeasurementInstructionDictValidator
 from .errors import MeasurementInstructionError
@@ -82,4 +92,14 @@ class MeasurementInstruction:
             raise MeasurementInstructionError("Measurement instruction " +\
                     "carries no projection state.")
         return ret
+
+    @property
+    def collapse(self):
+        """ Measurement Instruction : Verifies if measurement collapses """
+        return self._internal_dict['collapse']
+
+    @property
+    def seed(self):
+        """ Measurement Instruction : Returns seed of collapse """
+        return self._internal_dict['seed']
     
\ No newline at end of file
@@ -13,8 +13,10 @@ Dedicated validators for measurement instruction subpack.
 
 LOG
 
-Updated on 01 October 2021 | Created on 13 August 2021
+Updated on 17 October 2026 | Created on 13 August 2021
 """
+import numpy as np
+
 from qubit import QubitState
 
 from quantum_instruction.base import InstructionBaseValidator
@@ -37,7 +39,7 @@ class MeasurementInstructionDictValidator(InstructionBaseValidator):
     error_class = MeasurementInstructionDictValidationError
     error_location = _MODULE_LOCATION_ +\
             '.MeasurementInstructionDictValidator'
-    accepted_keys = ['register', 'state']
+    accepted_keys = ['register', 'state', 'collapse', 'seed']
 
     def __init__(self, instruc_dict=None):
         super().__init__()
@@ -62,6 +64,30 @@ class MeasurementInstructionDictValidator(InstructionBaseValidator):
                             "projective measurement is not a qubit.")
                 else:
                     self._validated_dict['state'] = instruc_dict['state']
+        if self.is_valid:
+            self.validate_collapse(instruc_dict)
+
+    def validate_collapse(self, instruc_dict):
+        """ Validate collapse and seed """
+        collapse = instruc_dict.get('collapse', False)
+        seed = instruc_dict.get('seed', None)
+        if not isinstance(collapse, bool):
+            self.report_errors("Collapse of measurement must " +\
+                    "be either True or False.")
+        elif collapse and 'state' in self._validated_dict.keys():
+            self.report_errors("Collapsing measurement is only " +\
+                    "performed in computational basis; projection " +\
+                    "state is not allowed.")
+        elif seed is not None and not collapse:
+            self.report_errors("Seed is only used by a collapsing " +\
+                    "measurement.")
+        elif seed is not None and (isinstance(seed, bool) or
+                not isinstance(seed, (int, np.random.Generator))):
+            self.report_errors("Seed of measurement must be an " +\
+                    "integer or a numpy random generator.")
+        else:
+            self._validated_dict['collapse'] = collapse
+            self._validated_dict['seed'] = seed
 
     def validated_data(self):
         return self._validated_dict
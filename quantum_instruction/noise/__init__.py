@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+SUBPACK
+
+Noise instruction
+
+PATH
+
+[app_root]/quantum_instruction/noise/
+
+INTRO
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from .errors import NoiseInstructionError, NoiseInstructionDictValidationError
+from .validators import NoiseInstructionDictValidator
+from .instructions import NoiseInstruction
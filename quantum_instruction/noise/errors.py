@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_instruction.noise.errors.py
+
+PATH
+
+[app_root]/quantum_instruction/noise/errors.py
+
+INTRO
+
+Dedicated errors for noise instruction subpack.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from quantum_instruction.base import InstructionBaseValidationError, \
+    InstructionBaseError
+
+
+class NoiseInstructionDictValidationError(InstructionBaseValidationError):
+    """ Error raised by noise instruction dict validator
+
+    ENTRY
+
+    `validators.NoiseInstructionDictValidator`
+    """
+    header = 'Noise_Instruction_Dict_Validation_Error'
+
+
+class NoiseInstructionError(InstructionBaseError):
+    """ Error raised by noise instruction object
+
+    ENTRY
+
+    `instructions.NoiseInstruction`
+    """
+    header = 'Noise_Instruction_Error'
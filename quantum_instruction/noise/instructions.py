@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_instruction.noise.instructions.py
+
+PATH
+
+[app_root]/quantum_instruction/noise/instructions.py
+
+INTRO
+
+Noise instruction is the instruction behind noise operation.
+
+Examples
+
+[Amplitude damping on a qubit]
+To apply amplitude damping with probability 0.1 on qubit 0 of
+register 'COMPREG',
+    {
+        'channel': {
+            'alias': 'amplitude_damping',
+            'parameters': {
+                'gamma': 0.1
+            }
+        },
+        'target': {
+            'register': 'COMPREG',
+            'local_index': 0
+        }
+    }
+
+[User-defined channel]
+    {
+        'channel': {
+            'instance': KrausChannel instance
+        },
+        'target': [
+            {
+                'register': 'COMPREG',
+                'local_index': 0
+            }
+        ]
+    }
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from .validators import NoiseInstructionDictValidator
+
+_MODULE_LOCATION_ = 'quantum_instruction.noise.instructions'
+
+
+class NoiseInstruction:
+    """ Noise operation instruction
+
+    ATTRIBUTES
+
+    `self.channel` : property; `KrausChannel` instance
+
+    `self.target_list` : property; list of target subdicts,
+    each with keys 'register' and 'local_index'
+    """
+    def __init__(self, instruc_dict):
+        validator = NoiseInstructionDictValidator(instruc_dict=instruc_dict)
+        if validator.is_valid:
+            self._internal_dict = validator.validated_data()
+        else:
+            validator.raise_last_error()
+
+    @property
+    def channel(self):
+        """ Noise Instruction : Returns channel """
+        return self._internal_dict['channel']
+
+    @property
+    def target_list(self):
+        """ Noise Instruction : Returns target subdicts """
+        return self._internal_dict['target']
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_instruction.noise.validators.py
+
+PATH
+
+[app_root]/quantum_instruction/noise/validators.py
+
+INTRO
+
+Dedicated validators for noise instruction subpack.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from noise import KrausChannel, channel_from_alias
+
+from quantum_instruction.base import InstructionBaseValidator
+from .errors import NoiseInstructionDictValidationError
+
+_MODULE_LOCATION_ = 'quantum_instruction.noise.validators'
+
+
+class NoiseInstructionDictValidator(InstructionBaseValidator):
+    """ Noise instruction dictionary validator
+
+    Noise instruction dictionary has two required keys. Key
+    'channel' is a subdict with either a key 'instance', a
+    `KrausChannel`, or a key 'alias' referencing a channel in
+    repertoire and an optional key 'parameters'. Key 'target'
+    is a target subdict, or a list of them for a channel on
+    several qubits, each with keys 'register' and 'local_index'.
+        {
+            'channel': {
+                'alias': 'depolarising',
+                'parameters': {
+                    'p': 0.01,
+                    'number_of_qubits': 2
+                }
+            },
+            'target': [
+                {
+                    'register': 'COMPREG',
+                    'local_index': 0
+                },
+                {
+                    'register': 'COMPREG',
+                    'local_index': 1
+                }
+            ]
+        }
+    Channel is made once, at validation.
+    """
+    error_class = NoiseInstructionDictValidationError
+    error_location = _MODULE_LOCATION_ + '.NoiseInstructionDictValidator'
+    accepted_keys = ['channel', 'target']
+
+    def __init__(self, instruc_dict=None):
+        super().__init__()
+        self._validated_dict = {}
+        self.validate(instruc_dict)
+
+    def validate(self, instruc_dict):
+        """ Main method """
+        if not isinstance(instruc_dict, dict):
+            self.report_errors("Noise instruction must be a dictionary.")
+        elif 'channel' not in instruc_dict.keys():
+            self.report_errors("Noise operation requires a channel.")
+        elif 'target' not in instruc_dict.keys():
+            self.report_errors("Noise operation requires a target.")
+        else:
+            self.validate_channel(instruc_dict['channel'])
+        if self.is_valid:
+            self.validate_target(instruc_dict['target'])
+
+    def validate_channel(self, channel_dict):
+        """ Validate channel subdict and make channel """
+        if not isinstance(channel_dict, dict):
+            self.report_errors("Channel of a noise operation must be " +\
+                    "described by a dictionary.")
+        elif channel_dict.get('instance', None) is not None:
+            if not isinstance(channel_dict['instance'], KrausChannel):
+                self.report_errors("User-defined channel must be " +\
+                        "an instance of 'KrausChannel'.")
+            else:
+                self._validated_dict['channel'] = channel_dict['instance']
+        elif not isinstance(channel_dict.get('alias', None), str):
+            self.report_errors("Channel used in a noise operation " +\
+                    "must be identified by its alias in channel repertoire.")
+        elif not isinstance(channel_dict.get('parameters', {}), dict):
+            self.report_errors("Parameters of a channel must be " +\
+                    "given in a dictionary.")
+        else:
+            try:
+                self._validated_dict['channel'] = channel_from_alias(
+                        channel_dict['alias'],
+                        **channel_dict.get('parameters', {}))
+            except Exception as err:
+                self.report_errors(str(err))
+
+    def validate_target(self, target):
+        """ Validate target subdict(s) """
+        if isinstance(target, dict):
+            target = [target]
+        if not isinstance(target, list):
+            self.report_errors("Target of a noise operation must be " +\
+                    "a dictionary or a list of dictionaries.")
+            return
+        for element in target:
+            if not isinstance(element, dict) \
+                    or not isinstance(element.get('register', None), str) \
+                    or isinstance(element.get('local_index', None), bool) \
+                    or not isinstance(element.get('local_index', None), int):
+                self.report_errors("Target qubit must be referenced " +\
+                        "by a register label and an integer local index.")
+                return
+        pairs = [(element['register'], element['local_index'])
+                 for element in target]
+        if len(set(pairs)) != len(pairs):
+            self.report_errors("Target qubits of a noise operation " +\
+                    "must be distinct.")
+        elif len(pairs) != self._validated_dict['channel'].number_of_qubits:
+            self.report_errors("Channel on " +\
+                    "{} qubit(s) ".format(
+                        self._validated_dict['channel'].number_of_qubits) +\
+                    "requires as many target qubits.")
+        else:
+            self._validated_dict['target'] = [
+                {'register': register, 'local_index': local_index}
+                for register, local_index in pairs]
+
+    def validated_data(self):
+        return self._validated_dict
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_instruction.noise.instructions.py
+
+Main test
+    Noise instruction object.
+
+Updated
+    17 October 2026
+"""
+import unittest
+
+from noise import KrausChannel
+from quantum_instruction.noise import NoiseInstruction, \
+    NoiseInstructionDictValidationError
+
+
+class Test_Instruction(unittest.TestCase):
+    def test_okay(self):
+        instruc = NoiseInstruction(instruc_dict={
+            'channel': {'alias': 'amplitude_damping',
+                        'parameters': {'gamma': 0.2}},
+            'target': {'register': 'REG1', 'local_index': 2}
+        })
+        self.assertTrue(isinstance(instruc.channel, KrausChannel))
+        self.assertEqual(instruc.channel.alias, 'amplitude_damping')
+        self.assertEqual(instruc.target_list,
+                         [{'register': 'REG1', 'local_index': 2}])
+
+    def test_invalid(self):
+        self.assertRaises(NoiseInstructionDictValidationError,
+                          NoiseInstruction, {
+                              'channel': {'alias': 'bit_flip'},
+                              'target': {'register': 'REG1',
+                                         'local_index': 0}
+                          })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_instruction.noise.validators.py
+
+Main test
+    Noise instruction dict validator.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from noise import KrausChannel
+from quantum_instruction.noise import NoiseInstructionDictValidator, \
+    NoiseInstructionDictValidationError
+
+
+def raiser(validator):
+    validator.raise_last_error()
+
+
+def target(register='REG1', local_index=0):
+    return {'register': register, 'local_index': local_index}
+
+
+class Test_Channel(unittest.TestCase):
+    def test_alias(self):
+        validator = NoiseInstructionDictValidator(instruc_dict={
+            'channel': {'alias': 'bit_flip', 'parameters': {'p': 0.1}},
+            'target': target()
+        })
+        self.assertTrue(validator.is_valid)
+        vd = validator.validated_data()
+        self.assertEqual(vd['channel'].alias, 'bit_flip')
+        self.assertEqual(vd['target'], [target()])
+
+    def test_instance(self):
+        channel = KrausChannel(kraus_matrices=[np.eye(4)])
+        validator = NoiseInstructionDictValidator(instruc_dict={
+            'channel': {'instance': channel},
+            'target': [target(local_index=1), target('REG2', 0)]
+        })
+        self.assertTrue(validator.is_valid)
+        self.assertTrue(validator.validated_data()['channel'] is channel)
+
+    def test_invalid_channel(self):
+        for channel_dict in [{'alias': 'amplitude_flip'},
+                             {'alias': 'bit_flip', 'parameters': {'p': 2}},
+                             {'alias': 'bit_flip', 'parameters': 0.1},
+                             {'instance': np.eye(2)}, 'bit_flip']:
+            validator = NoiseInstructionDictValidator(instruc_dict={
+                'channel': channel_dict, 'target': target()})
+            self.assertFalse(validator.is_valid)
+            self.assertRaises(NoiseInstructionDictValidationError,
+                              raiser, validator)
+
+    def test_missing_keys(self):
+        for instruc_dict in [{'target': target()},
+                             {'channel': {'alias': 'bit_flip',
+                                          'parameters': {'p': 0.1}}},
+                             'bit_flip']:
+            validator = NoiseInstructionDictValidator(
+                    instruc_dict=instruc_dict)
+            self.assertFalse(validator.is_valid)
+
+
+class Test_Target(unittest.TestCase):
+    def test_wrong_number(self):
+        validator = NoiseInstructionDictValidator(instruc_dict={
+            'channel': {'alias': 'depolarising',
+                        'parameters': {'p': 0.1, 'number_of_qubits': 2}},
+            'target': target()
+        })
+        self.assertFalse(validator.is_valid)
+
+    def test_not_distinct(self):
+        validator = NoiseInstructionDictValidator(instruc_dict={
+            'channel': {'alias': 'depolarising',
+                        'parameters': {'p': 0.1, 'number_of_qubits': 2}},
+            'target': [target(), target()]
+        })
+        self.assertFalse(validator.is_valid)
+
+    def test_wrong_type(self):
+        for element in [target(local_index=True), target(local_index='0'),
+                        {'register': 'REG1'}, 'REG1']:
+            validator = NoiseInstructionDictValidator(instruc_dict={
+                'channel': {'alias': 'bit_flip', 'parameters': {'p': 0.1}},
+                'target': element
+            })
+            self.assertFalse(validator.is_valid)
+
+
+if __name__ == '__main__':
+    unittest.main()
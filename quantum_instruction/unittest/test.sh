@@ -48,5 +48,16 @@ python3 -m unittest quantum_instruction/unittest/measurement/test_validator.py
 echo "--- --- Measurement instruction object --- ---"
 python3 -m unittest quantum_instruction/unittest/measurement/test_instruction.py
 
+
+# Noise instruction module
+echo "======================================"
+echo "| Noise-Operation Instruction Module |"
+echo "======================================"
+echo "--- Module Location : /quantum_instruction/noise/ ---"
+echo "--- --- Noise instruction validator --- ---"
+python3 -m unittest quantum_instruction/unittest/noise/test_validator.py
+echo "--- --- Noise instruction object --- ---"
+python3 -m unittest quantum_instruction/unittest/noise/test_instruction.py
+
 echo "**********************"
 echo "**********************"
\ No newline at end of file
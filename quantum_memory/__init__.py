@@ -24,6 +24,7 @@ LOG
 
 Updated on 28 September 2021 | Created on 18 July 2021
 """
-from .base_memory import BaseMemory
+from .base_memory import BaseMemory, GATE_ENGINES, MATRIX_ENGINE, \
+    STATEVECTOR_ENGINE, SPARSE_ENGINE
 from .qubit_memory import QubitMemory
 from .errors import QubitMemoryError
@@ -58,7 +58,7 @@ base class implements getters and setters
 
 LOG
 
-Updated on 28 September 2021 | Created on 18 July 2021
+Updated on 17 October 2026 | Created on 18 July 2021
 """
 from quantum_state.quantum_state import QuantumState
 from qubit.utils import qubit_state_by_tensor_product
@@ -66,6 +66,12 @@ from .errors import QuantumMemoryError
 
 _MODULE_LOCATION_ = 'quantum_memory.base_memory'
 
+# engines used by gate operations to renew the global state
+MATRIX_ENGINE = 'matrix'
+STATEVECTOR_ENGINE = 'statevector'
+SPARSE_ENGINE = 'sparse'
+GATE_ENGINES = [MATRIX_ENGINE, STATEVECTOR_ENGINE, SPARSE_ENGINE]
+
 
 class BaseMemory:
     """ Base quantum memory class
@@ -99,10 +105,17 @@ class BaseMemory:
 
     `self.set_global_state(,state)` : setter; manually replace the
     existing global state by `state`; use with caution is advised
+
+    `self.engine` : property; returns the engine gate operations use
+    to renew the global state, either 'matrix' (global operator matrix),
+    'statevector' (matrix-free tensor contraction) or 'sparse' (sparse
+    global operator matrix)
+
+    `self.set_engine(,engine)` : setter; selects the engine
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.BaseMemory'
 
-    def __init__(self, label=None):
+    def __init__(self, label=None, engine=None):
         """ Base Memory : Constructor
 
         Base memory creates the most important attributes to a
@@ -111,10 +124,17 @@ class BaseMemory:
         Arguments
 
         `label` (`str`) : a string to label memory
+
+        `engine` (`str`) : optional; engine used by gate operations,
+        'matrix', 'statevector' or 'sparse'; default to 'matrix'
         """
         self.label = label
         # global state
         self._global_state = None
+        # gate engine
+        self._engine = MATRIX_ENGINE
+        if engine is not None:
+            self.set_engine(engine)
 
     def _update_global_state_with_register(self, register):
         """ Base Memory : Updates global state from register(s)
@@ -176,6 +196,29 @@ class BaseMemory:
             ret = True
         return ret
 
+    @property
+    def engine(self):
+        """ Base Memory : Returns gate engine """
+        return self._engine
+
+    def set_engine(self, engine):
+        """ Base Memory : Sets gate engine
+
+        Arguments
+
+        `engine` (`str`) : 'matrix', 'statevector' or 'sparse'; all
+        engines produce the same global state, while 'statevector'
+        avoids constructing the global operator matrix and 'sparse'
+        constructs it in sparse format (requires scipy)
+        """
+        if engine in GATE_ENGINES:
+            self._engine = engine
+        else:
+            raise QuantumMemoryError("Gate engine " +\
+                    "'{}' is not supported. ".format(engine) +\
+                    "Choose from {}.".format(GATE_ENGINES),
+                    location=self._ERROR_LOCATION_+'.set_engine')
+
     def get_global_state(self):
         """ Base Memory : Returns global state """
         return self._global_state
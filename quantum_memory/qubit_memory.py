@@ -38,11 +38,12 @@ manager and index managers; a subclass of `BaseMemory`
 
 LOG
 
-Updated on 01 October 2021 | Created on 11 August 2021
+Updated on 17 October 2026 | Created on 11 August 2021
 """
 from linear_space.number import is_integer
 from quantum_operator.quantum_operators import QubitOperator
 from density_matrix.density_matrix import DensityMatrix
+from density_matrix.factored import FactoredDensityMatrix
 from quantum_register.registers import QubitRegister
 
 from .validators import QubitMemoryRegisterValidator, OperationLauncherValidator
@@ -198,6 +199,13 @@ class QubitMemory(IndexManager, RegisterMetadataManager, BaseMemory):
     `self.get_global_density_matrix()` : getter; returns the
     global density matrix
 
+    `self.is_mixed` : property; returns `True` once the global
+    density matrix has become mixed, e.g. after a noise channel;
+    the global state is then stale
+
+    `self.mark_mixed()` : marks the global state as stale; only
+    the global density matrix describes memory from then on
+
     `self.append_register(,register)` : append register metadata
     to the existing metadata list and update the global state
     accordingly
@@ -222,18 +230,22 @@ class QubitMemory(IndexManager, RegisterMetadataManager, BaseMemory):
     or a list of qubit registers; register can NOT be empty
 
     `lable` (`str`) : a string to label memory
+
+    `engine` (`str`) : optional; engine used by gate operations
+    to renew the global state, 'matrix', 'statevector' or 'sparse'
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.QubitMemory'
     register_class = QubitRegister
 
-    def __init__(self, register=None, label=None):
+    def __init__(self, register=None, label=None, engine=None):
         """ Qubit Memory : Initialiser
 
         FIXME Label hasn't been tested.
         """
-        super().__init__(label)
+        super().__init__(label, engine)
         self._metadata_list = []
         self._global_density_matrix = None
+        self._is_mixed = False
         validator = QubitMemoryRegisterValidator(register=register,
                 register_class=self.register_class)
         # after validator, registers provided externally
@@ -313,12 +325,13 @@ class QubitMemory(IndexManager, RegisterMetadataManager, BaseMemory):
     def _make_global_density_matrix(self):
         """ Qubit Memory : Makes global density matrix
 
-        NOTE For a large qubit state, creation of a density
-        matrix can be resource consuming.
+        Density matrix is kept in factor form, i.e. the global
+        state itself; its dense array of `4^n` numbers is only
+        formed if requested.
         """
         if self._global_state is not None:
             self._global_density_matrix = \
-                    DensityMatrix(state=self._global_state)
+                    FactoredDensityMatrix(state=self._global_state)
 
     @property
     def has_global_density_matrix(self):
@@ -346,6 +359,28 @@ class QubitMemory(IndexManager, RegisterMetadataManager, BaseMemory):
             raise QubitMemoryError('To set global density ' +\
                     "matrix, a density matrix instance is required.")
 
+    @property
+    def is_mixed(self):
+        """ Qubit Memory : Verifies if memory is mixed
+
+        Once memory is mixed, its global state is stale; operations
+        evolve the global density matrix only.
+        """
+        return self._is_mixed
+
+    def mark_mixed(self):
+        """ Qubit Memory : Marks memory as mixed
+
+        Invoked once the global density matrix is mixed, e.g. after
+        a noise channel or a partial trace. The global state no
+        longer describes memory and is not evolved any further.
+        """
+        if not self.has_global_density_matrix:
+            raise QubitMemoryError("Memory can only be marked " +\
+                    "mixed once it holds a global density matrix.",
+                    location=self._ERROR_LOCATION_+'.mark_mixed')
+        self._is_mixed = True
+
     def append_register(self, register):
         """ Qubit Memory : Appends register(s)
 
@@ -417,6 +452,10 @@ class QubitMemory(IndexManager, RegisterMetadataManager, BaseMemory):
                 raise QubitMemoryError("Operator to be " +\
                         "applied on the global state in memory " +\
                         "is not a qubit operator.")
+            if self.is_mixed:
+                raise QubitMemoryError("Memory is mixed; its " +\
+                        "global state is stale.",
+                        location=self._ERROR_LOCATION_+'.on_global_state')
             new_global_state = operator.apply(self.get_global_state())
             self.set_global_state(new_global_state)
         except Exception as err:
@@ -21,8 +21,9 @@ CONTENT
 
 LOG
 
-Updated on 01 October 2021 | Created on 18 July 2021
+Updated on 17 October 2026 | Created on 18 July 2021
 """
+from common.validator import BOUNDARY_SCOPE, INTERNAL_SCOPE
 from common.function import method_signature
 from quantum_register.base_register import BaseRegister
 
@@ -51,6 +52,7 @@ class QubitMemoryRegisterValidator(QuantumMemoryBaseValidator):
     """
     error_class = QubitMemoryRegisterValidationError
     error_location = __MODULE_LOCATION__ + '.QubitMemoryRegisterValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, register=None, register_class=None):
         """
@@ -147,6 +149,7 @@ class OperationLauncherValidator(QuantumMemoryBaseValidator):
     """
     error_class = OperationLauncherValidationError
     error_location = __MODULE_LOCATION__ + '.OperationLauncherValidator'
+    validation_scope = INTERNAL_SCOPE
 
     def __init__(self, operation_launcher):
         super().__init__()
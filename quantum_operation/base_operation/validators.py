@@ -15,8 +15,9 @@ Dedicated validators for base operation
 
 LOG
 
-Updated on 02 October 2021 | Created on 18 July 2021
+Updated on 17 October 2026 | Created on 18 July 2021
 """
+from common.validator import INTERNAL_SCOPE
 from quantum_operation.base import OperationBaseValidator
 
 from .errors import BaseOperationSubclassValidationError
@@ -40,6 +41,7 @@ class BaseOperationSubclassValidator(OperationBaseValidator):
     """
     error_class = BaseOperationSubclassValidationError
     error_location = _MODULE_LOCATION_ + '.OperationSubclassValdiator'
+    validation_scope = INTERNAL_SCOPE
 
     def __init__(self, opclass):
         super().__init__()
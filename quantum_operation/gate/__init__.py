@@ -14,8 +14,10 @@ a state.
 
 LOG
 
-Updated on 02 October 2021 | Created on 12 July 2021
+Updated on 17 October 2026 | Created on 12 July 2021
 """
 from .validators import GateOperationValidator
 from .operations import GateOperation
 from .utils import gate_operation_from_instruction_dict
+from .fused import FusedGateOperation, operation_qubits
+from .permutation import QubitPermutationOperation
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_operation.gate.fused.py
+
+PATH
+
+[app_root]/quantum_operation/gate/fused.py
+
+INTRO
+
+Fused gate operation merges a run of adjacent gate operations
+acting on a small set of qubits into one dense block.
+
+Each gate operation renews the global state in a separate pass
+over all `2^n` amplitudes. If several adjacent operations only
+touch, say, two qubits, their product is a `4`-by-`4` block that
+can be computed once and applied in a single pass.
+
+Qubits of a fused operation are identified by register label
+and local index, so the block is memory agnostic. Block is
+applied by tensor contraction on the global qubit indices,
+which need not be continuous. (See `gate.statevector`.)
+
+CONTENT
+
+`FusedGateOperation` - A run of gate operations applied as
+one dense block
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from linear_space.algebra import matrix_maker
+from linear_space.vector import ColumnVector
+from qubit import QubitState, ComputationalBasis
+from gate.statevector import apply_matrix_on_qubits
+from density_matrix import apply_unitary
+from quantum_instruction.gate import GateInstruction
+from quantum_operation.base_operation import BaseOperation
+
+from .errors import GateOperationError
+from .operations import GateOperation
+from .validators import GateOperationValidator
+
+_MODULE_LOCATION_ = 'quantum_operation.gate.fused'
+
+
+def operation_qubits(operation):
+    """ Qubits a gate operation acts on
+
+    Returns a list of `(register, local_index)` tuples, target
+    first, followed by control qubits in their listed order.
+    """
+    qubits = [(operation.target_dict['register'],
+               operation.target_dict['local_index'])]
+    if operation.has_control:
+        for el in operation.control_dict['list']:
+            qubits.append((el['register'], el['local_index']))
+    return qubits
+
+
+class FusedGateOperation(BaseOperation):
+    """ Fused gate operation
+
+    Wraps a list of gate operations executed in order. Instruction
+    of the leading operation is kept to satisfy the base operation;
+    all member operations are validated against memory on launch.
+
+    NOTE Fused block is applied by tensor contraction, regardless
+    of the engine selected in memory.
+
+    ATTRIBUTES
+
+    `self.operations` : property; list of member gate operations
+
+    `self.qubits` : property; list of `(register, local_index)`
+    tuples the block acts on, in order of appearance
+
+    `self.block_matrix()` : returns the dense block, product of
+    all member operations restricted to `self.qubits`
+
+    `self.ready(, memory)` : checks if all member operations are
+    ready; if not, raises errors
+
+    `self.get_operator_matrix(, memory)` : returns the global
+    operator matrix, product of member operator matrices
+
+    `self.get_operator_factor(, memory)` : returns the dense block
+    with the global indices of its qubits
+
+    `self.launch_in_socket(, memory)` : function to be invoked
+    in memory `operation_socket` method
+    """
+    error_location = _MODULE_LOCATION_ + '.FusedGateOperation'
+    memory_validator_class = GateOperationValidator
+    instruction_class = GateInstruction
+
+    def __init__(self, operations, oplabel=None):
+        """ Fused Gate Operation : Initialiser
+
+        Arguments
+
+        `operations` (`list`) : a non-empty list of gate operations,
+        in the order of execution
+
+        `oplabel` (`str`): an string to label operation object
+        """
+        if not isinstance(operations, list) or len(operations) == 0 \
+                or not all(isinstance(op, GateOperation) for op in operations):
+            raise GateOperationError("Fused gate operation requires " +\
+                    "a non-empty list of gate operations.",
+                    location=self.error_location+'.__init__')
+        super().__init__(operations[0]._instruction, oplabel=oplabel)
+        self._operations = list(operations)
+        self._qubits = []
+        for op in self._operations:
+            for qubit in operation_qubits(op):
+                if qubit not in self._qubits:
+                    self._qubits.append(qubit)
+        self._block_matrix = None
+
+    @property
+    def operations(self):
+        """ Fused Gate Operation : Returns member operations """
+        return self._operations
+
+    @property
+    def qubits(self):
+        """ Fused Gate Operation : Returns qubits of the block """
+        return self._qubits
+
+    def _local_parameters(self, operation):
+        """ Fused Gate Operation : Gate parameters within the block
+
+        Same as `GateOperation.get_operation_parameters`, except
+        that indices refer to positions in `self.qubits` and the
+        input state is a basis state of the block.
+        """
+        operation_parameters = {
+            'input_state': ComputationalBasis(
+                    bitstring='0' * len(self._qubits)),
+            'target_index': self._qubits.index(
+                    (operation.target_dict['register'],
+                     operation.target_dict['local_index']))
+        }
+        if 'parameters' in operation.gate_dict \
+                and bool(operation.gate_dict['parameters']):
+            operation_parameters = {**operation_parameters,
+                                    **operation.gate_dict['parameters']}
+        if operation.has_control:
+            operation_parameters['control_list'] = [
+                (self._qubits.index((el['register'], el['local_index'])),
+                 el['state']) for el in operation.control_dict['list']]
+        return operation_parameters
+
+    def block_matrix(self):
+        """ Fused Gate Operation : Returns dense block
+
+        Block is constructed once and cached, as it doesn't
+        depend on memory.
+        """
+        if self._block_matrix is None:
+            local_matrices = [
+                op.gate.global_operator_matrix(**self._local_parameters(op))
+                for op in self._operations]
+            # last operation is on the left most
+            self._block_matrix = matrix_maker(
+                    list_of_matrices=list(reversed(local_matrices)),
+                    method='dot')
+        return self._block_matrix
+
+    def ready(self, memory=None):
+        """ Fused Gate Operation : Check if all members are ready """
+        for op in self._operations:
+            op.ready(memory)
+
+    def get_operator_matrix(self, memory):
+        """ Fused Gate Operation : Returns global operator matrix """
+        operator_matrices = [op.get_operator_matrix(memory)
+                             for op in self._operations]
+        return matrix_maker(list_of_matrices=list(reversed(operator_matrices)),
+                            method='dot')
+
+    def get_operator_factor(self, memory):
+        """ Fused Gate Operation : Returns operator factor
+
+        Same keys as `GateOperation.get_operator_factor`; control
+        qubits are already part of the block.
+        """
+        self.ready(memory)
+        return {
+            'matrix': self.block_matrix(),
+            'qubit_indices': [memory.to_global_index(local_index, register)
+                              for register, local_index in self._qubits],
+            'control_list': None
+        }
+
+    def launch_in_socket(self, memory):
+        """ Fused Gate Operation : Launch in (memory) socket
+
+        Applies the dense block on the global state in one pass,
+        and on the global density matrix, if any; only on the latter
+        once memory is mixed.
+
+        Arguments
+
+        `memory` (`BaseMemory`): an active quantum memory on which
+        the operation is launched
+        """
+        try:
+            factor = self.get_operator_factor(memory)
+            if memory.has_global_density_matrix:
+                memory.set_global_density_matrix(apply_unitary(
+                        density_matrix=memory.get_global_density_matrix(),
+                        matrix=factor['matrix'],
+                        qubit_indices=factor['qubit_indices']))
+                if memory.is_mixed:
+                    return
+            global_state = memory.get_global_state()
+            new_array = apply_matrix_on_qubits(
+                    state_array=global_state.as_vector().as_array(),
+                    number_of_qubits=global_state.noq,
+                    qubit_indices=factor['qubit_indices'],
+                    block_matrix=factor['matrix'])
+            memory.set_global_state(
+                    QubitState.from_trusted_vector(
+                        ColumnVector.from_trusted_array(new_array)))
+        except Exception as err:
+            raise err
@@ -31,12 +31,22 @@ Primary validation validates user-provided operation dictionary
 against the requirement. Memory validator validates operation
 against an existing quantum memory for compatibility.
 
+Should memory hold a global density matrix, the gate is also
+applied on it, as `U rho U^dagger`, by contraction along the
+target axes. (See `density_matrix.apply_unitary`.) Once memory
+is mixed, e.g. after a noise operation, only the global density
+matrix is evolved, as the global state no longer describes it.
+
 LOG
 
-Updated on 02 October 2021 | Created on 12 July 2021
+Updated on 17 October 2026 | Created on 12 July 2021
 """
 from gate import single_qubit_gates as singles
+from density_matrix import apply_unitary
+from qubit import ComputationalBasis
 from quantum_instruction.gate import GateInstruction
+from quantum_memory.base_memory import MATRIX_ENGINE, STATEVECTOR_ENGINE, \
+    SPARSE_ENGINE
 from quantum_operation.base_operation import BaseOperation
 
 from .errors import GateOperationError
@@ -55,9 +65,15 @@ class GateOperationManager:
     `self.ready(, memory)` : check if an operationis ready;
     if not, raises errors
 
+    `self.get_operation_parameters(, memory)` : returns parameters
+    passed to the gate object for the target memory
+
     `self.get_operator_matrix(, memory)` : returns an operator
     matrix compatible with the target memory
 
+    `self.get_operator_factor(, memory)` : returns the gate matrix
+    with its global target and control indices, without enlarging
+
     `self.launch_in_socket(,memory)` : function to be invoked
     in memory `operation_socket` method
     """
@@ -84,24 +100,22 @@ class GateOperationManager:
                     "has no global state formed. Operation aborted.",
                     location=self.error_location+".ready")
 
-    def get_operator_matrix(self, memory):
-        """ Gate Operation Manager : Returns operator matrix
+    def get_operation_parameters(self, memory):
+        """ Gate Operation Manager : Returns operation parameters
 
-        Returns an operator matrix, a `SquareMatrix` object,
-        from the gate object.
+        Parameters passed to the gate object, prepared from
+        instruction and the target memory. They include the input
+        (global) state, the global target index, gate parameters
+        and, if a controlled operation, the global control list.
+        If memory selects the 'sparse' engine, parameter `sparse`
+        is set to request a sparse global operator matrix.
 
         Arguments
 
         `memory` (`QubitMemory`) : a qubit memory instance on
         which gate operation is applied
-
-        FIXME Lazy loading strategy. Try to make operator matrix
-        or its creation process dependent on the total number of
-        input state (i.e. metadata of state), not the state object.
-        State vector (object) is only needed when actual computation
-        takes place.
         """
-        operator_matrix = None
+        operation_parameters = None
         try:
             self.ready(memory)
             # prepare the gate operation parameters
@@ -126,13 +140,72 @@ class GateOperationManager:
                             el['local_index'], el['register']), el['state'])
                     control_list.append(control_tuple)
                 operation_parameters['control_list'] = control_list
-            # renew global state in memory
+            if getattr(memory, 'engine', MATRIX_ENGINE) == SPARSE_ENGINE:
+                operation_parameters['sparse'] = True
+        except Exception as err:
+            raise err
+        return operation_parameters
+
+    def get_operator_matrix(self, memory):
+        """ Gate Operation Manager : Returns operator matrix
+
+        Returns an operator matrix, a `SquareMatrix` object (or a
+        `SparseSquareMatrix` with the 'sparse' engine), from the
+        gate object.
+
+        Arguments
+
+        `memory` (`QubitMemory`) : a qubit memory instance on
+        which gate operation is applied
+
+        FIXME Lazy loading strategy. Try to make operator matrix
+        or its creation process dependent on the total number of
+        input state (i.e. metadata of state), not the state object.
+        State vector (object) is only needed when actual computation
+        takes place.
+        """
+        operator_matrix = None
+        try:
+            operation_parameters = self.get_operation_parameters(memory)
             operator_matrix = self.gate.global_operator_matrix(
                     **operation_parameters)
         except Exception as err:
             raise err
         return operator_matrix
 
+    def get_operator_factor(self, memory):
+        """ Gate Operation Manager : Returns operator factor
+
+        Operator factor is the single-qubit gate matrix together
+        with its global target and control indices. Unlike the
+        operator matrix, a factor is never enlarged to fit the
+        global state. (See `quantum_flow.UnifiedOperator`.)
+
+        Arguments
+
+        `memory` (`QubitMemory`) : a qubit memory instance on
+        which gate operation is applied
+
+        Returns
+
+        A dictionary with keys `matrix` (`SquareMatrix`), the gate
+        matrix; `qubit_indices` (`list`), global target index in a
+        list; `control_list` (`list` or `None`), global control list
+        """
+        operation_parameters = self.get_operation_parameters(memory)
+        gate_parameters = {}
+        if 'parameters' in self.gate_dict \
+                and bool(self.gate_dict['parameters']):
+            gate_parameters = self.gate_dict['parameters']
+        gate_matrix = self.gate.global_operator_matrix(
+                input_state=ComputationalBasis(bitstring='0'),
+                **gate_parameters)
+        return {
+            'matrix': gate_matrix,
+            'qubit_indices': [operation_parameters['target_index']],
+            'control_list': operation_parameters.get('control_list', None)
+        }
+
     def launch_in_socket(self, memory):
         """ Gate Operation Manager : Launch in (memory) socket
 
@@ -146,17 +219,42 @@ class GateOperationManager:
         been measured or partially traced out. Corresponding
         methods have already been implemented in memory object.
 
+        Depending on the engine selected in memory, the global
+        state is renewed either by the global operator matrix
+        ('matrix', or 'sparse' if in sparse format) or by contracting
+        the gate matrix with the global state along the target axes
+        ('statevector').
+
+        A global density matrix, if any, is evolved as well. Once
+        memory is mixed, e.g. after a noise operation, its global
+        state is stale and only the global density matrix is
+        evolved.
+
         Arguments
 
         `memory` (`BaseMemory`): an active quantum memory on which
         the operation is launched
         """
         try:
-            operator_matrix = self.get_operator_matrix(memory)
-            self.gate.update_matrix(matrix=operator_matrix)
-            # renew global state in memory
-            memory.set_global_state(
-                    self.gate.apply(memory.get_global_state()))
+            if memory.has_global_density_matrix:
+                factor = self.get_operator_factor(memory)
+                memory.set_global_density_matrix(apply_unitary(
+                        density_matrix=memory.get_global_density_matrix(),
+                        matrix=factor['matrix'],
+                        qubit_indices=factor['qubit_indices'],
+                        control_list=factor['control_list']))
+                if memory.is_mixed:
+                    return
+            if getattr(memory, 'engine', MATRIX_ENGINE) == STATEVECTOR_ENGINE:
+                operation_parameters = self.get_operation_parameters(memory)
+                memory.set_global_state(
+                        self.gate.statevector_apply(**operation_parameters))
+            else:
+                operator_matrix = self.get_operator_matrix(memory)
+                self.gate.update_matrix(matrix=operator_matrix)
+                # renew global state in memory
+                memory.set_global_state(
+                        self.gate.apply(memory.get_global_state()))
         except Exception as err:
             raise err
 
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_operation.gate.permutation.py
+
+PATH
+
+[app_root]/quantum_operation/gate/permutation.py
+
+INTRO
+
+Qubit permutation operation swaps pairs of qubits by permuting
+the axes of the global state, without any operator matrix.
+
+A SWAP is conventionally composed of three CNOT gate operations.
+Reversal of all qubits in a register, at the end of a quantum
+Fourier transform, thus takes `3n/2` passes over the global
+state, each requiring an enlarged operator matrix. Here, all
+swaps are composed into a single permutation of qubits, applied
+in one transpose of the state tensor. (See module
+`gate.statevector.permutation`.)
+
+Like gate operation, qubits are identified by register label
+and local index. Each pair is described by a CNOT instruction,
+used to validate both qubits against memory.
+
+CONTENT
+
+`QubitPermutationOperation` - A sequence of qubit swaps applied
+as one permutation
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from gate.statevector import permute_qubits, qubit_permutation_indices, \
+    permutation_matrix
+from density_matrix import permute_density_matrix
+from quantum_instruction.gate import GateInstruction
+from quantum_memory.base_memory import MATRIX_ENGINE, SPARSE_ENGINE
+from quantum_operation.base_operation import BaseOperation
+
+from .errors import GateOperationError
+from .validators import GateOperationValidator
+
+_MODULE_LOCATION_ = 'quantum_operation.gate.permutation'
+
+
+def _pair_instruction(qubit_a, qubit_b):
+    """ CNOT instruction on a pair of qubits """
+    return GateInstruction({
+        'gate': {
+            'alias': 'Flip',
+        },
+        'target': {
+            'register': qubit_a[0],
+            'local_index': qubit_a[1]
+        },
+        'control': {
+            'list': [
+                {
+                    'register': qubit_b[0],
+                    'local_index': qubit_b[1],
+                    'state': '1'
+                }
+            ]
+        }
+    })
+
+
+class QubitPermutationOperation(BaseOperation):
+    """ Qubit permutation operation
+
+    Swaps pairs of qubits in the given order. Swaps are composed
+    into one permutation of the global qubit axes, regardless of
+    the engine selected in memory.
+
+    ATTRIBUTES
+
+    `self.swaps` : property; list of pairs of `(register,
+    local_index)` tuples
+
+    `self.ready(, memory)` : checks if all qubits exist in memory;
+    if not, raises errors
+
+    `self.get_permutation(, memory)` : returns the permutation of
+    global qubit axes, in the convention of numpy transpose
+
+    `self.get_operator_matrix(, memory)` : returns the permutation
+    matrix; sparse if memory selects the 'sparse' engine
+
+    `self.get_operator_factor(, memory)` : returns the permutation
+    as an operator factor
+
+    `self.launch_in_socket(, memory)` : function to be invoked
+    in memory `operation_socket` method
+    """
+    error_location = _MODULE_LOCATION_ + '.QubitPermutationOperation'
+    memory_validator_class = GateOperationValidator
+    instruction_class = GateInstruction
+
+    def __init__(self, swaps, oplabel=None):
+        """ Qubit Permutation Operation : Initialiser
+
+        Arguments
+
+        `swaps` (`list`) : a non-empty list of pairs of qubits,
+        each qubit a `(register, local_index)` tuple
+
+        `oplabel` (`str`): an string to label operation object
+        """
+        if not isinstance(swaps, list) or len(swaps) == 0:
+            raise GateOperationError("Qubit permutation operation " +\
+                    "requires a non-empty list of qubit pairs.",
+                    location=self.error_location+'.__init__')
+        self._swaps = []
+        instructions = []
+        for pair in swaps:
+            if len(pair) != 2 or tuple(pair[0]) == tuple(pair[1]):
+                raise GateOperationError("Qubit permutation operation " +\
+                        "requires pairs of two distinct qubits.",
+                        location=self.error_location+'.__init__')
+            qubit_a, qubit_b = tuple(pair[0]), tuple(pair[1])
+            self._swaps.append((qubit_a, qubit_b))
+            instructions.append(_pair_instruction(qubit_a, qubit_b))
+        super().__init__(instructions[0], oplabel=oplabel)
+        self._instructions = instructions
+
+    @property
+    def swaps(self):
+        """ Qubit Permutation Operation : Returns qubit pairs """
+        return self._swaps
+
+    def ready(self, memory=None):
+        """ Qubit Permutation Operation : Check if operation is ready """
+        for instruction in self._instructions:
+            memory_validator = self.memory_validator_class(
+                    instruction=instruction, memory=memory)
+            if not memory_validator.is_valid:
+                memory_validator.raise_last_error()
+        if not memory.has_global_state:
+            raise GateOperationError("Memory {} ".format(memory.label) +\
+                    "has no global state formed. Operation aborted.",
+                    location=self.error_location+".ready")
+
+    def get_permutation(self, memory):
+        """ Qubit Permutation Operation : Returns global permutation
+
+        Qubit `k` of the new global state is qubit `axes[k]` of
+        the old one.
+        """
+        self.ready(memory)
+        axes = list(memory.global_index_range())
+        for qubit_a, qubit_b in self._swaps:
+            alpha = memory.to_global_index(qubit_a[1], qubit_a[0])
+            beta = memory.to_global_index(qubit_b[1], qubit_b[0])
+            axes[alpha], axes[beta] = axes[beta], axes[alpha]
+        return axes
+
+    def get_operator_matrix(self, memory):
+        """ Qubit Permutation Operation : Returns permutation matrix """
+        axes = self.get_permutation(memory)
+        return permutation_matrix(
+                indices=qubit_permutation_indices(
+                    number_of_qubits=len(axes), axes=axes),
+                sparse=getattr(memory, 'engine', MATRIX_ENGINE) \
+                        == SPARSE_ENGINE)
+
+    def get_operator_factor(self, memory):
+        """ Qubit Permutation Operation : Returns operator factor
+
+        Same keys as `GateOperation.get_operator_factor`, with
+        `matrix` set to `None` and an extra key `permutation`.
+        """
+        return {
+            'matrix': None,
+            'qubit_indices': None,
+            'control_list': None,
+            'permutation': self.get_permutation(memory)
+        }
+
+    def launch_in_socket(self, memory):
+        """ Qubit Permutation Operation : Launch in (memory) socket
+
+        Permutes qubits of the global state in one pass, and of
+        the global density matrix, if any; only of the latter once
+        memory is mixed.
+
+        Arguments
+
+        `memory` (`BaseMemory`): an active quantum memory on which
+        the operation is launched
+        """
+        try:
+            axes = self.get_permutation(memory)
+            if memory.has_global_density_matrix:
+                memory.set_global_density_matrix(permute_density_matrix(
+                        density_matrix=memory.get_global_density_matrix(),
+                        axes=axes))
+                if memory.is_mixed:
+                    return
+            global_state = memory.get_global_state()
+            new_array = permute_qubits(
+                    state_array=global_state.as_vector().as_array(),
+                    number_of_qubits=global_state.noq,
+                    axes=axes)
+            memory.set_global_state(
+                    QubitState.from_trusted_vector(
+                        ColumnVector.from_trusted_array(new_array)))
+        except Exception as err:
+            raise err
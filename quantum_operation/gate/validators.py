@@ -13,8 +13,9 @@ Dedicate validators for gate opertaion
 
 LOG
 
-Updated on 02 October 2021 | Created on 12 July 2021
+Updated on 17 October 2026 | Created on 12 July 2021
 """
+from common.validator import BOUNDARY_SCOPE
 from quantum_operation.base import OperationBaseValidator
 from .errors import GateOperationValidationError
 
@@ -33,6 +34,7 @@ class GateOperationValidator(OperationBaseValidator):
     """
     error_class = GateOperationValidationError
     error_location = _MODULE_LOCATION_ + '.GateOperationValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, instruction=None, memory=None):
         super().__init__()
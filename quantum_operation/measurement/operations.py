@@ -52,12 +52,36 @@ of an entire register is allowed. Therefore, instruction
 dictionary contains the required key 'register' and an
 optional key 'state'.
 
+[Pure and mixed memory]
+Unmeasured registers are traced out together, in one fused
+contraction. If memory holds no global density matrix, its
+global state is pure; the reduced density matrix of the measured
+register is then computed directly from the state vector and the
+global density matrix of the entire memory is never formed.
+Otherwise, e.g. after a partial trace, they are traced out of
+the existing global density matrix.
+
+[Collapsing measurement]
+With instruction key 'collapse' set to `True`, an outcome of the
+register is sampled from its marginal probabilities and the
+global state collapses onto it; amplitudes of non-matching basis
+states are zeroed by an index mask and the rest renormalised.
+All registers stay in memory and no density matrix is formed,
+so that gate operations may follow, e.g. for feed-forward.
+Launcher returns
+    {
+        'outcome': '10',
+        'probability': 0.5
+    }
+where the outcome is the bit string of the register.
+
 LOG
 
-Updated on 02 October 2021 | Created on 01 August 2021
+Updated on 17 October 2026 | Created on 01 August 2021
 """
-from density_matrix.density_matrix import QubitDensityMatrix
+from density_matrix.factored import FactoredDensityMatrix
 from measurement.projective import projective_all, projective_on_state
+from measurement.collapse import measure_and_collapse
 from quantum_instruction.measurement import MeasurementInstruction
 
 # from same package
@@ -115,12 +139,51 @@ class MeasurementOperation(BaseOperation):
                 registers_to_be_traced_out.append(label)
         return registers_to_be_traced_out
 
+    def _is_pure(self, memory):
+        """ Measurement Operation : Verifies if memory is pure
+
+        Memory is pure if it has no global density matrix and its
+        global state covers all registers in metadata list.
+        """
+        return not memory.has_global_density_matrix and \
+                memory.get_global_state().noq == \
+                len(memory.global_index_range())
+
+    def _collapse(self, memory):
+        """ Measurement Operation : Measure and collapse global state
+
+        Memory must be pure. Returns outcome and its probability.
+        """
+        try:
+            memory_validator = self.memory_validator_class(
+                    self._instruction, memory=memory)
+            if not memory_validator.is_valid:
+                raise memory_validator.report_errors()[0]
+            if not self._is_pure(memory):
+                raise MeasurementOperationError("Collapsing " +\
+                        "measurement requires a pure global state, " +\
+                        "but memory holds a density matrix.",
+                        location=self.error_location+'._collapse')
+            bitstring, probability, new_state = measure_and_collapse(
+                    memory.get_global_state(),
+                    list(memory.get_global_index_range_by_label(
+                        self._instruction.register)),
+                    seed=self._instruction.seed)
+            memory.set_global_state(new_state)
+        except Exception as err:
+            raise MeasurementOperationError(str(err),
+                    location=self.error_location) from err
+        return {'outcome': bitstring, 'probability': probability}
+
     def ready(self, memory):
         """ Measurement Operation : Check if operation is ready
 
         Two checks are conducted. [1] Check operation - memory
         compatibility using memory validator class. [2] Check if
-        memory has global state and global density matrix.
+        memory has global state and global density matrix; for
+        a pure memory of several registers, no density matrix is
+        formed here, as it is reduced from the state vector when
+        other registers are traced out.
 
         Arguments
 
@@ -133,10 +196,9 @@ class MeasurementOperation(BaseOperation):
             raise memory_validator.report_errors()[0]
         if not memory.has_global_state:
             memory.form_global_state()
-        # check if density matrix already exists
-        if not memory.has_global_density_matrix:
+        if self._is_pure(memory) and memory.number_of_registers == 1:
             memory.set_global_density_matrix(
-                    QubitDensityMatrix(state=memory.get_global_state()))
+                    FactoredDensityMatrix(state=memory.get_global_state()))
 
     def launch_in_socket(self, memory):
         """ Measurement Operation : Launcher for memory socket
@@ -151,12 +213,16 @@ class MeasurementOperation(BaseOperation):
         `memory` (`BaseMemory`) : an active memory object
         """
         ret = None
+        if self._instruction.collapse:
+            return self._collapse(memory)
         try:
             self.ready(memory)
             if memory.number_of_registers > 1:
-                # trace out other registers
-                for label in self.__registers_to_be_traced_out(memory):
-                    partial_trace_on_memory({'register': label}, memory)
+                # trace out other registers in one contraction
+                partial_trace_on_memory(
+                        [{'register': label} for label in
+                         self.__registers_to_be_traced_out(memory)],
+                        memory)
             # project all or on a state
             if self._instruction.has_state:
                 ret = projective_on_state(memory.get_global_density_matrix(),
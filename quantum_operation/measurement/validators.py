@@ -15,8 +15,9 @@ Dedicated validators for measurement.
 
 LOG
 
-Updated on 02 October 2021 | Created on 01 August 2021
+Updated on 17 October 2026 | Created on 01 August 2021
 """
+from common.validator import BOUNDARY_SCOPE
 from quantum_state import NullState
 from quantum_operation.base import OperationBaseValidator
 from .errors import MeasurementOperationValidationError
@@ -28,6 +29,7 @@ class MeasurementOperationValidator(OperationBaseValidator):
     """ Validate measurement dict against memory """
     error_class = MeasurementOperationValidationError
     error_location = _MODULE_LOCATION_ + '.MeasurementOperationValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, instruction, memory=None):
         super().__init__()
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+SUBPACK
+
+Noise operation
+
+PATH
+
+[app_root]/quantum_operation/noise/
+
+INTRO
+
+Noise operation applies a Kraus channel on target qubits of
+the global density matrix in memory.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from .errors import NoiseOperationValidationError, NoiseOperationError
+from .validators import NoiseOperationValidator
+from .operations import NoiseOperation
+from .utils import noise_operation_from_instruction_dict
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_operation.noise.errors.py
+
+PATH
+
+[app_root]/quantum_operation/noise/errors.py
+
+INTRO
+
+Dedicated errors.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from quantum_operation.base import OperationBaseError, \
+    OperationBaseValidationError
+
+
+class NoiseOperationValidationError(OperationBaseValidationError):
+    """ Error raised by noise operation validators
+
+    ENTRY
+
+    `validators.NoiseOperationValidator`
+    """
+    header = 'Noise_Operation_Validation_Error'
+
+
+class NoiseOperationError(OperationBaseError):
+    """ Error raised by noise operation
+
+    ENTRY
+
+    `operations.NoiseOperation`
+    """
+    header = 'Noise_Operation_Error'
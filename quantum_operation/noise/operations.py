@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_operation.noise.operations.py
+
+PATH
+
+[app_root]/quantum_operation/noise/operations.py
+
+INTRO
+
+Noise operation applies a Kraus channel, e.g. depolarising or
+amplitude damping, on target qubits of memory.
+
+A channel turns a pure memory into a mixed one, which can only
+be described by a density matrix. Should memory hold no global
+density matrix, one is formed from the global state, in factor
+form. The channel is then applied by contracting its Kraus
+matrices along the target axes only, and the new density matrix
+replaces the global density matrix. (See package `noise`.)
+
+Noise operations are launched in a quantum flow alongside gate
+operations. A noise operation marks memory as mixed: its global
+state is stale from then on, and gate operations only evolve the
+global density matrix.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from density_matrix.factored import FactoredDensityMatrix
+from noise import apply_channel
+from quantum_instruction.noise import NoiseInstruction
+from quantum_operation.base_operation import BaseOperation
+
+from .errors import NoiseOperationError
+from .validators import NoiseOperationValidator
+
+_MODULE_LOCATION_ = 'quantum_operation.noise.operations'
+
+
+class NoiseOperation(BaseOperation):
+    """ Noise operation
+
+    Noise operation wraps a noise instruction.
+
+    EXAMPLES
+
+    [Bit flip on a qubit]
+        {
+            'channel': {
+                'alias': 'bit_flip',
+                'parameters': {
+                    'p': 0.05
+                }
+            },
+            'target': {
+                'register': 'COMPREG',
+                'local_index': 2
+            }
+        }
+
+    ATTRIBUTES
+
+    `self.channel` : property; Kraus channel of the operation
+
+    `self.ready(, memory)` : checks operation against memory and
+    forms global density matrix if needed
+
+    `self.get_qubit_indices(, memory)` : global indices of target
+    qubits
+
+    `self.get_channel_factor(, memory)` : Kraus matrices and global
+    target indices, e.g. for a trajectory of a noisy flow
+
+    `self.launch_in_socket(, memory)` : function to be invoked
+    in memory `operation_socket` method
+    """
+    error_location = _MODULE_LOCATION_ + '.NoiseOperation'
+    memory_validator_class = NoiseOperationValidator
+    instruction_class = NoiseInstruction
+
+    @property
+    def channel(self):
+        """ Noise Operation : Returns channel """
+        return self._instruction.channel
+
+    def _validate_memory(self, memory):
+        """ Noise Operation : Check operation against memory """
+        memory_validator = self.memory_validator_class(
+                self._instruction, memory=memory)
+        if not memory_validator.is_valid:
+            raise memory_validator.report_errors()[0]
+
+    def ready(self, memory):
+        """ Noise Operation : Check if operation is ready
+
+        Two checks are conducted. [1] Check operation - memory
+        compatibility using memory validator class. [2] Check if
+        memory has global state and global density matrix; the
+        latter is formed from the global state, in factor form,
+        if absent.
+
+        Arguments
+
+        `memory` (`BaseMemory`): an active quantum memory on which
+        the operation is launched
+        """
+        self._validate_memory(memory)
+        if not memory.has_global_state:
+            memory.form_global_state()
+        if not memory.has_global_density_matrix:
+            memory.set_global_density_matrix(
+                    FactoredDensityMatrix(state=memory.get_global_state()))
+
+    def get_qubit_indices(self, memory):
+        """ Noise Operation : Global indices of target qubits """
+        return [memory.to_global_index(target['local_index'],
+                                       target['register'])
+                for target in self._instruction.target_list]
+
+    def get_channel_factor(self, memory):
+        """ Noise Operation : Returns channel factor
+
+        Channel factor is a dictionary with keys `kraus_matrices`,
+        an array of Kraus matrices, and `qubit_indices`, global
+        indices of target qubits. Memory is left untouched.
+        """
+        self._validate_memory(memory)
+        return {
+            'kraus_matrices': self.channel.kraus_arrays,
+            'qubit_indices': self.get_qubit_indices(memory)
+        }
+
+    def launch_in_socket(self, memory):
+        """ Noise Operation : Launcher for memory socket
+
+        Applies channel on the global density matrix, which is
+        then replaced; memory is marked as mixed.
+
+        Arguments
+
+        `memory` (`BaseMemory`) : an active memory object
+        """
+        try:
+            self.ready(memory)
+            memory.set_global_density_matrix(apply_channel(
+                    density_matrix=memory.get_global_density_matrix(),
+                    channel=self.channel,
+                    qubit_indices=self.get_qubit_indices(memory)))
+            memory.mark_mixed()
+        except Exception as err:
+            raise NoiseOperationError(str(err),
+                    location=self.error_location) from err
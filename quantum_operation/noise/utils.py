@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_operation.noise.utils.py
+
+PATH
+
+[app_root]/quantum_operation/noise/utils.py
+
+INTRO
+
+Utility functions
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from quantum_instruction.noise import NoiseInstruction
+
+from .errors import NoiseOperationError
+from .operations import NoiseOperation
+
+_MODULE_LOCATION_ = 'quantum_operation.noise.utils'
+
+
+def noise_operation_from_instruction_dict(instruc_dict):
+    """ Returns noise operation from an instruction dict
+
+    ARGUMENTS
+
+    `instruc_dict` (`dict`) : instruction dictionary
+
+    RETURN
+
+    `noise_op` (`NoiseOperation`) : a noise operation instance
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ +\
+            '.noise_operation_from_instruction_dict'
+    try:
+        instruc = NoiseInstruction(instruc_dict)
+        return NoiseOperation(instruction=instruc)
+    except Exception as err:
+        raise NoiseOperationError(str(err), location=_ERROR_LOCATION_)
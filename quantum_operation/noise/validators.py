@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+MODULE
+
+quantum_operation.noise.validators.py
+
+PATH
+
+[app_root]/quantum_operation/noise/validators.py
+
+INTRO
+
+Dedicated validators for noise operation.
+
+LOG
+
+Updated on 17 October 2026 | Created on 17 October 2026
+"""
+from common.validator import BOUNDARY_SCOPE
+from quantum_operation.base import OperationBaseValidator
+from .errors import NoiseOperationValidationError
+
+_MODULE_LOCATION_ = 'quantum_operation.noise.validators'
+
+
+class NoiseOperationValidator(OperationBaseValidator):
+    """ Validate noise instruction against memory
+
+    Every target qubit must exist in memory.
+    """
+    error_class = NoiseOperationValidationError
+    error_location = _MODULE_LOCATION_ + '.NoiseOperationValidator'
+    validation_scope = BOUNDARY_SCOPE
+
+    def __init__(self, instruction, memory=None):
+        super().__init__()
+        self.validate(instruction, memory)
+
+    def validate(self, instruc, memory):
+        """ Main validate method """
+        for target in instruc.target_list:
+            if not memory.has_register_label(target['register']):
+                self.report_errors("Register with label " +\
+                        "'{}' cannot be found ".format(target['register']) +\
+                        "in memory '{}'.".format(memory.label))
+            elif target['local_index'] not in \
+                    memory.get_local_index_range_by_label(target['register']):
+                self.report_errors("Local index " +\
+                        "{} is beyond ".format(target['local_index']) +\
+                        "the valid range of register " +\
+                        "'{}'.".format(target['register']))
@@ -16,9 +16,9 @@ and density matrix.
 
 LOG
 
-Updated on 02 October 2021 | Created on 02 August 2021
+Updated on 17 October 2026 | Created on 02 August 2021
 """
 from .validators import PartialTraceOperationValidator
-from .operations import PartialTraceOperation
+from .operations import PartialTraceOperation, fused_partial_trace_on_memory
 from .utils import partial_trace_operation_from_instruction_dict, \
     partial_trace_on_memory
@@ -29,16 +29,24 @@ only partial trace over a register is allowed. This
 restriction is mainly due to the complication of
 managing metadata list.
 
+Several partial traces on one memory are fused by
+`fused_partial_trace_on_memory`: qubits of all operations are
+traced out in a single contraction and metadata is updated once,
+instead of tracing the global density matrix once per register.
+If memory has no global density matrix yet, the reduced density
+matrix is formed directly from the global state.
+
 TODO Most urgent matters
 
 [1] What happens to the global state?
 
 LOG
 
-Updated on 13 October 2021 | Created on 02 August 2021
+Updated on 17 October 2026 | Created on 02 August 2021
 """
-from density_matrix.density_matrix import QubitDensityMatrix
-from measurement.partial_trace import partial_trace_out_index_range
+from density_matrix.factored import FactoredDensityMatrix
+from measurement.partial_trace import partial_trace_out_index_range, \
+    partial_trace_out_qubits, partial_trace_out_qubits_of_state
 from quantum_instruction.partial_trace import PartialTraceInstruction
 from quantum_operation.base_operation import BaseOperation
 
@@ -90,6 +98,34 @@ class PartialTraceOperation(BaseOperation):
                         max(self._instruction.global_index_range)]
         return bitrange
 
+    def _get_qubit_indices(self, memory):
+        """ Partial Trace Operation : Global indices of traced qubits """
+        bitrange = self._get_bitrange(memory)
+        return list(range(bitrange[0], bitrange[1] + 1))
+
+    def _get_removed_labels(self, memory):
+        """ Partial Trace Operation : Labels of traced-out registers
+
+        A register-referenced operation removes its register; a
+        global index range must cover entire registers, all of
+        which are removed.
+        """
+        if self._instruction.has_register:
+            return [self._instruction.register]
+        traced = set(self._get_qubit_indices(memory))
+        labels = []
+        for label in memory.get_all_labels():
+            register_range = set(memory.get_global_index_range_by_label(label))
+            if register_range <= traced:
+                labels.append(label)
+            elif register_range & traced:
+                raise PartialTraceOperationError("Global index " +\
+                        "range only covers part of register " +\
+                        "'{}'; only entire registers ".format(label) +\
+                        "can be traced out.",
+                        location=self.error_location+'._get_removed_labels')
+        return labels
+
     def ready(self, memory):
         """ Partial Trace Operation : Check if operation is ready
 
@@ -111,7 +147,7 @@ class PartialTraceOperation(BaseOperation):
         # check if global density matrix already exists
         if not memory.has_global_density_matrix:
             memory.set_global_density_matrix(
-                    QubitDensityMatrix(state=memory.get_global_state()))
+                    FactoredDensityMatrix(state=memory.get_global_state()))
 
     def launch_in_socket(self, memory):
         """ Partial Trace Operation : Launcher for memory socket
@@ -119,7 +155,8 @@ class PartialTraceOperation(BaseOperation):
         NOTE Only tracing out an entire register is allowed.
         After partial tracing, the register metadata is removed
         from the list. A reduced density matrix replaces the
-        existing global density matrix.
+        existing global density matrix, and memory is marked as
+        mixed.
 
         Arguments
 
@@ -133,9 +170,61 @@ class PartialTraceOperation(BaseOperation):
                     memory.get_global_density_matrix(),
                     self._get_bitrange(memory))
             memory.set_global_density_matrix(reduced_density_matrix)
+            memory.mark_mixed()
             # remove register metadata
             memory.remove_register_metadata_by_label(self._instruction.register)
         except Exception as err:
             raise PartialTraceOperationError(str(err),
                     location=self.error_location) from err
         return reduced_density_matrix
+
+
+def fused_partial_trace_on_memory(operations, memory):
+    """ Launch several partial trace operations at once
+
+    All operations are validated against memory as it is before
+    any tracing. Union of their qubits is traced out in a single
+    contraction, the reduced density matrix replaces the global
+    density matrix, memory is marked as mixed, and metadata of
+    traced-out registers are then removed.
+
+    ARGUMENTS
+
+    `operations` (`list`) : partial trace operations
+
+    `memory` (`BaseMemory`) : an active quantum memory object
+
+    RETURN
+
+    The reduced density matrix.
+    """
+    _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.fused_partial_trace_on_memory'
+    try:
+        qubit_indices = set()
+        labels = []
+        for operation in operations:
+            memory_validator = operation.memory_validator_class(
+                    operation._instruction, memory=memory)
+            if not memory_validator.is_valid:
+                raise memory_validator.report_errors()[0]
+            qubit_indices.update(operation._get_qubit_indices(memory))
+            for label in operation._get_removed_labels(memory):
+                if label not in labels:
+                    labels.append(label)
+        if not memory.has_global_state:
+            memory.form_global_state()
+        qubit_indices = sorted(qubit_indices)
+        if memory.has_global_density_matrix:
+            reduced_density_matrix = partial_trace_out_qubits(
+                    memory.get_global_density_matrix(), qubit_indices)
+        else:
+            reduced_density_matrix = partial_trace_out_qubits_of_state(
+                    memory.get_global_state(), qubit_indices)
+        memory.set_global_density_matrix(reduced_density_matrix)
+        memory.mark_mixed()
+        for label in labels:
+            memory.remove_register_metadata_by_label(label)
+    except Exception as err:
+        raise PartialTraceOperationError(str(err),
+                location=_ERROR_LOCATION_) from err
+    return reduced_density_matrix
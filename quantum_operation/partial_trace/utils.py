@@ -16,10 +16,10 @@ operations.
 
 LOG
 
-Updated on 02 October 2021 | Created on 02 August 2021
+Updated on 17 October 2026 | Created on 02 August 2021
 """
 from .operations import PartialTraceInstruction, PartialTraceOperation, \
-    PartialTraceOperationError
+    PartialTraceOperationError, fused_partial_trace_on_memory
 
 _MODULE_LOCATION_ = 'quantum_operation.partial_trace.utils'
 
@@ -54,19 +54,29 @@ def partial_trace_on_memory(instruc_dict, memory):
     Apply designated partial trace operation on user-provided
     memory object.
 
+    A list of operation dictionaries, e.g. one per register, is
+    traced out in one fused contraction; all references are
+    resolved against memory before any register is removed.
+
     ARGUMENTS
 
-    `instruc` (`dict`) : operation dictionary for intended
-    partial trace operation
+    `instruc` (`dict` or `list`) : operation dictionary for
+    intended partial trace operation, or a list of them
 
     `memory` (`BaseMemory`) : an active quantum memory object
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.partial_trace_on_memory'
     try:
-        partial_trace_instruction = \
-                PartialTraceInstruction(instruc_dict=instruc_dict)
-        partial_trace_operation = \
-                PartialTraceOperation(partial_trace_instruction)
-        memory.operation_socket(partial_trace_operation)
+        if isinstance(instruc_dict, dict):
+            partial_trace_instruction = \
+                    PartialTraceInstruction(instruc_dict=instruc_dict)
+            partial_trace_operation = \
+                    PartialTraceOperation(partial_trace_instruction)
+            memory.operation_socket(partial_trace_operation)
+        else:
+            fused_partial_trace_on_memory([
+                PartialTraceOperation(PartialTraceInstruction(
+                    instruc_dict=instruc)) for instruc in instruc_dict],
+                memory)
     except Exception as err:
         raise PartialTraceOperationError(str(err), location=_ERROR_LOCATION_)
@@ -15,8 +15,9 @@ Dedicated validators for partial trace operations.
 
 LOG
 
-Updated on 02 October 2021 | Created on 02 August 2021
+Updated on 17 October 2026 | Created on 02 August 2021
 """
+from common.validator import BOUNDARY_SCOPE
 from quantum_operation.base import OperationBaseValidator
 from .errors import PartialTraceOperationValidationError
 
@@ -27,6 +28,7 @@ class LocalReferencedOperationValidator(OperationBaseValidator):
     """ Validate local-referenced operation against memory """
     error_class = PartialTraceOperationValidationError
     error_location = _MODULE_LOCATION_ + '.LocalReferencedOperationValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, instruction, memory):
         super().__init__()
@@ -53,6 +55,7 @@ class GlobalReferencedOperationValidator(OperationBaseValidator):
     """ Validate global-referenced operation against memory """
     error_class = PartialTraceOperationValidationError
     error_location = _MODULE_LOCATION_ + '.GlobalReferencedOperationValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, instruction, memory):
         super().__init__()
@@ -71,6 +74,7 @@ class PartialTraceOperationValidator(OperationBaseValidator):
     """ Validate partial trace operation against memory """
     error_class = PartialTraceOperationValidationError
     error_location = _MODULE_LOCATION_ + '.PartialTraceOperationValidator'
+    validation_scope = BOUNDARY_SCOPE
 
     def __init__(self, instruction, memory=None):
         super().__init__()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_operation.gate.operations.py
+
+Main test:
+    Gate operation launched with matrix, statevector and
+    sparse engines selected in memory or in flow.
+
+Updated:
+    17 October 2026
+"""
+import unittest
+import numpy as np
+from linear_space.matrix import SparseSquareMatrix
+from qubit.utils import qubit_from_bitlist
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_memory.errors import QuantumMemoryError
+from quantum_operation.gate import gate_operation_from_instruction_dict
+from quantum_flow import QuantumFlow, QuantumFlowError, \
+    quantum_fourier_flow_on_register
+
+
+def first_register():
+    s1 = qubit_from_bitlist([(1, '010'), (1j, '111')])
+    return QubitRegister(label='reg1', state=s1)
+
+
+def memory_sample(engine=None):
+    reg1 = first_register()
+    s2 = qubit_from_bitlist([(1, '10'), (-1, '01')])
+    reg2 = QubitRegister(label='reg2', state=s2)
+    return QubitMemory(register=[reg1, reg2], engine=engine)
+
+
+def operation_list():
+    return [
+        gate_operation_from_instruction_dict({
+            'gate': {'alias': 'Hadamard'},
+            'target': {'register': 'reg2', 'local_index': 1}
+        }),
+        gate_operation_from_instruction_dict({
+            'gate': {'alias': 'PhaseRotation',
+                     'parameters': {'n': 1, 'm': 2}},
+            'target': {'register': 'reg1', 'local_index': 0},
+            'control': {'list': [
+                {'register': 'reg2', 'local_index': 1, 'state': '1'},
+                {'register': 'reg1', 'local_index': 2, 'state': '0'}
+            ]}
+        })
+    ]
+
+
+class TestEngine_Memory(unittest.TestCase):
+    def test_default(self):
+        self.assertTrue(memory_sample().engine == 'matrix')
+
+    def test_invalid(self):
+        with self.assertRaises(QuantumMemoryError):
+            memory_sample(engine='tensor')
+
+    def test_same_global_state(self):
+        matrix_memory = memory_sample()
+        statevector_memory = memory_sample(engine='statevector')
+        for op in operation_list():
+            matrix_memory.operation_socket(op)
+            statevector_memory.operation_socket(op)
+        self.assertTrue(np.allclose(
+            matrix_memory.get_global_state().as_vector().as_array(),
+            statevector_memory.get_global_state().as_vector().as_array(),
+            rtol=0, atol=1e-15))
+
+    def test_sparse_operator_matrix(self):
+        matrix_memory = memory_sample()
+        sparse_memory = memory_sample(engine='sparse')
+        for op in operation_list():
+            dense = op.get_operator_matrix(matrix_memory)
+            sparse = op.get_operator_matrix(sparse_memory)
+            self.assertTrue(isinstance(sparse, SparseSquareMatrix))
+            self.assertTrue(np.array_equal(dense.as_array(),
+                                           sparse.as_array()))
+            matrix_memory.operation_socket(op)
+            sparse_memory.operation_socket(op)
+        self.assertTrue(np.allclose(
+            matrix_memory.get_global_state().as_vector().as_array(),
+            sparse_memory.get_global_state().as_vector().as_array(),
+            rtol=0, atol=1e-15))
+
+
+class TestEngine_Flow(unittest.TestCase):
+    def test_flow_overrides_memory(self):
+        matrix_memory = memory_sample()
+        statevector_memory = memory_sample()
+        flow = quantum_fourier_flow_on_register(first_register())
+        flow.launch_on_memory(matrix_memory)
+        flow.set_engine('statevector')
+        flow.launch_on_memory(statevector_memory)
+        # memory restores its own engine after launch
+        self.assertTrue(statevector_memory.engine == 'matrix')
+        self.assertTrue(np.allclose(
+            matrix_memory.get_global_state().as_vector().as_array(),
+            statevector_memory.get_global_state().as_vector().as_array(),
+            rtol=0, atol=1e-14))
+
+    def test_constructor(self):
+        flow = QuantumFlow(operation=operation_list(), engine='statevector')
+        self.assertTrue(flow.engine == 'statevector')
+        with self.assertRaises(QuantumFlowError):
+            QuantumFlow(operation=operation_list(), engine='tensor')
+
+
+if __name__ == '__main__':
+    unittest.main()
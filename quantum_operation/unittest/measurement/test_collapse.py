@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_operation.measurement.operations.py
+    measurement.collapse.py
+
+Main test
+    Collapsing measurement samples an outcome, projects the
+    global state onto it and renormalises; registers stay in
+    memory.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_instruction.measurement import MeasurementInstruction
+from quantum_instruction.measurement.errors import \
+    MeasurementInstructionDictValidationError
+from quantum_operation.measurement import MeasurementOperation
+from quantum_operation.measurement.errors import MeasurementOperationError
+from measurement.collapse import outcome_mask, collapse_state_array
+
+
+def state_from(array):
+    array = np.array(array, dtype=complex)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def bell_memory():
+    """ Two registers of one qubit each, jointly in a Bell state """
+    memory = QubitMemory(register=[
+        QubitRegister(label='A', state=state_from([1, 0])),
+        QubitRegister(label='B', state=state_from([1, 0]))])
+    memory.set_global_state(state_from([1, 0, 0, 1]))
+    return memory
+
+
+def collapse(memory, label, seed=None):
+    instruc_dict = {'register': label, 'collapse': True}
+    if seed is not None:
+        instruc_dict['seed'] = seed
+    operation = MeasurementOperation(
+            MeasurementInstruction(instruc_dict=instruc_dict))
+    return memory.operation_socket(operation)
+
+
+class Test_Mask(unittest.TestCase):
+    def test_outcome_mask(self):
+        mask = outcome_mask(3, [2, 0], 0b10)
+        expected = [int(format(index, '03b')[2]) == 1 and
+                    int(format(index, '03b')[0]) == 0
+                    for index in range(8)]
+        self.assertTrue(np.array_equal(mask, expected))
+
+    def test_collapse_renormalises(self):
+        array = np.array([0.5, 0.5, 0.5, 0.5], dtype=complex)
+        collapse_state_array(array, 2, [0], 1, 0.5)
+        self.assertTrue(np.allclose(array, [0, 0, 1/np.sqrt(2),
+                                            1/np.sqrt(2)]))
+
+
+class Test_Collapse(unittest.TestCase):
+    def test_bell_correlation(self):
+        for seed in range(10):
+            memory = bell_memory()
+            first = collapse(memory, 'A', seed=seed)
+            self.assertAlmostEqual(first['probability'], 0.5)
+            second = collapse(memory, 'B', seed=seed + 100)
+            self.assertEqual(first['outcome'], second['outcome'])
+            self.assertAlmostEqual(second['probability'], 1.0)
+            self.assertEqual(memory.get_all_labels(), ['A', 'B'])
+            self.assertFalse(memory.has_global_density_matrix)
+
+    def test_post_measurement_state(self):
+        memory = bell_memory()
+        result = collapse(memory, 'A', seed=3)
+        index = int(result['outcome'] * 2, 2)
+        expected = np.zeros(4)
+        expected[index] = 1.0
+        state = memory.get_global_state().as_vector().as_array()
+        self.assertTrue(np.allclose(state.reshape(-1), expected))
+        self.assertAlmostEqual(np.linalg.norm(state), 1.0)
+
+    def test_seed_reproducible(self):
+        outcomes = [collapse(bell_memory(), 'A', seed=11)['outcome']
+                    for _ in range(5)]
+        self.assertEqual(len(set(outcomes)), 1)
+
+    def test_both_outcomes_occur(self):
+        outcomes = {collapse(bell_memory(), 'A', seed=seed)['outcome']
+                    for seed in range(40)}
+        self.assertEqual(outcomes, {'0', '1'})
+
+    def test_mixed_memory_raises(self):
+        memory = bell_memory()
+        memory.operation_socket(MeasurementOperation(
+            MeasurementInstruction(instruc_dict={'register': 'A'})))
+        with self.assertRaises(MeasurementOperationError):
+            collapse(memory, 'A')
+
+
+class Test_Instruction(unittest.TestCase):
+    def test_invalid(self):
+        for instruc_dict in [
+                {'register': 'A', 'collapse': 1},
+                {'register': 'A', 'seed': 3},
+                {'register': 'A', 'collapse': True, 'seed': 1.5},
+                {'register': 'A', 'collapse': True,
+                 'state': state_from([1, 0])}]:
+            with self.assertRaises(MeasurementInstructionDictValidationError):
+                MeasurementInstruction(instruc_dict=instruc_dict)
+
+    def test_defaults(self):
+        instruction = MeasurementInstruction(instruc_dict={'register': 'A'})
+        self.assertFalse(instruction.collapse)
+        self.assertIsNone(instruction.seed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_operation.measurement.operations.py
+
+Main test
+    Measurement on a pure memory forms the reduced density
+    matrix from the state vector; results agree with tracing
+    out registers from the global density matrix.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from density_matrix.density_matrix import QubitDensityMatrix
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_instruction.measurement import MeasurementInstruction
+from quantum_operation.measurement import MeasurementOperation
+from measurement.partial_trace import partial_trace_out_qubits, \
+    partial_trace_out_qubits_of_state
+
+
+def random_state(noq, seed):
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=2**noq) + 1.j * rng.normal(size=2**noq)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def trio_memory():
+    """ Registers of 2, 1 and 2 qubits in random states """
+    return QubitMemory(register=[
+        QubitRegister(label='reg1', state=random_state(2, 1)),
+        QubitRegister(label='reg2', state=random_state(1, 2)),
+        QubitRegister(label='reg3', state=random_state(2, 3))])
+
+
+def measure(memory, label):
+    operation = MeasurementOperation(
+            MeasurementInstruction(instruc_dict={'register': label}))
+    return memory.operation_socket(operation)
+
+
+class Test_Reduced_State(unittest.TestCase):
+    def test_against_density_matrix(self):
+        state = random_state(5, 4)
+        density_matrix = QubitDensityMatrix(state=state)
+        for traced in [[0], [4], [1, 3], [0, 2, 4], [3, 0]]:
+            expected = partial_trace_out_qubits(density_matrix, traced)
+            reduced = partial_trace_out_qubits_of_state(state, traced)
+            self.assertTrue(isinstance(reduced, QubitDensityMatrix))
+            self.assertTrue(np.allclose(reduced.as_array(),
+                                        expected.as_array(), atol=1e-14))
+
+    def test_all_traced(self):
+        state = random_state(3, 5)
+        self.assertTrue(np.isclose(
+            partial_trace_out_qubits_of_state(state, [0, 1, 2]), 1.0))
+
+
+class Test_Pure_Measurement(unittest.TestCase):
+    def test_against_mixed_path(self):
+        for label in ['reg1', 'reg2', 'reg3']:
+            pure = trio_memory()
+            probs = measure(pure, label)
+            # a global density matrix selects the existing path
+            mixed = trio_memory()
+            mixed.set_global_density_matrix(
+                    QubitDensityMatrix(state=mixed.get_global_state()))
+            expected = measure(mixed, label)
+            self.assertEqual(pure.get_all_labels(), [label])
+            self.assertEqual(probs.keys(), expected.keys())
+            for key in probs.keys():
+                self.assertTrue(abs(probs[key] - expected[key]) < 1e-14)
+            self.assertTrue(np.allclose(
+                pure.get_global_density_matrix().as_array(),
+                mixed.get_global_density_matrix().as_array(), atol=1e-14))
+
+    def test_single_register(self):
+        state = random_state(2, 6)
+        memory = QubitMemory(register=[
+            QubitRegister(label='reg', state=state)])
+        probs = measure(memory, 'reg')
+        amplitudes = state.as_vector().as_array().reshape(-1)
+        for index, key in enumerate(['00', '01', '10', '11']):
+            self.assertTrue(abs(probs[key] -
+                                abs(amplitudes[index])**2) < 1e-14)
+
+
+if __name__ == '__main__':
+    unittest.main()
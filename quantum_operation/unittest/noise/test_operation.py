@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_operation.noise.operations.py
+
+Main test
+    Noise operations in a flow alongside gate operations; the
+    global density matrix agrees with the explicit sum over
+    enlarged Kraus matrices and keeps a unit trace.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from density_matrix import FactoredDensityMatrix
+from noise import depolarising_channel, amplitude_damping_channel, \
+    phase_damping_channel
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_memory.base_memory import MATRIX_ENGINE, STATEVECTOR_ENGINE
+from quantum_memory.errors import QubitMemoryError
+from quantum_operation.gate import gate_operation_from_instruction_dict, \
+    QubitPermutationOperation
+from quantum_operation.noise import NoiseOperation, NoiseOperationError, \
+    noise_operation_from_instruction_dict
+from quantum_operation.partial_trace import partial_trace_on_memory
+from quantum_flow import QuantumFlow
+
+HADAMARD = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+CNOT = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+
+
+def state_from(array):
+    array = np.array(array, dtype=complex)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def new_memory():
+    """ Register 'A' of two qubits and register 'B' of one qubit """
+    return QubitMemory(register=[
+        QubitRegister(label='A', state=state_from([1, 0, 0, 0])),
+        QubitRegister(label='B', state=state_from([1, 0]))])
+
+
+def enlarge(matrix, noq, qubit_indices):
+    """ Matrix on all qubits, by explicit index mapping """
+    dimension = 2**noq
+    big = np.zeros((dimension, dimension), dtype=complex)
+    for row in range(dimension):
+        for col in range(dimension):
+            row_bits = format(row, '0{}b'.format(noq))
+            col_bits = format(col, '0{}b'.format(noq))
+            if any(row_bits[k] != col_bits[k] for k in range(noq)
+                   if k not in qubit_indices):
+                continue
+            sub_row = int(''.join(row_bits[k] for k in qubit_indices), 2)
+            sub_col = int(''.join(col_bits[k] for k in qubit_indices), 2)
+            big[row, col] = matrix[sub_row, sub_col]
+    return big
+
+
+def evolve(rho, kraus_matrices, qubit_indices, noq=3):
+    result = np.zeros(rho.shape, dtype=complex)
+    for matrix in kraus_matrices:
+        big = enlarge(matrix, noq, qubit_indices)
+        result += big @ rho @ big.conj().T
+    return result
+
+
+def gate(alias, register, local_index, control=None):
+    instruc_dict = {
+        'gate': {'alias': alias},
+        'target': {'register': register, 'local_index': local_index}
+    }
+    if control is not None:
+        instruc_dict['control'] = {'list': [
+            {'register': control[0], 'local_index': control[1],
+             'state': '1'}]}
+    return gate_operation_from_instruction_dict(instruc_dict)
+
+
+def noise(alias, parameters, targets):
+    return noise_operation_from_instruction_dict({
+        'channel': {'alias': alias, 'parameters': parameters},
+        'target': [{'register': register, 'local_index': local_index}
+                   for register, local_index in targets]
+    })
+
+
+def noisy_flow():
+    return QuantumFlow(operation=[
+        gate('Hadamard', 'A', 0),
+        noise('depolarising', {'p': 0.2}, [('A', 0)]),
+        gate('Flip', 'B', 0, control=('A', 0)),
+        noise('amplitude_damping', {'gamma': 0.3}, [('B', 0)]),
+        gate('Hadamard', 'A', 1),
+        noise('depolarising', {'p': 0.1, 'number_of_qubits': 2},
+              [('A', 1), ('B', 0)]),
+        gate('Flip', 'A', 0, control=('A', 1)),
+        noise('phase_damping', {'lam': 0.4}, [('A', 0)])
+    ])
+
+
+def expected_density_array():
+    rho = np.zeros((8, 8), dtype=complex)
+    rho[0, 0] = 1.0
+    rho = evolve(rho, [HADAMARD], [0])
+    rho = evolve(rho, depolarising_channel(0.2).kraus_arrays, [0])
+    rho = evolve(rho, [CNOT], [0, 2])
+    rho = evolve(rho, amplitude_damping_channel(0.3).kraus_arrays, [2])
+    rho = evolve(rho, [HADAMARD], [1])
+    rho = evolve(rho, depolarising_channel(
+        0.1, number_of_qubits=2).kraus_arrays, [1, 2])
+    rho = evolve(rho, [CNOT], [1, 0])
+    rho = evolve(rho, phase_damping_channel(0.4).kraus_arrays, [0])
+    return rho
+
+
+class Test_Noise_Operation(unittest.TestCase):
+    def test_flow_against_kraus_sum(self):
+        expected = expected_density_array()
+        for engine in [MATRIX_ENGINE, STATEVECTOR_ENGINE]:
+            memory = new_memory()
+            flow = noisy_flow()
+            flow.set_engine(engine)
+            flow.launch_on_memory(memory)
+            self.assertTrue(memory.has_global_density_matrix)
+            rho = memory.get_global_density_matrix()
+            self.assertTrue(isinstance(rho, FactoredDensityMatrix))
+            self.assertAlmostEqual(rho.trace, 1.0)
+            self.assertTrue(np.allclose(rho.as_array(), expected))
+
+    def test_fused_flow(self):
+        memory = new_memory()
+        fused_flow = noisy_flow().fuse(max_qubits=2)
+        self.assertTrue(any(isinstance(operation, NoiseOperation)
+                            for operation in fused_flow.get_sequence()))
+        fused_flow.launch_on_memory(memory)
+        self.assertTrue(np.allclose(
+            memory.get_global_density_matrix().as_array(),
+            expected_density_array()))
+
+    def test_permutation(self):
+        memory = new_memory()
+        noisy_flow().launch_on_memory(memory)
+        memory.operation_socket(
+                QubitPermutationOperation([(('A', 0), ('B', 0))]))
+        expected = evolve(expected_density_array(), [SWAP], [0, 2])
+        self.assertTrue(np.allclose(
+            memory.get_global_density_matrix().as_array(), expected))
+
+    def test_partial_trace_after_noise(self):
+        memory = new_memory()
+        noisy_flow().launch_on_memory(memory)
+        partial_trace_on_memory({'register': 'A'}, memory)
+        expected = expected_density_array().reshape(4, 2, 4, 2)
+        expected = np.einsum('aiaj->ij', expected)
+        self.assertTrue(np.allclose(
+            memory.get_global_density_matrix().as_array(), expected))
+
+    def test_global_state_stale(self):
+        memory = new_memory()
+        memory.operation_socket(gate('Hadamard', 'A', 0))
+        self.assertFalse(memory.is_mixed)
+        memory.operation_socket(noise('bit_flip', {'p': 0.1}, [('A', 0)]))
+        self.assertTrue(memory.is_mixed)
+        state = memory.get_global_state()
+        memory.operation_socket(gate('Hadamard', 'A', 1))
+        self.assertTrue(memory.get_global_state() is state)
+        self.assertRaises(QubitMemoryError, memory.on_global_state,
+                          QuantumFlow(operation=[gate('Hadamard', 'A', 1)]
+                                      ).as_unified_operator(memory))
+
+    def test_unknown_target(self):
+        memory = new_memory()
+        operation = noise('bit_flip', {'p': 0.1}, [('C', 0)])
+        self.assertRaises(NoiseOperationError, memory.operation_socket,
+                          operation)
+        operation = noise('bit_flip', {'p': 0.1}, [('B', 1)])
+        self.assertRaises(NoiseOperationError, memory.operation_socket,
+                          operation)
+
+    def test_invalid_instruction(self):
+        self.assertRaises(NoiseOperationError,
+                          noise_operation_from_instruction_dict,
+                          {'channel': {'alias': 'bit_flip'}})
+
+
+if __name__ == '__main__':
+    unittest.main()
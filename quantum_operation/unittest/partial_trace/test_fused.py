@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+#-*- coding:utf-8 -*-
+"""
+File under test
+    quantum_operation.partial_trace.operations.py
+    quantum_operation.partial_trace.utils.py
+
+Main test
+    Several registers traced out in one fused partial trace
+    give the same reduced density matrix and metadata as tracing
+    them out one by one.
+
+Updated
+    17 October 2026
+"""
+import unittest
+import numpy as np
+
+from linear_space.vector import ColumnVector
+from qubit import QubitState
+from density_matrix.density_matrix import QubitDensityMatrix
+from quantum_register.registers import QubitRegister
+from quantum_memory.qubit_memory import QubitMemory
+from quantum_operation.partial_trace import partial_trace_on_memory
+from quantum_operation.partial_trace.errors import PartialTraceOperationError
+
+
+def random_state(noq, seed):
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=2**noq) + 1.j * rng.normal(size=2**noq)
+    array = array / np.linalg.norm(array)
+    return QubitState(vector=ColumnVector(array=array.reshape(-1, 1)))
+
+
+def quartet_memory(entangled=True):
+    """ Registers of 2, 1, 2 and 1 qubits """
+    memory = QubitMemory(register=[
+        QubitRegister(label='reg1', state=random_state(2, 1)),
+        QubitRegister(label='reg2', state=random_state(1, 2)),
+        QubitRegister(label='reg3', state=random_state(2, 3)),
+        QubitRegister(label='reg4', state=random_state(1, 4))])
+    if entangled:
+        memory.set_global_state(random_state(6, 5))
+    return memory
+
+
+def sequential(memory, labels):
+    for label in labels:
+        partial_trace_on_memory({'register': label}, memory)
+    return memory.get_global_density_matrix()
+
+
+class Test_Fused(unittest.TestCase):
+    def test_against_sequential(self):
+        for labels in [['reg2'], ['reg1', 'reg3'], ['reg4', 'reg2'],
+                       ['reg1', 'reg2', 'reg4']]:
+            expected = sequential(quartet_memory(), labels)
+            memory = quartet_memory()
+            partial_trace_on_memory(
+                    [{'register': label} for label in labels], memory)
+            self.assertTrue(np.allclose(
+                memory.get_global_density_matrix().as_array(),
+                expected.as_array(), atol=1e-14))
+            self.assertEqual(memory.get_all_labels(),
+                [label for label in ['reg1', 'reg2', 'reg3', 'reg4']
+                 if label not in labels])
+
+    def test_from_existing_density_matrix(self):
+        memory = quartet_memory()
+        memory.set_global_density_matrix(
+                QubitDensityMatrix(state=memory.get_global_state()))
+        partial_trace_on_memory([{'register': 'reg1'},
+                                 {'register': 'reg3'}], memory)
+        expected = sequential(quartet_memory(), ['reg1', 'reg3'])
+        self.assertTrue(np.allclose(
+            memory.get_global_density_matrix().as_array(),
+            expected.as_array(), atol=1e-14))
+
+    def test_global_and_local_references(self):
+        memory = quartet_memory()
+        partial_trace_on_memory([{'global_index_range': [0, 1]},
+                                 {'register': 'reg4'}], memory)
+        self.assertEqual(memory.get_all_labels(), ['reg2', 'reg3'])
+        expected = sequential(quartet_memory(), ['reg1', 'reg4'])
+        self.assertTrue(np.allclose(
+            memory.get_global_density_matrix().as_array(),
+            expected.as_array(), atol=1e-14))
+
+    def test_partial_global_range_raises(self):
+        with self.assertRaises(PartialTraceOperationError):
+            partial_trace_on_memory([{'global_index_range': [1, 2]}],
+                                    quartet_memory())
+
+    def test_unknown_register_raises(self):
+        memory = quartet_memory()
+        with self.assertRaises(PartialTraceOperationError):
+            partial_trace_on_memory([{'register': 'reg1'},
+                                     {'register': 'reg9'}], memory)
+        self.assertEqual(len(memory.get_all_labels()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
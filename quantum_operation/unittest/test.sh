@@ -19,6 +19,9 @@ python3 -m unittest quantum_operation/unittest/gate_operation/test_operation.py
 echo "--- --- Operation Launch method --- ---"
 python3 -m unittest quantum_operation/unittest/gate_operation/test_launch.py
 
+echo "--- --- Operation engines --- ---"
+python3 -m unittest quantum_operation/unittest/gate_operation/test_engine.py
+
 
 # Partial trace operation
 echo "==================================="
@@ -26,6 +29,8 @@ echo "| Partial Trace Operation Subpack |"
 echo "==================================="
 echo "--- Partial tracing out a register ---"
 python3 -m unittest quantum_operation/unittest/partial_trace/test_partial_tracing.py
+echo "--- Fused partial trace of several registers ---"
+python3 -m unittest quantum_operation/unittest/partial_trace/test_fused.py
 
 
 # Measurement operation
@@ -36,6 +41,18 @@ echo "--- Operation validator ---"
 python3 -m unittest quantum_operation/unittest/measurement/test_validator.py
 echo "--- Measurment operation ---"
 python3 -m unittest quantum_operation/unittest/measurement/test_operation.py
+echo "--- Measurment on pure memory ---"
+python3 -m unittest quantum_operation/unittest/measurement/test_pure.py
+echo "--- Collapsing measurement ---"
+python3 -m unittest quantum_operation/unittest/measurement/test_collapse.py
+
+
+# Noise operation
+echo "==========================="
+echo "| Noise Operation Subpack |"
+echo "==========================="
+echo "--- Noise operation in a flow with gates ---"
+python3 -m unittest quantum_operation/unittest/noise/test_operation.py
 
 
 echo "**********************"
@@ -36,9 +36,9 @@ CONTENT
 
 LOG
 
-Updated on 29 September 2021 | Created on 08 March 2021
+Updated on 17 October 2026 | Created on 08 March 2021
 """
-from linear_space.matrix import  SquareMatrix
+from linear_space.matrix import  SquareMatrix, SparseSquareMatrix
 from linear_space.algebra import matrix_product
 
 from quantum_state import QuantumState, NullState, NULL_STATE
@@ -83,13 +83,14 @@ class QuantumOperator:
     CONSTRUCTOR
 
     `matrix`: internal matrix of operator; must be an
-    instance of class `SquareMatrix`; default to `None`
+    instance of class `SquareMatrix` or `SparseSquareMatrix`;
+    default to `None`
     """
     state_class = QuantumState
 
     def __init__(self, matrix=None):
         """ Quantum Operator :: Constructor """
-        if isinstance(matrix, SquareMatrix):
+        if isinstance(matrix, (SquareMatrix, SparseSquareMatrix)):
             self._matrix = matrix
         else:
             self._matrix = None
@@ -101,13 +102,13 @@ class QuantumOperator:
     def has_matrix(self):
         """ Quantum Operator :: Verify if internal matrix exists """
         ret = False
-        if isinstance(self._matrix, SquareMatrix):
+        if isinstance(self._matrix, (SquareMatrix, SparseSquareMatrix)):
             ret = True
         return ret
 
     def update_matrix(self, matrix):
         """ Quantum Operator :: Update internal matrix """
-        if isinstance(matrix, SquareMatrix):
+        if isinstance(matrix, (SquareMatrix, SparseSquareMatrix)):
             self._matrix = matrix
         else:
             raise QuantumOperatorError("Quantum operator " +\
@@ -147,7 +148,8 @@ class QuantumOperator:
                         # NOTE If state is a subclass of quantum state,
                         # the returned state would still be an instance of
                         # QuantumState
-                        new_state = self.state_class(vector=new_vector)
+                        new_state = self.state_class.from_trusted_vector(
+                                new_vector)
                     except Exception as err:
                         raise QuantumOperatorError(
                             str(err.relocate(_MODULE_LOCATION_+\
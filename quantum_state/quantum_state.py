@@ -80,10 +80,13 @@ Dimension: Number of elements in a (unit) vector
 
 LOG
 
-Updated on 30 September 2021 | Created on 20 June 2020
+Updated on 17 October 2026 | Created on 20 June 2020
 """
 from linear_space.number import is_one
 from linear_space.algebra import norm, inner
+from linear_space.vector import UnitVector
+from linear_space.linear_object import is_trusted_validation_enabled
+from linear_space.precision import precision_tolerance
 
 from .base import AbstractQuantumState
 from .errors import QuantumStateError
@@ -193,6 +196,10 @@ class QuantumState(AbstractQuantumState):
     the state vector `self._vector`
 
     `self.__repr__()`: invokes method `self.string_representation()`
+
+    `cls.from_trusted_vector(vector)` : classmethod; wraps a column
+    vector produced internally, e.g. a state updated by a gate,
+    without validation
     """
     _ERROR_LOCATION_ = _MODULE_LOCATION_ + '.QuantumState'
 
@@ -216,6 +223,24 @@ class QuantumState(AbstractQuantumState):
         else:
             validator.raise_last_error(self._ERROR_LOCATION_+'.__init__')
 
+    @classmethod
+    def from_trusted_vector(cls, vector):
+        """ Quantum State :: Construct without validation
+
+        Vector must be one the constructor would accept and
+        already normalised; its array is wrapped as it is, neither
+        copied nor normalised again. Validation is only run if
+        switched on by `linear_space.linear_object.set_trusted_validation`.
+        """
+        if is_trusted_validation_enabled():
+            return cls(vector=vector)
+        state = cls.__new__(cls)
+        if isinstance(vector, UnitVector):
+            state._vector = vector
+        else:
+            state._vector = UnitVector.from_trusted_array(vector.as_array())
+        return state
+
     def as_vector(self):
         """ Quantum State :: Return internal vector """
         return self._vector
@@ -296,7 +321,10 @@ class QuantumState(AbstractQuantumState):
         Criterion for identical states is that the norm of
         their inner product is unity, meaning the projection
         of one state onto the other is (almost) itself, or
-        two states have a complete overlap.
+        two states have a complete overlap. Inner product is
+        divided by the norms of both states, since states wrapped
+        from gate results are not normalised again and their norms
+        drift by rounding.
 
         Must not compare two states with element-by-element
         approach as in common vectors, since what matters to
@@ -314,7 +342,11 @@ class QuantumState(AbstractQuantumState):
         if isinstance(other_state, QuantumState):
             if self.size == other_state.size:
                 innerprod = inner(self.as_vector(), other_state.as_vector())
-                if is_one(norm(innerprod)):
+                overlap = norm(innerprod) / (self.as_vector().norm
+                                             * other_state.as_vector().norm)
+                if is_one(overlap, precision_tolerance(
+                        self.as_vector().as_array(),
+                        other_state.as_vector().as_array())):
                     ret = True
         else:
             raise QuantumStateError("Cannot compare a quantum " +\
@@ -47,6 +47,10 @@ echo ""
 ./quantum_algebra/unittest/test.sh
 echo ""
 
+# Package: Noise
+./noise/unittest/test.sh
+echo ""
+
 # Package: Quantum Register
 ./quantum_register/unittest/test.sh
 echo ""
@@ -71,6 +75,10 @@ echo ""
 ./quantum_circuit/unittest/test.sh
 echo ""
 
+# Package: Benchmark
+./benchmark/unittest/test.sh
+echo ""
+
 test_end=`date '+%Y_%m_%d__%H_%M_%S'`;
 echo "** Library-level Unit Test Summary **"
 echo "** Test began at   $test_start   **";